@@ -2,7 +2,8 @@ import copy
 import datetime
 import hashlib
 import json
-from typing import Any, Dict, Optional, Union
+import threading
+from typing import Any, Callable, Dict, Optional, Tuple, Union
 
 from great_expectations.core.id_dict import (
     BatchKwargs,
@@ -424,4 +425,70 @@ class Batch(DictDot):
         return json.dumps(json_dict, indent=2)
 
     def head(self):
-        return self._data.head()
+        return self.data.head()
+
+
+class LazyBatch(Batch):
+    """A Batch whose data is loaded on first access, rather than when the Batch is built.
+
+    The data, batch_spec and batch_markers are obtained by calling batch_loader, which returns them as a tuple (for
+    instance DataConnector.get_batch_data_and_metadata for the batch_definition). Unloading the Batch releases its
+    data, which is loaded again if it is accessed later.
+    """
+
+    def __init__(
+        self,
+        batch_loader: Callable[[], Tuple[Any, BatchSpec, BatchMarkers]],
+        batch_request: BatchRequest = None,
+        batch_definition: BatchDefinition = None,
+    ):
+        super().__init__(
+            data=None,
+            batch_request=batch_request,
+            batch_definition=batch_definition,
+        )
+        self._batch_loader = batch_loader
+        self._is_loaded = False
+        self._has_metadata = False
+        self._load_lock = threading.Lock()
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._is_loaded
+
+    def load(self) -> None:
+        """Loads the data, batch_spec and batch_markers of the Batch, if they are not loaded yet."""
+        with self._load_lock:
+            if self._is_loaded:
+                return
+            batch_data, batch_spec, batch_markers = self._batch_loader()
+            self._data = batch_data
+            if batch_spec is not None:
+                self._batch_spec = batch_spec
+            if batch_markers is not None:
+                self._batch_markers = batch_markers
+            self._is_loaded = True
+            self._has_metadata = True
+
+    def unload(self) -> None:
+        """Releases the data of the Batch; its batch_spec and batch_markers are kept."""
+        with self._load_lock:
+            self._data = None
+            self._is_loaded = False
+
+    @property
+    def data(self):
+        self.load()
+        return self._data
+
+    @property
+    def batch_spec(self):
+        if not self._has_metadata:
+            self.load()
+        return self._batch_spec
+
+    @property
+    def batch_markers(self):
+        if not self._has_metadata:
+            self.load()
+        return self._batch_markers
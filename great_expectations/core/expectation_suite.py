@@ -2,7 +2,7 @@ import datetime
 import json
 import logging
 from copy import deepcopy
-from typing import Any, List, Union
+from typing import Any, List, Optional, Union
 
 from great_expectations import __version__ as ge_version
 from great_expectations.core.evaluation_parameters import (
@@ -32,6 +32,9 @@ from great_expectations.types import SerializableDictDot
 
 logger = logging.getLogger(__name__)
 
+# Metrics describing the full schema of a batch, which cannot be computed over only some of its columns
+SCHEMA_METRICS = {"table.columns", "table.column_count"}
+
 
 class ExpectationSuite(SerializableDictDot):
     """
@@ -196,6 +199,54 @@ class ExpectationSuite(SerializableDictDot):
         """Return a list of column map expectations."""
         return [e for e in self.expectations if "column" in e.kwargs]
 
+    def get_referenced_columns(self) -> Optional[List[str]]:
+        """Return the columns referenced by the expectations of the suite, which are the only columns a batch needs
+        to be validated against the suite, or None if the suite needs all the columns of the batch.
+
+        This is the case for expectations about the schema of the batch, such as expect_table_columns_to_match_set,
+        for expectations with a row_condition, which may reference any column, and for expectations that are not
+        registered.
+        """
+        from great_expectations.expectations.registry import get_expectation_impl
+
+        columns = []
+        for expectation in self.expectations:
+            kwargs = expectation.kwargs
+            if kwargs.get("row_condition"):
+                return None
+            expectation_impl = get_expectation_impl(expectation.expectation_type)
+            if expectation_impl is None:
+                return None
+            if SCHEMA_METRICS & set(expectation_impl.metric_dependencies):
+                # The existence of a column can be checked on the loaded columns, unlike its position
+                if "column" not in kwargs or "column_index" in kwargs:
+                    return None
+            for key in ["column", "column_A", "column_B"]:
+                if kwargs.get(key) is not None:
+                    columns.append(kwargs[key])
+            columns.extend(kwargs.get("column_list") or [])
+
+        if not columns:
+            return None
+        return list(dict.fromkeys(columns))
+
+    def get_shared_row_condition(self) -> Optional[dict]:
+        """Return the row_condition and condition_parser shared by all the expectations of the suite, as a dictionary,
+        or None if some expectations have no row_condition or a different one."""
+        row_conditions = {
+            (
+                expectation.kwargs.get("row_condition"),
+                expectation.kwargs.get("condition_parser"),
+            )
+            for expectation in self.expectations
+        }
+        if len(row_conditions) != 1:
+            return None
+        row_condition, condition_parser = row_conditions.pop()
+        if not row_condition:
+            return None
+        return {"row_condition": row_condition, "condition_parser": condition_parser}
+
     @staticmethod
     def _filter_citations(citations, filter_key):
         citations_with_bk = []
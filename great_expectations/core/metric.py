@@ -1,3 +1,5 @@
+import hashlib
+import json
 import warnings
 
 from dateutil.parser import parse
@@ -290,3 +292,47 @@ class ValidationMetricIdentifier(MetricIdentifier):
             metric_name=metric_id.metric_name,
             metric_kwargs_id=metric_id.metric_kwargs_id,
         )
+
+
+class ResolvedMetricIdentifier(MetricIdentifier):
+    """A ResolvedMetricIdentifier identifies the value of a metric resolved by an execution engine for the data
+    identified by a batch fingerprint."""
+
+    def __init__(self, batch_fingerprint, metric_name, metric_kwargs_id):
+        super().__init__(metric_name, metric_kwargs_id)
+        self._batch_fingerprint = batch_fingerprint
+
+    @property
+    def batch_fingerprint(self):
+        return self._batch_fingerprint
+
+    @classmethod
+    def from_metric_id(cls, batch_fingerprint, metric_id):
+        """Builds an identifier from the id of a MetricConfiguration, i.e. a tuple of the metric name and of the ids of
+        its domain and value kwargs."""
+        metric_name, metric_domain_kwargs_id, metric_value_kwargs_id = metric_id
+        metric_kwargs_id = hashlib.md5(
+            json.dumps(
+                [metric_domain_kwargs_id, metric_value_kwargs_id], sort_keys=True
+            ).encode("utf-8")
+        ).hexdigest()
+        return cls(batch_fingerprint, metric_name, metric_kwargs_id)
+
+    def to_tuple(self):
+        return tuple([self.batch_fingerprint] + list(super().to_tuple()))
+
+    def to_fixed_length_tuple(self):
+        return self.to_tuple()
+
+    @classmethod
+    def from_tuple(cls, tuple_):
+        if len(tuple_) != 3:
+            raise GreatExpectationsError(
+                "ResolvedMetricIdentifier tuple must have exactly three components."
+            )
+        metric_id = MetricIdentifier.from_tuple(tuple_[-2:])
+        return cls(tuple_[0], metric_id.metric_name, metric_id.metric_kwargs_id)
+
+    @classmethod
+    def from_fixed_length_tuple(cls, tuple_):
+        return cls.from_tuple(tuple_)
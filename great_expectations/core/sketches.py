@@ -0,0 +1,249 @@
+"""Mergeable sketches used to compute approximate column statistics.
+
+Every sketch can be updated with any number of chunks of values and merged with a sketch of the same configuration
+built over other data, so that partial results computed over the pieces of a batch can be combined. Each sketch also
+reports the error bound of its estimates.
+"""
+import math
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_HYPERLOGLOG_PRECISION = 14
+DEFAULT_QUANTILE_SKETCH_CAPACITY = 1024
+DEFAULT_FREQUENT_ITEMS_CAPACITY = 1024
+# The rank error allowed when quantiles are computed approximately by an engine, such as Spark's approxQuantile
+DEFAULT_QUANTILE_RANK_ERROR = 0.01
+
+
+def _to_series(values) -> pd.Series:
+    if isinstance(values, pd.Series):
+        return values.dropna()
+    return pd.Series(values).dropna()
+
+
+class HyperLogLog:
+    """Estimates the number of distinct values seen, with a relative standard error of 1.04 / sqrt(2 ** precision)."""
+
+    def __init__(self, precision: int = DEFAULT_HYPERLOGLOG_PRECISION):
+        if not 4 <= precision <= 18:
+            raise ValueError("precision must be an integer between 4 and 18")
+        self._precision = precision
+        self._registers = np.zeros(1 << precision, dtype=np.uint8)
+
+    @property
+    def precision(self) -> int:
+        return self._precision
+
+    @property
+    def relative_standard_error(self) -> float:
+        return self.get_relative_standard_error(self._precision)
+
+    @staticmethod
+    def get_relative_standard_error(precision: int) -> float:
+        return 1.04 / math.sqrt(1 << precision)
+
+    def update(self, values) -> "HyperLogLog":
+        """Adds the non-null values to the sketch."""
+        values = _to_series(values)
+        if len(values) == 0:
+            return self
+        hashes = pd.util.hash_pandas_object(values, index=False).to_numpy(
+            dtype=np.uint64
+        )
+        remaining_bits = 64 - self._precision
+        register_indices = (hashes >> np.uint64(remaining_bits)).astype(np.int64)
+        remainders = hashes & np.uint64((1 << remaining_bits) - 1)
+        # The rank of a hash is the position of the leftmost 1 among its remaining bits. frexp is only exact up to 53
+        # bits, so the bit length of larger remainders is computed on their top bits.
+        high_bits = remainders >> np.uint64(11)
+        bit_lengths = np.where(
+            high_bits > 0,
+            np.frexp(high_bits.astype(np.float64))[1] + 11,
+            np.frexp(remainders.astype(np.float64))[1],
+        )
+        ranks = (remaining_bits - bit_lengths + 1).astype(np.uint8)
+        np.maximum.at(self._registers, register_indices, ranks)
+        return self
+
+    def merge(self, other: "HyperLogLog") -> "HyperLogLog":
+        """Adds the values seen by the other sketch to this sketch."""
+        if other.precision != self._precision:
+            raise ValueError("Only sketches of the same precision can be merged")
+        np.maximum(self._registers, other._registers, out=self._registers)
+        return self
+
+    def estimate(self) -> int:
+        """Returns the estimated number of distinct values."""
+        m = len(self._registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = (
+            alpha * m * m / np.sum(np.power(2.0, -self._registers.astype(float)))
+        )
+        empty_registers = int(np.count_nonzero(self._registers == 0))
+        if estimate <= 2.5 * m and empty_registers > 0:
+            # Linear counting is more accurate for small cardinalities
+            estimate = m * math.log(m / empty_registers)
+        return int(round(estimate))
+
+
+class QuantileSketch:
+    """Estimates quantiles of numeric values using a hierarchy of compactors, as in the KLL sketch.
+
+    Each level holds at most `capacity` items, which each stand for 2 ** level of the values seen. Compacting a level
+    sorts it and promotes every other item to the next level, which moves the rank of any value by at most the weight
+    of one item of that level; the sketch tracks the sum of these shifts as its rank error.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_QUANTILE_SKETCH_CAPACITY):
+        if capacity < 2:
+            raise ValueError("capacity must be at least 2")
+        self._capacity = capacity
+        self._levels: List[np.ndarray] = [np.empty(0)]
+        self._count = 0
+        self._absolute_rank_error = 0
+        self._compactions = 0
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def rank_error(self) -> float:
+        """The maximum error of the rank of an estimated quantile, as a fraction of the number of values seen."""
+        if self._count == 0:
+            return 0.0
+        return self._absolute_rank_error / self._count
+
+    def update(self, values) -> "QuantileSketch":
+        """Adds the non-null values to the sketch."""
+        values = _to_series(values).to_numpy(dtype=float)
+        self._count += len(values)
+        self._levels[0] = np.concatenate([self._levels[0], values])
+        self._compress()
+        return self
+
+    def merge(self, other: "QuantileSketch") -> "QuantileSketch":
+        """Adds the values seen by the other sketch to this sketch."""
+        if other.capacity != self._capacity:
+            raise ValueError("Only sketches of the same capacity can be merged")
+        for level, items in enumerate(other._levels):
+            if level == len(self._levels):
+                self._levels.append(np.empty(0))
+            self._levels[level] = np.concatenate([self._levels[level], items])
+        self._count += other._count
+        self._absolute_rank_error += other._absolute_rank_error
+        self._compress()
+        return self
+
+    def _compress(self):
+        level = 0
+        while level < len(self._levels):
+            items = self._levels[level]
+            if len(items) > self._capacity:
+                items = np.sort(items)
+                # Only an even number of items can be compacted without changing the total weight
+                kept = items[len(items) - len(items) % 2 :]
+                items = items[: len(items) - len(items) % 2]
+                # Alternating which half is promoted keeps the rank errors from accumulating in one direction
+                promoted = items[self._compactions % 2 :: 2]
+                self._compactions += 1
+                if level + 1 == len(self._levels):
+                    self._levels.append(np.empty(0))
+                self._levels[level + 1] = np.concatenate(
+                    [self._levels[level + 1], promoted]
+                )
+                self._levels[level] = kept
+                self._absolute_rank_error += 1 << level
+            level += 1
+
+    def quantiles(self, quantiles: Iterable[float]) -> List[Optional[float]]:
+        """Returns the estimated values at the given quantiles, or None for each quantile if no values were seen."""
+        quantiles = list(quantiles)
+        if self._count == 0:
+            return [None] * len(quantiles)
+        items = np.concatenate(self._levels)
+        weights = np.concatenate(
+            [
+                np.full(len(level_items), 1 << level)
+                for level, level_items in enumerate(self._levels)
+            ]
+        )
+        order = np.argsort(items, kind="mergesort")
+        items = items[order]
+        cumulative_weights = np.cumsum(weights[order])
+        indices = np.searchsorted(
+            cumulative_weights,
+            [max(quantile * self._count, 1) for quantile in quantiles],
+            side="left",
+        )
+        return [float(items[min(index, len(items) - 1)]) for index in indices]
+
+
+class FrequentItemsSketch:
+    """Estimates the counts of the most frequent values using the Misra-Gries summary.
+
+    At most `capacity` values are tracked. The estimated count of a value is never larger than its actual count, and
+    is smaller by at most `max_error`, which itself never exceeds the number of values seen divided by capacity + 1.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_FREQUENT_ITEMS_CAPACITY):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self._capacity = capacity
+        self._counters: Dict = {}
+        self._count = 0
+        self._max_error = 0
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def max_error(self) -> int:
+        return self._max_error
+
+    def update(self, values) -> "FrequentItemsSketch":
+        """Adds the non-null values to the sketch."""
+        value_counts = _to_series(values).value_counts()
+        self._add_counts(value_counts.to_dict(), int(value_counts.sum()))
+        return self
+
+    def merge(self, other: "FrequentItemsSketch") -> "FrequentItemsSketch":
+        """Adds the values seen by the other sketch to this sketch."""
+        if other.capacity != self._capacity:
+            raise ValueError("Only sketches of the same capacity can be merged")
+        self._max_error += other._max_error
+        self._add_counts(other._counters, other._count)
+        return self
+
+    def _add_counts(self, counts: Dict, count: int):
+        counters = dict(self._counters)
+        for value, value_count in counts.items():
+            counters[value] = counters.get(value, 0) + value_count
+        if len(counters) > self._capacity:
+            # Subtracting the (capacity + 1)-th largest count from every counter leaves at most capacity of them
+            threshold = sorted(counters.values(), reverse=True)[self._capacity]
+            counters = {
+                value: value_count - threshold
+                for value, value_count in counters.items()
+                if value_count > threshold
+            }
+            self._max_error += threshold
+        self._counters = counters
+        self._count += count
+
+    def value_counts(self) -> pd.Series:
+        """Returns the estimated counts of the tracked values, in descending order of count."""
+        series = pd.Series(self._counters, name="count", dtype="int64")
+        series.index.name = "value"
+        return series.sort_values(ascending=False, kind="mergesort")
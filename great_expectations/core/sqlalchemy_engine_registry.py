@@ -0,0 +1,93 @@
+"""A process-wide registry of SQLAlchemy engines.
+
+SqlAlchemyExecutionEngines, SqlAlchemyDatasources and DatabaseStoreBackends that connect to the same database with the
+same create_engine options share one engine, and therefore one connection pool, instead of each opening their own.
+The options include the pool settings, such as pool_size, pool_recycle and pool_pre_ping, so components configured
+with different ones keep distinct engines. Engines remain registered, with their pools, for the lifetime of the
+process, so that building a DataContext again reuses them.
+"""
+import logging
+import threading
+from typing import Dict, Hashable, Optional
+
+logger = logging.getLogger(__name__)
+
+try:
+    import sqlalchemy as sa
+    from sqlalchemy.engine.url import make_url
+except ImportError:
+    sa = None
+    make_url = None
+
+_engines: Dict[Hashable, "sa.engine.Engine"] = {}
+_engines_lock = threading.Lock()
+
+
+def get_sqlalchemy_engine(url, **create_engine_kwargs) -> "sa.engine.Engine":
+    """Returns the engine registered for a database url and create_engine options, creating and registering it if there
+    is none.
+
+    Engines of in-memory sqlite databases are never shared, since each of them holds a distinct database, nor are
+    engines whose options cannot be compared, such as options holding a callable creator.
+
+    Args:
+        url (str or URL): the url of the database, as accepted by sqlalchemy.create_engine
+        **create_engine_kwargs: the options passed to sqlalchemy.create_engine
+
+    Returns:
+        A SQLAlchemy Engine
+    """
+    key = _get_engine_key(url, create_engine_kwargs)
+    if key is None:
+        return sa.create_engine(url, **create_engine_kwargs)
+    with _engines_lock:
+        engine = _engines.get(key)
+        if engine is None:
+            engine = sa.create_engine(url, **create_engine_kwargs)
+            _engines[key] = engine
+        else:
+            logger.debug(f"Reusing the SQLAlchemy engine of {repr(engine.url)}")
+        return engine
+
+
+def dispose_sqlalchemy_engines() -> None:
+    """Closes the connection pools of the registered engines and empties the registry."""
+    with _engines_lock:
+        engines = list(_engines.values())
+        _engines.clear()
+    for engine in engines:
+        engine.dispose()
+
+
+def _get_engine_key(url, create_engine_kwargs: dict) -> Optional[Hashable]:
+    url = make_url(url)
+    if url.get_backend_name() == "sqlite" and (
+        url.database in (None, "", ":memory:") or url.query.get("mode") == "memory"
+    ):
+        return None
+    try:
+        return (
+            url.drivername,
+            url.username,
+            url.password,
+            url.host,
+            url.port,
+            url.database,
+            _freeze(dict(url.query)),
+            _freeze(create_engine_kwargs),
+        )
+    except TypeError:
+        return None
+
+
+def _freeze(value) -> Hashable:
+    """Converts dictionaries and lists, recursively, into tuples that can be hashed and compared. Raises a TypeError
+    for values that cannot be compared, including callables, which may hold state of their own."""
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if callable(value):
+        raise TypeError(f"Unable to compare the callable {value}")
+    hash(value)
+    return value
@@ -1505,10 +1505,21 @@ class BaseDataContext:
         sampling_kwargs: dict = None,
         splitter_method: str = None,
         splitter_kwargs: dict = None,
+        project_columns: bool = False,
+        push_down_row_condition: bool = False,
         **kwargs,
     ) -> Validator:
         """
         This method applies only to the new (V3) Datasource schema.
+
+        If project_columns is True, only the columns referenced by the expectation suite are loaded from files, unless
+        the suite needs all the columns of the batch (see ExpectationSuite.get_referenced_columns). Expectations added
+        to the validator afterwards can then only reference those columns.
+
+        If push_down_row_condition is True and all the expectations of the suite share a row_condition of the pandas
+        or python condition_parser, only the rows satisfying it are loaded, which lets the PandasExecutionEngine skip
+        the row groups of parquet files that cannot satisfy it. Expectations added to the validator afterwards can then
+        only validate those rows.
         """
 
         if (
@@ -1534,6 +1545,37 @@ class BaseDataContext:
                 expectation_suite_name=create_expectation_suite_with_name
             )
 
+        # Directives passed down to the execution engine to load only the data that the suite needs
+        batch_spec_directives = dict()
+        if project_columns:
+            referenced_columns = expectation_suite.get_referenced_columns()
+            if referenced_columns is not None:
+                batch_spec_directives["columns"] = referenced_columns
+        if push_down_row_condition:
+            shared_row_condition = expectation_suite.get_shared_row_condition()
+            if shared_row_condition is not None and shared_row_condition[
+                "condition_parser"
+            ] in ["python", "pandas"]:
+                batch_spec_directives.update(shared_row_condition)
+        if batch_spec_directives:
+            batch_spec_passthrough = {
+                **(batch_spec_passthrough or {}),
+                **batch_spec_directives,
+            }
+            if batch_request is not None:
+                batch_request = BatchRequest(
+                    datasource_name=batch_request.datasource_name,
+                    data_connector_name=batch_request.data_connector_name,
+                    data_asset_name=batch_request.data_asset_name,
+                    partition_request=batch_request.partition_request,
+                    batch_data=batch_request.batch_data,
+                    limit=batch_request.limit,
+                    batch_spec_passthrough={
+                        **(batch_request.batch_spec_passthrough or {}),
+                        **batch_spec_directives,
+                    },
+                )
+
         batch: Batch = cast(
             Batch,
             self.get_batch(
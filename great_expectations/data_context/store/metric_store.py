@@ -1,6 +1,11 @@
+import base64
 import json
+import pickle
 
-from great_expectations.core.metric import ValidationMetricIdentifier
+from great_expectations.core.metric import (
+    ResolvedMetricIdentifier,
+    ValidationMetricIdentifier,
+)
 from great_expectations.core.util import ensure_json_serializable
 from great_expectations.data_context.store.database_store_backend import (
     DatabaseStoreBackend,
@@ -91,3 +96,52 @@ class EvaluationParameterStore(MetricStore):
             key = self.tuple_to_key(k)
             params[key.to_evaluation_parameter_urn()] = self.get(key)
         return params
+
+
+class ResolvedMetricStore(Store):
+    """
+    A ResolvedMetricStore stores the values of metrics resolved by an execution engine, keyed by the fingerprint of the
+    batch they were computed on, so that they can be reused when the same data is validated again.
+
+    Values are pickled, so a ResolvedMetricStore should only be read from a trusted store backend.
+    """
+
+    _key_class = ResolvedMetricIdentifier
+
+    def __init__(self, store_backend=None, store_name=None):
+        if store_backend is not None:
+            store_backend_module_name = store_backend.get(
+                "module_name", "great_expectations.data_context.store"
+            )
+            store_backend_class_name = store_backend.get(
+                "class_name", "InMemoryStoreBackend"
+            )
+            verify_dynamic_loading_support(module_name=store_backend_module_name)
+            store_backend_class = load_class(
+                store_backend_class_name, store_backend_module_name
+            )
+
+            if issubclass(store_backend_class, DatabaseStoreBackend):
+                # Provide defaults for this common case
+                if "table_name" not in store_backend:
+                    store_backend["table_name"] = store_backend.get(
+                        "table_name", "ge_resolved_metrics"
+                    )
+                if "key_columns" not in store_backend:
+                    store_backend["key_columns"] = store_backend.get(
+                        "key_columns",
+                        [
+                            "batch_fingerprint",
+                            "metric_name",
+                            "metric_kwargs_id",
+                        ],
+                    )
+
+        super().__init__(store_backend=store_backend, store_name=store_name)
+
+    def serialize(self, key, value):
+        return base64.b64encode(pickle.dumps(value)).decode("utf-8")
+
+    def deserialize(self, key, value):
+        if value:
+            return pickle.loads(base64.b64decode(value))
@@ -254,60 +254,63 @@ class S3GlobReaderBatchKwargsGenerator(BatchKwargsGenerator):
         }
         directory_assets = asset_config.get("directory_assets", False)
 
-        if "continuation_token" in iterator_dict:
-            query_options.update(
-                {"ContinuationToken": iterator_dict["continuation_token"]}
+        while True:
+            if "continuation_token" in iterator_dict:
+                query_options.update(
+                    {"ContinuationToken": iterator_dict["continuation_token"]}
+                )
+
+            logger.debug(
+                "Fetching objects from S3 with query options: %s" % str(query_options)
             )
+            asset_options = self._s3.list_objects_v2(**query_options)
+            if directory_assets:
+                if "CommonPrefixes" not in asset_options:
+                    raise BatchKwargsError(
+                        "Unable to build batch_kwargs. The asset may not be configured correctly. If directory assets "
+                        "are requested, then common prefixes must be returned.",
+                        {
+                            "asset_configuration": asset_config,
+                            "contents": asset_options["Contents"]
+                            if "Contents" in asset_options
+                            else None,
+                        },
+                    )
+                keys = [item["Prefix"] for item in asset_options["CommonPrefixes"]]
+            else:
+                if "Contents" not in asset_options:
+                    raise BatchKwargsError(
+                        "Unable to build batch_kwargs. The asset may not be configured correctly. If s3 returned common "
+                        "prefixes it may not have been able to identify desired keys, and they are included in the "
+                        "incomplete batch_kwargs object returned with this error.",
+                        {
+                            "asset_configuration": asset_config,
+                            "common_prefixes": asset_options["CommonPrefixes"]
+                            if "CommonPrefixes" in asset_options
+                            else None,
+                        },
+                    )
+                keys = [
+                    item["Key"]
+                    for item in asset_options["Contents"]
+                    if item["Size"] > 0
+                ]
 
-        logger.debug(
-            "Fetching objects from S3 with query options: %s" % str(query_options)
-        )
-        asset_options = self._s3.list_objects_v2(**query_options)
-        if directory_assets:
-            if "CommonPrefixes" not in asset_options:
-                raise BatchKwargsError(
-                    "Unable to build batch_kwargs. The asset may not be configured correctly. If directory assets "
-                    "are requested, then common prefixes must be returned.",
-                    {
-                        "asset_configuration": asset_config,
-                        "contents": asset_options["Contents"]
-                        if "Contents" in asset_options
-                        else None,
-                    },
-                )
-            keys = [item["Prefix"] for item in asset_options["CommonPrefixes"]]
-        else:
-            if "Contents" not in asset_options:
-                raise BatchKwargsError(
-                    "Unable to build batch_kwargs. The asset may not be configured correctly. If s3 returned common "
-                    "prefixes it may not have been able to identify desired keys, and they are included in the "
-                    "incomplete batch_kwargs object returned with this error.",
-                    {
-                        "asset_configuration": asset_config,
-                        "common_prefixes": asset_options["CommonPrefixes"]
-                        if "CommonPrefixes" in asset_options
-                        else None,
-                    },
-                )
             keys = [
-                item["Key"] for item in asset_options["Contents"] if item["Size"] > 0
+                key
+                for key in filter(
+                    lambda x: re.match(asset_config.get("regex_filter", ".*"), x)
+                    is not None,
+                    keys,
+                )
             ]
+            yield from keys
 
-        keys = [
-            key
-            for key in filter(
-                lambda x: re.match(asset_config.get("regex_filter", ".*"), x)
-                is not None,
-                keys,
-            )
-        ]
-        yield from keys
-
-        if asset_options["IsTruncated"]:
+            if not asset_options["IsTruncated"]:
+                break
             iterator_dict["continuation_token"] = asset_options["NextContinuationToken"]
-            # Recursively fetch more
-            yield from self._get_asset_options(asset_config, iterator_dict)
-        elif "continuation_token" in iterator_dict:
+
+        if "continuation_token" in iterator_dict:
             # Make sure we clear the token once we've gotten fully through
             del iterator_dict["continuation_token"]
 
@@ -0,0 +1,183 @@
+import logging
+from collections import defaultdict
+from typing import Any, Dict, Hashable, Iterator, List, Optional, Tuple
+
+import great_expectations.exceptions as ge_exceptions
+from great_expectations.core.batch import BatchDefinition, BatchRequest
+from great_expectations.datasource.data_connector.sorter import Sorter
+from great_expectations.datasource.data_connector.util import (
+    batch_definition_matches_batch_request,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class BatchDefinitionIndex:
+    """
+    Indexes the batch_definitions of a DataConnector by data_asset_name and by partition_definition key/value pairs,
+    so that the batch_definitions matching a BatchRequest are found without scanning all of them.
+
+    The batch_definitions are returned in the order in which they were indexed.  When sorters are given, the order of
+    the batch_definitions of each data_asset is computed once, the first time it is needed, so that any subset of them
+    is sorted without calling the sorters again.
+    """
+
+    def __init__(
+        self,
+        batch_definition_list: List[BatchDefinition],
+        sorters: Optional[Dict[str, Sorter]] = None,
+    ):
+        self._batch_definition_list = batch_definition_list
+        self._sorters = sorters or {}
+        self._positions: Dict[int, int] = {}
+        self._positions_by_data_asset_name: Dict[str, List[int]] = defaultdict(list)
+        self._positions_by_partition: Dict[
+            Tuple[str, Hashable], List[int]
+        ] = defaultdict(list)
+        self._unhashable_positions: List[int] = []
+        self._sort_ranks_by_data_asset_name: Dict[str, Optional[Dict[int, int]]] = {}
+
+        for position, batch_definition in enumerate(batch_definition_list):
+            self._positions[id(batch_definition)] = position
+            self._positions_by_data_asset_name[
+                batch_definition.data_asset_name
+            ].append(position)
+            for key, value in batch_definition.partition_definition.items():
+                try:
+                    self._positions_by_partition[(key, value)].append(position)
+                except TypeError:
+                    self._unhashable_positions.append(position)
+
+    def __len__(self) -> int:
+        return len(self._batch_definition_list)
+
+    def get_batch_definition_list(
+        self, batch_request: BatchRequest
+    ) -> List[BatchDefinition]:
+        """
+        Returns the batch_definitions that match batch_request (see batch_definition_matches_batch_request).
+        """
+        candidate_positions: Optional[List[int]] = None
+        if batch_request.data_asset_name:
+            candidate_positions = self._positions_by_data_asset_name.get(
+                batch_request.data_asset_name, []
+            )
+
+        partition_identifiers: Any = None
+        if batch_request.partition_request:
+            partition_identifiers = batch_request.partition_request.get(
+                "partition_identifiers"
+            )
+        if partition_identifiers and isinstance(partition_identifiers, dict):
+            for key, value in partition_identifiers.items():
+                try:
+                    positions: List[int] = self._positions_by_partition.get(
+                        (key, value), []
+                    )
+                except TypeError:
+                    # Unhashable values can only be compared one batch_definition at a time.
+                    candidate_positions = None
+                    break
+                if self._unhashable_positions:
+                    positions = sorted(
+                        set(positions) | set(self._unhashable_positions)
+                    )
+                candidate_positions = (
+                    positions
+                    if candidate_positions is None
+                    else _intersect(candidate_positions, positions)
+                )
+                if not candidate_positions:
+                    return []
+
+        batch_definitions: Iterator[BatchDefinition] = (
+            iter(self._batch_definition_list)
+            if candidate_positions is None
+            else (
+                self._batch_definition_list[position]
+                for position in candidate_positions
+            )
+        )
+        return [
+            batch_definition
+            for batch_definition in batch_definitions
+            if batch_definition_matches_batch_request(
+                batch_definition=batch_definition, batch_request=batch_request
+            )
+        ]
+
+    def sort(
+        self, batch_definition_list: List[BatchDefinition]
+    ) -> List[BatchDefinition]:
+        """
+        Sorts batch_definitions of this index as the sorters would, ordering those of a data_asset by their rank among
+        all the batch_definitions of that data_asset.
+        """
+        if not self._sorters:
+            return batch_definition_list
+        data_asset_names: set = {
+            batch_definition.data_asset_name
+            for batch_definition in batch_definition_list
+        }
+        if len(data_asset_names) == 1:
+            sort_ranks: Optional[Dict[int, int]] = self._get_sort_ranks(
+                data_asset_name=data_asset_names.pop()
+            )
+            if sort_ranks is not None:
+                return sorted(
+                    batch_definition_list,
+                    key=lambda batch_definition: sort_ranks[
+                        self._positions[id(batch_definition)]
+                    ],
+                )
+        return _sort_batch_definition_list(
+            batch_definition_list=batch_definition_list, sorters=self._sorters
+        )
+
+    def _get_sort_ranks(self, data_asset_name: str) -> Optional[Dict[int, int]]:
+        if data_asset_name not in self._sort_ranks_by_data_asset_name:
+            positions: List[int] = self._positions_by_data_asset_name.get(
+                data_asset_name, []
+            )
+            sort_ranks: Optional[Dict[int, int]]
+            try:
+                sorted_batch_definition_list: List[
+                    BatchDefinition
+                ] = _sort_batch_definition_list(
+                    batch_definition_list=[
+                        self._batch_definition_list[position]
+                        for position in positions
+                    ],
+                    sorters=self._sorters,
+                )
+                sort_ranks = {
+                    self._positions[id(batch_definition)]: rank
+                    for rank, batch_definition in enumerate(
+                        sorted_batch_definition_list
+                    )
+                }
+            except (ge_exceptions.SorterError, TypeError, ValueError) as e:
+                # Some batch_definitions of the data_asset cannot be sorted; subsets without them still can be.
+                logger.debug(
+                    f'Unable to index the order of data_asset "{data_asset_name}": {e}'
+                )
+                sort_ranks = None
+            self._sort_ranks_by_data_asset_name[data_asset_name] = sort_ranks
+        return self._sort_ranks_by_data_asset_name[data_asset_name]
+
+
+def _sort_batch_definition_list(
+    batch_definition_list: List[BatchDefinition], sorters: Dict[str, Sorter]
+) -> List[BatchDefinition]:
+    for sorter in reversed(list(sorters.values())):
+        batch_definition_list = sorter.get_sorted_batch_definitions(
+            batch_definitions=batch_definition_list
+        )
+    return batch_definition_list
+
+
+def _intersect(positions: List[int], other_positions: List[int]) -> List[int]:
+    if len(other_positions) < len(positions):
+        positions, other_positions = other_positions, positions
+    other_position_set: set = set(other_positions)
+    return [position for position in positions if position in other_position_set]
@@ -38,6 +38,7 @@ class ConfiguredAssetFilePathDataConnector(FilePathDataConnector):
         execution_engine: Optional[ExecutionEngine] = None,
         default_regex: Optional[dict] = None,
         sorters: Optional[list] = None,
+        data_references_cache_ttl: Optional[float] = None,
     ):
         """
         Base class for DataConnectors that connect to filesystem-like data by taking in
@@ -51,6 +52,8 @@ class ConfiguredAssetFilePathDataConnector(FilePathDataConnector):
             execution_engine (ExecutionEngine): Execution Engine object to actually read the data
             default_regex (dict): Optional dict the filter and organize the data_references.
             sorters (list): Optional list if you want to sort the data_references
+            data_references_cache_ttl (float): Optional number of seconds after which the cached data_references of
+                an asset are updated
         """
         logger.debug(f'Constructing ConfiguredAssetFilePathDataConnector "{name}".')
         super().__init__(
@@ -59,6 +62,7 @@ class ConfiguredAssetFilePathDataConnector(FilePathDataConnector):
             execution_engine=execution_engine,
             default_regex=default_regex,
             sorters=sorters,
+            data_references_cache_ttl=data_references_cache_ttl,
         )
 
         if assets is None:
@@ -113,21 +117,49 @@ class ConfiguredAssetFilePathDataConnector(FilePathDataConnector):
         # Map data_references to batch_definitions
         self._data_references_cache = {}
 
-        for data_asset_name in self.get_available_data_asset_names():
-            self._data_references_cache[data_asset_name] = {}
-
-            for data_reference in self._get_data_reference_list(
-                data_asset_name=data_asset_name
-            ):
-                mapped_batch_definition_list: List[
-                    BatchDefinition
-                ] = self._map_data_reference_to_batch_definition_list(
-                    data_reference=data_reference,
-                    data_asset_name=data_asset_name,
+        self._update_data_references_cache()
+
+    def _update_data_references_cache(
+        self, data_asset_name: Optional[str] = None
+    ) -> Optional[str]:
+        """
+        Lists the data_references of data_asset_name (of all assets if it is None) and maps the ones that are not
+        cached yet to batch_definitions; only the requested asset is listed.
+        """
+        if self._data_references_cache is None:
+            self._data_references_cache = {}
+
+        data_asset_names: List[str] = self.get_available_data_asset_names()
+        if data_asset_name is not None:
+            data_asset_names = [
+                name for name in data_asset_names if name == data_asset_name
+            ]
+
+        for name in data_asset_names:
+            data_reference_sub_cache: Optional[dict] = self._data_references_cache.get(
+                name
+            )
+            data_reference_list: Optional[List[str]]
+            if data_reference_sub_cache is None:
+                data_reference_list = self._get_data_reference_list(
+                    data_asset_name=name
                 )
-                self._data_references_cache[data_asset_name][
-                    data_reference
-                ] = mapped_batch_definition_list
+            else:
+                data_reference_list = self._get_updated_data_reference_list(
+                    data_asset_name=name,
+                    cached_data_reference_list=list(data_reference_sub_cache.keys()),
+                )
+                if data_reference_list is None:
+                    continue
+            self._data_references_cache[
+                name
+            ] = self._map_data_reference_list_to_batch_definition_lists(
+                data_reference_list=data_reference_list,
+                data_asset_name=name,
+                data_reference_sub_cache=data_reference_sub_cache,
+            )
+
+        return data_asset_name
 
     def _get_data_reference_list(
         self, data_asset_name: Optional[str] = None
@@ -1,12 +1,13 @@
 import logging
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from great_expectations.datasource.data_connector import (
     ConfiguredAssetFilePathDataConnector,
 )
 from great_expectations.datasource.data_connector.asset import Asset
 from great_expectations.datasource.data_connector.util import (
+    get_filesystem_directory_mtime,
     get_filesystem_one_level_directory_glob_path_list,
     normalize_directory_path,
 )
@@ -37,6 +38,7 @@ class ConfiguredAssetFilesystemDataConnector(ConfiguredAssetFilePathDataConnecto
         default_regex: Optional[dict] = None,
         glob_directive: str = "**/*",
         sorters: Optional[list] = None,
+        data_references_cache_ttl: Optional[float] = None,
     ):
         """
         Base class for DataConnectors that connect to data on a filesystem. This class supports the configuration of default_regex
@@ -50,6 +52,9 @@ class ConfiguredAssetFilesystemDataConnector(ConfiguredAssetFilePathDataConnecto
             default_regex (dict): Optional dict the filter and organize the data_references.
             glob_directive (str): glob for selecting files in directory (defaults to *)
             sorters (list): Optional list if you want to sort the data_references
+            data_references_cache_ttl (float): Optional number of seconds after which the cached data_references of
+                an asset are updated; the directory of an asset whose glob_directive does not descend into
+                subdirectories is only listed again if it was modified
 
         """
         logger.debug(f'Constructing ConfiguredAssetFilesystemDataConnector "{name}".')
@@ -61,12 +66,60 @@ class ConfiguredAssetFilesystemDataConnector(ConfiguredAssetFilePathDataConnecto
             execution_engine=execution_engine,
             default_regex=default_regex,
             sorters=sorters,
+            data_references_cache_ttl=data_references_cache_ttl,
         )
 
         self._base_directory = base_directory
         self._glob_directive = glob_directive
+        self._listed_directory_mtimes: Dict[Tuple[str, str], Optional[int]] = {}
 
     def _get_data_reference_list_for_asset(self, asset: Optional[Asset]) -> List[str]:
+        base_directory: str
+        glob_directive: str
+        base_directory, glob_directive = self._get_directory_and_glob_directive(
+            asset=asset
+        )
+
+        # The modification time is read first, so that files added while listing are found by the next update.
+        self._listed_directory_mtimes[
+            (base_directory, glob_directive)
+        ] = get_filesystem_directory_mtime(
+            base_directory_path=base_directory, glob_directive=glob_directive
+        )
+        path_list: List[str] = get_filesystem_one_level_directory_glob_path_list(
+            base_directory_path=base_directory,
+            glob_directive=glob_directive,
+            regex_pattern=self._get_regex_config(
+                data_asset_name=None if asset is None else asset.name
+            ).get("pattern"),
+        )
+
+        return sorted(path_list)
+
+    def _get_updated_data_reference_list(
+        self, data_asset_name: Optional[str], cached_data_reference_list: List[str]
+    ) -> Optional[List[str]]:
+        base_directory: str
+        glob_directive: str
+        base_directory, glob_directive = self._get_directory_and_glob_directive(
+            asset=self._get_asset(data_asset_name=data_asset_name)
+        )
+        listed_directory_mtime: Optional[int] = self._listed_directory_mtimes.get(
+            (base_directory, glob_directive)
+        )
+        if (
+            listed_directory_mtime is not None
+            and get_filesystem_directory_mtime(
+                base_directory_path=base_directory, glob_directive=glob_directive
+            )
+            == listed_directory_mtime
+        ):
+            return None
+        return self._get_data_reference_list(data_asset_name=data_asset_name)
+
+    def _get_directory_and_glob_directive(
+        self, asset: Optional[Asset]
+    ) -> Tuple[str, str]:
         base_directory: str = self.base_directory
         glob_directive: str = self._glob_directive
 
@@ -78,11 +131,7 @@ class ConfiguredAssetFilesystemDataConnector(ConfiguredAssetFilePathDataConnecto
             if asset.glob_directive:
                 glob_directive = asset.glob_directive
 
-        path_list: List[str] = get_filesystem_one_level_directory_glob_path_list(
-            base_directory_path=base_directory, glob_directive=glob_directive
-        )
-
-        return sorted(path_list)
+        return base_directory, glob_directive
 
     def _get_full_file_path_for_asset(
         self, path: str, asset: Optional[Asset] = None
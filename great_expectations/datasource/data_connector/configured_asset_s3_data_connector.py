@@ -46,6 +46,7 @@ class ConfiguredAssetS3DataConnector(ConfiguredAssetFilePathDataConnector):
         delimiter: str = "/",
         max_keys: int = 1000,
         boto3_options: dict = None,
+        data_references_cache_ttl: Optional[float] = None,
     ):
         """
         ConfiguredAssetDataConnector for connecting to S3.
@@ -62,6 +63,8 @@ class ConfiguredAssetS3DataConnector(ConfiguredAssetFilePathDataConnector):
             delimiter (str): S3 delimiter
             max_keys (int): S3 max_keys (default is 1000)
             boto3_options (dict): optional boto3 options
+            data_references_cache_ttl (float): optional number of seconds after which the cached data_references of
+                an asset are updated, by listing the keys that follow its last cached key
         """
         logger.debug(f'Constructing ConfiguredAssetS3DataConnector "{name}".')
 
@@ -72,6 +75,7 @@ class ConfiguredAssetS3DataConnector(ConfiguredAssetFilePathDataConnector):
             assets=assets,
             default_regex=default_regex,
             sorters=sorters,
+            data_references_cache_ttl=data_references_cache_ttl,
         )
         self._bucket = bucket
         self._prefix = os.path.join(prefix, "")
@@ -88,7 +92,9 @@ class ConfiguredAssetS3DataConnector(ConfiguredAssetFilePathDataConnector):
                 "Unable to load boto3 (it is required for ConfiguredAssetS3DataConnector)."
             )
 
-    def _get_data_reference_list_for_asset(self, asset: Optional[Asset]) -> List[str]:
+    def _get_data_reference_list_for_asset(
+        self, asset: Optional[Asset], start_after: Optional[str] = None
+    ) -> List[str]:
         query_options: dict = {
             "Bucket": self._bucket,
             "Prefix": self._prefix,
@@ -104,17 +110,47 @@ class ConfiguredAssetS3DataConnector(ConfiguredAssetFilePathDataConnector):
                 query_options["Delimiter"] = asset.delimiter
             if asset.max_keys:
                 query_options["MaxKeys"] = asset.max_keys
+        if start_after is not None:
+            query_options["StartAfter"] = start_after
 
-        path_list: List[str] = [
+        try:
+            path_list: List[str] = [
+                key
+                for key in list_s3_keys(
+                    s3=self._s3,
+                    query_options=query_options,
+                    iterator_dict={},
+                    recursive=False,
+                )
+            ]
+        except ValueError:
+            if start_after is None:
+                raise
+            # Nothing follows start_after.
+            path_list = []
+        return path_list
+
+    def _get_updated_data_reference_list(
+        self, data_asset_name: Optional[str], cached_data_reference_list: List[str]
+    ) -> Optional[List[str]]:
+        """
+        Lists only the keys that follow the last cached key, in the lexicographic order in which S3 lists keys; keys
+        deleted, or added before the last cached key, are only found when the cache is refreshed as a whole.
+        """
+        if not cached_data_reference_list:
+            return self._get_data_reference_list(data_asset_name=data_asset_name)
+        start_after: str = max(cached_data_reference_list)
+        new_path_list: List[str] = [
             key
-            for key in list_s3_keys(
-                s3=self._s3,
-                query_options=query_options,
-                iterator_dict={},
-                recursive=False,
+            for key in self._get_data_reference_list_for_asset(
+                asset=self._get_asset(data_asset_name=data_asset_name),
+                start_after=start_after,
             )
+            if key > start_after
         ]
-        return path_list
+        if not new_path_list:
+            return None
+        return cached_data_reference_list + new_path_list
 
     def _get_full_file_path(
         self,
@@ -27,6 +27,8 @@ class ConfiguredAssetSqlDataConnector(DataConnector):
         datasource_name (str): The name of the Datasource that contains it
         execution_engine (ExecutionEngine): An ExecutionEngine
         data_assets (str): data_assets
+        data_references_cache_ttl (float): Optional number of seconds after which the partitions of a data_asset
+            are queried again
     """
 
     def __init__(
@@ -35,6 +37,7 @@ class ConfiguredAssetSqlDataConnector(DataConnector):
         datasource_name: str,
         execution_engine: Optional[ExecutionEngine] = None,
         data_assets: Optional[Dict[str, Asset]] = None,
+        data_references_cache_ttl: Optional[float] = None,
     ):
         self._data_assets = data_assets
 
@@ -42,6 +45,7 @@ class ConfiguredAssetSqlDataConnector(DataConnector):
             name=name,
             datasource_name=datasource_name,
             execution_engine=execution_engine,
+            data_references_cache_ttl=data_references_cache_ttl,
         )
 
     @property
@@ -91,17 +95,36 @@ class ConfiguredAssetSqlDataConnector(DataConnector):
         self._data_references_cache = {}
 
         for data_asset_name in self.data_assets:
-            data_asset = self.data_assets[data_asset_name]
-            partition_definition_list = (
-                self._get_partition_definition_list_from_data_asset_config(
-                    data_asset_name,
-                    data_asset,
-                )
+            self._refresh_data_asset_partitions(data_asset_name=data_asset_name)
+
+    def _update_data_references_cache(
+        self, data_asset_name: Optional[str] = None
+    ) -> Optional[str]:
+        """
+        Queries the partitions of data_asset_name only, rather than those of all data_assets.
+        """
+        if data_asset_name is None:
+            self._refresh_data_references_cache()
+            return None
+
+        if self._data_references_cache is None:
+            self._data_references_cache = {}
+        if data_asset_name in self.data_assets:
+            self._refresh_data_asset_partitions(data_asset_name=data_asset_name)
+        return data_asset_name
+
+    def _refresh_data_asset_partitions(self, data_asset_name: str):
+        data_asset = self.data_assets[data_asset_name]
+        partition_definition_list = (
+            self._get_partition_definition_list_from_data_asset_config(
+                data_asset_name,
+                data_asset,
             )
+        )
 
-            # TODO Abe 20201029 : Apply sorters to partition_definition_list here
-            # TODO Will 20201102 : add sorting code here
-            self._data_references_cache[data_asset_name] = partition_definition_list
+        # TODO Abe 20201029 : Apply sorters to partition_definition_list here
+        # TODO Will 20201102 : add sorting code here
+        self._data_references_cache[data_asset_name] = partition_definition_list
 
     def _get_column_names_from_splitter_kwargs(self, splitter_kwargs) -> List[str]:
         column_names: List[str] = []
@@ -139,8 +162,9 @@ class ConfiguredAssetSqlDataConnector(DataConnector):
     def get_batch_definition_list_from_batch_request(self, batch_request):
         self._validate_batch_request(batch_request=batch_request)
 
-        if self._data_references_cache is None:
-            self._refresh_data_references_cache()
+        self._refresh_data_references_cache_if_expired(
+            data_asset_name=batch_request.data_asset_name
+        )
 
         batch_definition_list = []
 
@@ -1,6 +1,7 @@
 import logging
 import random
-from typing import Any, List, Optional, Tuple
+import time
+from typing import Any, Dict, List, Optional, Tuple
 
 from great_expectations.core.batch import BatchDefinition, BatchMarkers, BatchRequest
 from great_expectations.core.id_dict import BatchSpec
@@ -36,6 +37,7 @@ class DataConnector:
         name: str,
         datasource_name: str,
         execution_engine: Optional[ExecutionEngine] = None,
+        data_references_cache_ttl: Optional[float] = None,
     ):
         """
         Base class for DataConnectors
@@ -44,6 +46,8 @@ class DataConnector:
             name (str): required name for DataConnector
             datasource_name (str): required name for datasource
             execution_engine (ExecutionEngine): optional reference to ExecutionEngine
+            data_references_cache_ttl (float): optional number of seconds after which the data_references cached for
+                a data_asset are brought up to date when they are requested again; if None, they are listed only once
 
         """
         self._name = name
@@ -53,6 +57,11 @@ class DataConnector:
         # This is a dictionary which maps data_references onto batch_requests.
         self._data_references_cache = None
 
+        self._data_references_cache_ttl = data_references_cache_ttl
+        # Times at which the data_references of each data_asset (of all of them for the key None) were last listed.
+        self._data_references_cache_refresh_times: Dict[Optional[str], float] = {}
+        self._timed_data_references_cache = None
+
         self._data_context_root_directory = None
 
     @property
@@ -63,6 +72,10 @@ class DataConnector:
     def datasource_name(self) -> str:
         return self._datasource_name
 
+    @property
+    def data_references_cache_ttl(self) -> Optional[float]:
+        return self._data_references_cache_ttl
+
     @property
     def data_context_root_directory(self) -> str:
         return self._data_context_root_directory
@@ -119,6 +132,64 @@ class DataConnector:
     ):
         raise NotImplementedError
 
+    def _update_data_references_cache(
+        self, data_asset_name: Optional[str] = None
+    ) -> Optional[str]:
+        """
+        Brings the cached data_references of data_asset_name (of all data_assets if it is None) up to date, reusing
+        what is already cached where the underlying data store allows it.  By default, the whole cache is rebuilt.
+
+        Args:
+            data_asset_name (str): optional data_asset_name whose data_references are requested
+
+        Returns:
+            the data_asset_name whose data_references were updated, or None if those of all data_assets were
+        """
+        self._refresh_data_references_cache()
+        return None
+
+    def _refresh_data_references_cache_if_expired(
+        self, data_asset_name: Optional[str] = None
+    ) -> bool:
+        """
+        Updates the cached data_references of data_asset_name (of all data_assets if it is None) if they have not been
+        listed yet, or if they were listed more than data_references_cache_ttl seconds ago.
+
+        Args:
+            data_asset_name (str): optional data_asset_name whose data_references are requested
+
+        Returns:
+            True if the cache was updated
+        """
+        now: float = time.monotonic()
+        if self._data_references_cache is not self._timed_data_references_cache:
+            # The cache was rebuilt as a whole (or dropped) by _refresh_data_references_cache.
+            self._data_references_cache_refresh_times = (
+                {} if self._data_references_cache is None else {None: now}
+            )
+            self._timed_data_references_cache = self._data_references_cache
+
+        refresh_times: List[float] = [
+            self._data_references_cache_refresh_times[key]
+            for key in {None, data_asset_name}
+            if key in self._data_references_cache_refresh_times
+        ]
+        if refresh_times and (
+            self._data_references_cache_ttl is None
+            or now - max(refresh_times) < self._data_references_cache_ttl
+        ):
+            return False
+
+        updated_data_asset_name: Optional[str] = self._update_data_references_cache(
+            data_asset_name=data_asset_name
+        )
+        if updated_data_asset_name is None:
+            self._data_references_cache_refresh_times = {None: now}
+        else:
+            self._data_references_cache_refresh_times[updated_data_asset_name] = now
+        self._timed_data_references_cache = self._data_references_cache
+        return True
+
     def _get_data_reference_list(
         self, data_asset_name: Optional[str] = None
     ) -> List[str]:
@@ -192,8 +263,7 @@ class DataConnector:
             max_examples (int): how many data_references should be printed?
 
         """
-        if self._data_references_cache is None:
-            self._refresh_data_references_cache()
+        self._refresh_data_references_cache_if_expired()
 
         if pretty_print:
             print("\t" + self.name, ":", self.__class__.__name__)
@@ -1,8 +1,12 @@
 import logging
-from typing import Iterator, List, Optional
+import re
+from typing import Dict, Iterator, List, Optional, Pattern
 
 import great_expectations.exceptions as ge_exceptions
 from great_expectations.core.batch import BatchDefinition, BatchRequest
+from great_expectations.datasource.data_connector.batch_definition_index import (
+    BatchDefinitionIndex,
+)
 from great_expectations.datasource.data_connector.data_connector import DataConnector
 from great_expectations.datasource.data_connector.partition_query import (
     PartitionQuery,
@@ -10,7 +14,6 @@ from great_expectations.datasource.data_connector.partition_query import (
 )
 from great_expectations.datasource.data_connector.sorter import Sorter
 from great_expectations.datasource.data_connector.util import (
-    batch_definition_matches_batch_request,
     build_sorters_from_config,
     map_batch_definition_to_data_reference_string_using_regex,
     map_data_reference_string_to_batch_definition_list_using_regex,
@@ -38,6 +41,7 @@ class FilePathDataConnector(DataConnector):
         execution_engine: Optional[ExecutionEngine] = None,
         default_regex: Optional[dict] = None,
         sorters: Optional[list] = None,
+        data_references_cache_ttl: Optional[float] = None,
     ):
         """
         Base class for DataConnectors that connect to filesystem-like data. This class supports the configuration of default_regex
@@ -49,6 +53,7 @@ class FilePathDataConnector(DataConnector):
             execution_engine (ExecutionEngine): Execution Engine object to actually read the data
             default_regex (dict): Optional dict the filter and organize the data_references.
             sorters (list): Optional list if you want to sort the data_references
+            data_references_cache_ttl (float): Optional number of seconds after which cached data_references are updated
         """
         logger.debug(f'Constructing FilePathDataConnector "{name}".')
 
@@ -56,6 +61,7 @@ class FilePathDataConnector(DataConnector):
             name=name,
             datasource_name=datasource_name,
             execution_engine=execution_engine,
+            data_references_cache_ttl=data_references_cache_ttl,
         )
 
         if default_regex is None:
@@ -65,6 +71,9 @@ class FilePathDataConnector(DataConnector):
         self._sorters = build_sorters_from_config(config_list=sorters)
         self._validate_sorters_configuration()
 
+        self._batch_definition_index: Optional[BatchDefinitionIndex] = None
+        self._batch_definition_index_cache = None
+
     @property
     def sorters(self) -> Optional[dict]:
         return self._sorters
@@ -112,6 +121,9 @@ class FilePathDataConnector(DataConnector):
             - if batch_request also has a partition_query, then select batch_definitions that match partition_query.
             - if data_connector has sorters configured, then sort the batch_definition list before returning.
 
+        The batch_definitions are looked up in an index of the data references cache (see BatchDefinitionIndex),
+        which is rebuilt when the cache is refreshed.
+
         Args:
             batch_request (BatchRequest): BatchRequest to process
 
@@ -121,16 +133,17 @@ class FilePathDataConnector(DataConnector):
         """
         self._validate_batch_request(batch_request=batch_request)
 
-        if self._data_references_cache is None:
-            self._refresh_data_references_cache()
+        self._refresh_data_references_cache_if_expired(
+            data_asset_name=batch_request.data_asset_name
+        )
 
-        batch_definition_list: List[BatchDefinition] = list(
-            filter(
-                lambda batch_definition: batch_definition_matches_batch_request(
-                    batch_definition=batch_definition, batch_request=batch_request
-                ),
-                self._get_batch_definition_list_from_cache(),
-            )
+        batch_definition_index: BatchDefinitionIndex = (
+            self._get_batch_definition_index()
+        )
+        batch_definition_list: List[
+            BatchDefinition
+        ] = batch_definition_index.get_batch_definition_list(
+            batch_request=batch_request
         )
 
         if batch_request.partition_request is not None:
@@ -142,13 +155,85 @@ class FilePathDataConnector(DataConnector):
             )
 
         if len(self.sorters) > 0:
-            sorted_batch_definition_list = self._sort_batch_definition_list(
+            sorted_batch_definition_list = batch_definition_index.sort(
                 batch_definition_list=batch_definition_list
             )
             return sorted_batch_definition_list
         else:
             return batch_definition_list
 
+    def _refresh_data_references_cache_if_expired(
+        self, data_asset_name: Optional[str] = None
+    ) -> bool:
+        refreshed: bool = super()._refresh_data_references_cache_if_expired(
+            data_asset_name=data_asset_name
+        )
+        if refreshed:
+            self._batch_definition_index = None
+        return refreshed
+
+    def _get_updated_data_reference_list(
+        self, data_asset_name: Optional[str], cached_data_reference_list: List[str]
+    ) -> Optional[List[str]]:
+        """
+        Lists the data_references of data_asset_name again, knowing those that were cached.
+
+        Subclasses only list what may have changed since cached_data_reference_list was listed, where the underlying
+        data store allows it.
+
+        Returns:
+            the list of data_references, or None if it is known not to have changed
+        """
+        return self._get_data_reference_list(data_asset_name=data_asset_name)
+
+    def _map_data_reference_list_to_batch_definition_lists(
+        self,
+        data_reference_list: List[str],
+        data_asset_name: Optional[str] = None,
+        data_reference_sub_cache: Optional[dict] = None,
+    ) -> Dict[str, Optional[List[BatchDefinition]]]:
+        """
+        Maps data_references onto batch_definitions, reusing the mappings found in data_reference_sub_cache.
+
+        The regex of data_asset_name is looked up and compiled once for all data_references.
+        """
+        if not data_reference_list:
+            return {}
+        if data_reference_sub_cache is None:
+            data_reference_sub_cache = {}
+        regex_config: dict = self._get_regex_config(data_asset_name=data_asset_name)
+        regex_pattern: Pattern = re.compile(regex_config["pattern"])
+        group_names: List[str] = regex_config["group_names"]
+        return {
+            data_reference: data_reference_sub_cache[data_reference]
+            if data_reference in data_reference_sub_cache
+            else map_data_reference_string_to_batch_definition_list_using_regex(
+                datasource_name=self.datasource_name,
+                data_connector_name=self.name,
+                data_asset_name=data_asset_name,
+                data_reference=data_reference,
+                regex_pattern=regex_pattern,
+                group_names=group_names,
+            )
+            for data_reference in data_reference_list
+        }
+
+    def _get_batch_definition_index(self) -> BatchDefinitionIndex:
+        """
+        Returns the index of the batch_definitions in the data references cache, building it if the cache has been
+        refreshed since the index was last built.
+        """
+        if (
+            self._batch_definition_index is None
+            or self._batch_definition_index_cache is not self._data_references_cache
+        ):
+            self._batch_definition_index = BatchDefinitionIndex(
+                batch_definition_list=self._get_batch_definition_list_from_cache(),
+                sorters=self.sorters,
+            )
+            self._batch_definition_index_cache = self._data_references_cache
+        return self._batch_definition_index
+
     def _sort_batch_definition_list(
         self, batch_definition_list: List[BatchDefinition]
     ) -> List[BatchDefinition]:
@@ -30,6 +30,7 @@ class InferredAssetFilePathDataConnector(FilePathDataConnector):
         execution_engine: Optional[ExecutionEngine] = None,
         default_regex: Optional[dict] = None,
         sorters: Optional[list] = None,
+        data_references_cache_ttl: Optional[float] = None,
     ):
         """
         Base class for DataConnectors that connect to filesystem-like data. This class supports the configuration of default_regex
@@ -41,6 +42,7 @@ class InferredAssetFilePathDataConnector(FilePathDataConnector):
             execution_engine (ExecutionEngine): ExecutionEngine object to actually read the data
             default_regex (dict): Optional dict the filter and organize the data_references.
             sorters (list): Optional list if you want to sort the data_references
+            data_references_cache_ttl (float): Optional number of seconds after which cached data_references are updated
         """
         logger.debug(f'Constructing InferredAssetFilePathDataConnector "{name}".')
 
@@ -50,6 +52,7 @@ class InferredAssetFilePathDataConnector(FilePathDataConnector):
             execution_engine=execution_engine,
             default_regex=default_regex,
             sorters=sorters,
+            data_references_cache_ttl=data_references_cache_ttl,
         )
 
     def _refresh_data_references_cache(self):
@@ -65,6 +68,32 @@ class InferredAssetFilePathDataConnector(FilePathDataConnector):
             )
             self._data_references_cache[data_reference] = mapped_batch_definition_list
 
+    def _update_data_references_cache(
+        self, data_asset_name: Optional[str] = None
+    ) -> Optional[str]:
+        """
+        Lists the data_references again and maps the ones that are not cached yet to batch_definitions.  Data assets are
+        inferred from the data_references, so all of them are updated.
+        """
+        if self._data_references_cache is None:
+            self._refresh_data_references_cache()
+            return None
+
+        data_reference_list: Optional[
+            List[str]
+        ] = self._get_updated_data_reference_list(
+            data_asset_name=None,
+            cached_data_reference_list=list(self._data_references_cache.keys()),
+        )
+        if data_reference_list is not None:
+            self._data_references_cache = (
+                self._map_data_reference_list_to_batch_definition_lists(
+                    data_reference_list=data_reference_list,
+                    data_reference_sub_cache=self._data_references_cache,
+                )
+            )
+        return None
+
     def get_data_reference_list_count(self) -> int:
         """
         Returns the list of data_references known by this DataConnector by looping over all data_asset_names in
@@ -102,8 +131,7 @@ class InferredAssetFilePathDataConnector(FilePathDataConnector):
         Returns:
             A list of available names
         """
-        if self._data_references_cache is None:
-            self._refresh_data_references_cache()
+        self._refresh_data_references_cache_if_expired()
 
         # This will fetch ALL batch_definitions in the cache
         batch_definition_list: List[
@@ -7,6 +7,7 @@ from great_expectations.datasource.data_connector import (
     InferredAssetFilePathDataConnector,
 )
 from great_expectations.datasource.data_connector.util import (
+    get_filesystem_directory_mtime,
     get_filesystem_one_level_directory_glob_path_list,
     normalize_directory_path,
 )
@@ -39,6 +40,7 @@ class InferredAssetFilesystemDataConnector(InferredAssetFilePathDataConnector):
         glob_directive: str = "*",
         sorters: Optional[list] = None,
         batch_spec_passthrough: dict = None,
+        data_references_cache_ttl: Optional[float] = None,
     ):
         """
         Base class for DataConnectors that connect to filesystem-like data. This class supports the configuration of default_regex
@@ -51,6 +53,9 @@ class InferredAssetFilesystemDataConnector(InferredAssetFilePathDataConnector):
             execution_engine (ExecutionEngine): ExecutionEngine object to actually read the data
             default_regex (dict): Optional dict the filter and organize the data_references.
             sorters (list): Optional list if you want to sort the data_references
+            data_references_cache_ttl (float): Optional number of seconds after which cached data_references are
+                updated; if glob_directive does not descend into subdirectories, base_directory is only listed again
+                if it was modified
         """
         logger.debug(f'Constructing InferredAssetFilesystemDataConnector "{name}".')
 
@@ -60,11 +65,13 @@ class InferredAssetFilesystemDataConnector(InferredAssetFilePathDataConnector):
             execution_engine=execution_engine,
             default_regex=default_regex,
             sorters=sorters,
+            data_references_cache_ttl=data_references_cache_ttl,
         )
 
         self._base_directory = base_directory
         self._glob_directive = glob_directive
         self._batch_spec_passthrough = batch_spec_passthrough or {}
+        self._listed_directory_mtime: Optional[int] = None
 
     def _get_data_reference_list(
         self, data_asset_name: Optional[str] = None
@@ -74,11 +81,31 @@ class InferredAssetFilesystemDataConnector(InferredAssetFilePathDataConnector):
 
         This method is used to refresh the cache.
         """
-        path_list: List[str] = get_filesystem_one_level_directory_glob_path_list(
+        # The modification time is read first, so that files added while listing are found by the next update.
+        self._listed_directory_mtime = get_filesystem_directory_mtime(
             base_directory_path=self.base_directory, glob_directive=self._glob_directive
         )
+        path_list: List[str] = get_filesystem_one_level_directory_glob_path_list(
+            base_directory_path=self.base_directory,
+            glob_directive=self._glob_directive,
+            regex_pattern=self._get_regex_config().get("pattern"),
+        )
         return sorted(path_list)
 
+    def _get_updated_data_reference_list(
+        self, data_asset_name: Optional[str], cached_data_reference_list: List[str]
+    ) -> Optional[List[str]]:
+        if (
+            self._listed_directory_mtime is not None
+            and get_filesystem_directory_mtime(
+                base_directory_path=self.base_directory,
+                glob_directive=self._glob_directive,
+            )
+            == self._listed_directory_mtime
+        ):
+            return None
+        return self._get_data_reference_list(data_asset_name=data_asset_name)
+
     def _get_full_file_path(
         self, path: str, data_asset_name: Optional[str] = None
     ) -> str:
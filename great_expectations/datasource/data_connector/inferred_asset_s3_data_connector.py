@@ -42,6 +42,7 @@ class InferredAssetS3DataConnector(InferredAssetFilePathDataConnector):
         delimiter: str = "/",
         max_keys: int = 1000,
         boto3_options: dict = None,
+        data_references_cache_ttl: Optional[float] = None,
     ):
         """
         InferredAssetS3DataConnector for connecting to S3.
@@ -57,6 +58,8 @@ class InferredAssetS3DataConnector(InferredAssetFilePathDataConnector):
             delimiter (str): S3 delimiter
             max_keys (int): S3 max_keys (default is 1000)
             boto3_options (dict): optional boto3 options
+            data_references_cache_ttl (float): optional number of seconds after which cached data_references are
+                updated, by listing the keys that follow the last cached key
         """
         logger.debug(f'Constructing InferredAssetS3DataConnector "{name}".')
 
@@ -66,6 +69,7 @@ class InferredAssetS3DataConnector(InferredAssetFilePathDataConnector):
             execution_engine=execution_engine,
             default_regex=default_regex,
             sorters=sorters,
+            data_references_cache_ttl=data_references_cache_ttl,
         )
 
         self._bucket = bucket
@@ -91,22 +95,50 @@ class InferredAssetS3DataConnector(InferredAssetFilePathDataConnector):
 
         This method is used to refresh the cache.
         """
+        return self._list_keys()
+
+    def _get_updated_data_reference_list(
+        self, data_asset_name: Optional[str], cached_data_reference_list: List[str]
+    ) -> Optional[List[str]]:
+        """
+        Lists only the keys that follow the last cached key, in the lexicographic order in which S3 lists keys; keys
+        deleted, or added before the last cached key, are only found when the cache is refreshed as a whole.
+        """
+        if not cached_data_reference_list:
+            return self._get_data_reference_list(data_asset_name=data_asset_name)
+        start_after: str = max(cached_data_reference_list)
+        new_path_list: List[str] = [
+            key for key in self._list_keys(start_after=start_after) if key > start_after
+        ]
+        if not new_path_list:
+            return None
+        return cached_data_reference_list + new_path_list
+
+    def _list_keys(self, start_after: Optional[str] = None) -> List[str]:
         query_options: dict = {
             "Bucket": self._bucket,
             "Prefix": self._prefix,
             "Delimiter": self._delimiter,
             "MaxKeys": self._max_keys,
         }
+        if start_after is not None:
+            query_options["StartAfter"] = start_after
 
-        path_list: List[str] = [
-            key
-            for key in list_s3_keys(
-                s3=self._s3,
-                query_options=query_options,
-                iterator_dict={},
-                recursive=True,
-            )
-        ]
+        try:
+            path_list: List[str] = [
+                key
+                for key in list_s3_keys(
+                    s3=self._s3,
+                    query_options=query_options,
+                    iterator_dict={},
+                    recursive=True,
+                )
+            ]
+        except ValueError:
+            if start_after is None:
+                raise
+            # Nothing follows start_after.
+            path_list = []
         return path_list
 
     def _get_full_file_path(
@@ -32,6 +32,7 @@ class InferredAssetSqlDataConnector(ConfiguredAssetSqlDataConnector):
         included_tables: List = None,
         skip_inapplicable_tables: bool = True,
         introspection_directives: Dict = None,
+        data_references_cache_ttl: Optional[float] = None,
     ):
         """
         InferredAssetDataConnector for connecting to data on a SQL database
@@ -53,6 +54,8 @@ class InferredAssetSqlDataConnector(ConfiguredAssetSqlDataConnector):
                 If True, tables that can't be successfully queried using sampling and splitter methods are excluded from inferred data_asset_names.
                 If False, the class will throw an error during initialization if any such tables are encountered.
             introspection_directives (Dict): Arguments passed to the introspection method to guide introspection
+            data_references_cache_ttl (float): Optional number of seconds after which the partitions of a data_asset
+                are queried again
         """
         self._data_asset_name_prefix = data_asset_name_prefix
         self._data_asset_name_suffix = data_asset_name_suffix
@@ -72,6 +75,7 @@ class InferredAssetSqlDataConnector(ConfiguredAssetSqlDataConnector):
             datasource_name=datasource_name,
             execution_engine=execution_engine,
             data_assets=None,
+            data_references_cache_ttl=data_references_cache_ttl,
         )
 
         # This cache will contain a "config" for each data_asset discovered via introspection.
@@ -111,6 +115,17 @@ class InferredAssetSqlDataConnector(ConfiguredAssetSqlDataConnector):
 
         super()._refresh_data_references_cache()
 
+    def _update_data_references_cache(
+        self, data_asset_name: Optional[str] = None
+    ) -> Optional[str]:
+        """
+        Introspects the database again, unless data_asset_name is a data_asset that was already introspected.
+        """
+        if data_asset_name is None or data_asset_name not in self.data_assets:
+            self._refresh_data_references_cache()
+            return None
+        return super()._update_data_references_cache(data_asset_name=data_asset_name)
+
     def _refresh_introspected_data_assets_cache(
         self,
         data_asset_name_prefix: str = None,
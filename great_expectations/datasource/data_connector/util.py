@@ -1,13 +1,26 @@
 # Utility methods for dealing with DataConnector objects
 
 import copy
+import fnmatch
 import logging
 import os
 import re
 import sre_constants
 import sre_parse
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Pattern,
+    Tuple,
+    Union,
+)
 
 import pandas as pd
 
@@ -78,28 +91,33 @@ def map_data_reference_string_to_batch_definition_list_using_regex(
     data_connector_name: str,
     data_asset_name: str,
     data_reference: str,
-    regex_pattern: str,
+    regex_pattern: Union[str, Pattern],
     group_names: List[str],
 ) -> Optional[List[BatchDefinition]]:
-    batch_request: BatchRequest = (
-        convert_data_reference_string_to_batch_request_using_regex(
-            data_reference=data_reference,
-            regex_pattern=regex_pattern,
-            group_names=group_names,
-        )
-    )
-    if batch_request is None:
+    """
+    Builds the BatchDefinition of data_reference directly from the groups matched by regex_pattern, which may be
+    compiled once by callers that map many data_references with the same pattern.
+    """
+    # noinspection PyUnresolvedReferences
+    matches: Optional[re.Match] = re.match(regex_pattern, data_reference)
+    if matches is None:
         return None
 
+    partition_definition: PartitionDefinition = PartitionDefinition(
+        zip(group_names, matches.groups())
+    )
+    matched_data_asset_name: str = DEFAULT_DATA_ASSET_NAME
+    if "data_asset_name" in partition_definition:
+        matched_data_asset_name = partition_definition.pop("data_asset_name")
     if data_asset_name is None:
-        data_asset_name = batch_request.data_asset_name
+        data_asset_name = matched_data_asset_name
 
     return [
         BatchDefinition(
             datasource_name=datasource_name,
             data_connector_name=data_connector_name,
             data_asset_name=data_asset_name,
-            partition_definition=PartitionDefinition(batch_request.partition_request),
+            partition_definition=partition_definition,
         )
     ]
 
@@ -242,25 +260,233 @@ def normalize_directory_path(
 
 
 def get_filesystem_one_level_directory_glob_path_list(
-    base_directory_path: str, glob_directive: str
+    base_directory_path: str, glob_directive: str, regex_pattern: Optional[str] = None
 ) -> List[str]:
     """
     List file names, relative to base_directory_path one level deep, with expansion specified by glob_directive.
+
+    Directories are listed with os.scandir, matching each component of glob_directive as Path.glob would.  When
+    regex_pattern is given, subdirectories that no path matched by it can be under are not listed at all (see
+    _get_directory_regex_list); files directly in the listed directories are returned whether or not they match it.
     :param base_directory_path -- base directory path, relative to which file paths will be collected
     :param glob_directive -- glob expansion directive
+    :param regex_pattern -- optional pattern of the relative file paths of interest, used to prune subdirectories
     :returns -- list of relative file paths
     """
-    globbed_paths = Path(base_directory_path).glob(glob_directive)
-    path_list: List[str] = [
-        os.path.relpath(str(posix_path), base_directory_path)
-        for posix_path in globbed_paths
+    glob_components: Tuple[str, ...] = Path(glob_directive).parts
+    if (
+        not glob_components
+        or Path(glob_directive).is_absolute()
+        or glob_components[-1] == "**"
+        or ".." in glob_components
+    ):
+        globbed_paths = Path(base_directory_path).glob(glob_directive)
+        return [
+            os.path.relpath(str(posix_path), base_directory_path)
+            for posix_path in globbed_paths
+        ]
+
+    # Consecutive "**" components match the same directories as a single one.
+    glob_components = tuple(
+        component
+        for index, component in enumerate(glob_components)
+        if not (
+            component == "**" and index > 0 and glob_components[index - 1] == "**"
+        )
+    )
+    name_matchers: List[Optional[Callable]] = [
+        None
+        if component == "**"
+        else re.compile(fnmatch.translate(os.path.normcase(component))).match
+        for component in glob_components
     ]
+    directory_regex_list: List[Pattern] = (
+        [] if regex_pattern is None else _get_directory_regex_list(regex_pattern)
+    )
+
+    def list_directory(
+        directory_path: str, relative_path: str, depth: int, component_index: int
+    ) -> Iterator[str]:
+        is_last_component: bool = component_index == len(glob_components) - 1
+        try:
+            with os.scandir(directory_path) as entries:
+                entry_list: List[os.DirEntry] = list(entries)
+        except (FileNotFoundError, NotADirectoryError, PermissionError):
+            return
+        if glob_components[component_index] == "**":
+            yield from list_directory(
+                directory_path, relative_path, depth, component_index + 1
+            )
+        name_matcher: Optional[Callable] = name_matchers[component_index]
+        for entry in entry_list:
+            if name_matcher is None:
+                # Like Path.glob, "**" does not descend into symbolic links to directories.
+                if not _is_directory(entry) or entry.is_symlink():
+                    continue
+            elif name_matcher(os.path.normcase(entry.name)) is None:
+                continue
+            entry_relative_path: str = (
+                os.path.join(relative_path, entry.name) if relative_path else entry.name
+            )
+            if is_last_component:
+                yield entry_relative_path
+                continue
+            if not _is_directory(entry) or (
+                depth < len(directory_regex_list)
+                and directory_regex_list[depth].fullmatch(entry.name) is None
+            ):
+                continue
+            yield from list_directory(
+                entry.path,
+                entry_relative_path,
+                depth + 1,
+                component_index if name_matcher is None else component_index + 1,
+            )
+
+    path_list: List[str] = list(
+        list_directory(base_directory_path, "", 0, component_index=0)
+    )
+    if glob_components.count("**") > 1:
+        path_list = list(dict.fromkeys(path_list))
     return path_list
 
 
+def _is_directory(entry: os.DirEntry) -> bool:
+    try:
+        return entry.is_dir()
+    except OSError:
+        return False
+
+
+def _get_directory_regex_list(regex_pattern: str) -> List[Pattern]:
+    """
+    Splits regex_pattern at the "/" separating the directories of the paths it matches, returning the patterns that the
+    name of the directory at each depth must match.  The split stops at the first part that could itself match a "/",
+    since the directories it spans are then unknown, and nothing is split out of patterns with top-level alternatives.
+    """
+    if os.sep != "/":
+        return []
+    try:
+        flags: int = re.compile(regex_pattern).flags
+    except re.error:
+        return []
+    if flags & re.VERBOSE:
+        return []
+
+    parts: List[str] = []
+    part_start: int = 0
+    depth: int = 0
+    index: int = 0
+    while index < len(regex_pattern):
+        character: str = regex_pattern[index]
+        if character == "\\":
+            if depth == 0 and regex_pattern[index + 1 : index + 2] == "/":
+                parts.append(regex_pattern[part_start:index])
+                part_start = index + 2
+            index += 2
+            continue
+        if character == "[":
+            # Skip the character class, in which "]" is literal if it comes first.
+            index += 1
+            if regex_pattern[index : index + 1] == "^":
+                index += 1
+            if regex_pattern[index : index + 1] == "]":
+                index += 1
+            while index < len(regex_pattern) and regex_pattern[index] != "]":
+                index += 2 if regex_pattern[index] == "\\" else 1
+        elif character == "(":
+            depth += 1
+        elif character == ")":
+            depth -= 1
+        elif depth == 0 and character == "|":
+            return []
+        elif depth == 0 and character == "/":
+            parts.append(regex_pattern[part_start:index])
+            part_start = index + 1
+        index += 1
+
+    directory_regex_list: List[Pattern] = []
+    for part in parts:
+        if part.startswith("^"):
+            part = part[1:]
+        try:
+            if _regex_may_match_separator(sre_parse.parse(part, flags)):
+                break
+            directory_regex_list.append(re.compile(part, flags))
+        except (re.error, ValueError):
+            break
+    return directory_regex_list
+
+
+# noinspection PyUnresolvedReferences
+def _regex_may_match_separator(parsed_sre) -> bool:
+    """
+    Tells whether the parsed regular expression may match a "/", erring on the side of True for any construct that is
+    not known never to match one.
+    """
+    separator: int = ord("/")
+    for token, value in parsed_sre:
+        if token == sre_constants.LITERAL:
+            if value == separator:
+                return True
+        elif token == sre_constants.AT:
+            pass
+        elif token in [sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT]:
+            if _regex_may_match_separator(value[2]):
+                return True
+        elif token == sre_constants.SUBPATTERN:
+            if _regex_may_match_separator(value[-1]):
+                return True
+        elif token == sre_constants.BRANCH:
+            if any(_regex_may_match_separator(branch) for branch in value[1]):
+                return True
+        elif token == sre_constants.IN:
+            for item_token, item_value in value:
+                if item_token == sre_constants.LITERAL:
+                    if item_value == separator:
+                        return True
+                elif item_token == sre_constants.RANGE:
+                    if item_value[0] <= separator <= item_value[1]:
+                        return True
+                elif item_token == sre_constants.CATEGORY:
+                    if item_value not in [
+                        sre_constants.CATEGORY_DIGIT,
+                        sre_constants.CATEGORY_WORD,
+                        sre_constants.CATEGORY_SPACE,
+                    ]:
+                        return True
+                else:
+                    return True
+        else:
+            return True
+    return False
+
+
+def get_filesystem_directory_mtime(
+    base_directory_path: str, glob_directive: str
+) -> Optional[int]:
+    """
+    Return the modification time of base_directory_path if the paths matched by glob_directive within it can only
+    change when it is modified, that is if glob_directive does not descend into subdirectories.
+    :param base_directory_path -- base directory path, relative to which file paths are collected
+    :param glob_directive -- glob expansion directive
+    :returns -- modification time of base_directory_path in nanoseconds, or None
+    """
+    if "**" in glob_directive or "/" in glob_directive or os.sep in glob_directive:
+        return None
+    try:
+        return os.stat(base_directory_path).st_mtime_ns
+    except OSError:
+        return None
+
+
 def list_s3_keys(
-    s3, query_options: dict, iterator_dict: dict, recursive: bool = False
-) -> str:
+    s3,
+    query_options: dict,
+    iterator_dict: Optional[dict] = None,
+    recursive: bool = False,
+    max_workers: int = 8,
+) -> Iterator[str]:
     """
     For InferredAssetS3DataConnector, we take bucket and prefix and search for files using RegEx at and below the level
     specified by that bucket and prefix.  However, for ConfiguredAssetS3DataConnector, we take bucket and prefix and
@@ -268,52 +494,103 @@ def list_s3_keys(
     ConfiguredAssetS3DataConnector is needed, because paths on S3 are comprised not only the leaf file name but the
     full path that includes both the prefix and the file name.  Otherwise, in the situations where multiple data assets
     share levels of a directory tree, matching files to data assets will not be possible, due to the path ambiguity.
+
+    Pages are fetched iteratively, following "NextContinuationToken".  When recursive, the common prefixes found
+    under the prefix are listed concurrently, on at most max_workers threads; keys are still yielded depth first, the
+    keys of a prefix before those of its common prefixes.
     :param s3: s3 client connection
     :param query_options: s3 query attributes ("Bucket", "Prefix", "Delimiter", "MaxKeys")
     :param iterator_dict: dictionary to manage "NextContinuationToken" (if "IsTruncated" is returned from S3)
     :param recursive: True for InferredAssetS3DataConnector and False for ConfiguredAssetS3DataConnector (see above)
+    :param max_workers: maximum number of common prefixes listed at the same time (if recursive)
     :return: string valued key representing file path on S3 (full prefix and leaf file name)
     """
     if iterator_dict is None:
         iterator_dict = {}
 
-    if "continuation_token" in iterator_dict:
-        query_options.update({"ContinuationToken": iterator_dict["continuation_token"]})
-
-    logger.debug(f"Fetching objects from S3 with query options: {query_options}")
-
-    s3_objects_info: dict = s3.list_objects_v2(**query_options)
-
-    if not any(key in s3_objects_info for key in ["Contents", "CommonPrefixes"]):
-        raise ValueError("S3 query may not have been configured correctly.")
+    if not recursive:
+        for keys, _ in _list_s3_pages(
+            s3=s3, query_options=query_options, iterator_dict=iterator_dict
+        ):
+            yield from keys
+        return
+
+    stop_listing: threading.Event = threading.Event()
+
+    def list_prefix(prefix_query_options: dict, prefix_iterator_dict: dict):
+        # Lists all pages of one prefix, then schedules the listing of its common prefixes.
+        keys: List[str] = []
+        common_prefixes: List[str] = []
+        if stop_listing.is_set():
+            return keys, []
+        for page_keys, page_common_prefixes in _list_s3_pages(
+            s3=s3,
+            query_options=prefix_query_options,
+            iterator_dict=prefix_iterator_dict,
+        ):
+            if stop_listing.is_set():
+                return keys, []
+            keys.extend(page_keys)
+            common_prefixes.extend(page_common_prefixes)
+        return (
+            keys,
+            [
+                executor.submit(
+                    list_prefix, dict(prefix_query_options, Prefix=prefix), {}
+                )
+                for prefix in common_prefixes
+                if not stop_listing.is_set()
+            ],
+        )
 
-    if "Contents" in s3_objects_info:
-        keys: List[str] = [
-            item["Key"] for item in s3_objects_info["Contents"] if item["Size"] > 0
+    executor: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        pending_listings: List[Future] = [
+            executor.submit(list_prefix, dict(query_options), iterator_dict)
         ]
-        yield from keys
-    if recursive and "CommonPrefixes" in s3_objects_info:
-        common_prefixes: List[Dict[str, Any]] = s3_objects_info["CommonPrefixes"]
-        for prefix_info in common_prefixes:
-            query_options_tmp: dict = copy.deepcopy(query_options)
-            query_options_tmp.update({"Prefix": prefix_info["Prefix"]})
-            # Recursively fetch from updated prefix
-            yield from list_s3_keys(
-                s3=s3,
-                query_options=query_options_tmp,
-                iterator_dict={},
-                recursive=recursive,
-            )
-    if s3_objects_info["IsTruncated"]:
-        iterator_dict["continuation_token"] = s3_objects_info["NextContinuationToken"]
-        # Recursively fetch more
-        yield from list_s3_keys(
-            s3=s3,
-            query_options=query_options,
-            iterator_dict=iterator_dict,
-            recursive=recursive,
+        while pending_listings:
+            keys, prefix_listings = pending_listings.pop().result()
+            yield from keys
+            pending_listings.extend(reversed(prefix_listings))
+    finally:
+        stop_listing.set()
+        executor.shutdown(wait=True)
+
+
+def _list_s3_pages(
+    s3, query_options: dict, iterator_dict: dict
+) -> Iterator[Tuple[List[str], List[str]]]:
+    """
+    Lists the pages of an S3 query, yielding the keys of non-empty objects and the common prefixes of each page.
+    """
+    query_options = dict(query_options)
+    while True:
+        if "continuation_token" in iterator_dict:
+            query_options["ContinuationToken"] = iterator_dict["continuation_token"]
+
+        logger.debug(f"Fetching objects from S3 with query options: {query_options}")
+
+        s3_objects_info: dict = s3.list_objects_v2(**query_options)
+
+        if not any(key in s3_objects_info for key in ["Contents", "CommonPrefixes"]):
+            raise ValueError("S3 query may not have been configured correctly.")
+
+        yield (
+            [
+                item["Key"]
+                for item in s3_objects_info.get("Contents", [])
+                if item["Size"] > 0
+            ],
+            [
+                prefix_info["Prefix"]
+                for prefix_info in s3_objects_info.get("CommonPrefixes", [])
+            ],
         )
 
+        if not s3_objects_info["IsTruncated"]:
+            break
+        iterator_dict["continuation_token"] = s3_objects_info["NextContinuationToken"]
+
     if "continuation_token" in iterator_dict:
         # Make sure we clear the token once we've gotten fully through
         del iterator_dict["continuation_token"]
@@ -1,6 +1,8 @@
 import copy
 import logging
-from typing import Any, Dict, List, Optional, Union
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional, Union
 
 import great_expectations.exceptions as ge_exceptions
 from great_expectations.core.batch import (
@@ -8,6 +10,7 @@ from great_expectations.core.batch import (
     BatchDefinition,
     BatchMarkers,
     BatchRequest,
+    LazyBatch,
 )
 from great_expectations.data_context.util import instantiate_class_from_config
 from great_expectations.datasource.data_connector import DataConnector
@@ -98,13 +101,14 @@ class BaseDatasource:
         return batch_list[0]
 
     def get_batch_list_from_batch_request(
-        self, batch_request: BatchRequest
+        self, batch_request: BatchRequest, lazy: bool = False
     ) -> List[Batch]:
         """
         Processes batch_request and returns the (possibly empty) list of batch objects.
 
         Args:
             :batch_request encapsulation of request parameters necessary to identify the (possibly multiple) batches
+            :lazy if True, the data of each batch is loaded on first access (see LazyBatch), rather than up front
             :returns possibly empty list of batch objects; each batch object contains a dataset and associated metatada
         """
         self._validate_batch_request(batch_request=batch_request)
@@ -124,6 +128,18 @@ class BaseDatasource:
                 batch_definition.batch_spec_passthrough = (
                     batch_request.batch_spec_passthrough
                 )
+                if lazy:
+                    batches.append(
+                        LazyBatch(
+                            batch_loader=self._get_batch_loader(
+                                data_connector=data_connector,
+                                batch_definition=batch_definition,
+                            ),
+                            batch_request=batch_request,
+                            batch_definition=batch_definition,
+                        )
+                    )
+                    continue
                 batch_data: Any
                 batch_spec: PathBatchSpec
                 batch_markers: BatchMarkers
@@ -175,6 +191,66 @@ class BaseDatasource:
 
             return [new_batch]
 
+    def iter_batches_from_batch_request(
+        self, batch_request: BatchRequest, prefetch: int = 0
+    ) -> Iterator[Batch]:
+        """
+        Processes batch_request and yields its batches one at a time, so that only the batch being validated, and the
+        ones being prefetched, are held in memory.
+
+        Each batch is loaded when it is yielded, and its data is released when the next one is requested; accessing
+        the data of a released batch loads it again. Batches loaded into an ExecutionEngine should also be unloaded
+        from it (see ExecutionEngine.unload_batch_data) once they are validated.
+
+        Args:
+            :batch_request encapsulation of request parameters necessary to identify the (possibly multiple) batches
+            :prefetch the number of batches loaded ahead of the one being yielded, on a background thread
+            :returns an iterator over the batch objects
+        """
+        if prefetch < 0:
+            raise ValueError("prefetch must be a non-negative integer")
+
+        if batch_request["batch_data"] is not None:
+            yield from self.get_batch_list_from_batch_request(batch_request)
+            return
+
+        batches: deque = deque(
+            self.get_batch_list_from_batch_request(batch_request, lazy=True)
+        )
+        if prefetch == 0:
+            while batches:
+                batch: LazyBatch = batches.popleft()
+                batch.load()
+                yield batch
+                batch.unload()
+            return
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            loading: deque = deque()
+            try:
+                while batches or loading:
+                    while batches and len(loading) <= prefetch:
+                        batch = batches.popleft()
+                        loading.append((batch, executor.submit(batch.load)))
+                    batch, future = loading.popleft()
+                    future.result()
+                    yield batch
+                    batch.unload()
+            finally:
+                for _, future in loading:
+                    future.cancel()
+
+    @staticmethod
+    def _get_batch_loader(
+        data_connector: DataConnector, batch_definition: BatchDefinition
+    ):
+        def batch_loader():
+            return data_connector.get_batch_data_and_metadata(
+                batch_definition=batch_definition
+            )
+
+        return batch_loader
+
     def _build_data_connector_from_config(
         self,
         name: str,
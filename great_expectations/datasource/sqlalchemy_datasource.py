@@ -5,6 +5,7 @@ from string import Template
 from urllib.parse import urlparse
 
 from great_expectations.core.batch import Batch, BatchMarkers
+from great_expectations.core.sqlalchemy_engine_registry import get_sqlalchemy_engine
 from great_expectations.core.util import nested_update
 from great_expectations.dataset.sqlalchemy_dataset import SqlAlchemyBatchReference
 from great_expectations.datasource import LegacyDatasource
@@ -19,12 +20,10 @@ logger = logging.getLogger(__name__)
 
 try:
     import sqlalchemy
-    from sqlalchemy import create_engine
     from sqlalchemy.sql.elements import quoted_name
 
 except ImportError:
     sqlalchemy = None
-    create_engine = None
     logger.debug("Unable to import sqlalchemy.")
 
 
@@ -242,13 +241,13 @@ class SqlAlchemyDatasource(LegacyDatasource):
             # if a connection string or url was provided, use that
             elif "connection_string" in kwargs:
                 connection_string = kwargs.pop("connection_string")
-                self.engine = create_engine(connection_string, **kwargs)
+                self.engine = get_sqlalchemy_engine(connection_string, **kwargs)
                 connection = self.engine.connect()
                 connection.close()
             elif "url" in credentials:
                 url = credentials.pop("url")
                 self.drivername = urlparse(url).scheme
-                self.engine = create_engine(url, **kwargs)
+                self.engine = get_sqlalchemy_engine(url, **kwargs)
                 connection = self.engine.connect()
                 connection.close()
 
@@ -260,7 +259,7 @@ class SqlAlchemyDatasource(LegacyDatasource):
                     drivername,
                 ) = self._get_sqlalchemy_connection_options(**kwargs)
                 self.drivername = drivername
-                self.engine = create_engine(options, **create_engine_kwargs)
+                self.engine = get_sqlalchemy_engine(options, **create_engine_kwargs)
                 connection = self.engine.connect()
                 connection.close()
 
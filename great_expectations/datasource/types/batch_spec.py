@@ -72,6 +72,24 @@ class PathBatchSpec(PandasDatasourceBatchSpec, SparkDFDatasourceBatchSpec):
     def reader_method(self):
         return self.get("reader_method")
 
+    @property
+    def chunksize(self):
+        """The number of rows read at a time, if the file is to be validated one chunk at a time rather than loaded in
+        memory."""
+        return self.get("chunksize")
+
+    @property
+    def memory_map(self):
+        """Whether a feather (Arrow IPC) file is memory-mapped rather than read, so that the processes loading it share
+        one copy of its data."""
+        return self.get("memory_map", False)
+
+    @property
+    def columns(self):
+        """The columns to load, if the batch is only validated against some of its columns; all columns are loaded if
+        None."""
+        return self.get("columns")
+
 
 class S3BatchSpec(PandasDatasourceBatchSpec, SparkDFDatasourceBatchSpec):
     def __init__(self, *args, **kwargs):
@@ -87,6 +105,12 @@ class S3BatchSpec(PandasDatasourceBatchSpec, SparkDFDatasourceBatchSpec):
     def reader_method(self):
         return self.get("reader_method")
 
+    @property
+    def columns(self):
+        """The columns to load, if the batch is only validated against some of its columns; all columns are loaded if
+        None."""
+        return self.get("columns")
+
 
 class RuntimeDataBatchSpec(BatchSpec):
     _id_ignore_keys = set("batch_data")
@@ -1,8 +1,11 @@
 import hashlib
+import json
 import logging
 import pickle
+from typing import Optional
 from urllib.parse import urlparse
 
+import numpy as np
 import pandas as pd
 
 logger = logging.getLogger(__name__)
@@ -21,6 +24,10 @@ except ImportError:
         "Unable to load pyspark; install optional spark dependency for support."
     )
 
+# A sampled fingerprint of a DataFrame hashes this many blocks of consecutive rows, spread evenly over the DataFrame
+FINGERPRINT_SAMPLE_BLOCKS = 64
+FINGERPRINT_BLOCK_ROWS = 1024
+
 
 # S3Url class courtesy: https://stackoverflow.com/questions/42641315/s3-urls-get-bucket-name-and-path
 class S3Url(object):
@@ -67,11 +74,48 @@ class S3Url(object):
         return self._parsed.geturl()
 
 
-def hash_pandas_dataframe(df):
+def hash_pandas_dataframe(
+    df, sampled: bool = False, source_metadata: Optional[dict] = None
+):
+    """Returns a fingerprint of the content of a DataFrame, which hashes every row unless it is sampled.
+
+    A sampled fingerprint is computed in bounded time whatever the size of the DataFrame: it hashes its shape, columns
+    and dtypes, and FINGERPRINT_SAMPLE_BLOCKS blocks of FINGERPRINT_BLOCK_ROWS rows including the first and last ones.
+    Changes to the other rows are only reflected by the source_metadata, such as the size and modification time of
+    the file or the ETag of the S3 object the DataFrame was read from, which is hashed as well if it is provided.
+    """
+    fingerprint = hashlib.md5()
+    if sampled:
+        fingerprint.update(
+            json.dumps(
+                {
+                    "shape": list(df.shape),
+                    "columns": [str(column) for column in df.columns],
+                    "dtypes": [str(dtype) for dtype in df.dtypes],
+                }
+            ).encode("utf-8")
+        )
+        df = _get_fingerprint_sample(df)
+
     try:
         obj = pd.util.hash_pandas_object(df, index=True).values
     except TypeError:
         # In case of facing unhashable objects (like dict), use pickle
         obj = pickle.dumps(df, pickle.HIGHEST_PROTOCOL)
+    fingerprint.update(obj)
 
-    return hashlib.md5(obj).hexdigest()
+    if source_metadata is not None:
+        fingerprint.update(
+            json.dumps(source_metadata, sort_keys=True, default=str).encode("utf-8")
+        )
+    return fingerprint.hexdigest()
+
+
+def _get_fingerprint_sample(df):
+    row_count = len(df)
+    if row_count <= FINGERPRINT_SAMPLE_BLOCKS * FINGERPRINT_BLOCK_ROWS:
+        return df
+    block_starts = np.linspace(
+        0, row_count - FINGERPRINT_BLOCK_ROWS, FINGERPRINT_SAMPLE_BLOCKS, dtype=np.int64
+    )
+    return df.iloc[(block_starts[:, None] + np.arange(FINGERPRINT_BLOCK_ROWS)).ravel()]
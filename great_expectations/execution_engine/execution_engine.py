@@ -1,11 +1,16 @@
 import copy
 import logging
+import sys
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
 from enum import Enum
-from typing import Any, Dict, Iterable, Tuple, Union
+from typing import Any, Dict, Hashable, Iterable, Iterator, Optional, Tuple, Union
 
 from ruamel.yaml import YAML
 
-from great_expectations.core.batch import Batch, BatchSpec
+from great_expectations.core.batch import Batch, BatchMarkers, BatchSpec
 from great_expectations.exceptions import GreatExpectationsError
 from great_expectations.expectations.registry import get_metric_provider
 from great_expectations.util import (
@@ -18,13 +23,124 @@ logger = logging.getLogger(__name__)
 yaml = YAML()
 yaml.default_flow_style = False
 
+_MISSING = object()
+
+# The metric cache holds the values of resolved metrics, some of which (such as unexpected values) can be large, for
+# as long as the execution engine lives; it is therefore bounded unless configured otherwise.
+DEFAULT_METRIC_CACHE_MAX_ENTRIES = 1024
+DEFAULT_METRIC_CACHE_MAX_BYTES = 128 * 1024 * 1024
+
+
+def _estimate_size_in_bytes(value: Any) -> int:
+    """Returns a rough estimate of the memory held by a metric value."""
+    if hasattr(value, "memory_usage"):
+        try:
+            memory_usage = value.memory_usage(deep=True)
+            if hasattr(memory_usage, "sum"):
+                memory_usage = memory_usage.sum()
+            return int(memory_usage)
+        except (TypeError, ValueError):
+            pass
+    if hasattr(value, "nbytes"):
+        return int(value.nbytes)
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(
+            _estimate_size_in_bytes(k) + _estimate_size_in_bytes(v)
+            for k, v in value.items()
+        )
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return sys.getsizeof(value) + sum(
+            _estimate_size_in_bytes(element) for element in value
+        )
+    return sys.getsizeof(value)
+
 
-class NoOpDict:
-    def __getitem__(self, item):
-        return None
+class MetricCache:
+    """A thread-safe, least-recently-used cache of resolved metric values.
 
-    def __setitem__(self, key, value):
-        return None
+    Entries are keyed by a batch cache key and a metric id, so that every entry computed for a batch can be invalidated
+    at once. The cache can be bounded by the number of entries and by the estimated size in bytes of the cached values;
+    the least recently used entries are evicted first when either bound is exceeded.
+    """
+
+    def __init__(
+        self, max_entries: Optional[int] = None, max_bytes: Optional[int] = None
+    ):
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._size_in_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    def get(self, batch_key: Hashable, metric_id: Tuple, default: Any = None) -> Any:
+        with self._lock:
+            key = (batch_key, metric_id)
+            if key not in self._entries:
+                self._misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return self._entries[key][0]
+
+    def put(self, batch_key: Hashable, metric_id: Tuple, value: Any) -> None:
+        if self._max_entries == 0:
+            return
+        size_in_bytes = _estimate_size_in_bytes(value)
+        if self._max_bytes is not None and size_in_bytes > self._max_bytes:
+            logger.debug(
+                f"Not caching metric {str(metric_id)}: its size exceeds the metric cache size limit"
+            )
+            return
+        with self._lock:
+            key = (batch_key, metric_id)
+            if key in self._entries:
+                self._size_in_bytes -= self._entries.pop(key)[1]
+            self._entries[key] = (value, size_in_bytes)
+            self._size_in_bytes += size_in_bytes
+            while self._entries and (
+                (
+                    self._max_entries is not None
+                    and len(self._entries) > self._max_entries
+                )
+                or (
+                    self._max_bytes is not None
+                    and self._size_in_bytes > self._max_bytes
+                )
+            ):
+                _, (_, evicted_size_in_bytes) = self._entries.popitem(last=False)
+                self._size_in_bytes -= evicted_size_in_bytes
+                self._evictions += 1
+
+    def invalidate_batch(self, batch_key: Hashable) -> None:
+        """Evicts every entry computed for the given batch cache key."""
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == batch_key]:
+                self._size_in_bytes -= self._entries.pop(key)[1]
+                self._evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._evictions += len(self._entries)
+            self._entries.clear()
+            self._size_in_bytes = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def statistics(self) -> dict:
+        """Counters describing the usage of the cache."""
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "entries": len(self._entries),
+                "size_in_bytes": self._size_in_bytes,
+            }
 
 
 class ExecutionEngine:
@@ -37,6 +153,8 @@ class ExecutionEngine:
         batch_spec_defaults=None,
         batch_data_dict=None,
         validator=None,
+        metric_cache_max_entries=DEFAULT_METRIC_CACHE_MAX_ENTRIES,
+        metric_cache_max_bytes=DEFAULT_METRIC_CACHE_MAX_BYTES,
     ):
         self.name = name
         self._validator = validator
@@ -44,11 +162,12 @@ class ExecutionEngine:
         # NOTE: using caching makes the strong assumption that the user will not modify the core data store
         # (e.g. self.spark_df) over the lifetime of the dataset instance
         self._caching = caching
-        # NOTE: 20200918 - this is a naive cache; update.
         if self._caching:
-            self._metric_cache = {}
+            self._metric_cache = MetricCache(
+                max_entries=metric_cache_max_entries, max_bytes=metric_cache_max_bytes
+            )
         else:
-            self._metric_cache = NoOpDict()
+            self._metric_cache = MetricCache(max_entries=0)
 
         if batch_spec_defaults is None:
             batch_spec_defaults = {}
@@ -66,6 +185,8 @@ class ExecutionEngine:
         }
 
         self._batch_data_dict = {}
+        self._batch_cache_keys = {}
+        self._metric_resolution_times = threading.local()
         if batch_data_dict is None:
             batch_data_dict = {}
         self._load_batch_data_from_dict(batch_data_dict)
@@ -117,6 +238,12 @@ class ExecutionEngine:
     def config(self) -> dict:
         return self._config
 
+    @property
+    def metric_cache_statistics(self) -> dict:
+        """Hit, miss and eviction counters, as well as the current number of entries and estimated size in bytes, of
+        the metric cache."""
+        return self._metric_cache.statistics
+
     def get_batch_data(
         self,
         batch_spec: BatchSpec,
@@ -133,13 +260,97 @@ class ExecutionEngine:
         batch_data, _ = self.get_batch_data_and_markers(batch_spec)
         return batch_data
 
-    def load_batch_data(self, batch_id: str, batch_data: Any) -> None:
+    def load_batch_data(
+        self,
+        batch_id: str,
+        batch_data: Any,
+        batch_markers: Optional[BatchMarkers] = None,
+    ) -> None:
         """
         Loads the specified batch_data into the execution engine
+
+        If batch_markers include a data fingerprint, metrics cached for that fingerprint are reused; otherwise metrics
+        are cached under the batch_id, and any metrics cached for data previously loaded under the same batch_id are
+        invalidated.
         """
+        batch_cache_key = batch_id
+        replacement = None
+        if batch_markers is not None and batch_markers.get("pandas_data_fingerprint"):
+            batch_cache_key = batch_markers["pandas_data_fingerprint"]
+            replacement = batch_cache_key
+        if batch_id in self._batch_data_dict:
+            self._invalidate_batch_cache_key(batch_id, replacement=replacement)
+
         self._batch_data_dict[batch_id] = self._get_typed_batch_data(batch_data)
+        self._batch_cache_keys[batch_id] = batch_cache_key
         self._active_batch_data_id = batch_id
 
+    def unload_batch_data(self, batch_id: str) -> None:
+        """
+        Removes the specified batch from the execution engine, evicting the metrics cached for it.
+        """
+        if batch_id not in self._batch_data_dict:
+            raise GreatExpectationsError(
+                f"Unable to unload batch with batch_id {batch_id}: it is not loaded."
+            )
+        self._invalidate_batch_cache_key(batch_id)
+        del self._batch_data_dict[batch_id]
+        del self._batch_cache_keys[batch_id]
+        if self._active_batch_data_id == batch_id:
+            self._active_batch_data_id = None
+
+    def release_resources(self) -> None:
+        """
+        Releases the resources the execution engine holds for its loaded batches, such as cached data, once a
+        validation is finished. The batches stay loaded, and any resource they need again is acquired on demand.
+        """
+        pass
+
+    @contextmanager
+    def recording_metric_resolution_times(self) -> Iterator[Dict]:
+        """Records, in the yielded dictionary, the time in seconds spent computing the metrics that resolve_metrics
+        resolves in the current thread. Each entry is keyed by the tuple of the ids of the metrics computed together:
+        the id of a single metric computed by its own metric function, or those of the metrics of a bundle, such as
+        the one computed by resolve_metric_bundle. Metrics found in the metric cache are not recorded."""
+        previous_metric_resolution_times = getattr(
+            self._metric_resolution_times, "times", None
+        )
+        metric_resolution_times = dict()
+        self._metric_resolution_times.times = metric_resolution_times
+        try:
+            yield metric_resolution_times
+        finally:
+            self._metric_resolution_times.times = previous_metric_resolution_times
+
+    def _record_metric_resolution_time(
+        self, metrics: Iterable[MetricConfiguration], start: float
+    ) -> None:
+        """Records the time elapsed since start (a time.perf_counter value) computing the given metrics together, if
+        resolution times are being recorded in the current thread (see recording_metric_resolution_times)."""
+        metric_resolution_times = getattr(self._metric_resolution_times, "times", None)
+        if metric_resolution_times is not None:
+            metric_resolution_times[tuple(metric.id for metric in metrics)] = (
+                time.perf_counter() - start
+            )
+
+    def _invalidate_batch_cache_key(self, batch_id: str, replacement=None) -> None:
+        """Evicts the cached metrics of a batch, unless its cache key is kept by the replacement or another batch."""
+        batch_cache_key = self._batch_cache_keys.get(batch_id, batch_id)
+        if batch_cache_key == replacement:
+            return
+        if any(
+            other_batch_cache_key == batch_cache_key
+            for other_batch_id, other_batch_cache_key in self._batch_cache_keys.items()
+            if other_batch_id != batch_id
+        ):
+            return
+        self._metric_cache.invalidate_batch(batch_cache_key)
+
+    def _get_batch_cache_key(self, domain_kwargs: dict) -> Hashable:
+        """Returns the key under which metrics computed over the given domain are cached."""
+        batch_id = domain_kwargs.get("batch_id") or self.active_batch_data_id
+        return self._batch_cache_keys.get(batch_id, batch_id)
+
     def _load_batch_data_from_dict(self, batch_data_dict):
         """
         Loads all data in batch_data_dict into load_batch_data
@@ -175,6 +386,15 @@ class ExecutionEngine:
 
         metric_fn_bundle = []
         for metric_to_resolve in metrics_to_resolve:
+            batch_cache_key = self._get_batch_cache_key(
+                metric_to_resolve.metric_domain_kwargs
+            )
+            cached_value = self._metric_cache.get(
+                batch_cache_key, metric_to_resolve.id, _MISSING
+            )
+            if cached_value is not _MISSING:
+                resolved_metrics[metric_to_resolve.id] = cached_value
+                continue
             metric_class, metric_fn = get_metric_provider(
                 metric_name=metric_to_resolve.metric_name, execution_engine=self
             )
@@ -217,6 +437,7 @@ class ExecutionEngine:
             metric_fn_type = getattr(
                 metric_fn, "metric_fn_type", MetricFunctionTypes.VALUE
             )
+            start = time.perf_counter()
             if metric_fn_type in [
                 MetricPartialFunctionTypes.MAP_SERIES,
                 MetricPartialFunctionTypes.MAP_FN,
@@ -235,6 +456,11 @@ class ExecutionEngine:
                 resolved_metrics[metric_to_resolve.id] = metric_fn(
                     **metric_provider_kwargs
                 )
+                self._metric_cache.put(
+                    batch_cache_key,
+                    metric_to_resolve.id,
+                    resolved_metrics[metric_to_resolve.id],
+                )
             else:
                 logger.warning(
                     f"Unrecognized metric function type while trying to resolve {str(metric_to_resolve.id)}"
@@ -242,8 +468,24 @@ class ExecutionEngine:
                 resolved_metrics[metric_to_resolve.id] = metric_fn(
                     **metric_provider_kwargs
                 )
+            self._record_metric_resolution_time([metric_to_resolve], start)
         if len(metric_fn_bundle) > 0:
-            resolved_metrics.update(self.resolve_metric_bundle(metric_fn_bundle))
+            start = time.perf_counter()
+            bundle_resolved_metrics = self.resolve_metric_bundle(metric_fn_bundle)
+            self._record_metric_resolution_time(
+                [metric_to_resolve for metric_to_resolve, *_ in metric_fn_bundle],
+                start,
+            )
+            for metric_to_resolve, *_ in metric_fn_bundle:
+                if metric_to_resolve.id in bundle_resolved_metrics:
+                    self._metric_cache.put(
+                        self._get_batch_cache_key(
+                            metric_to_resolve.metric_domain_kwargs
+                        ),
+                        metric_to_resolve.id,
+                        bundle_resolved_metrics[metric_to_resolve.id],
+                    )
+            resolved_metrics.update(bundle_resolved_metrics)
 
         return resolved_metrics
 
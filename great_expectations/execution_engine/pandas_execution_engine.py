@@ -1,13 +1,28 @@
-import copy
 import datetime
+import gzip
 import hashlib
+import io
 import logging
+import os
 import random
+import threading
+import time
+import uuid
+from collections import OrderedDict, defaultdict, namedtuple
 from functools import partial
-from typing import Any, Callable, Iterable, List, Optional, Tuple, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 import pandas as pd
-from ruamel.yaml.compat import StringIO
 
 import great_expectations.exceptions.exceptions as ge_exceptions
 from great_expectations.datasource.types import (
@@ -22,16 +37,190 @@ try:
 except ImportError:
     boto3 = None
 
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+try:
+    import pyarrow
+    import pyarrow.feather
+    import pyarrow.ipc
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
 from ..core.batch import BatchMarkers
-from ..core.id_dict import BatchSpec
+from ..core.id_dict import BatchSpec, IDDict
 from ..datasource.util import hash_pandas_dataframe
 from ..exceptions import BatchSpecError, GreatExpectationsError, ValidationError
-from .execution_engine import ExecutionEngine, MetricDomainTypes
+from ..expectations.registry import get_metric_provider
+from ..expectations.row_conditions import (
+    ConditionParserError,
+    parse_condition_to_parquet_filters,
+)
+from ..validator.validation_graph import MetricConfiguration
+from .execution_engine import (
+    _MISSING,
+    ExecutionEngine,
+    MetricDomainTypes,
+    MetricFunctionTypes,
+    MetricPartialFunctionTypes,
+)
 
 logger = logging.getLogger(__name__)
 
 HASH_THRESHOLD = 1e9
 
+DEFAULT_ROW_CONDITION_CACHE_MAX_ENTRIES = 16
+
+# Readers that need to seek in their file, which are given S3 objects through ranged GETs rather than a stream
+RANDOM_ACCESS_READER_METHODS = {
+    "read_excel",
+    "read_feather",
+    "read_orc",
+    "read_parquet",
+}
+
+# The size of the ranged GETs used to read S3 objects with random access
+S3_RANGE_SIZE = 8 * 1024 * 1024
+
+# "numpy" loads batches with the default dtypes of pandas, "pyarrow" as DataFrames of pandas ArrowDtypes, whose data is
+# held in Arrow arrays that the core metrics compute over with pyarrow.compute
+DTYPE_BACKENDS = ("numpy", "pyarrow")
+
+# The readers whose files are loaded by pyarrow directly, without a conversion from pandas dtypes, when the dtype_backend
+# is "pyarrow", and the reader options that pyarrow supports for them
+ARROW_READER_OPTIONS = {
+    "read_feather": {"columns"},
+    "read_parquet": {"columns", "filters"},
+}
+
+# The reader options through which pandas readers load only some of the columns of a file
+COLUMN_PROJECTION_READER_OPTIONS = {
+    "read_csv": "usecols",
+    "read_excel": "usecols",
+    "read_feather": "columns",
+    "read_orc": "columns",
+    "read_parquet": "columns",
+    "read_table": "usecols",
+}
+
+
+class _S3RangedFile(io.RawIOBase):
+    """A read-only, seekable file over an S3 object, which only fetches the byte ranges that are read from it.
+
+    It lets readers such as read_parquet fetch the footer of a file and then the row groups and columns they need,
+    instead of downloading the whole object. Wrap it in an io.BufferedReader to avoid issuing many small GETs.
+    """
+
+    def __init__(self, s3_client, bucket: str, key: str, size: int):
+        self._s3 = s3_client
+        self._bucket = bucket
+        self._key = key
+        self._size = size
+        self._position = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self._position + offset
+        elif whence == io.SEEK_END:
+            position = self._size + offset
+        else:
+            raise ValueError(f"Invalid whence: {whence}")
+        if position < 0:
+            raise ValueError(f"Negative seek position: {position}")
+        self._position = position
+        return position
+
+    def readinto(self, buffer) -> int:
+        data = self._read_range(len(buffer))
+        buffer[: len(data)] = data
+        return len(data)
+
+    def readall(self) -> bytes:
+        return self._read_range(self._size - self._position)
+
+    def _read_range(self, size: int) -> bytes:
+        if size <= 0 or self._position >= self._size:
+            return b""
+        end = min(self._position + size, self._size) - 1
+        s3_object = self._s3.get_object(
+            Bucket=self._bucket, Key=self._key, Range=f"bytes={self._position}-{end}"
+        )
+        data = s3_object["Body"].read()
+        self._position += len(data)
+        return data
+
+
+def _get_compression_codings(content_encoding: Optional[str]) -> List[str]:
+    """Returns the codings of an HTTP Content-Encoding that compress the content, in the order in which they were
+    applied. Other codings, such as "identity" or "aws-chunked", are ignored."""
+    return [
+        coding
+        for coding in (
+            coding.strip().lower() for coding in (content_encoding or "").split(",")
+        )
+        if coding in ("gzip", "x-gzip", "zstd")
+    ]
+
+
+def _decompress_stream(stream, content_encoding: Optional[str]):
+    """Wraps a binary stream in the decompressors of its HTTP Content-Encoding, e.g. "gzip" or "zstd"."""
+    for coding in reversed(_get_compression_codings(content_encoding)):
+        if coding in ("gzip", "x-gzip"):
+            stream = gzip.GzipFile(fileobj=stream, mode="rb")
+        elif coding == "zstd":
+            if zstandard is None:
+                raise ge_exceptions.ExecutionEngineError(
+                    "The zstandard package is required to read zstd-encoded S3 objects."
+                )
+            stream = zstandard.ZstdDecompressor().stream_reader(stream)
+    return stream
+
+
+def _is_parquet_filter_comparison_in_schema(
+    comparison: Tuple, schema: "pyarrow.Schema"
+) -> bool:
+    """Returns whether pyarrow can compare a column of a parquet file to the value of a filter comparison: the column
+    is in the schema of the file, and the value, or each value of an "in" comparison, has a type matching the column.
+    """
+    column, operator, value = comparison
+    if column not in schema.names:
+        return False
+    arrow_type = schema.field(column).type
+    if pyarrow.types.is_dictionary(arrow_type):
+        arrow_type = arrow_type.value_type
+    for literal in value if operator == "in" else [value]:
+        if isinstance(literal, bool):
+            is_comparable = pyarrow.types.is_boolean(arrow_type)
+        elif isinstance(literal, (int, float)):
+            is_comparable = (
+                pyarrow.types.is_integer(arrow_type)
+                or pyarrow.types.is_floating(arrow_type)
+                or pyarrow.types.is_decimal(arrow_type)
+            )
+        elif isinstance(literal, str):
+            is_comparable = pyarrow.types.is_string(
+                arrow_type
+            ) or pyarrow.types.is_large_string(arrow_type)
+        else:
+            is_comparable = False
+        if not is_comparable:
+            return False
+    return True
+
 
 class PandasBatchData(pd.DataFrame):
     # @property
@@ -39,6 +228,57 @@ class PandasBatchData(pd.DataFrame):
         return self.shape[0]
 
 
+class ChunkedPandasBatchData:
+    """A batch that is read from a file one chunk of rows at a time, so that it never needs to fit in memory.
+
+    Iterating over the batch reads the file again, applying the splitting and sampling methods of its batch spec to
+    each chunk. Metrics over a chunked batch are computed by combining partial states computed over every chunk.
+    """
+
+    def __init__(
+        self,
+        reader_fn: Callable,
+        path: str,
+        reader_options: dict,
+        chunksize: int,
+        chunk_transform: Optional[Callable[[pd.DataFrame], pd.DataFrame]] = None,
+    ):
+        self._reader_fn = reader_fn
+        self._path = path
+        self._reader_options = reader_options
+        self._chunksize = chunksize
+        self._chunk_transform = chunk_transform
+
+    @property
+    def chunksize(self) -> int:
+        return self._chunksize
+
+    def __iter__(self) -> Iterator[pd.DataFrame]:
+        reader = self._reader_fn(
+            self._path, chunksize=self._chunksize, **self._reader_options
+        )
+        if isinstance(reader, pd.DataFrame):
+            raise BatchSpecError(
+                f"The reader function {self._reader_fn.__name__} does not support reading a file in chunks."
+            )
+        try:
+            for chunk in reader:
+                if self._chunk_transform is not None:
+                    chunk = self._chunk_transform(chunk)
+                yield chunk
+        finally:
+            close = getattr(reader, "close", None)
+            if close is not None:
+                close()
+
+
+# A row-level partial metric (such as a condition) of a chunked batch. It cannot be held in memory for the whole
+# batch, so it is recomputed on each chunk by the metrics that depend on it.
+_ChunkedPartialMetric = namedtuple(
+    "_ChunkedPartialMetric", ["metric", "metric_class", "metric_fn"]
+)
+
+
 class PandasExecutionEngine(ExecutionEngine):
     """
 PandasExecutionEngine instantiates the great_expectations Expectations API as a subclass of a pandas.DataFrame.
@@ -76,6 +316,9 @@ Notes:
     recognized_batch_spec_defaults = {
         "reader_method",
         "reader_options",
+        "chunksize",
+        "dtype_backend",
+        "memory_map",
     }
 
     def __init__(self, *args, **kwargs):
@@ -83,6 +326,22 @@ Notes:
             "discard_subset_failing_expectations", False
         )
         boto3_options: dict = kwargs.get("boto3_options", {})
+        # Row-condition-filtered frames are memoized per (batch_id, row_condition, condition_parser), so that
+        # expectations sharing a condition only filter the batch once.
+        self._row_condition_cache_max_entries = kwargs.pop(
+            "row_condition_cache_max_entries", DEFAULT_ROW_CONDITION_CACHE_MAX_ENTRIES
+        )
+        self._row_condition_cache = OrderedDict()
+        self._dtype_backend = self._validate_dtype_backend(
+            kwargs.pop("dtype_backend", None) or "numpy"
+        )
+        self._row_condition_cache_lock = threading.Lock()
+        # Chunked batches are resolved by computing the metrics of a pass over each of their chunks in turn; the chunk
+        # being read stands in for its batch in the thread resolving the pass only
+        self._current_chunks = threading.local()
+        # The metrics of each compute domain are resolved together; the columns of the domain are then fetched and
+        # null-filtered once for all of them, in the thread resolving them only
+        self._domain_column_bundles = threading.local()
 
         # Try initializing boto3 client. If unsuccessful, we'll catch it when/if a S3BatchSpec is passed in.
         try:
@@ -96,6 +355,8 @@ Notes:
             {
                 "discard_subset_failing_expectations": self.discard_subset_failing_expectations,
                 "boto3_options": boto3_options,
+                "row_condition_cache_max_entries": self._row_condition_cache_max_entries,
+                "dtype_backend": self._dtype_backend,
             }
         )
 
@@ -103,6 +364,72 @@ Notes:
         super().configure_validator(validator)
         validator.expose_dataframe_methods = True
 
+    @staticmethod
+    def _validate_dtype_backend(dtype_backend: str) -> str:
+        if dtype_backend not in DTYPE_BACKENDS:
+            raise ge_exceptions.InvalidConfigError(
+                f"dtype_backend must be one of {', '.join(DTYPE_BACKENDS)}, not {dtype_backend}."
+            )
+        if dtype_backend == "pyarrow" and (
+            pyarrow is None or not hasattr(pd, "ArrowDtype")
+        ):
+            raise ge_exceptions.ExecutionEngineError(
+                "The pyarrow dtype_backend requires the pyarrow package and pandas 1.5 or later."
+            )
+        return dtype_backend
+
+    @property
+    def dtype_backend(self) -> str:
+        return self._dtype_backend
+
+    def load_batch_data(self, batch_id: str, batch_data: Any, **kwargs) -> None:
+        self._invalidate_row_condition_cache(batch_id)
+        super().load_batch_data(batch_id, batch_data, **kwargs)
+
+    def unload_batch_data(self, batch_id: str) -> None:
+        super().unload_batch_data(batch_id)
+        self._invalidate_row_condition_cache(batch_id)
+
+    def _invalidate_row_condition_cache(self, batch_id: str) -> None:
+        """Evicts the filtered frames memoized for the given batch."""
+        with self._row_condition_cache_lock:
+            for key in [
+                key for key in self._row_condition_cache if key[0] == batch_id
+            ]:
+                del self._row_condition_cache[key]
+
+    def _get_row_condition_filtered_data(
+        self,
+        batch_id: str,
+        data: pd.DataFrame,
+        row_condition: str,
+        condition_parser: str,
+    ) -> pd.DataFrame:
+        """Returns the rows of the batch that satisfy the row_condition, evaluating each distinct condition at most
+        once per batch while it remains among the most recently used ones."""
+        # The rows of a chunk are only filtered by the pass reading it, so they are not memoized
+        cacheable = self._get_current_chunk(batch_id) is None
+        key = (batch_id, row_condition, condition_parser)
+        if cacheable:
+            with self._row_condition_cache_lock:
+                if key in self._row_condition_cache:
+                    self._row_condition_cache.move_to_end(key)
+                    return self._row_condition_cache[key]
+
+        filtered_data = data.query(row_condition, parser=condition_parser).reset_index(
+            drop=True
+        )
+
+        if cacheable and self._caching and self._row_condition_cache_max_entries:
+            with self._row_condition_cache_lock:
+                self._row_condition_cache[key] = filtered_data
+                while (
+                    len(self._row_condition_cache)
+                    > self._row_condition_cache_max_entries
+                ):
+                    self._row_condition_cache.popitem(last=False)
+        return filtered_data
+
     def get_batch_data_and_markers(
         self, batch_spec: BatchSpec
     ) -> Tuple[Any, BatchMarkers]:  # batch_data
@@ -126,8 +453,45 @@ Notes:
 
             path: str = batch_spec["path"]
             reader_fn: Callable = self._get_reader_fn(reader_method, path)
+            reader_method = (
+                reader_method
+                or self.guess_reader_method_from_path(path)["reader_method"]
+            )
+            reader_options = self._get_column_projection_reader_options(
+                batch_spec, reader_method, reader_options, path
+            )
+            reader_options = self._get_row_filter_reader_options(
+                batch_spec, reader_method, reader_options, batch_markers, path
+            )
 
-            batch_data = reader_fn(path, **reader_options)
+            dtype_backend = self._get_dtype_backend(batch_spec)
+            chunksize: Optional[int] = batch_spec.chunksize
+            if chunksize:
+                if batch_spec.get("sampling_method") == "_sample_using_limit":
+                    raise BatchSpecError(
+                        "The _sample_using_limit sampling method cannot be applied to a batch read in chunks."
+                    )
+                batch_data = ChunkedPandasBatchData(
+                    reader_fn=reader_fn,
+                    path=path,
+                    reader_options=reader_options,
+                    chunksize=chunksize,
+                    chunk_transform=partial(
+                        self._apply_splitting_and_sampling_methods, batch_spec
+                    ),
+                )
+            else:
+                batch_data = self._read_batch_data(
+                    reader_fn,
+                    reader_method,
+                    path,
+                    reader_options,
+                    dtype_backend,
+                    memory_map=batch_spec.memory_map,
+                )
+                batch_data = self._project_columns(
+                    batch_spec, reader_method, reader_options, batch_data
+                )
 
         elif isinstance(batch_spec, S3BatchSpec):
             if self._s3 is None:
@@ -135,41 +499,352 @@ Notes:
                     f"""PandasExecutionEngine has been passed a S3BatchSpec,
                         but the ExecutionEngine does not have a boto3 client configured. Please check your config."""
                 )
-            s3_engine = self._s3
             s3_url = S3Url(batch_spec.get("s3"))
             reader_method: str = batch_spec.get("reader_method")
             reader_options: dict = batch_spec.get("reader_options") or {}
 
-            s3_object = s3_engine.get_object(Bucket=s3_url.bucket, Key=s3_url.key)
-
             logger.debug(
                 "Fetching s3 object. Bucket: {} Key: {}".format(
                     s3_url.bucket, s3_url.key
                 )
             )
             reader_fn = self._get_reader_fn(reader_method, s3_url.key)
-            batch_data = reader_fn(
-                StringIO(
-                    s3_object["Body"]
-                    .read()
-                    .decode(s3_object.get("ContentEncoding", "utf-8"))
-                ),
-                **reader_options,
+            reader_method = (
+                reader_method
+                or self.guess_reader_method_from_path(s3_url.key)["reader_method"]
+            )
+            s3_object_file = self._get_s3_object_file(
+                s3_url, reader_method=reader_method
+            )
+            try:
+                reader_options = self._get_column_projection_reader_options(
+                    batch_spec, reader_method, reader_options, s3_object_file
+                )
+                reader_options = self._get_row_filter_reader_options(
+                    batch_spec,
+                    reader_method,
+                    reader_options,
+                    batch_markers,
+                    s3_object_file,
+                )
+                batch_data = self._read_batch_data(
+                    reader_fn,
+                    reader_method,
+                    s3_object_file,
+                    reader_options,
+                    self._get_dtype_backend(batch_spec),
+                )
+            finally:
+                s3_object_file.close()
+            batch_data = self._project_columns(
+                batch_spec, reader_method, reader_options, batch_data
             )
         else:
             raise BatchSpecError(
                 f"batch_spec must be of type RuntimeDataBatchSpec, PathBatchSpec, or S3BatchSpec, not {batch_spec.__class__.__name__}"
             )
 
+        if isinstance(batch_data, ChunkedPandasBatchData):
+            # Splitting and sampling are applied to each chunk as it is read, and the data is never fingerprinted
+            return batch_data, batch_markers
+
+        batch_data = self._convert_to_dtype_backend(
+            batch_data, self._get_dtype_backend(batch_spec)
+        )
         batch_data = self._apply_splitting_and_sampling_methods(batch_spec, batch_data)
         if batch_data.memory_usage().sum() < HASH_THRESHOLD:
             batch_markers["pandas_data_fingerprint"] = hash_pandas_dataframe(batch_data)
+        else:
+            # Hashing every row of a large batch would take too long, so its fingerprint only covers a sample of its
+            # rows, along with the metadata of the file or S3 object it was read from. Without such metadata, e.g. for
+            # an in-memory DataFrame, changes outside the sample would go unnoticed, and metrics cached under the
+            # fingerprint would be reused for the changed data, so the batch is not fingerprinted.
+            source_metadata = self._get_source_metadata(batch_spec)
+            if source_metadata is not None:
+                batch_markers["pandas_data_fingerprint"] = hash_pandas_dataframe(
+                    batch_data, sampled=True, source_metadata=source_metadata
+                )
+                batch_markers["pandas_data_fingerprint_sampled"] = True
 
         typed_batch_data = self._get_typed_batch_data(batch_data)
 
         return typed_batch_data, batch_markers
 
+    def _get_source_metadata(self, batch_spec: BatchSpec) -> Optional[dict]:
+        """Returns the metadata identifying the version of the file or S3 object a batch is read from, or None if the
+        batch is not read from a local file or S3."""
+        if isinstance(batch_spec, PathBatchSpec) and os.path.isfile(batch_spec.path):
+            stat = os.stat(batch_spec.path)
+            return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+        if isinstance(batch_spec, S3BatchSpec) and self._s3 is not None:
+            s3_url = S3Url(batch_spec.s3)
+            s3_object_head = self._s3.head_object(Bucket=s3_url.bucket, Key=s3_url.key)
+            return {
+                "size": s3_object_head.get("ContentLength"),
+                "etag": s3_object_head.get("ETag"),
+                "last_modified": s3_object_head.get("LastModified"),
+            }
+        return None
+
+    def _get_dtype_backend(self, batch_spec: BatchSpec) -> str:
+        """Returns the dtype_backend of the batch_spec, or else of the execution engine.
+
+        Memory-mapped batches default to the pyarrow dtype_backend, since converting them to numpy dtypes would copy
+        them out of the mapped file.
+        """
+        dtype_backend = batch_spec.get("dtype_backend")
+        if dtype_backend is None and batch_spec.get("memory_map"):
+            dtype_backend = "pyarrow"
+        return self._validate_dtype_backend(dtype_backend or self._dtype_backend)
+
+    @staticmethod
+    def _read_batch_data(
+        reader_fn: Callable,
+        reader_method: str,
+        source,
+        reader_options: dict,
+        dtype_backend: str,
+        memory_map: bool = False,
+    ):
+        """Reads a file with its pandas reader, or as a pyarrow.Table if the dtype_backend is "pyarrow" and pyarrow can
+        read it with the given reader options.
+
+        Feather (Arrow IPC) files can be memory-mapped, in which case the Table refers to the pages of the file in the
+        page cache, which are shared by all the processes reading it, rather than to a copy of its data.
+        """
+        if memory_map:
+            if pyarrow is None:
+                raise ge_exceptions.ExecutionEngineError(
+                    "The pyarrow package is required to memory-map a batch."
+                )
+            if reader_method != "read_feather" or not (
+                set(reader_options) <= ARROW_READER_OPTIONS["read_feather"]
+            ):
+                raise BatchSpecError(
+                    "Only feather (Arrow IPC) files, read with no reader options other than columns, can be "
+                    "memory-mapped."
+                )
+            return pyarrow.feather.read_table(source, memory_map=True, **reader_options)
+
+        arrow_reader_options = ARROW_READER_OPTIONS.get(reader_method)
+        if (
+            dtype_backend == "pyarrow"
+            and arrow_reader_options is not None
+            and set(reader_options) <= arrow_reader_options
+        ):
+            if reader_method == "read_parquet":
+                return pyarrow.parquet.read_table(source, **reader_options)
+            return pyarrow.feather.read_table(source, **reader_options)
+        return reader_fn(source, **reader_options)
+
+    @staticmethod
+    def _convert_to_dtype_backend(batch_data, dtype_backend: str) -> pd.DataFrame:
+        """Converts batch data, which may be a pyarrow.Table, into a DataFrame of the dtypes of the dtype_backend.
+
+        The columns of a pyarrow.Table are wrapped in ArrowDtypes without copying their data. DataFrames of the numpy
+        dtype_backend are left as they are.
+        """
+        if pyarrow is not None and isinstance(batch_data, pyarrow.Table):
+            if dtype_backend == "pyarrow":
+                return batch_data.to_pandas(types_mapper=pd.ArrowDtype)
+            return batch_data.to_pandas()
+        if dtype_backend == "pyarrow" and not all(
+            isinstance(dtype, pd.ArrowDtype) for dtype in batch_data.dtypes
+        ):
+            return pyarrow.Table.from_pandas(batch_data).to_pandas(
+                types_mapper=pd.ArrowDtype
+            )
+        return batch_data
+
+    @staticmethod
+    def _get_columns_to_load(batch_spec: BatchSpec) -> Optional[List[str]]:
+        """Returns the columns of a file to load for a batch_spec, which include the columns used to split and sample
+        it, or None if all the columns are to be loaded."""
+        columns = batch_spec.get("columns")
+        if not columns:
+            return None
+        columns = list(columns)
+        for method_kwargs in [
+            batch_spec.get("splitter_kwargs") or {},
+            batch_spec.get("sampling_kwargs") or {},
+        ]:
+            if method_kwargs.get("column_name") is not None:
+                columns.append(method_kwargs["column_name"])
+            columns.extend(method_kwargs.get("column_names") or [])
+        return list(dict.fromkeys(columns))
+
+    def _get_column_projection_reader_options(
+        self, batch_spec: BatchSpec, reader_method: str, reader_options: dict, source
+    ) -> dict:
+        """Adds the reader option making the reader load only the columns of the batch_spec, unless the reader has no
+        such option or it is already set.
+
+        The columns missing from the file are left out, to be reported by the expectations: a callable usecols
+        ignores them, and the columns of parquet, feather and orc files are looked up in their schema. If the schema
+        cannot be read, all the columns are loaded and projected afterwards (see _project_columns).
+        """
+        columns = self._get_columns_to_load(batch_spec)
+        reader_option = COLUMN_PROJECTION_READER_OPTIONS.get(reader_method)
+        if columns is None or reader_option is None or reader_option in reader_options:
+            return reader_options
+        if reader_option == "usecols":
+            columns = set(columns)
+            return {**reader_options, "usecols": lambda column: column in columns}
+        schema = self._read_columnar_file_schema(reader_method, source)
+        if schema is None:
+            return reader_options
+        return {
+            **reader_options,
+            "columns": [column for column in columns if column in schema.names],
+        }
+
+    @staticmethod
+    def _read_columnar_file_schema(
+        reader_method: str, source
+    ) -> Optional["pyarrow.Schema"]:
+        """Returns the schema of a parquet, feather or orc file, given as a path or a seekable binary file, or None if
+        it is not such a file or its schema cannot be read. A file is left at the position it was at."""
+        if pyarrow is None or reader_method not in [
+            "read_feather",
+            "read_orc",
+            "read_parquet",
+        ]:
+            return None
+        position = None if isinstance(source, str) else source.tell()
+        try:
+            if reader_method == "read_parquet":
+                return pyarrow.parquet.read_schema(source)
+            if reader_method == "read_feather":
+                return pyarrow.ipc.open_file(source).schema
+            from pyarrow import orc
+
+            return orc.ORCFile(source).schema
+        except (ImportError, OSError, pyarrow.ArrowException) as e:
+            logger.debug(f"Unable to read the schema of the file: {e}")
+            return None
+        finally:
+            if position is not None:
+                source.seek(position)
+
+    def _project_columns(
+        self,
+        batch_spec: BatchSpec,
+        reader_method: str,
+        reader_options: dict,
+        batch_data,
+    ):
+        """Drops the columns that are not to be loaded from the data read by a reader that loaded all of them."""
+        columns = self._get_columns_to_load(batch_spec)
+        if (
+            columns is None
+            or COLUMN_PROJECTION_READER_OPTIONS.get(reader_method) in reader_options
+        ):
+            return batch_data
+        if pyarrow is not None and isinstance(batch_data, pyarrow.Table):
+            return batch_data.select(
+                [column for column in batch_data.column_names if column in columns]
+            )
+        return batch_data[
+            [column for column in batch_data.columns if column in columns]
+        ]
+
+    @staticmethod
+    def _get_batch_spec_condition_parser(batch_spec: BatchSpec) -> str:
+        condition_parser = batch_spec.get("condition_parser")
+        if condition_parser not in ["python", "pandas"]:
+            raise BatchSpecError(
+                "condition_parser is required when setting a row_condition, and must be 'python' or 'pandas'"
+            )
+        return condition_parser
+
+    def _get_row_filter_reader_options(
+        self,
+        batch_spec: BatchSpec,
+        reader_method: str,
+        reader_options: dict,
+        batch_markers: BatchMarkers,
+        source,
+    ) -> dict:
+        """Pushes the row_condition of a batch_spec down to read_parquet as filters, so that the row groups whose
+        statistics exclude the condition are not read. The filters are recorded in the batch_markers.
+
+        The row_condition is applied to the rows that are read in any case, since it might not be fully translated.
+        Comparisons to columns missing from the schema of the file, or to literals of another type than the column,
+        which pyarrow would refuse, are left out of the filters.
+        """
+        row_condition = batch_spec.get("row_condition")
+        if (
+            not row_condition
+            or reader_method != "read_parquet"
+            or "filters" in reader_options
+        ):
+            return reader_options
+        self._get_batch_spec_condition_parser(batch_spec)
+        try:
+            filters = parse_condition_to_parquet_filters(row_condition)
+        except ConditionParserError:
+            logger.debug(f"Unable to push down the row_condition {row_condition}")
+            return reader_options
+        schema = self._read_columnar_file_schema(reader_method, source)
+        if schema is None:
+            return reader_options
+        filters = [
+            [
+                comparison
+                for comparison in conjunction
+                if _is_parquet_filter_comparison_in_schema(comparison, schema)
+            ]
+            for conjunction in filters
+        ]
+        if not all(filters):
+            # A conjunction left without comparisons selects all the rows
+            logger.debug(f"Unable to push down the row_condition {row_condition}")
+            return reader_options
+        batch_markers["pushed_down_filters"] = [
+            [list(comparison) for comparison in conjunction] for conjunction in filters
+        ]
+        return {**reader_options, "filters": filters}
+
+    def _get_s3_object_file(self, s3_url: S3Url, reader_method: str):
+        """Returns a binary file-like object over an S3 object, which is decompressed according to its
+        Content-Encoding.
+
+        The object is streamed to the reader, so that its full content is never held in memory besides the parsed
+        DataFrame, except for readers that need to seek in their file: those read it through ranged GETs, or from
+        memory if it must be decompressed first.
+        """
+        if reader_method in RANDOM_ACCESS_READER_METHODS:
+            s3_object_head = self._s3.head_object(
+                Bucket=s3_url.bucket, Key=s3_url.key
+            )
+            if not _get_compression_codings(s3_object_head.get("ContentEncoding")):
+                return io.BufferedReader(
+                    _S3RangedFile(
+                        self._s3,
+                        bucket=s3_url.bucket,
+                        key=s3_url.key,
+                        size=s3_object_head["ContentLength"],
+                    ),
+                    buffer_size=S3_RANGE_SIZE,
+                )
+
+        s3_object = self._s3.get_object(Bucket=s3_url.bucket, Key=s3_url.key)
+        s3_object_file = _decompress_stream(
+            s3_object["Body"], s3_object.get("ContentEncoding")
+        )
+        if reader_method in RANDOM_ACCESS_READER_METHODS:
+            with s3_object_file:
+                return io.BytesIO(s3_object_file.read())
+        return s3_object_file
+
     def _apply_splitting_and_sampling_methods(self, batch_spec, batch_data):
+        # The row_condition of a batch_spec restricts the batch to the rows satisfying it, before it is split
+        if batch_spec.get("row_condition"):
+            batch_data = batch_data.query(
+                batch_spec["row_condition"],
+                parser=self._get_batch_spec_condition_parser(batch_spec),
+            )
+
         if batch_spec.get("splitter_method"):
             splitter_fn = getattr(self, batch_spec.get("splitter_method"))
             splitter_kwargs: str = batch_spec.get("splitter_kwargs") or {}
@@ -182,9 +857,255 @@ Notes:
         return batch_data
 
     def _get_typed_batch_data(self, batch_data):
+        if isinstance(batch_data, ChunkedPandasBatchData):
+            return batch_data
         typed_batch_data = PandasBatchData(batch_data)
         return typed_batch_data
 
+    def resolve_metrics(
+        self,
+        metrics_to_resolve: Iterable[MetricConfiguration],
+        metrics: Dict[Tuple, Any] = None,
+        runtime_configuration: dict = None,
+    ) -> dict:
+        """Resolves the metrics of chunked batches by reading them chunk by chunk (see ChunkedPandasBatchData), and
+        the other metrics in bundles of the metrics over the same compute domain (see resolve_domain_bundle)."""
+        metrics_to_resolve = list(metrics_to_resolve)
+        chunked_metrics_to_resolve = []
+        domain_bundles = defaultdict(list)
+        for metric_to_resolve in metrics_to_resolve:
+            if isinstance(
+                self._get_domain_batch_data(metric_to_resolve.metric_domain_kwargs),
+                ChunkedPandasBatchData,
+            ):
+                chunked_metrics_to_resolve.append(metric_to_resolve)
+            else:
+                domain_bundles[
+                    self._get_compute_domain_id(metric_to_resolve.metric_domain_kwargs)
+                ].append(metric_to_resolve)
+
+        resolved_metrics = dict()
+        for domain_bundle in domain_bundles.values():
+            resolved_metrics.update(
+                self.resolve_domain_bundle(
+                    domain_bundle,
+                    metrics=metrics,
+                    runtime_configuration=runtime_configuration,
+                )
+            )
+        if chunked_metrics_to_resolve:
+            resolved_metrics.update(
+                self._resolve_chunked_metrics(
+                    metrics_to_resolve=chunked_metrics_to_resolve,
+                    metrics=metrics or dict(),
+                    runtime_configuration=runtime_configuration,
+                )
+            )
+        return resolved_metrics
+
+    def resolve_domain_bundle(
+        self,
+        metrics_to_resolve: List[MetricConfiguration],
+        metrics: Optional[Dict[Tuple, Any]] = None,
+        runtime_configuration: Optional[dict] = None,
+    ) -> dict:
+        """Resolves metrics over the same compute domain, such as the conditions and aggregates of the columns of a
+        batch, or the unexpected outputs of the map metrics over them, in a single pass over the domain.
+
+        Each column of the domain is fetched, and filtered for nulls, once for all the metrics (see get_domain_column),
+        rather than once per metric."""
+        self._domain_column_bundles.columns = dict()
+        try:
+            return super().resolve_metrics(
+                metrics_to_resolve=metrics_to_resolve,
+                metrics=metrics,
+                runtime_configuration=runtime_configuration,
+            )
+        finally:
+            self._domain_column_bundles.columns = None
+
+    def get_domain_column(
+        self, domain_kwargs: dict, filter_column_isnull: bool = False
+    ) -> Tuple[pd.Series, dict, dict]:
+        """Returns the column of a column domain, without its null values if filter_column_isnull, along with the
+        compute and accessor domain kwargs of the domain (see get_compute_domain).
+
+        While a bundle of metrics over the domain is being resolved (see resolve_domain_bundle), the column is only
+        fetched and filtered once for all of them."""
+        domain_columns = getattr(self._domain_column_bundles, "columns", None)
+        key = (IDDict(domain_kwargs).to_id(), filter_column_isnull)
+        if domain_columns is not None and key in domain_columns:
+            return domain_columns[key]
+        df, compute_domain_kwargs, accessor_domain_kwargs = self.get_compute_domain(
+            domain_kwargs=domain_kwargs, domain_type=MetricDomainTypes.COLUMN
+        )
+        column = df[accessor_domain_kwargs["column"]]
+        if filter_column_isnull:
+            column = column[column.notnull()]
+        domain_column = (column, compute_domain_kwargs, accessor_domain_kwargs)
+        if domain_columns is not None:
+            domain_columns[key] = domain_column
+        return domain_column
+
+    def _get_compute_domain_id(self, domain_kwargs: dict) -> str:
+        """Returns an identifier of the data a domain is computed over: its batch and row_condition, without the
+        columns that metrics access within it."""
+        return IDDict(
+            {
+                "batch_id": domain_kwargs.get("batch_id") or self.active_batch_data_id,
+                **{
+                    key: value
+                    for key, value in domain_kwargs.items()
+                    if key
+                    not in ["batch_id", "column", "column_A", "column_B", "columns"]
+                },
+            }
+        ).to_id()
+
+    def _get_domain_batch_data(self, domain_kwargs: dict) -> Any:
+        batch_id = domain_kwargs.get("batch_id") or self.active_batch_data_id
+        return self.loaded_batch_data_dict.get(batch_id)
+
+    def _resolve_chunked_metrics(
+        self,
+        metrics_to_resolve: List[MetricConfiguration],
+        metrics: Dict[Tuple, Any],
+        runtime_configuration: Optional[dict],
+    ) -> dict:
+        """Resolves metrics of chunked batches. The metrics of each batch that need its data are all computed in a
+        single pass over its chunks, using the ChunkMerger of their metric provider to combine the partial states
+        computed over every chunk."""
+        resolved_metrics = dict()
+        metrics_by_batch_id = defaultdict(list)
+        for metric_to_resolve in metrics_to_resolve:
+            batch_cache_key = self._get_batch_cache_key(
+                metric_to_resolve.metric_domain_kwargs
+            )
+            cached_value = self._metric_cache.get(
+                batch_cache_key, metric_to_resolve.id, _MISSING
+            )
+            if cached_value is not _MISSING:
+                resolved_metrics[metric_to_resolve.id] = cached_value
+                continue
+
+            metric_class, metric_fn = get_metric_provider(
+                metric_name=metric_to_resolve.metric_name, execution_engine=self
+            )
+            chunk_merger = metric_class.get_chunk_merger(metric_to_resolve)
+            if metric_fn is None or chunk_merger is None:
+                raise GreatExpectationsError(
+                    f"The metric {metric_to_resolve.metric_name} cannot be computed over a batch that is read in "
+                    f"chunks."
+                )
+            metric_fn_type = getattr(
+                metric_fn, "metric_fn_type", MetricFunctionTypes.VALUE
+            )
+            if isinstance(metric_fn_type, MetricPartialFunctionTypes):
+                resolved_metrics[metric_to_resolve.id] = _ChunkedPartialMetric(
+                    metric_to_resolve, metric_class, metric_fn
+                )
+            elif not chunk_merger.uses_data:
+                resolved_metrics[metric_to_resolve.id] = metric_fn(
+                    **self._get_chunk_metric_provider_kwargs(
+                        metric_to_resolve,
+                        metric_class,
+                        metrics,
+                        runtime_configuration,
+                    )
+                )
+                self._metric_cache.put(
+                    batch_cache_key,
+                    metric_to_resolve.id,
+                    resolved_metrics[metric_to_resolve.id],
+                )
+            else:
+                batch_id = (
+                    metric_to_resolve.metric_domain_kwargs.get("batch_id")
+                    or self.active_batch_data_id
+                )
+                metrics_by_batch_id[batch_id].append(
+                    (
+                        metric_to_resolve,
+                        metric_class,
+                        chunk_merger.get_state or metric_fn,
+                        chunk_merger.merge,
+                    )
+                )
+
+        for batch_id, metric_entries in metrics_by_batch_id.items():
+            start = time.perf_counter()
+            chunk_states = {metric.id: [] for metric, *_ in metric_entries}
+            current_chunks = self._current_chunks.__dict__.setdefault("chunks", {})
+            try:
+                for chunk in self._batch_data_dict[batch_id]:
+                    current_chunks[batch_id] = PandasBatchData(chunk)
+                    # Row-level partial metrics computed over this chunk are shared by the metrics of the pass
+                    chunk_metrics = dict(metrics)
+                    for metric, metric_class, get_state, _ in metric_entries:
+                        metric_provider_kwargs = self._get_chunk_metric_provider_kwargs(
+                            metric,
+                            metric_class,
+                            chunk_metrics,
+                            runtime_configuration,
+                        )
+                        chunk_states[metric.id].append(
+                            get_state(**metric_provider_kwargs)
+                        )
+            finally:
+                current_chunks.pop(batch_id, None)
+
+            for metric, _, _, merge in metric_entries:
+                resolved_metrics[metric.id] = merge(chunk_states[metric.id])
+                self._metric_cache.put(
+                    self._get_batch_cache_key(metric.metric_domain_kwargs),
+                    metric.id,
+                    resolved_metrics[metric.id],
+                )
+            self._record_metric_resolution_time(
+                [metric for metric, *_ in metric_entries], start
+            )
+
+        return resolved_metrics
+
+    def _get_current_chunk(self, batch_id: str) -> Optional[PandasBatchData]:
+        """Returns the chunk of a chunked batch that the current thread is computing metrics over, if any."""
+        return getattr(self._current_chunks, "chunks", {}).get(batch_id)
+
+    def _get_chunk_metric_provider_kwargs(
+        self,
+        metric: MetricConfiguration,
+        metric_class: type,
+        chunk_metrics: Dict[Tuple, Any],
+        runtime_configuration: Optional[dict],
+    ) -> dict:
+        """Returns the keyword arguments of the metric provider function of a metric of a chunked batch, computing the
+        row-level partial metrics it depends on over the chunk currently loaded."""
+        metric_dependencies = dict()
+        for name, dependency in metric.metric_dependencies.items():
+            try:
+                dependency_value = chunk_metrics[dependency.id]
+            except KeyError as e:
+                raise GreatExpectationsError(f"Missing metric dependency: {str(e)}")
+            if isinstance(dependency_value, _ChunkedPartialMetric):
+                dependency_value = dependency_value.metric_fn(
+                    **self._get_chunk_metric_provider_kwargs(
+                        dependency_value.metric,
+                        dependency_value.metric_class,
+                        chunk_metrics,
+                        runtime_configuration,
+                    )
+                )
+                chunk_metrics[dependency.id] = dependency_value
+            metric_dependencies[name] = dependency_value
+        return {
+            "cls": metric_class,
+            "execution_engine": self,
+            "metric_domain_kwargs": metric.metric_domain_kwargs,
+            "metric_value_kwargs": metric.metric_value_kwargs,
+            "metrics": metric_dependencies,
+            "runtime_configuration": runtime_configuration,
+        }
+
     @property
     def dataframe(self):
         """Tests whether or not a Batch has been loaded. If the loaded batch does not exist, raises a
@@ -233,6 +1154,61 @@ Notes:
                 f'Unable to find reader_method "{reader_method}" in pandas.'
             )
 
+    @staticmethod
+    def convert_to_memory_mapped_batch_spec(
+        batch_spec: RuntimeDataBatchSpec, path: str
+    ) -> PathBatchSpec:
+        """Writes the batch data of a RuntimeDataBatchSpec, a DataFrame or pyarrow.Table, to an uncompressed feather
+        (Arrow IPC) file, and returns a PathBatchSpec loading that file with memory mapping.
+
+        The returned batch spec can be sent to validators in other processes, which then share the copy of the data in
+        the page cache instead of each holding their own. The file is written under a temporary name and then renamed,
+        so that it is never read partially written; it is left for the caller to delete.
+
+        Args:
+            batch_spec (RuntimeDataBatchSpec): the batch spec holding the data to share; its other keys, such as its
+                splitter and sampling methods, are kept in the returned batch spec.
+            path (str): the path of the file to write.
+
+        Returns:
+            A PathBatchSpec with memory_map set to True
+        """
+        if pyarrow is None:
+            raise ge_exceptions.ExecutionEngineError(
+                "The pyarrow package is required to memory-map a batch."
+            )
+        batch_data = batch_spec.batch_data
+        if isinstance(batch_data, pd.DataFrame):
+            batch_data = pyarrow.Table.from_pandas(batch_data)
+        elif not isinstance(batch_data, pyarrow.Table):
+            raise BatchSpecError(
+                "Only the batch data of a RuntimeDataBatchSpec that holds a DataFrame or a pyarrow.Table can be "
+                "memory-mapped."
+            )
+
+        temp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+        try:
+            pyarrow.feather.write_feather(
+                batch_data, temp_path, compression="uncompressed"
+            )
+            os.replace(temp_path, path)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+        return PathBatchSpec(
+            {
+                **{
+                    key: value
+                    for key, value in batch_spec.items()
+                    if key != "batch_data"
+                },
+                "path": path,
+                "reader_method": "read_feather",
+                "memory_map": True,
+            }
+        )
+
     # NOTE Abe 20201105: Any reason this shouldn't be a private method?
     @staticmethod
     def guess_reader_method_from_path(path):
@@ -255,7 +1231,11 @@ Notes:
             return {"reader_method": "read_json"}
         elif path.endswith(".pkl"):
             return {"reader_method": "read_pickle"}
-        elif path.endswith(".feather"):
+        elif (
+            path.endswith(".feather")
+            or path.endswith(".arrow")
+            or path.endswith(".ipc")
+        ):
             return {"reader_method": "read_feather"}
         elif path.endswith(".csv.gz") or path.endswith(".tsv.gz"):
             return {
@@ -298,6 +1278,7 @@ Notes:
         if batch_id is None:
             # We allow no batch id specified if there is only one batch
             if self.active_batch_data_id is not None:
+                batch_id = self.active_batch_data_id
                 data = self.active_batch_data
             else:
                 raise ValidationError(
@@ -308,8 +1289,12 @@ Notes:
                 data = self.loaded_batch_data_dict[batch_id]
             else:
                 raise ValidationError(f"Unable to find batch with batch_id {batch_id}")
+        chunk = self._get_current_chunk(batch_id)
+        if chunk is not None:
+            data = chunk
 
-        compute_domain_kwargs = copy.deepcopy(domain_kwargs)
+        # Domain kwargs only hold identifiers, so a shallow copy keeps the caller's dictionary intact
+        compute_domain_kwargs = dict(domain_kwargs)
         accessor_domain_kwargs = dict()
         table = domain_kwargs.get("table", None)
         if table:
@@ -330,8 +1315,8 @@ Notes:
                 )
             else:
                 # Querying row condition
-                data = data.query(row_condition, parser=condition_parser).reset_index(
-                    drop=True
+                data = self._get_row_condition_filtered_data(
+                    batch_id, data, row_condition, condition_parser
                 )
 
         # Warning user if accessor keys are in any domain that is not of type table, will be ignored
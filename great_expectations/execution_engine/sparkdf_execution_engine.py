@@ -2,8 +2,10 @@ import copy
 import datetime
 import hashlib
 import logging
+import time
 import uuid
-from typing import Any, Callable, Dict, Iterable, Optional, Tuple, Union
+from collections import defaultdict, namedtuple
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
 
 from great_expectations.core.batch import BatchMarkers, BatchSpec
 from great_expectations.core.id_dict import IDDict
@@ -21,16 +23,23 @@ from ..exceptions import (
     GreatExpectationsError,
     ValidationError,
 )
+from ..expectations.registry import get_metric_provider
 from ..expectations.row_conditions import parse_condition_to_spark
 from ..validator.validation_graph import MetricConfiguration
-from .execution_engine import ExecutionEngine, MetricDomainTypes
+from .execution_engine import (
+    _MISSING,
+    ExecutionEngine,
+    MetricDomainTypes,
+    MetricPartialFunctionTypes,
+)
 
 logger = logging.getLogger(__name__)
 
 try:
     import pyspark
     import pyspark.sql.functions as F
-    from pyspark.sql import DataFrame, SparkSession
+    from pyspark import StorageLevel
+    from pyspark.sql import DataFrame, Row, SparkSession, Window
     from pyspark.sql.types import (
         BooleanType,
         DateType,
@@ -51,8 +60,11 @@ try:
 
 except ImportError:
     pyspark = None
+    StorageLevel = None
     SparkSession = None
     DataFrame = None
+    Row = None
+    Window = None
     F = None
     StructType = (None,)
     StructField = (None,)
@@ -151,7 +163,9 @@ class SparkDFExecutionEngine(ExecutionEngine):
 
     def __init__(self, *args, **kwargs):
         # Creation of the Spark DataFrame is done outside this class
+        # persist is either a boolean or the name of the StorageLevel at which loaded batches are persisted
         self._persist = kwargs.pop("persist", True)
+        self._persisted_batch_ids = set()
         self._spark_config = kwargs.pop("spark_config", {})
         try:
             builder = SparkSession.builder
@@ -167,6 +181,8 @@ class SparkDFExecutionEngine(ExecutionEngine):
             )
             self.spark = None
 
+        self._storage_level = self._get_storage_level(self._persist)
+
         super().__init__(*args, **kwargs)
 
         self._config.update(
@@ -176,6 +192,56 @@ class SparkDFExecutionEngine(ExecutionEngine):
             }
         )
 
+    @staticmethod
+    def _get_storage_level(persist: Union[bool, str]) -> Optional["StorageLevel"]:
+        if not persist or StorageLevel is None:
+            return None
+        if persist is True:
+            return StorageLevel.MEMORY_AND_DISK
+        storage_level = getattr(StorageLevel, str(persist).upper(), None)
+        if not isinstance(storage_level, StorageLevel):
+            raise ExecutionEngineError(
+                f"Unable to persist batches at unknown Spark storage level {persist}."
+            )
+        return storage_level
+
+    @property
+    def persisted_batch_ids(self) -> List[str]:
+        """The ids of the loaded batches currently persisted by the execution engine."""
+        return sorted(self._persisted_batch_ids)
+
+    def load_batch_data(self, batch_id: str, batch_data: Any, **kwargs) -> None:
+        if batch_id in self._batch_data_dict:
+            self._unpersist_batch_data(batch_id)
+        super().load_batch_data(batch_id, batch_data, **kwargs)
+        self._persist_batch_data(batch_id)
+
+    def unload_batch_data(self, batch_id: str) -> None:
+        self._unpersist_batch_data(batch_id)
+        super().unload_batch_data(batch_id)
+
+    def release_resources(self) -> None:
+        """Unpersists the loaded batches; they are persisted again when metrics are next computed over them."""
+        for batch_id in self.persisted_batch_ids:
+            self._unpersist_batch_data(batch_id)
+
+    def _persist_batch_data(self, batch_id: str) -> None:
+        """Persists a loaded batch at the configured storage level, so that the metrics computed over it do not read
+        its source again. Batches that were already cached, e.g. by the caller, are left alone."""
+        if self._storage_level is None or batch_id in self._persisted_batch_ids:
+            return
+        batch_data = self._batch_data_dict[batch_id]
+        if not isinstance(batch_data, DataFrame) or batch_data.is_cached:
+            return
+        batch_data.persist(self._storage_level)
+        self._persisted_batch_ids.add(batch_id)
+
+    def _unpersist_batch_data(self, batch_id: str) -> None:
+        if batch_id not in self._persisted_batch_ids:
+            return
+        self._persisted_batch_ids.remove(batch_id)
+        self._batch_data_dict[batch_id].unpersist()
+
     @property
     def dataframe(self):
         """If a batch has been loaded, returns a Spark Dataframe containing the data within the loaded batch"""
@@ -230,6 +296,13 @@ class SparkDFExecutionEngine(ExecutionEngine):
             )
 
         batch_data = self._apply_splitting_and_sampling_methods(batch_spec, batch_data)
+        columns = batch_spec.get("columns")
+        if columns and not isinstance(batch_spec, RuntimeDataBatchSpec):
+            # Spark only reads the selected columns of the file; those missing from it are reported by the
+            # expectations
+            batch_data = batch_data.select(
+                *[column for column in batch_data.columns if column in columns]
+            )
         typed_batch_data = SparkDFBatchData(batch_data)
 
         return typed_batch_data, batch_markers
@@ -332,6 +405,7 @@ class SparkDFExecutionEngine(ExecutionEngine):
         if batch_id is None:
             # We allow no batch id specified if there is only one batch
             if self.active_batch_data:
+                self._persist_batch_data(self.active_batch_data_id)
                 data = self.active_batch_data
             else:
                 raise ValidationError(
@@ -339,6 +413,7 @@ class SparkDFExecutionEngine(ExecutionEngine):
                 )
         else:
             if batch_id in self.loaded_batch_data_dict:
+                self._persist_batch_data(batch_id)
                 data = self.loaded_batch_data_dict[batch_id]
             else:
                 raise ValidationError(f"Unable to find batch with batch_id {batch_id}")
@@ -351,18 +426,9 @@ class SparkDFExecutionEngine(ExecutionEngine):
                 "SparkExecutionEngine does not currently support multiple named tables."
             )
 
-        row_condition = domain_kwargs.get("row_condition", None)
-        if row_condition:
-            condition_parser = domain_kwargs.get("condition_parser", None)
-            if condition_parser == "spark":
-                data = data.filter(row_condition)
-            elif condition_parser == "great_expectations__experimental__":
-                parsed_condition = parse_condition_to_spark(row_condition)
-                data = data.filter(parsed_condition)
-            else:
-                raise GreatExpectationsError(
-                    f"unrecognized condition_parser {str(condition_parser)}for Spark execution engine"
-                )
+        row_condition = self._get_row_condition_column(domain_kwargs)
+        if row_condition is not None:
+            data = data.filter(row_condition)
 
         # Warning user if accessor keys are in any domain that is not of type table, will be ignored
         if (
@@ -448,6 +514,23 @@ class SparkDFExecutionEngine(ExecutionEngine):
 
         return data, compute_domain_kwargs, accessor_domain_kwargs
 
+    @staticmethod
+    def _get_row_condition_column(
+        domain_kwargs: dict,
+    ) -> Optional["pyspark.sql.Column"]:
+        """Returns the row_condition of the domain as a Spark column expression, or None if it has none."""
+        row_condition = domain_kwargs.get("row_condition", None)
+        if not row_condition:
+            return None
+        condition_parser = domain_kwargs.get("condition_parser", None)
+        if condition_parser == "spark":
+            return F.expr(row_condition)
+        elif condition_parser == "great_expectations__experimental__":
+            return parse_condition_to_spark(row_condition)
+        raise GreatExpectationsError(
+            f"unrecognized condition_parser {str(condition_parser)}for Spark execution engine"
+        )
+
     def add_column_row_condition(
         self, domain_kwargs, column_name=None, filter_null=True, filter_nan=False
     ):
@@ -550,6 +633,273 @@ class SparkDFExecutionEngine(ExecutionEngine):
 
         return resolved_metrics
 
+    def resolve_metrics(
+        self,
+        metrics_to_resolve: Iterable[MetricConfiguration],
+        metrics: Dict[Tuple, Any] = None,
+        runtime_configuration: dict = None,
+    ) -> dict:
+        """Resolves metrics as the ExecutionEngine does, except that the unexpected values, rows and value counts of
+        all the map metrics over the same dataframe are collected together (see resolve_unexpected_output_bundle),
+        rather than by one Spark job per metric.
+
+        The row_condition of a compute domain (such as the null filter of each column) is folded into the unexpected
+        condition of its metrics, so that metrics over different row conditions of a dataframe are bundled together.
+        Window conditions are only bundled with metrics of the same compute domain, since they are evaluated over the
+        rows the row_condition keeps."""
+        if metrics is None:
+            metrics = dict()
+        metrics_to_resolve = list(metrics_to_resolve)
+
+        unexpected_output_bundles = defaultdict(list)
+        for metric_to_resolve in metrics_to_resolve:
+            condition_dependency = metric_to_resolve.metric_dependencies.get(
+                "unexpected_condition"
+            )
+            if condition_dependency is None or condition_dependency.id not in metrics:
+                continue
+            _, metric_fn = get_metric_provider(
+                metric_name=metric_to_resolve.metric_name, execution_engine=self
+            )
+            unexpected_output = getattr(metric_fn, "unexpected_output", None)
+            if unexpected_output is None:
+                continue
+            if (
+                self._metric_cache.get(
+                    self._get_batch_cache_key(metric_to_resolve.metric_domain_kwargs),
+                    metric_to_resolve.id,
+                    _MISSING,
+                )
+                is not _MISSING
+            ):
+                continue
+            (
+                unexpected_condition,
+                compute_domain_kwargs,
+                accessor_domain_kwargs,
+            ) = metrics[condition_dependency.id]
+            if unexpected_output != "rows" and "column" not in accessor_domain_kwargs:
+                continue
+            _, condition_fn = get_metric_provider(
+                metric_name=condition_dependency.metric_name, execution_engine=self
+            )
+            row_condition = None
+            if (
+                getattr(condition_fn, "metric_fn_type", None)
+                != MetricPartialFunctionTypes.WINDOW_CONDITION_FN
+            ):
+                row_condition = self._get_row_condition_column(compute_domain_kwargs)
+                compute_domain_kwargs = {
+                    key: value
+                    for key, value in compute_domain_kwargs.items()
+                    if key not in ["row_condition", "condition_parser"]
+                }
+            compute_domain_kwargs = IDDict(compute_domain_kwargs)
+            unexpected_output_bundles[compute_domain_kwargs.to_id()].append(
+                _UnexpectedOutput(
+                    metric=metric_to_resolve,
+                    output=unexpected_output,
+                    condition=unexpected_condition,
+                    row_condition=row_condition,
+                    compute_domain_kwargs=compute_domain_kwargs,
+                    accessor_domain_kwargs=accessor_domain_kwargs,
+                )
+            )
+
+        # A metric alone on its dataframe is resolved by its own metric function
+        bundled_metrics = [
+            unexpected_output.metric
+            for bundle in unexpected_output_bundles.values()
+            if len(bundle) > 1
+            for unexpected_output in bundle
+        ]
+        bundled_metric_ids = {metric.id for metric in bundled_metrics}
+        resolved_metrics = super().resolve_metrics(
+            metrics_to_resolve=[
+                metric_to_resolve
+                for metric_to_resolve in metrics_to_resolve
+                if metric_to_resolve.id not in bundled_metric_ids
+            ],
+            metrics=metrics,
+            runtime_configuration=runtime_configuration,
+        )
+        for bundle in unexpected_output_bundles.values():
+            if len(bundle) > 1:
+                start = time.perf_counter()
+                resolved_metrics.update(self.resolve_unexpected_output_bundle(bundle))
+                self._record_metric_resolution_time(
+                    [unexpected_output.metric for unexpected_output in bundle], start
+                )
+        for metric_to_resolve in bundled_metrics:
+            self._metric_cache.put(
+                self._get_batch_cache_key(metric_to_resolve.metric_domain_kwargs),
+                metric_to_resolve.id,
+                resolved_metrics[metric_to_resolve.id],
+            )
+        return resolved_metrics
+
+    def resolve_unexpected_output_bundle(
+        self, unexpected_output_bundle: List["_UnexpectedOutput"]
+    ) -> dict:
+        """Collects the unexpected values, rows and value counts of map metrics over the same dataframe.
+
+        The unexpected condition of every metric, restricted to the rows its row_condition keeps, is evaluated in a
+        single projection of the domain, which is exploded into one row per unexpected row and metric. The samples of
+        all the metrics are then collected by one Spark job, each metric keeping its first partial_unexpected_count
+        rows, and the value counts by another one.
+
+        Args:
+            unexpected_output_bundle - the metrics to resolve, each with its kind of output ("values", "rows" or
+                "value_counts"), its unexpected condition, the row_condition folded out of its compute domain (if
+                any), and its compute and accessor domain kwargs
+
+        Returns:
+            A dictionary of the collected metrics
+        """
+        compute_domain_kwargs = unexpected_output_bundle[0].compute_domain_kwargs
+        df, _, _ = self.get_compute_domain(
+            compute_domain_kwargs, domain_type="identity"
+        )
+        resolved_metrics = dict()
+        unexpected_conditions = [
+            unexpected_output.condition == True
+            if unexpected_output.row_condition is None
+            else unexpected_output.row_condition
+            & (unexpected_output.condition == True)
+            for unexpected_output in unexpected_output_bundle
+        ]
+
+        samples = {
+            idx: unexpected_output
+            for idx, unexpected_output in enumerate(unexpected_output_bundle)
+            if unexpected_output.output in ("values", "rows")
+        }
+        if samples:
+            if any(sample.output == "rows" for sample in samples.values()):
+                sample_columns = df.columns
+            else:
+                sample_columns = list(
+                    dict.fromkeys(
+                        sample.accessor_domain_kwargs["column"]
+                        for sample in samples.values()
+                    )
+                )
+            unexpected = df.select(
+                F.monotonically_increasing_id().alias("__row_id"),
+                F.struct(*[F.col(column) for column in sample_columns]).alias(
+                    "__row"
+                ),
+                F.explode(
+                    F.array(
+                        *[
+                            F.when(unexpected_conditions[idx], F.lit(idx))
+                            for idx, sample in samples.items()
+                        ]
+                    )
+                ).alias("__metric_idx"),
+            ).filter(F.col("__metric_idx").isNotNull())
+
+            limits = {
+                idx: _get_partial_unexpected_count(sample.metric)
+                for idx, sample in samples.items()
+            }
+            if any(limit is not None for limit in limits.values()):
+                unexpected = unexpected.withColumn(
+                    "__rank",
+                    F.row_number().over(
+                        Window.partitionBy("__metric_idx").orderBy("__row_id")
+                    ),
+                )
+                in_sample = F.lit(False)
+                for idx, limit in limits.items():
+                    metric_in_sample = F.col("__metric_idx") == idx
+                    if limit is not None:
+                        metric_in_sample = metric_in_sample & (
+                            F.col("__rank") <= limit
+                        )
+                    in_sample = in_sample | metric_in_sample
+                unexpected = unexpected.filter(in_sample)
+
+            sampled_rows = defaultdict(list)
+            for row in unexpected.orderBy("__row_id").collect():
+                sampled_rows[row["__metric_idx"]].append(row["__row"])
+            for idx, sample in samples.items():
+                if sample.output == "rows":
+                    resolved_metrics[sample.metric.id] = sampled_rows[idx]
+                else:
+                    column = sample.accessor_domain_kwargs["column"]
+                    resolved_metrics[sample.metric.id] = [
+                        row[column] for row in sampled_rows[idx]
+                    ]
+
+        value_counts = {
+            idx: unexpected_output
+            for idx, unexpected_output in enumerate(unexpected_output_bundle)
+            if unexpected_output.output == "value_counts"
+        }
+        if value_counts:
+            # Every exploded row holds the column of its own metric, and nulls in the columns of the other metrics,
+            # so that all the value counts are computed by a single aggregation
+            count_columns = list(
+                dict.fromkeys(
+                    value_count.accessor_domain_kwargs["column"]
+                    for value_count in value_counts.values()
+                )
+            )
+            column_types = {field.name: field.dataType for field in df.schema.fields}
+            unexpected_values = F.array(
+                *[
+                    F.when(
+                        unexpected_conditions[idx],
+                        F.struct(
+                            F.lit(idx).alias("__metric_idx"),
+                            *[
+                                (
+                                    F.col(column)
+                                    if column
+                                    == value_count.accessor_domain_kwargs["column"]
+                                    else F.lit(None).cast(column_types[column])
+                                ).alias(column)
+                                for column in count_columns
+                            ],
+                        ),
+                    )
+                    for idx, value_count in value_counts.items()
+                ]
+            )
+            counts = (
+                df.select(F.explode(unexpected_values).alias("__unexpected"))
+                .filter(F.col("__unexpected").isNotNull())
+                .groupBy("__unexpected")
+                .count()
+                .collect()
+            )
+            counted_values = defaultdict(list)
+            for row in counts:
+                counted_values[row["__unexpected"]["__metric_idx"]].append(
+                    (row["__unexpected"], row["count"])
+                )
+            for idx, value_count in value_counts.items():
+                column = value_count.accessor_domain_kwargs["column"]
+                value_count_row = Row(column, "count")
+                metric_value_counts = sorted(
+                    (
+                        value_count_row(value[column], count)
+                        for value, count in counted_values[idx]
+                    ),
+                    key=lambda row: row["count"],
+                    reverse=True,
+                )
+                resolved_metrics[value_count.metric.id] = metric_value_counts[
+                    : _get_partial_unexpected_count(value_count.metric)
+                ]
+
+        logger.debug(
+            f"SparkDFExecutionEngine collected {len(unexpected_output_bundle)} unexpected outputs on domain_id "
+            f"{compute_domain_kwargs.to_id()}"
+        )
+        return resolved_metrics
+
     def head(self, n=5):
         """Returns dataframe head. Default is 5"""
         return self.dataframe.limit(n).toPandas()
@@ -737,3 +1087,24 @@ class SparkDFExecutionEngine(ExecutionEngine):
             .drop("encrypted_value")
         )
         return res
+
+
+_UnexpectedOutput = namedtuple(
+    "_UnexpectedOutput",
+    [
+        "metric",
+        "output",
+        "condition",
+        "row_condition",
+        "compute_domain_kwargs",
+        "accessor_domain_kwargs",
+    ],
+)
+
+
+def _get_partial_unexpected_count(metric: MetricConfiguration) -> Optional[int]:
+    """Returns the number of unexpected values or rows kept by a map metric, or None if they are all kept."""
+    result_format = metric.metric_value_kwargs["result_format"]
+    if result_format["result_format"] == "COMPLETE":
+        return None
+    return result_format["partial_unexpected_count"]
@@ -1,7 +1,9 @@
 import copy
 import datetime
 import logging
+import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 from urllib.parse import urlparse
@@ -10,6 +12,7 @@ import pandas as pd
 
 from great_expectations.core import IDDict
 from great_expectations.core.batch import Batch, BatchMarkers
+from great_expectations.core.sqlalchemy_engine_registry import get_sqlalchemy_engine
 from great_expectations.core.util import convert_to_json_serializable
 from great_expectations.exceptions import (
     DatasourceKeyPairAuthBadPassphraseError,
@@ -17,7 +20,11 @@ from great_expectations.exceptions import (
     InvalidConfigError,
 )
 from great_expectations.execution_engine import ExecutionEngine
-from great_expectations.execution_engine.execution_engine import MetricDomainTypes
+from great_expectations.execution_engine.execution_engine import (
+    DEFAULT_METRIC_CACHE_MAX_BYTES,
+    DEFAULT_METRIC_CACHE_MAX_ENTRIES,
+    MetricDomainTypes,
+)
 from great_expectations.expectations.row_conditions import parse_condition_to_sqlalchemy
 from great_expectations.util import (
     filter_properties_dict,
@@ -37,14 +44,32 @@ try:
     from sqlalchemy.engine import reflection
     from sqlalchemy.engine.default import DefaultDialect
     from sqlalchemy.engine.url import URL
-    from sqlalchemy.sql import Select
-    from sqlalchemy.sql.elements import TextClause, quoted_name
+    from sqlalchemy.sql import Select, operators, visitors
+    from sqlalchemy.sql.elements import (
+        ColumnClause,
+        FunctionFilter,
+        Over,
+        TextClause,
+        WithinGroup,
+        quoted_name,
+    )
+    from sqlalchemy.sql.functions import FunctionElement
+    from sqlalchemy.sql.selectable import FromClause, ScalarSelect
 except ImportError:
     reflection = None
     DefaultDialect = None
     Select = None
+    operators = None
+    visitors = None
+    ColumnClause = None
+    FunctionFilter = None
+    Over = None
     TextClause = None
+    WithinGroup = None
     quoted_name = None
+    FunctionElement = None
+    FromClause = None
+    ScalarSelect = None
 
 
 try:
@@ -144,6 +169,7 @@ class SqlAlchemyBatchData:
         temp_table_name: str = None,
         temp_table_schema_name: str = None,
         use_quoted_name: bool = False,
+        reproducible_query: bool = True,
     ):
         """A Constructor used to initialize and SqlAlchemy Batch, create an id for it, and verify that all necessary
         parameters have been provided. If a Query is given, also builds a temporary table for this query
@@ -174,6 +200,10 @@ class SqlAlchemyBatchData:
                     used if a temporary table is requested.
                 use_quoted_name (bool): \
                     If true, names should be quoted to preserve case sensitivity on databases that usually normalize them
+                reproducible_query (bool): \
+                    If False, the query or selectable may return other rows each time it is executed, e.g. those of a
+                    random sample, so that a temporary table created from it is kept until the batch is unloaded rather
+                    than released between validations.
 
         The query that will be executed against the DB can be determined in any of three ways:
 
@@ -196,6 +226,11 @@ class SqlAlchemyBatchData:
 
         self._schema_name = schema_name
         self._use_quoted_name = use_quoted_name
+        self._temp_table_name = None
+        self._temp_table_schema_name = None
+        self._temp_table_query = None
+        self._released_temp_table = None
+        self._reproducible_query = reproducible_query
 
         if sum(bool(x) for x in [table_name, query, selectable is not None]) != 1:
             raise ValueError(
@@ -253,6 +288,9 @@ class SqlAlchemyBatchData:
                 query,
                 temp_table_schema_name=temp_table_schema_name,
             )
+            self._temp_table_name = generated_table_name
+            self._temp_table_schema_name = temp_table_schema_name
+            self._temp_table_query = query
             self._selectable = sa.Table(
                 generated_table_name,
                 sa.MetaData(),
@@ -281,6 +319,11 @@ class SqlAlchemyBatchData:
     def use_quoted_name(self):
         return self._use_quoted_name
 
+    @property
+    def temp_table_name(self) -> Optional[str]:
+        """The name of the temporary table created for the batch, or None if it was not created or has been dropped"""
+        return self._temp_table_name
+
     def _create_temporary_table(
         self, temp_table_name, query, temp_table_schema_name=None
     ):
@@ -326,6 +369,58 @@ class SqlAlchemyBatchData:
             )
         self._engine.execute(stmt)
 
+    def drop_temp_table(self) -> None:
+        """
+        Drops the temporary table created for the batch, if any. The batch cannot be accessed anymore once it is
+        dropped.
+        """
+        if self._temp_table_name is None:
+            return
+        temp_table_name = self._temp_table_name
+        if self.sql_engine_dialect.name.lower() == "bigquery":
+            stmt = f"DROP TABLE IF EXISTS `{temp_table_name}`"
+        elif self.sql_engine_dialect.name.lower() == "snowflake":
+            if self._temp_table_schema_name is not None:
+                temp_table_name = self._temp_table_schema_name + "." + temp_table_name
+            stmt = f"DROP TABLE IF EXISTS {temp_table_name}"
+        elif self.sql_engine_dialect.name == "mysql":
+            stmt = f"DROP TEMPORARY TABLE IF EXISTS {temp_table_name}"
+        elif self.sql_engine_dialect.name == "mssql":
+            stmt = f"DROP TABLE {temp_table_name}"
+        else:
+            stmt = f'DROP TABLE IF EXISTS "{temp_table_name}"'
+        self._engine.execute(stmt)
+        self._temp_table_name = None
+        self._temp_table_schema_name = None
+
+    def release_temp_table(self) -> None:
+        """
+        Drops the temporary table created for the batch, if any, until restore_temp_table creates it again from the
+        same query. The temporary table of a query that is not reproducible is kept, since the batch would otherwise
+        hold other rows once it is created again, while the metrics computed over its former rows are still cached.
+        """
+        if self._temp_table_name is None or not self._reproducible_query:
+            return
+        self._released_temp_table = (
+            self._temp_table_name,
+            self._temp_table_schema_name,
+        )
+        self.drop_temp_table()
+
+    def restore_temp_table(self) -> None:
+        """Creates the temporary table of the batch again, if it was dropped by release_temp_table."""
+        if self._released_temp_table is None:
+            return
+        temp_table_name, temp_table_schema_name = self._released_temp_table
+        self._create_temporary_table(
+            temp_table_name,
+            self._temp_table_query,
+            temp_table_schema_name=temp_table_schema_name,
+        )
+        self._temp_table_name = temp_table_name
+        self._temp_table_schema_name = temp_table_schema_name
+        self._released_temp_table = None
+
     def head(self, n=5, fetch_all=False):
         """Fetches the head of the table"""
 
@@ -356,6 +451,82 @@ class SqlAlchemyBatchData:
         return rows[0][0]
 
 
+# Aggregate functions that ignore NULL arguments: computing them over the rows satisfying a condition is equivalent to
+# computing them over all rows with the arguments of the rows not satisfying the condition replaced by NULL.
+NULL_IGNORING_AGGREGATE_FUNCTIONS = {
+    "avg",
+    "count",
+    "max",
+    "min",
+    "stddev",
+    "stddev_pop",
+    "stddev_samp",
+    "sum",
+    "var_pop",
+    "var_samp",
+    "variance",
+}
+
+
+def _get_conditional_aggregate(aggregate, condition):
+    """Rewrites an aggregate over the rows satisfying a condition as an equivalent aggregate over all rows, by wrapping
+    the argument of every null-ignoring aggregate function in a CASE WHEN (e.g. avg(x) becomes
+    avg(CASE WHEN condition THEN x END)).
+
+    Returns None if the aggregate cannot be rewritten safely, e.g. if it references columns outside of an aggregate
+    function or uses window, ordered-set or other aggregate functions.
+    """
+    rewritable = True
+
+    def replace(element):
+        nonlocal rewritable
+        if (
+            isinstance(element, FunctionElement)
+            and element.name.lower() in NULL_IGNORING_AGGREGATE_FUNCTIONS
+        ):
+            arguments = list(element.clauses)
+            if len(arguments) != 1:
+                # e.g. the scalar, multi-argument min and max functions of sqlite
+                rewritable = False
+                return None
+            argument = arguments[0]
+            if isinstance(argument, ColumnClause) and argument.name == "*":
+                conditional_argument = sa.case([(condition, sa.literal(1))])
+            elif getattr(argument, "operator", None) is operators.distinct_op:
+                conditional_argument = sa.distinct(
+                    sa.case([(condition, argument.element)])
+                )
+            else:
+                conditional_argument = sa.case([(condition, argument)])
+            return getattr(sa.func, element.name)(
+                conditional_argument, type_=element.type
+            )
+        if isinstance(
+            element,
+            (
+                ColumnClause,
+                FromClause,
+                FunctionFilter,
+                Over,
+                TextClause,
+                WithinGroup,
+            ),
+        ):
+            rewritable = False
+        return None
+
+    conditional_aggregate = visitors.replacement_traverse(aggregate, {}, replace)
+    if not rewritable:
+        return None
+    return conditional_aggregate
+
+
+TEMP_TABLE_POLICIES = ("always", "never", "auto")
+
+# Sampling methods whose selectable may return different rows each time it is queried
+NONDETERMINISTIC_SAMPLING_METHODS = {"_sample_using_random", "_sample_using_limit"}
+
+
 class SqlAlchemyExecutionEngine(ExecutionEngine):
     def __init__(
         self,
@@ -366,6 +537,11 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
         connection_string=None,
         url=None,
         batch_data_dict=None,
+        metric_cache_max_entries=DEFAULT_METRIC_CACHE_MAX_ENTRIES,
+        metric_cache_max_bytes=DEFAULT_METRIC_CACHE_MAX_BYTES,
+        max_bundle_select_width=None,
+        max_concurrent_queries=None,
+        temp_table_policy=None,
         **kwargs,  # These will be passed as optional parameters to the SQLAlchemy engine, **not** the ExecutionEngine
     ):
         """Builds a SqlAlchemyExecutionEngine, using a provided connection string/url/engine/credentials to access the
@@ -392,13 +568,50 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
                     If neither the engines, the credentials, nor the connection_string have been provided,
                     a url can be used to access the data. This will be overridden by all other configuration
                     options if any are provided.
+                metric_cache_max_entries (int): \
+                    The maximum number of resolved metrics kept in the metric cache (1024 by default). Unbounded if
+                    None.
+                metric_cache_max_bytes (int): \
+                    The maximum estimated size, in bytes, of the resolved metrics kept in the metric cache (128 MiB
+                    by default). Unbounded if None.
+                max_bundle_select_width (int): \
+                    The maximum number of aggregates computed by a single statement when resolving a metric bundle,
+                    for databases that limit the width of a select list. Unbounded if not provided.
+                max_concurrent_queries (int): \
+                    The maximum number of statements of a metric bundle executed concurrently, each on its own
+                    connection from the engine's pool. Statements are executed serially if not provided, or if the
+                    engine is bound to a single connection (e.g. for sqlite, mssql and snowflake temporary tables).
+                temp_table_policy (str): \
+                    Whether batches are materialized in a temporary table before they are validated: "always",
+                    "never", or "auto" (the default) to create one only for batches that could otherwise differ from
+                    one query to the next, i.e. sampled randomly or with a limit. Batches that are whole tables or
+                    splits of a table are then queried in place. Can be overridden by the "temp_table_policy" of a
+                    batch_spec.
         """
-        super().__init__(name=name, batch_data_dict=batch_data_dict)  # , **kwargs)
+        super().__init__(
+            name=name,
+            batch_data_dict=batch_data_dict,
+            metric_cache_max_entries=metric_cache_max_entries,
+            metric_cache_max_bytes=metric_cache_max_bytes,
+        )  # , **kwargs)
         self._name = name
 
         self._credentials = credentials
         self._connection_string = connection_string
         self._url = url
+        if max_bundle_select_width is not None and max_bundle_select_width < 1:
+            raise InvalidConfigError(
+                "max_bundle_select_width must be a positive number of aggregates."
+            )
+        self._max_bundle_select_width = max_bundle_select_width
+        if max_concurrent_queries is not None and max_concurrent_queries < 1:
+            raise InvalidConfigError(
+                "max_concurrent_queries must be a positive number of queries."
+            )
+        self._max_concurrent_queries = max_concurrent_queries or 1
+        self._temp_table_policy = self._validate_temp_table_policy(
+            temp_table_policy or "auto"
+        )
 
         if engine is not None:
             if credentials is not None:
@@ -410,10 +623,10 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
         elif credentials is not None:
             self.engine = self._build_engine(credentials=credentials, **kwargs)
         elif connection_string is not None:
-            self.engine = sa.create_engine(connection_string, **kwargs)
+            self.engine = get_sqlalchemy_engine(connection_string, **kwargs)
         elif url is not None:
             self.drivername = urlparse(url).scheme
-            self.engine = sa.create_engine(url, **kwargs)
+            self.engine = get_sqlalchemy_engine(url, **kwargs)
         else:
             raise InvalidConfigError(
                 "Credentials or an engine are required for a SqlAlchemyExecutionEngine."
@@ -521,7 +734,7 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
             options = sa.engine.url.URL(drivername, **credentials)
 
         self.drivername = drivername
-        engine = sa.create_engine(options, **create_engine_kwargs)
+        engine = get_sqlalchemy_engine(options, **create_engine_kwargs)
         return engine
 
     def _get_sqlalchemy_key_pair_auth_url(
@@ -574,6 +787,17 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
             create_engine_kwargs,
         )
 
+    def _initialize_dialect(self) -> None:
+        """Connects once if the engine has not connected yet on the postgresql dialect. The dialect only learns the
+        server version when connecting, and metrics rely on it to tell Redshift (reached through the postgresql
+        driver) from PostgreSQL."""
+        dialect = self.engine.dialect
+        if (
+            dialect.name.lower() == "postgresql"
+            and getattr(dialect, "server_version_info", None) is None
+        ):
+            self.engine.connect().close()
+
     def get_compute_domain(
         self,
         domain_kwargs: Dict,
@@ -594,6 +818,7 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
         Returns:
             SqlAlchemy column
         """
+        self._initialize_dialect()
         # Extracting value from enum if it is given for future computation
         domain_type = MetricDomainTypes(domain_type)
         batch_id = domain_kwargs.get("batch_id")
@@ -613,6 +838,9 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
                     f"Unable to find batch with batch_id {batch_id}"
                 )
 
+        if isinstance(data_object, SqlAlchemyBatchData):
+            data_object.restore_temp_table()
+
         compute_domain_kwargs = copy.deepcopy(domain_kwargs)
         accessor_domain_kwargs = dict()
         if "table" in domain_kwargs and domain_kwargs["table"] is not None:
@@ -683,7 +911,7 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
         elif domain_type == MetricDomainTypes.COLUMN:
             if "column" in compute_domain_kwargs:
                 # Checking if case- sensitive and using appropriate name
-                if self.active_batch_data.use_quoted_name:
+                if data_object.use_quoted_name:
                     accessor_domain_kwargs["column"] = quoted_name(
                         compute_domain_kwargs.pop("column")
                     )
@@ -704,7 +932,7 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
                 "column_A" in compute_domain_kwargs
                 and "column_B" in compute_domain_kwargs
             ):
-                if self.active_batch_data.use_quoted_name:
+                if data_object.use_quoted_name:
                     # If case matters...
                     accessor_domain_kwargs["column_A"] = quoted_name(
                         compute_domain_kwargs.pop("column_A")
@@ -734,7 +962,7 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
         elif domain_type == MetricDomainTypes.IDENTITY:
             # If we would like our data to become a single column
             if "column" in compute_domain_kwargs:
-                if self.active_batch_data.use_quoted_name:
+                if data_object.use_quoted_name:
                     selectable = sa.select(
                         [sa.column(quoted_name(compute_domain_kwargs["column"]))]
                     ).select_from(selectable)
@@ -747,7 +975,7 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
             elif ("column_A" in compute_domain_kwargs) and (
                 "column_B" in compute_domain_kwargs
             ):
-                if self.active_batch_data.use_quoted_name:
+                if data_object.use_quoted_name:
                     selectable = sa.select(
                         [
                             sa.column(quoted_name(compute_domain_kwargs["column_A"])),
@@ -764,7 +992,7 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
             else:
                 # If we would like our data to become a multicolumn
                 if "columns" in compute_domain_kwargs:
-                    if self.active_batch_data.use_quoted_name:
+                    if data_object.use_quoted_name:
                         # Building a list of column objects used for sql alchemy selection
                         to_select = [
                             sa.column(quoted_name(col))
@@ -800,7 +1028,8 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
         """
         resolved_metrics = dict()
 
-        # We need a different query for each domain (where clause).
+        # Aggregates over the same selectable are computed by as few statements as possible: the aggregates of domains
+        # that only add a row_condition to another domain are rewritten as conditional aggregates over that domain.
         queries: Dict[Tuple, dict] = dict()
         for (
             metric_to_resolve,
@@ -811,40 +1040,201 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
         ) in metric_fn_bundle:
             if not isinstance(compute_domain_kwargs, IDDict):
                 compute_domain_kwargs = IDDict(compute_domain_kwargs)
+            compute_domain_kwargs, engine_fn = self._get_unconditional_aggregate(
+                compute_domain_kwargs, engine_fn
+            )
             domain_id = compute_domain_kwargs.to_id()
             if domain_id not in queries:
                 queries[domain_id] = {
-                    "select": [],
-                    "ids": [],
+                    "aggregates": [],
+                    "subqueries": [],
                     "domain_kwargs": compute_domain_kwargs,
                 }
-            queries[domain_id]["select"].append(
-                engine_fn.label(metric_to_resolve.metric_name)
-            )
-            queries[domain_id]["ids"].append(metric_to_resolve.id)
+            # A metric partial may compute a list of values, e.g. one per quantile
+            is_list = isinstance(engine_fn, (list, tuple))
+            expressions = list(engine_fn) if is_list else [engine_fn]
+            labeled_expressions = [
+                expression.label(
+                    f"{metric_to_resolve.metric_name}_{idx}"
+                    if is_list
+                    else metric_to_resolve.metric_name
+                )
+                for idx, expression in enumerate(expressions)
+            ]
+            # Scalar subqueries do not aggregate the rows of the domain, so they are selected without a FROM clause
+            if all(
+                isinstance(expression, ScalarSelect) for expression in expressions
+            ):
+                entries = queries[domain_id]["subqueries"]
+            else:
+                entries = queries[domain_id]["aggregates"]
+            entries.append((metric_to_resolve.id, labeled_expressions, is_list))
+
+        statements = []
         for query in queries.values():
             selectable, compute_domain_kwargs, _ = self.get_compute_domain(
                 query["domain_kwargs"], domain_type="identity"
             )
-            assert len(query["select"]) == len(query["ids"])
-            res = self.engine.execute(
-                sa.select(query["select"]).select_from(selectable)
-            ).fetchall()
+            domain_id = IDDict(compute_domain_kwargs).to_id()
+            for entries, select_from in [
+                (query["aggregates"], selectable),
+                (query["subqueries"], None),
+            ]:
+                for chunk in self._get_bundle_select_list_chunks(entries):
+                    select = sa.select(
+                        [
+                            expression
+                            for _, expressions, _ in chunk
+                            for expression in expressions
+                        ]
+                    )
+                    if select_from is not None:
+                        select = select.select_from(select_from)
+                    statements.append((domain_id, select, chunk))
+
+        if (
+            self._max_concurrent_queries > 1
+            and len(statements) > 1
+            and self._can_execute_bundle_concurrently(
+                [query["domain_kwargs"] for query in queries.values()]
+            )
+        ):
+            with ThreadPoolExecutor(
+                max_workers=min(self._max_concurrent_queries, len(statements))
+            ) as executor:
+                results = list(
+                    executor.map(
+                        self._execute_bundle_statement,
+                        [statement for _, statement, _ in statements],
+                    )
+                )
+        else:
+            results = [
+                self._execute_bundle_statement(statement)
+                for _, statement, _ in statements
+            ]
+
+        for (domain_id, _, chunk), res in zip(statements, results):
             logger.debug(
-                f"SqlAlchemyExecutionEngine computed {len(res[0])} metrics on domain_id {IDDict(compute_domain_kwargs).to_id()}"
+                f"SqlAlchemyExecutionEngine computed {len(chunk)} metrics on domain_id {domain_id}"
             )
             assert (
                 len(res) == 1
             ), "all bundle-computed metrics must be single-value statistics"
-            assert len(query["ids"]) == len(
-                res[0]
-            ), "unexpected number of metrics returned"
-            for idx, id in enumerate(query["ids"]):
-                resolved_metrics[id] = convert_to_json_serializable(res[0][idx])
+            values = list(res[0])
+            assert sum(
+                len(expressions) for _, expressions, _ in chunk
+            ) == len(values), "unexpected number of metrics returned"
+            for id, expressions, is_list in chunk:
+                metric_values = [
+                    convert_to_json_serializable(value)
+                    for value in values[: len(expressions)]
+                ]
+                values = values[len(expressions) :]
+                resolved_metrics[id] = (
+                    metric_values if is_list else metric_values[0]
+                )
 
         # Convert metrics to be serializable
         return resolved_metrics
 
+    def _can_execute_bundle_concurrently(self, domain_kwargs_list: List[dict]) -> bool:
+        """Returns whether the statements of a metric bundle over the given domains can be dispatched to several
+        connections of the engine's pool. Temporary tables only exist within the connection (session) that created
+        them, so the statements are executed serially if the engine is bound to a single connection, or if any of the
+        batches they select from is materialized in a temporary table."""
+        if not isinstance(self.engine, sa.engine.Engine):
+            logger.debug(
+                "SqlAlchemyExecutionEngine is bound to a single connection: executing bundle queries serially"
+            )
+            return False
+        for domain_kwargs in domain_kwargs_list:
+            batch_id = domain_kwargs.get("batch_id")
+            batch_data = (
+                self.active_batch_data
+                if batch_id is None
+                else self.loaded_batch_data_dict.get(batch_id)
+            )
+            if getattr(batch_data, "temp_table_name", None) is not None:
+                logger.debug(
+                    "SqlAlchemyExecutionEngine bundle selects from a temporary table: executing bundle queries serially"
+                )
+                return False
+        return True
+
+    def _get_bundle_select_list_chunks(self, entries: list) -> List[list]:
+        """Splits the entries of a metric bundle statement so that no statement selects more than
+        max_bundle_select_width expressions. The expressions of a metric are never split across statements."""
+        chunks = []
+        chunk = []
+        chunk_width = 0
+        for entry in entries:
+            width = len(entry[1])
+            if (
+                chunk
+                and self._max_bundle_select_width is not None
+                and chunk_width + width > self._max_bundle_select_width
+            ):
+                chunks.append(chunk)
+                chunk = []
+                chunk_width = 0
+            chunk.append(entry)
+            chunk_width += width
+        if chunk:
+            chunks.append(chunk)
+        return chunks
+
+    def _execute_bundle_statement(self, statement: "sa.sql.Select") -> list:
+        """Executes a statement of a metric bundle, on its own connection from the engine's pool if the engine is not
+        bound to a single connection, and logs how long it took and how many rows it returned."""
+        start = time.perf_counter()
+        if isinstance(self.engine, sa.engine.Engine):
+            with self.engine.connect() as connection:
+                res = connection.execute(statement).fetchall()
+        else:
+            res = self.engine.execute(statement).fetchall()
+        logger.debug(
+            f"SqlAlchemyExecutionEngine executed a bundle query in {time.perf_counter() - start:.3f}s, returning "
+            f"{len(res)} row(s)"
+        )
+        return res
+
+    def _get_unconditional_aggregate(
+        self, compute_domain_kwargs: IDDict, aggregate
+    ) -> Tuple[IDDict, Any]:
+        """If the compute domain has a row_condition, and the aggregate can be rewritten as a conditional aggregate,
+        returns the compute domain without the row_condition along with the conditional aggregate, so that it can be
+        computed alongside the aggregates over the unconditional domain. Otherwise, returns its arguments unchanged.
+        """
+        if (
+            not compute_domain_kwargs.get("row_condition")
+            or compute_domain_kwargs.get("condition_parser")
+            != "great_expectations__experimental__"
+        ):
+            return compute_domain_kwargs, aggregate
+        condition = parse_condition_to_sqlalchemy(
+            compute_domain_kwargs["row_condition"]
+        )
+        if isinstance(aggregate, (list, tuple)):
+            conditional_aggregate = [
+                _get_conditional_aggregate(expression, condition)
+                for expression in aggregate
+            ]
+            if any(expression is None for expression in conditional_aggregate):
+                return compute_domain_kwargs, aggregate
+        else:
+            conditional_aggregate = _get_conditional_aggregate(aggregate, condition)
+            if conditional_aggregate is None:
+                return compute_domain_kwargs, aggregate
+        unconditional_domain_kwargs = IDDict(
+            {
+                key: value
+                for key, value in compute_domain_kwargs.items()
+                if key not in ["row_condition", "condition_parser"]
+            }
+        )
+        return unconditional_domain_kwargs, conditional_aggregate
+
     ### Splitter methods for partitioning tables ###
 
     def _split_on_whole_table(
@@ -974,6 +1364,62 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
         """Match the values in the named column against value_list, and only keep the matches"""
         return sa.column(column_name).in_(value_list)
 
+    @staticmethod
+    def _validate_temp_table_policy(temp_table_policy: str) -> str:
+        if temp_table_policy not in TEMP_TABLE_POLICIES:
+            raise InvalidConfigError(
+                f"temp_table_policy must be one of {', '.join(TEMP_TABLE_POLICIES)}, not {temp_table_policy}."
+            )
+        return temp_table_policy
+
+    @property
+    def temp_table_policy(self) -> str:
+        return self._temp_table_policy
+
+    def load_batch_data(
+        self,
+        batch_id: str,
+        batch_data: Any,
+        batch_markers: Optional[BatchMarkers] = None,
+    ) -> None:
+        """
+        Loads the specified batch_data into the execution engine, dropping the temporary table of the batch previously
+        loaded under the same batch_id, if any.
+        """
+        previous_batch_data = self._batch_data_dict.get(batch_id)
+        super().load_batch_data(
+            batch_id=batch_id, batch_data=batch_data, batch_markers=batch_markers
+        )
+        if previous_batch_data is not batch_data:
+            self._drop_temp_table(previous_batch_data)
+
+    def unload_batch_data(self, batch_id: str) -> None:
+        """
+        Removes the specified batch from the execution engine, dropping its temporary table, if any.
+        """
+        batch_data = self._batch_data_dict.get(batch_id)
+        super().unload_batch_data(batch_id)
+        self._drop_temp_table(batch_data)
+
+    def release_resources(self) -> None:
+        """Drops the temporary tables of the loaded batches once a validation is finished, so that they do not hold
+        space on the database; they are created again when metrics are next computed over their batches. The temporary
+        tables of nondeterministic samples are kept (see SqlAlchemyBatchData.release_temp_table)."""
+        for batch_data in self._batch_data_dict.values():
+            if isinstance(batch_data, SqlAlchemyBatchData):
+                batch_data.release_temp_table()
+
+    def _drop_temp_table(self, batch_data) -> None:
+        """Drops the temporary table of a batch, unless the batch is still loaded under another batch_id."""
+        if not isinstance(batch_data, SqlAlchemyBatchData):
+            return
+        if any(
+            loaded_batch_data is batch_data
+            for loaded_batch_data in self._batch_data_dict.values()
+        ):
+            return
+        batch_data.drop_temp_table()
+
     def _sample_using_md5(
         self,
         column_name: str,
@@ -1030,6 +1476,19 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
                 )
         return sa.select("*").select_from(sa.text(table_name)).where(split_clause)
 
+    def _should_create_temp_table(self, batch_spec) -> bool:
+        """Applies the temp_table_policy of the batch_spec, or else of the execution engine, to a batch."""
+        temp_table_policy = self._validate_temp_table_policy(
+            batch_spec.get("temp_table_policy", self._temp_table_policy)
+        )
+        if temp_table_policy == "auto":
+            # Queries over a split of a table return the same rows every time, but those over a random sample or the
+            # first n rows of a table, without an ordering, might not
+            return (
+                batch_spec.get("sampling_method") in NONDETERMINISTIC_SAMPLING_METHODS
+            )
+        return temp_table_policy == "always"
+
     def get_batch_data_and_markers(
         self, batch_spec
     ) -> Tuple[SqlAlchemyBatchData, BatchMarkers]:
@@ -1040,7 +1499,12 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
         else:
             temp_table_name = None
         batch_data = SqlAlchemyBatchData(
-            engine=self.engine, selectable=selectable, temp_table_name=temp_table_name
+            engine=self.engine,
+            selectable=selectable,
+            create_temp_table=self._should_create_temp_table(batch_spec),
+            temp_table_name=temp_table_name,
+            reproducible_query=batch_spec.get("sampling_method")
+            not in NONDETERMINISTIC_SAMPLING_METHODS,
         )
 
         batch_markers = BatchMarkers(
@@ -51,6 +51,9 @@ class ExpectColumnProportionOfUniqueValuesToBeBetween(ColumnExpectation):
         catch_exceptions (boolean or None): \
             If True, then catch exceptions and include them as part of the result object. \
             For more detail, see :ref:`catch_exceptions`.
+        approximate (boolean): \
+            If True, then the metric may be estimated with an approximate algorithm, and its error bound is \
+            reported in the details of the result.
         meta (dict or None): \
             A JSON-serializable dictionary (nesting allowed) that will be included in the output without \
             modification. For more detail, see :ref:`meta`.
@@ -83,6 +86,12 @@ class ExpectColumnProportionOfUniqueValuesToBeBetween(ColumnExpectation):
     # Setting necessary computation metric dependencies and defining kwargs, as well as assigning kwargs default values\
     metric_dependencies = ("column.unique_proportion",)
     success_keys = ("min_value", "strict_min", "max_value", "strict_max")
+    runtime_keys = (
+        "include_config",
+        "catch_exceptions",
+        "result_format",
+        "approximate",
+    )
 
     # Default values
     default_kwarg_values = {
@@ -93,6 +102,7 @@ class ExpectColumnProportionOfUniqueValuesToBeBetween(ColumnExpectation):
         "result_format": "BASIC",
         "include_config": True,
         "catch_exceptions": False,
+        "approximate": False,
     }
 
     """ A Column Aggregate MetricProvider Decorator for the Unique Proportion"""
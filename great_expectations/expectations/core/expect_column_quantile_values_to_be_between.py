@@ -3,6 +3,7 @@ from typing import Dict, Optional
 import numpy as np
 
 from great_expectations.core import ExpectationConfiguration
+from great_expectations.core.sketches import DEFAULT_QUANTILE_RANK_ERROR
 from great_expectations.exceptions import InvalidExpectationConfigurationError
 from great_expectations.execution_engine import ExecutionEngine
 from great_expectations.expectations.expectation import ColumnExpectation
@@ -89,6 +90,9 @@ class ExpectColumnQuantileValuesToBeBetween(ColumnExpectation):
                catch_exceptions (boolean or None): \
                    If True, then catch exceptions and include them as part of the result object. \
                    For more detail, see :ref:`catch_exceptions`.
+               approximate (boolean): \
+                   If True, then the metric may be estimated with an approximate algorithm, and its error bound is \
+                   reported in the details of the result.
                meta (dict or None): \
                    A JSON-serializable dictionary (nesting allowed) that will be included in the output without \
                    modification. For more detail, see :ref:`meta`.
@@ -121,6 +125,12 @@ class ExpectColumnQuantileValuesToBeBetween(ColumnExpectation):
         "quantile_ranges",
         "allow_relative_error",
     )
+    runtime_keys = (
+        "include_config",
+        "catch_exceptions",
+        "result_format",
+        "approximate",
+    )
     default_kwarg_values = {
         "row_condition": None,
         "allow_relative_eror": None,
@@ -130,6 +140,7 @@ class ExpectColumnQuantileValuesToBeBetween(ColumnExpectation):
         "allow_relative_error": False,
         "include_config": True,
         "catch_exceptions": False,
+        "approximate": False,
     }
 
     def validate_configuration(self, configuration: Optional[ExpectationConfiguration]):
@@ -360,9 +371,17 @@ class ExpectColumnQuantileValuesToBeBetween(ColumnExpectation):
             configuration, execution_engine, runtime_configuration
         )
         # column.quantile_values expects a "quantiles" key
-        all_dependencies["metrics"]["column.quantile_values"].metric_value_kwargs[
+        metric_value_kwargs = all_dependencies["metrics"][
+            "column.quantile_values"
+        ].metric_value_kwargs
+        metric_value_kwargs["quantiles"] = configuration.kwargs["quantile_ranges"][
             "quantiles"
-        ] = configuration.kwargs["quantile_ranges"]["quantiles"]
+        ]
+        approximate = self.get_runtime_kwargs(
+            configuration=configuration, runtime_configuration=runtime_configuration
+        ).get("approximate")
+        if approximate and not metric_value_kwargs.get("allow_relative_error"):
+            metric_value_kwargs["allow_relative_error"] = DEFAULT_QUANTILE_RANK_ERROR
         return all_dependencies
 
     def _validate(
@@ -390,10 +409,23 @@ class ExpectColumnQuantileValuesToBeBetween(ColumnExpectation):
             for idx, range_ in enumerate(comparison_quantile_ranges)
         ]
 
+        details = {"success_details": success_details}
+        if self.get_runtime_kwargs(
+            configuration=configuration, runtime_configuration=runtime_configuration
+        ).get("approximate"):
+            details.update(
+                self._get_approximation_details(
+                    metric_name="column.quantile_values",
+                    configuration=configuration,
+                    execution_engine=execution_engine,
+                    runtime_configuration=runtime_configuration,
+                )
+            )
+
         return {
             "success": np.all(success_details),
             "result": {
                 "observed_value": {"quantiles": quantiles, "values": quantile_vals},
-                "details": {"success_details": success_details},
+                "details": details,
             },
         }
@@ -44,6 +44,9 @@ class ExpectColumnUniqueValueCountToBeBetween(ColumnExpectation):
                 catch_exceptions (boolean or None): \
                     If True, then catch exceptions and include them as part of the result object. \
                     For more detail, see :ref:`catch_exceptions`.
+                approximate (boolean): \
+                    If True, then the metric may be estimated with an approximate algorithm, and its error bound is \
+                    reported in the details of the result.
                 meta (dict or None): \
                     A JSON-serializable dictionary (nesting allowed) that will be included in the output without \
                     modification. For more detail, see :ref:`meta`.
@@ -79,6 +82,12 @@ class ExpectColumnUniqueValueCountToBeBetween(ColumnExpectation):
         "min_value",
         "max_value",
     )
+    runtime_keys = (
+        "include_config",
+        "catch_exceptions",
+        "result_format",
+        "approximate",
+    )
 
     # Default values
     default_kwarg_values = {
@@ -89,6 +98,7 @@ class ExpectColumnUniqueValueCountToBeBetween(ColumnExpectation):
         "result_format": "BASIC",
         "include_config": True,
         "catch_exceptions": False,
+        "approximate": False,
     }
 
     """ A Column Aggregate Metric Decorator for the Unique Value Count"""
@@ -25,6 +25,7 @@ from great_expectations.expectations.registry import (
     _registered_metrics,
     _registered_renderers,
     get_metric_kwargs,
+    get_metric_provider,
     register_expectation,
     register_renderer,
 )
@@ -1118,6 +1119,28 @@ class TableExpectation(Expectation, ABC):
 
         return True
 
+    def _get_approximation_details(
+        self,
+        metric_name: str,
+        configuration: ExpectationConfiguration,
+        execution_engine: ExecutionEngine,
+        runtime_configuration: Optional[dict] = None,
+    ) -> dict:
+        """Returns the result details reporting that the metric was computed approximately, along with its error
+        bound (None if the bound is not known)."""
+        metric = self.get_validation_dependencies(
+            configuration=configuration,
+            execution_engine=execution_engine,
+            runtime_configuration=runtime_configuration,
+        )["metrics"][metric_name]
+        metric_provider_class, _ = get_metric_provider(metric_name, execution_engine)
+        return {
+            "approximate": True,
+            "error_bound": metric_provider_class.get_approximation_error_bound(
+                metric=metric, execution_engine=execution_engine
+            ),
+        }
+
     def _validate_metric_value_between(
         self,
         metric_name,
@@ -1156,7 +1179,18 @@ class TableExpectation(Expectation, ABC):
 
         success = above_min and below_max
 
-        return {"success": success, "result": {"observed_value": metric_value}}
+        result = {"observed_value": metric_value}
+        if self.get_runtime_kwargs(
+            configuration=configuration, runtime_configuration=runtime_configuration
+        ).get("approximate"):
+            result["details"] = self._get_approximation_details(
+                metric_name=metric_name,
+                configuration=configuration,
+                execution_engine=execution_engine,
+                runtime_configuration=runtime_configuration,
+            )
+
+        return {"success": success, "result": result}
 
 
 class ColumnExpectation(TableExpectation, ABC):
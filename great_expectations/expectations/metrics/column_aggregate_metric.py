@@ -59,14 +59,12 @@ def column_aggregate_value(
                     "filter_column_isnull", getattr(cls, "filter_column_isnull", False)
                 )
 
-                df, _, accessor_domain_kwargs = execution_engine.get_compute_domain(
-                    domain_kwargs=metric_domain_kwargs, domain_type=domain_type
+                column, _, _ = execution_engine.get_domain_column(
+                    metric_domain_kwargs, filter_column_isnull=filter_column_isnull
                 )
-                if filter_column_isnull:
-                    df = df[df[accessor_domain_kwargs["column"]].notnull()]
                 return metric_fn(
                     cls,
-                    column=df[accessor_domain_kwargs["column"]],
+                    column=column,
                     **metric_value_kwargs,
                     _metrics=metrics,
                 )
@@ -200,6 +198,23 @@ def column_aggregate_partial(engine: Type[ExecutionEngine], **kwargs):
         raise ValueError("Unsupported engine for column_aggregate_partial")
 
 
+def get_pandas_column(
+    cls,
+    execution_engine: "PandasExecutionEngine",
+    metric_domain_kwargs: Dict,
+    **kwargs
+):
+    """Returns the column of the domain of a column metric on the pandas engine, honoring filter_column_isnull, for
+    the functions computing partial states of column metrics (see ChunkMerger)."""
+    filter_column_isnull = kwargs.get(
+        "filter_column_isnull", getattr(cls, "filter_column_isnull", False)
+    )
+    column, _, _ = execution_engine.get_domain_column(
+        metric_domain_kwargs, filter_column_isnull=filter_column_isnull
+    )
+    return column
+
+
 class ColumnMetricProvider(TableMetricProvider):
     domain_keys = (
         "batch_id",
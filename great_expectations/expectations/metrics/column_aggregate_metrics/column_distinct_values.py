@@ -1,19 +1,32 @@
 from typing import Any, Dict, Optional, Tuple
 
 from great_expectations.core import ExpectationConfiguration
+from great_expectations.core.sketches import (
+    DEFAULT_HYPERLOGLOG_PRECISION,
+    HyperLogLog,
+)
 from great_expectations.execution_engine import (
     ExecutionEngine,
     PandasExecutionEngine,
     SparkDFExecutionEngine,
 )
+from great_expectations.execution_engine.execution_engine import MetricDomainTypes
 from great_expectations.execution_engine.sqlalchemy_execution_engine import (
     SqlAlchemyExecutionEngine,
 )
 from great_expectations.expectations.metrics.column_aggregate_metric import (
     ColumnMetricProvider,
     column_aggregate_value,
+    get_pandas_column,
+)
+from great_expectations.expectations.metrics.import_manager import F, sa
+from great_expectations.expectations.metrics.metric_provider import (
+    ChunkMerger,
+    metric_value,
+)
+from great_expectations.expectations.metrics.util import (
+    get_approximate_count_distinct_aggregate,
 )
-from great_expectations.expectations.metrics.metric_provider import metric_value
 from great_expectations.validator.validation_graph import MetricConfiguration
 
 
@@ -80,12 +93,28 @@ class ColumnDistinctValues(ColumnMetricProvider):
 
         return dependencies
 
+    @classmethod
+    def get_chunk_merger(cls, metric: MetricConfiguration) -> Optional[ChunkMerger]:
+        return ChunkMerger(merge=lambda states: set().union(*states))
+
 
 class ColumnDistinctValuesCount(ColumnMetricProvider):
+    """Counts the distinct non-null values of a column.
+
+    If the "approximate" value kwarg is set, the count is estimated with a HyperLogLog sketch on pandas, with
+    approx_count_distinct on Spark, and with the approximate aggregate function of the dialect, if it has one, on
+    SQL backends.
+    """
+
     metric_name = "column.distinct_values.count"
+    value_keys = ("approximate",)
+
+    default_kwarg_values = {"approximate": False}
 
     @column_aggregate_value(engine=PandasExecutionEngine)
-    def _pandas(cls, column, **kwargs):
+    def _pandas(cls, column, approximate=False, **kwargs):
+        if approximate:
+            return HyperLogLog().update(column).estimate()
         return column.nunique()
 
     @metric_value(engine=SqlAlchemyExecutionEngine)
@@ -97,8 +126,22 @@ class ColumnDistinctValuesCount(ColumnMetricProvider):
         metrics: Dict[Tuple, Any],
         runtime_configuration: Dict,
     ):
-        observed_value_counts = metrics["column.value_counts"]
-        return len(observed_value_counts)
+        if not metric_value_kwargs.get("approximate"):
+            observed_value_counts = metrics["column.value_counts"]
+            return len(observed_value_counts)
+
+        selectable, _, accessor_domain_kwargs = execution_engine.get_compute_domain(
+            metric_domain_kwargs, MetricDomainTypes.COLUMN
+        )
+        column = sa.column(accessor_domain_kwargs["column"])
+        count_distinct = get_approximate_count_distinct_aggregate(
+            column, execution_engine.engine.dialect
+        )
+        if count_distinct is None:
+            count_distinct = sa.func.count(sa.distinct(column))
+        return execution_engine.engine.execute(
+            sa.select([count_distinct]).select_from(selectable)
+        ).scalar()
 
     @metric_value(engine=SparkDFExecutionEngine)
     def _spark(
@@ -109,8 +152,21 @@ class ColumnDistinctValuesCount(ColumnMetricProvider):
         metrics: Dict[Tuple, Any],
         runtime_configuration: Dict,
     ):
-        observed_value_counts = metrics["column.value_counts"]
-        return len(observed_value_counts)
+        if not metric_value_kwargs.get("approximate"):
+            observed_value_counts = metrics["column.value_counts"]
+            return len(observed_value_counts)
+
+        df, _, accessor_domain_kwargs = execution_engine.get_compute_domain(
+            metric_domain_kwargs, MetricDomainTypes.COLUMN
+        )
+        return df.select(
+            F.approx_count_distinct(
+                F.col(accessor_domain_kwargs["column"]),
+                rsd=HyperLogLog.get_relative_standard_error(
+                    DEFAULT_HYPERLOGLOG_PRECISION
+                ),
+            )
+        ).collect()[0][0]
 
     @classmethod
     def _get_evaluation_dependencies(
@@ -131,7 +187,7 @@ class ColumnDistinctValuesCount(ColumnMetricProvider):
 
         if isinstance(
             execution_engine, (SqlAlchemyExecutionEngine, SparkDFExecutionEngine)
-        ):
+        ) and not metric.metric_value_kwargs.get("approximate"):
             dependencies.update(
                 {
                     "column.value_counts": MetricConfiguration(
@@ -143,3 +199,58 @@ class ColumnDistinctValuesCount(ColumnMetricProvider):
             )
 
         return dependencies
+
+    @classmethod
+    def get_approximation_error_bound(
+        cls,
+        metric: MetricConfiguration,
+        execution_engine: ExecutionEngine,
+    ) -> Optional[dict]:
+        if isinstance(
+            execution_engine, (PandasExecutionEngine, SparkDFExecutionEngine)
+        ):
+            return {
+                "relative_standard_error": HyperLogLog.get_relative_standard_error(
+                    DEFAULT_HYPERLOGLOG_PRECISION
+                )
+            }
+        if isinstance(execution_engine, SqlAlchemyExecutionEngine):
+            if (
+                get_approximate_count_distinct_aggregate(
+                    sa.column("column"), execution_engine.engine.dialect
+                )
+                is None
+            ):
+                # The dialect has no approximate aggregate function, so the count is exact
+                return {"relative_standard_error": 0.0}
+        return None
+
+    @classmethod
+    def get_chunk_merger(cls, metric: MetricConfiguration) -> Optional[ChunkMerger]:
+        """Chunks contribute a HyperLogLog sketch of their values in approximate mode, and the set of their distinct
+        values otherwise."""
+        if metric.metric_value_kwargs.get("approximate"):
+
+            def get_state(cls, execution_engine, metric_domain_kwargs, **kwargs):
+                return HyperLogLog().update(
+                    get_pandas_column(cls, execution_engine, metric_domain_kwargs)
+                )
+
+            def merge(sketches):
+                merged_sketch = HyperLogLog()
+                for sketch in sketches:
+                    merged_sketch.merge(sketch)
+                return merged_sketch.estimate()
+
+            return ChunkMerger(merge=merge, get_state=get_state)
+
+        def get_state(cls, execution_engine, metric_domain_kwargs, **kwargs):
+            return set(
+                get_pandas_column(cls, execution_engine, metric_domain_kwargs)
+                .dropna()
+                .unique()
+            )
+
+        return ChunkMerger(
+            merge=lambda states: len(set().union(*states)), get_state=get_state
+        )
@@ -1,3 +1,8 @@
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
 from great_expectations.execution_engine import (
     PandasExecutionEngine,
     SparkDFExecutionEngine,
@@ -10,7 +15,10 @@ from great_expectations.expectations.metrics.column_aggregate_metric import (
     column_aggregate_partial,
     column_aggregate_value,
 )
-from great_expectations.expectations.metrics.import_manager import F, sa
+from great_expectations.expectations.metrics.import_manager import F, pc, sa
+from great_expectations.expectations.metrics.metric_provider import ChunkMerger
+from great_expectations.expectations.metrics.util import compute_with_arrow
+from great_expectations.validator.validation_graph import MetricConfiguration
 
 
 class ColumnMax(ColumnMetricProvider):
@@ -18,6 +26,11 @@ class ColumnMax(ColumnMetricProvider):
 
     @column_aggregate_value(engine=PandasExecutionEngine)
     def _pandas(cls, column, **kwargs):
+        maximum = compute_with_arrow(
+            column, lambda values: pc.min_max(values)["max"].as_py()
+        )
+        if maximum is not None:
+            return maximum
         return column.max()
 
     @column_aggregate_partial(engine=SqlAlchemyExecutionEngine)
@@ -27,3 +40,11 @@ class ColumnMax(ColumnMetricProvider):
     @column_aggregate_partial(engine=SparkDFExecutionEngine)
     def _spark(cls, column, **kwargs):
         return F.max(column)
+
+    @classmethod
+    def get_chunk_merger(cls, metric: MetricConfiguration) -> Optional[ChunkMerger]:
+        return ChunkMerger(
+            merge=lambda states: max(
+                [state for state in states if not pd.isnull(state)], default=np.nan
+            )
+        )
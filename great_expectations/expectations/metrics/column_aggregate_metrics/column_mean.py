@@ -1,3 +1,7 @@
+from typing import Optional
+
+import numpy as np
+
 from great_expectations.execution_engine import (
     PandasExecutionEngine,
     SparkDFExecutionEngine,
@@ -9,8 +13,12 @@ from great_expectations.expectations.metrics.column_aggregate_metric import (
     ColumnMetricProvider,
     column_aggregate_partial,
     column_aggregate_value,
+    get_pandas_column,
 )
-from great_expectations.expectations.metrics.import_manager import F, sa
+from great_expectations.expectations.metrics.import_manager import F, pc, sa
+from great_expectations.expectations.metrics.metric_provider import ChunkMerger
+from great_expectations.expectations.metrics.util import compute_with_arrow
+from great_expectations.validator.validation_graph import MetricConfiguration
 
 
 class ColumnMean(ColumnMetricProvider):
@@ -21,6 +29,9 @@ class ColumnMean(ColumnMetricProvider):
     @column_aggregate_value(engine=PandasExecutionEngine)
     def _pandas(cls, column, **kwargs):
         """Pandas Mean Implementation"""
+        mean = compute_with_arrow(column, lambda values: pc.mean(values).as_py())
+        if mean is not None:
+            return mean
         return column.mean()
 
     @column_aggregate_partial(engine=SqlAlchemyExecutionEngine)
@@ -36,3 +47,18 @@ class ColumnMean(ColumnMetricProvider):
         if types[_column_name] not in ("int", "float", "double", "bigint"):
             raise TypeError("Expected numeric column type for function mean()")
         return F.mean(column)
+
+    @classmethod
+    def get_chunk_merger(cls, metric: MetricConfiguration) -> Optional[ChunkMerger]:
+        """Chunks contribute the sum and the count of their non-null values."""
+
+        def get_state(cls, execution_engine, metric_domain_kwargs, **kwargs):
+            column = get_pandas_column(cls, execution_engine, metric_domain_kwargs)
+            return column.sum(), column.count()
+
+        def merge(states):
+            total = sum(state[0] for state in states)
+            count = sum(state[1] for state in states)
+            return total / count if count else np.nan
+
+        return ChunkMerger(merge=merge, get_state=get_state)
@@ -14,13 +14,20 @@ from great_expectations.execution_engine.sqlalchemy_execution_engine import (
 )
 from great_expectations.expectations.metrics.column_aggregate_metric import (
     ColumnMetricProvider,
+    column_aggregate_partial,
     column_aggregate_value,
 )
+from great_expectations.expectations.metrics.column_aggregate_metrics.column_quantile_values import (
+    get_pandas_quantile_sketch,
+    merge_quantile_sketches,
+)
 from great_expectations.expectations.metrics.import_manager import F, sa
 from great_expectations.expectations.metrics.metric_provider import (
+    ChunkMerger,
     MetricProvider,
     metric_value,
 )
+from great_expectations.expectations.metrics.util import get_quantile_aggregate
 from great_expectations.validator.validation_graph import MetricConfiguration
 
 
@@ -34,58 +41,50 @@ class ColumnMedian(ColumnMetricProvider):
         """Pandas Median Implementation"""
         return column.median()
 
-    @metric_value(engine=SqlAlchemyExecutionEngine, metric_fn_type="value")
+    @column_aggregate_partial(engine=SqlAlchemyExecutionEngine)
     def _sqlalchemy(
         cls,
-        execution_engine: "SqlAlchemyExecutionEngine",
-        metric_domain_kwargs: Dict,
-        metric_value_kwargs: Dict,
-        metrics: Dict[Tuple, Any],
-        runtime_configuration: Dict,
+        column,
+        _dialect,
+        _table,
+        _metrics,
+        allow_relative_error=False,
+        **kwargs,
     ):
-        (
-            selectable,
-            compute_domain_kwargs,
-            accessor_domain_kwargs,
-        ) = execution_engine.get_compute_domain(
-            metric_domain_kwargs, MetricDomainTypes.COLUMN
-        )
-        column_name = accessor_domain_kwargs["column"]
-        column = sa.column(column_name)
-        sqlalchemy_engine = execution_engine.engine
-        dialect = sqlalchemy_engine.dialect
         """SqlAlchemy Median Implementation"""
-        if dialect.name.lower() == "awsathena":
+        median_aggregate = get_quantile_aggregate(
+            column=column,
+            quantile=0.5,
+            dialect=_dialect,
+            allow_relative_error=allow_relative_error,
+            interpolate=True,
+        )
+        if median_aggregate is not None:
+            return median_aggregate
+
+        # Without a median aggregate function, we select the center value(s) of the sorted column in a subquery
+        if _dialect.name.lower() == "awsathena":
             raise NotImplementedError("AWS Athena does not support OFFSET.")
-        nonnull_count = metrics.get("column_values.nonnull.count")
+        nonnull_count = _metrics.get("column_values.nonnull.count")
         if not nonnull_count:
-            return None
-        element_values = sqlalchemy_engine.execute(
-            sa.select([column])
-            .order_by(column)
+            return sa.select([sa.null()]).as_scalar()
+        center_values = (
+            sa.select([column.label("center_value")])
             .where(column != None)
-            .offset(max(nonnull_count // 2 - 1, 0))
-            .limit(2)
-            .select_from(selectable)
+            .order_by(column)
+            .offset((nonnull_count - 1) // 2)
+            .limit(2 - nonnull_count % 2)
+            .select_from(_table)
+            .alias("center_values")
         )
-
-        column_values = list(element_values.fetchall())
-
-        if len(column_values) == 0:
-            column_median = None
-        elif nonnull_count % 2 == 0:
+        if nonnull_count % 2 == 0:
             # An even number of column values: take the average of the two center values
-            column_median = (
-                float(
-                    column_values[0][0]
-                    + column_values[1][0]  # left center value  # right center value
-                )
-                / 2.0
-            )  # Average center values
+            # (center_value * 1.0 is needed for a correct calculation of avg in MSSQL)
+            column_median = sa.func.avg(center_values.c.center_value * 1.0)
         else:
             # An odd number of column values, we can just take the center value
-            column_median = column_values[1][0]  # True center value
-        return column_median
+            column_median = sa.func.min(center_values.c.center_value)
+        return sa.select([column_median]).as_scalar()
 
     @metric_value(engine=SparkDFExecutionEngine, metric_fn_type="value")
     def _spark(
@@ -120,6 +119,21 @@ class ColumnMedian(ColumnMetricProvider):
         )
         return np.mean(result)
 
+    @classmethod
+    def get_chunk_merger(cls, metric: MetricConfiguration) -> Optional[ChunkMerger]:
+        """The median of a batch read in chunks is computed with a quantile sketch, as the mean of its two center
+        values. It is only exact as long as the sketch holds every value, so merging fails beyond that."""
+
+        def merge(sketches):
+            sketch = merge_quantile_sketches(sketches)
+            if sketch.count == 0:
+                return None
+            return np.mean(
+                sketch.quantiles([0.5, 0.5 + (1 / (2 + (2 * sketch.count)))])
+            )
+
+        return ChunkMerger(merge=merge, get_state=get_pandas_quantile_sketch)
+
     @classmethod
     def _get_evaluation_dependencies(
         cls,
@@ -155,9 +169,30 @@ class ColumnMedian(ColumnMetricProvider):
             }
         )
 
-        if isinstance(execution_engine, SqlAlchemyExecutionEngine):
+        # The number of non-null values is only needed to locate the center values on dialects without a median
+        # aggregate function
+        if isinstance(
+            execution_engine, SqlAlchemyExecutionEngine
+        ) and not _has_median_aggregate(execution_engine, metric):
             dependencies["column_values.nonnull.count"] = MetricConfiguration(
                 "column_values.nonnull.count", metric.metric_domain_kwargs
             )
 
         return dependencies
+
+
+def _has_median_aggregate(
+    execution_engine: "SqlAlchemyExecutionEngine", metric: MetricConfiguration
+) -> bool:
+    return (
+        get_quantile_aggregate(
+            column=sa.column(metric.metric_domain_kwargs["column"]),
+            quantile=0.5,
+            dialect=execution_engine.engine.dialect,
+            allow_relative_error=metric.metric_value_kwargs.get(
+                "allow_relative_error", False
+            ),
+            interpolate=True,
+        )
+        is not None
+    )
@@ -1,3 +1,8 @@
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
 from great_expectations.execution_engine import (
     PandasExecutionEngine,
     SparkDFExecutionEngine,
@@ -11,7 +16,10 @@ from great_expectations.expectations.metrics.column_aggregate_metric import (
     column_aggregate_value,
 )
 from great_expectations.expectations.metrics.column_aggregate_metric import sa as sa
-from great_expectations.expectations.metrics.import_manager import F
+from great_expectations.expectations.metrics.import_manager import F, pc
+from great_expectations.expectations.metrics.metric_provider import ChunkMerger
+from great_expectations.expectations.metrics.util import compute_with_arrow
+from great_expectations.validator.validation_graph import MetricConfiguration
 
 
 class ColumnMin(ColumnMetricProvider):
@@ -19,6 +27,11 @@ class ColumnMin(ColumnMetricProvider):
 
     @column_aggregate_value(engine=PandasExecutionEngine)
     def _pandas(cls, column, **kwargs):
+        minimum = compute_with_arrow(
+            column, lambda values: pc.min_max(values)["min"].as_py()
+        )
+        if minimum is not None:
+            return minimum
         return column.min()
 
     @column_aggregate_partial(engine=SqlAlchemyExecutionEngine)
@@ -28,3 +41,11 @@ class ColumnMin(ColumnMetricProvider):
     @column_aggregate_partial(engine=SparkDFExecutionEngine)
     def _spark(cls, column, **kwargs):
         return F.min(column)
+
+    @classmethod
+    def get_chunk_merger(cls, metric: MetricConfiguration) -> Optional[ChunkMerger]:
+        return ChunkMerger(
+            merge=lambda states: min(
+                [state for state in states if not pd.isnull(state)], default=np.nan
+            )
+        )
@@ -15,7 +15,13 @@ from great_expectations.expectations.metrics.column_aggregate_metric import (
     column_aggregate_value,
 )
 from great_expectations.expectations.metrics.column_aggregate_metric import sa as sa
-from great_expectations.expectations.metrics.metric_provider import metric_value
+from great_expectations.expectations.metrics.column_aggregate_metrics.column_distinct_values import (
+    ColumnDistinctValuesCount,
+)
+from great_expectations.expectations.metrics.metric_provider import (
+    ChunkMerger,
+    metric_value,
+)
 from great_expectations.validator.validation_graph import MetricConfiguration
 
 
@@ -32,6 +38,9 @@ def unique_proportion(_metrics):
 
 class ColumnUniqueProportion(ColumnMetricProvider):
     metric_name = "column.unique_proportion"
+    value_keys = ("approximate",)
+
+    default_kwarg_values = {"approximate": False}
 
     @metric_value(engine=PandasExecutionEngine)
     def _pandas(*args, metrics, **kwargs):
@@ -58,7 +67,9 @@ class ColumnUniqueProportion(ColumnMetricProvider):
         }
         return {
             "column.distinct_values.count": MetricConfiguration(
-                "column.distinct_values.count", metric.metric_domain_kwargs
+                "column.distinct_values.count",
+                metric.metric_domain_kwargs,
+                {"approximate": bool(metric.metric_value_kwargs.get("approximate"))},
             ),
             "table.row_count": MetricConfiguration(
                 "table.row_count", table_domain_kwargs
@@ -67,3 +78,18 @@ class ColumnUniqueProportion(ColumnMetricProvider):
                 "column_values.nonnull.unexpected_count", metric.metric_domain_kwargs
             ),
         }
+
+    @classmethod
+    def get_chunk_merger(cls, metric: MetricConfiguration) -> Optional[ChunkMerger]:
+        return ChunkMerger(uses_data=False)
+
+    @classmethod
+    def get_approximation_error_bound(
+        cls,
+        metric: MetricConfiguration,
+        execution_engine: ExecutionEngine,
+    ) -> Optional[dict]:
+        # Only the number of distinct values is approximated, so the proportion has the same relative error
+        return ColumnDistinctValuesCount.get_approximation_error_bound(
+            metric=metric, execution_engine=execution_engine
+        )
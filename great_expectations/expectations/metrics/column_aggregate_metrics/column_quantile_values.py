@@ -1,42 +1,53 @@
 import logging
-import traceback
+import uuid
 from collections import Iterable
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
 
+from great_expectations.core.sketches import (
+    DEFAULT_QUANTILE_RANK_ERROR,
+    QuantileSketch,
+)
+from great_expectations.exceptions import GreatExpectationsError
 from great_expectations.execution_engine.execution_engine import MetricDomainTypes
 
 try:
-    from sqlalchemy.engine import RowProxy
-    from sqlalchemy.exc import ProgrammingError
-    from sqlalchemy.sql import Select
-    from sqlalchemy.sql.elements import Label, TextClause, WithinGroup
-    from sqlalchemy.sql.selectable import CTE
+    from sqlalchemy.sql.elements import ColumnElement, Label
+    from sqlalchemy.sql.selectable import CTE, ScalarSelect
 except ImportError:
-    RowProxy = None
-    ProgrammingError = None
-    Select = None
+    ColumnElement = None
     Label = None
-    TextClaus = None
-    WithinGroup = None
     CTE = None
+    ScalarSelect = None
 
 from great_expectations.execution_engine import (
+    ExecutionEngine,
     PandasExecutionEngine,
     SparkDFExecutionEngine,
 )
+from great_expectations.execution_engine.pandas_execution_engine import (
+    ChunkedPandasBatchData,
+)
 from great_expectations.execution_engine.sqlalchemy_execution_engine import (
     SqlAlchemyExecutionEngine,
 )
-from great_expectations.execution_engine.util import get_approximate_percentile_disc_sql
 from great_expectations.expectations.metrics.column_aggregate_metric import (
     ColumnMetricProvider,
+    column_aggregate_partial,
     column_aggregate_value,
+    get_pandas_column,
 )
 from great_expectations.expectations.metrics.column_aggregate_metric import sa as sa
-from great_expectations.expectations.metrics.metric_provider import metric_value
-from great_expectations.expectations.metrics.util import attempt_allowing_relative_error
+from great_expectations.expectations.metrics.metric_provider import (
+    ChunkMerger,
+    metric_value,
+)
+from great_expectations.expectations.metrics.util import (
+    get_quantile_aggregate,
+    has_approximate_quantile_aggregate,
+)
+from great_expectations.validator.validation_graph import MetricConfiguration
 
 logger = logging.getLogger(__name__)
 
@@ -51,50 +62,33 @@ class ColumnQuantileValues(ColumnMetricProvider):
 
         return column.quantile(quantiles, interpolation="nearest").tolist()
 
-    @metric_value(engine=SqlAlchemyExecutionEngine)
+    @column_aggregate_partial(engine=SqlAlchemyExecutionEngine)
     def _sqlalchemy(
-        cls,
-        execution_engine: "SqlAlchemyExecutionEngine",
-        metric_domain_kwargs: Dict,
-        metric_value_kwargs: Dict,
-        metrics: Dict[Tuple, Any],
-        runtime_configuration: Dict,
+        cls, column, quantiles, _dialect, _table, allow_relative_error=False, **kwargs
     ):
-        (
-            selectable,
-            compute_domain_kwargs,
-            accessor_domain_kwargs,
-        ) = execution_engine.get_compute_domain(
-            metric_domain_kwargs, domain_type=MetricDomainTypes.COLUMN
-        )
-        column_name = accessor_domain_kwargs["column"]
-        column = sa.column(column_name)
-        sqlalchemy_engine = execution_engine.engine
-        dialect = sqlalchemy_engine.dialect
-        quantiles = metric_value_kwargs["quantiles"]
-        allow_relative_error = metric_value_kwargs.get("allow_relative_error", False)
-        if dialect.name.lower() == "mssql":
+        """Quantile Function
+
+        Quantiles are computed as aggregate functions, in the same query as the other aggregates of the domain, on
+        dialects providing one. Otherwise, each quantile is computed by a scalar subquery."""
+        if _dialect.name.lower() == "mssql":
             return _get_column_quantiles_mssql(
                 column=column,
                 quantiles=quantiles,
-                selectable=selectable,
-                sqlalchemy_engine=sqlalchemy_engine,
+                selectable=_table,
             )
-        elif dialect.name.lower() == "bigquery":
+        elif _dialect.name.lower() == "bigquery" and not allow_relative_error:
             return _get_column_quantiles_bigquery(
                 column=column,
                 quantiles=quantiles,
-                selectable=selectable,
-                sqlalchemy_engine=sqlalchemy_engine,
+                selectable=_table,
             )
-        elif dialect.name.lower() == "mysql":
+        elif _dialect.name.lower() == "mysql":
             return _get_column_quantiles_mysql(
                 column=column,
                 quantiles=quantiles,
-                selectable=selectable,
-                sqlalchemy_engine=sqlalchemy_engine,
+                selectable=_table,
             )
-        elif dialect.name.lower() == "snowflake":
+        elif _dialect.name.lower() == "snowflake":
             # NOTE: 20201216 - JPC - snowflake has a representation/precision limitation
             # in its percentile_disc implementation that causes an error when we do
             # not round. It is unclear to me *how* the call to round affects the behavior --
@@ -107,18 +101,14 @@ class ColumnQuantileValues(ColumnMetricProvider):
                 column=column,
                 quantiles=quantiles,
                 allow_relative_error=allow_relative_error,
-                dialect=dialect,
-                selectable=selectable,
-                sqlalchemy_engine=sqlalchemy_engine,
+                dialect=_dialect,
             )
         else:
             return _get_column_quantiles_generic_sqlalchemy(
                 column=column,
                 quantiles=quantiles,
                 allow_relative_error=allow_relative_error,
-                dialect=dialect,
-                selectable=selectable,
-                sqlalchemy_engine=sqlalchemy_engine,
+                dialect=_dialect,
             )
 
     @metric_value(engine=SparkDFExecutionEngine)
@@ -152,59 +142,117 @@ class ColumnQuantileValues(ColumnMetricProvider):
             )
         return df.approxQuantile(column, list(quantiles), allow_relative_error)
 
+    @classmethod
+    def get_approximation_error_bound(
+        cls,
+        metric: MetricConfiguration,
+        execution_engine: ExecutionEngine,
+    ) -> Optional[dict]:
+        allow_relative_error = metric.metric_value_kwargs.get("allow_relative_error")
+        if isinstance(execution_engine, PandasExecutionEngine):
+            batch_id = (
+                metric.metric_domain_kwargs.get("batch_id")
+                or execution_engine.active_batch_data_id
+            )
+            if isinstance(
+                execution_engine.loaded_batch_data_dict.get(batch_id),
+                ChunkedPandasBatchData,
+            ):
+                # The quantile sketch of a batch read in chunks is only merged if its rank error is within this bound
+                if allow_relative_error is True:
+                    allow_relative_error = DEFAULT_QUANTILE_RANK_ERROR
+                return {"rank_error": float(allow_relative_error or 0.0)}
+            # Quantiles of a single dataframe are always computed exactly
+            return {"rank_error": 0.0}
+        if isinstance(execution_engine, SparkDFExecutionEngine):
+            return {"rank_error": float(allow_relative_error or 0.0)}
+        if isinstance(execution_engine, SqlAlchemyExecutionEngine):
+            if allow_relative_error and has_approximate_quantile_aggregate(
+                execution_engine.engine.dialect
+            ):
+                # The accuracy of approximate aggregate functions is not documented by every dialect
+                return None
+            return {"rank_error": 0.0}
+        return None
 
-def _get_column_quantiles_mssql(
-    column, quantiles: Iterable, selectable, sqlalchemy_engine
-) -> list:
-    # mssql requires over(), so we add an empty over() clause
-    selects: List[WithinGroup] = [
-        sa.func.percentile_disc(quantile).within_group(column.asc()).over()
-        for quantile in quantiles
-    ]
-    quantiles_query: Select = sa.select(selects).select_from(selectable)
+    @classmethod
+    def get_chunk_merger(cls, metric: MetricConfiguration) -> Optional[ChunkMerger]:
+        """The quantiles of a batch read in chunks are estimated with a quantile sketch."""
+        quantiles = metric.metric_value_kwargs["quantiles"]
+        allow_relative_error = metric.metric_value_kwargs.get("allow_relative_error")
+
+        def merge(sketches):
+            sketch = merge_quantile_sketches(sketches, allow_relative_error)
+            if sketch.count == 0:
+                return sketch.quantiles(quantiles)
+            # Select the values of the ranks used by the "nearest" interpolation of pandas, so that the quantiles are
+            # the same as those of the whole batch as long as the sketch holds every value
+            return sketch.quantiles(
+                [
+                    (np.around(quantile * (sketch.count - 1)) + 0.5) / sketch.count
+                    for quantile in quantiles
+                ]
+            )
+
+        return ChunkMerger(merge=merge, get_state=get_pandas_quantile_sketch)
 
-    try:
-        quantiles_results: RowProxy = sqlalchemy_engine.execute(
-            quantiles_query
-        ).fetchone()
-        return list(quantiles_results)
-    except ProgrammingError as pe:
-        exception_message: str = "An SQL syntax Exception occurred."
-        exception_traceback: str = traceback.format_exc()
-        exception_message += (
-            f'{type(pe).__name__}: "{str(pe)}".  Traceback: "{exception_traceback}".'
+
+def get_pandas_quantile_sketch(
+    cls, execution_engine, metric_domain_kwargs, **kwargs
+) -> QuantileSketch:
+    """Returns a quantile sketch of the column of the domain, as the state of a quantile metric over one chunk of a
+    batch read in chunks."""
+    return QuantileSketch().update(
+        get_pandas_column(cls, execution_engine, metric_domain_kwargs)
+    )
+
+
+def merge_quantile_sketches(
+    sketches: List[QuantileSketch], allow_relative_error=False
+) -> QuantileSketch:
+    """Merges the quantile sketches of the chunks of a batch. Once the batch holds more values than the sketch
+    capacity, the sketch only estimates quantiles, so its rank error must be allowed by allow_relative_error."""
+    merged_sketch = QuantileSketch()
+    for sketch in sketches:
+        merged_sketch.merge(sketch)
+    if allow_relative_error is True:
+        allow_relative_error = DEFAULT_QUANTILE_RANK_ERROR
+    if merged_sketch.rank_error > float(allow_relative_error or 0.0):
+        raise GreatExpectationsError(
+            "Quantiles of a batch read in chunks could only be estimated with a rank error of "
+            f"{merged_sketch.rank_error:.6f}, which exceeds the allowed relative error "
+            f"({float(allow_relative_error or 0.0)}). Allow a relative error (approximate mode), or read the batch "
+            "without a chunksize."
         )
-        logger.error(exception_message)
-        raise pe
+    return merged_sketch
 
 
-def _get_column_quantiles_bigquery(
-    column, quantiles: Iterable, selectable, sqlalchemy_engine
-) -> list:
-    # BigQuery does not support "WITHIN", so we need a special case for it
-    selects: List[WithinGroup] = [
-        sa.func.percentile_disc(column, quantile).over() for quantile in quantiles
+def _get_column_quantiles_mssql(column, quantiles: Iterable, selectable) -> list:
+    # mssql requires over(), so we add an empty over() clause; percentile_disc is then a window function, which we
+    # evaluate on the first row of the domain.
+    return [
+        sa.select(
+            [sa.func.percentile_disc(quantile).within_group(column.asc()).over()]
+        )
+        .select_from(selectable)
+        .limit(1)
+        .as_scalar()
+        for quantile in quantiles
     ]
-    quantiles_query: Select = sa.select(selects).select_from(selectable)
 
-    try:
-        quantiles_results: RowProxy = sqlalchemy_engine.execute(
-            quantiles_query
-        ).fetchone()
-        return list(quantiles_results)
-    except ProgrammingError as pe:
-        exception_message: str = "An SQL syntax Exception occurred."
-        exception_traceback: str = traceback.format_exc()
-        exception_message += (
-            f'{type(pe).__name__}: "{str(pe)}".  Traceback: "{exception_traceback}".'
-        )
-        logger.error(exception_message)
-        raise pe
 
+def _get_column_quantiles_bigquery(column, quantiles: Iterable, selectable) -> list:
+    # BigQuery does not support "WITHIN", so we need a special case for it
+    return [
+        sa.select([sa.func.percentile_disc(column, quantile).over()])
+        .select_from(selectable)
+        .limit(1)
+        .as_scalar()
+        for quantile in quantiles
+    ]
 
-def _get_column_quantiles_mysql(
-    column, quantiles: Iterable, selectable, sqlalchemy_engine
-) -> list:
+
+def _get_column_quantiles_mysql(column, quantiles: Iterable, selectable) -> list:
     # MySQL does not support "percentile_disc", so we implement it as a compound query.
     # Please see https://stackoverflow.com/questions/19770026/calculate-percentile-value-using-mysql for reference.
     percent_rank_query: CTE = (
@@ -219,10 +267,11 @@ def _get_column_quantiles_mysql(
         )
         .order_by(sa.column("p").asc())
         .select_from(selectable)
-        .cte("t")
+        # The quantiles of several columns may be selected by the same bundle statement, whose CTEs need distinct names
+        .cte(f"t_{uuid.uuid4().hex[:8]}")
     )
 
-    selects: List[WithinGroup] = []
+    selects: List[ScalarSelect] = []
     for idx, quantile in enumerate(quantiles):
         # pymysql cannot handle conversion of numpy float64 to float; convert just in case
         if np.issubdtype(type(quantile), np.float_):
@@ -243,24 +292,14 @@ def _get_column_quantiles_mysql(
             )
             .label(f"q_{idx}")
         )
-        selects.append(quantile_column)
-    quantiles_query: Select = (
-        sa.select(selects).distinct().order_by(percent_rank_query.c.p.desc())
-    )
-
-    try:
-        quantiles_results: RowProxy = sqlalchemy_engine.execute(
-            quantiles_query
-        ).fetchone()
-        return list(quantiles_results)
-    except ProgrammingError as pe:
-        exception_message: str = "An SQL syntax Exception occurred."
-        exception_traceback: str = traceback.format_exc()
-        exception_message += (
-            f'{type(pe).__name__}: "{str(pe)}".  Traceback: "{exception_traceback}".'
+        selects.append(
+            sa.select([quantile_column])
+            .distinct()
+            .order_by(percent_rank_query.c.p.desc())
+            .limit(1)
+            .as_scalar()
         )
-        logger.error(exception_message)
-        raise pe
+    return selects
 
 
 # Support for computing the quantiles column for PostGreSQL and Redshift is included in the same method as that for
@@ -272,51 +311,18 @@ def _get_column_quantiles_generic_sqlalchemy(
     quantiles: Iterable,
     allow_relative_error: bool,
     dialect,
-    selectable,
-    sqlalchemy_engine,
 ) -> list:
-    selects: List[WithinGroup] = [
-        sa.func.percentile_disc(quantile).within_group(column.asc())
-        for quantile in quantiles
-    ]
-    quantiles_query: Select = sa.select(selects).select_from(selectable)
-
-    try:
-        quantiles_results: RowProxy = sqlalchemy_engine.execute(
-            quantiles_query
-        ).fetchone()
-        return list(quantiles_results)
-    except ProgrammingError:
-        # ProgrammingError: (psycopg2.errors.SyntaxError) Aggregate function "percentile_disc" is not supported;
-        # use approximate percentile_disc or percentile_cont instead.
-        if attempt_allowing_relative_error(dialect):
-            # Redshift does not have a percentile_disc method, but does support an approximate version.
-            sql_approx: str = get_approximate_percentile_disc_sql(
-                selects=selects, sql_engine_dialect=dialect
-            )
-            selects_approx: List[TextClause] = [sa.text(sql_approx)]
-            quantiles_query_approx: Select = sa.select(selects_approx).select_from(
-                selectable
-            )
-            if allow_relative_error:
-                try:
-                    quantiles_results: RowProxy = sqlalchemy_engine.execute(
-                        quantiles_query_approx
-                    ).fetchone()
-                    return list(quantiles_results)
-                except ProgrammingError as pe:
-                    exception_message: str = "An SQL syntax Exception occurred."
-                    exception_traceback: str = traceback.format_exc()
-                    exception_message += f'{type(pe).__name__}: "{str(pe)}".  Traceback: "{exception_traceback}".'
-                    logger.error(exception_message)
-                    raise pe
-            else:
-                raise ValueError(
-                    f'The SQL engine dialect "{str(dialect)}" does not support computing quantiles '
-                    "without approximation error; set allow_relative_error to True to allow approximate quantiles."
-                )
-        else:
-            raise ValueError(
-                f'The SQL engine dialect "{str(dialect)}" does not support computing quantiles with '
-                "approximation error; set allow_relative_error to False to disable approximate quantiles."
+    selects: List[ColumnElement] = []
+    for quantile in quantiles:
+        quantile_aggregate = get_quantile_aggregate(
+            column=column,
+            quantile=quantile,
+            dialect=dialect,
+            allow_relative_error=allow_relative_error,
+        )
+        if quantile_aggregate is None:
+            quantile_aggregate = sa.func.percentile_disc(quantile).within_group(
+                column.asc()
             )
+        selects.append(quantile_aggregate)
+    return selects
@@ -1,4 +1,7 @@
 import logging
+from typing import Optional
+
+import numpy as np
 
 from great_expectations.execution_engine import (
     PandasExecutionEngine,
@@ -11,7 +14,10 @@ from great_expectations.expectations.metrics.column_aggregate_metric import (
     ColumnMetricProvider,
     column_aggregate_partial,
     column_aggregate_value,
+    get_pandas_column,
 )
+from great_expectations.expectations.metrics.metric_provider import ChunkMerger
+from great_expectations.validator.validation_graph import MetricConfiguration
 
 logger = logging.getLogger(__name__)
 
@@ -49,3 +55,32 @@ class ColumnStandardDeviation(ColumnMetricProvider):
     def _spark(cls, column, **kwargs):
         """Spark Standard Deviation implementation"""
         return F.stddev_samp(column)
+
+    @classmethod
+    def get_chunk_merger(cls, metric: MetricConfiguration) -> Optional[ChunkMerger]:
+        """Chunks contribute the count, the mean and the sum of squared deviations from the mean of their non-null
+        values, which are combined pairwise (Chan et al.) to avoid the cancellation of a sum of squares."""
+
+        def get_state(cls, execution_engine, metric_domain_kwargs, **kwargs):
+            column = get_pandas_column(
+                cls, execution_engine, metric_domain_kwargs
+            ).dropna()
+            if len(column) == 0:
+                return 0, 0.0, 0.0
+            mean = column.mean()
+            return len(column), mean, ((column - mean) ** 2).sum()
+
+        def merge(states):
+            count, mean, m2 = 0, 0.0, 0.0
+            for chunk_count, chunk_mean, chunk_m2 in states:
+                if chunk_count == 0:
+                    continue
+                total_count = count + chunk_count
+                delta = chunk_mean - mean
+                mean += delta * chunk_count / total_count
+                m2 += chunk_m2 + delta ** 2 * count * chunk_count / total_count
+                count = total_count
+            # Sample standard deviation, as computed by pandas
+            return np.sqrt(m2 / (count - 1)) if count > 1 else np.nan
+
+        return ChunkMerger(merge=merge, get_state=get_state)
@@ -1,3 +1,5 @@
+from typing import Optional
+
 from great_expectations.execution_engine import (
     PandasExecutionEngine,
     SparkDFExecutionEngine,
@@ -11,6 +13,8 @@ from great_expectations.expectations.metrics.column_aggregate_metric import (
     column_aggregate_value,
 )
 from great_expectations.expectations.metrics.import_manager import F, sa
+from great_expectations.expectations.metrics.metric_provider import ChunkMerger
+from great_expectations.validator.validation_graph import MetricConfiguration
 
 
 class ColumnSum(ColumnMetricProvider):
@@ -27,3 +31,7 @@ class ColumnSum(ColumnMetricProvider):
     @column_aggregate_partial(engine=SparkDFExecutionEngine)
     def _spark(cls, column, **kwargs):
         return F.sum(column)
+
+    @classmethod
+    def get_chunk_merger(cls, metric: MetricConfiguration) -> Optional[ChunkMerger]:
+        return ChunkMerger(merge=sum)
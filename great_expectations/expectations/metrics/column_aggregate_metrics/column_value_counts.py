@@ -1,4 +1,5 @@
-from typing import Any, Dict, Tuple
+from functools import reduce
+from typing import Any, Dict, Optional, Tuple
 
 import pandas as pd
 
@@ -11,8 +12,13 @@ from great_expectations.execution_engine.execution_engine import MetricDomainTyp
 from great_expectations.expectations.metrics.column_aggregate_metric import (
     ColumnMetricProvider,
 )
-from great_expectations.expectations.metrics.import_manager import F, sa
-from great_expectations.expectations.metrics.metric_provider import metric_value
+from great_expectations.expectations.metrics.import_manager import F, pc, sa
+from great_expectations.expectations.metrics.metric_provider import (
+    ChunkMerger,
+    metric_value,
+)
+from great_expectations.expectations.metrics.util import compute_with_arrow
+from great_expectations.validator.validation_graph import MetricConfiguration
 
 
 class ColumnValueCounts(ColumnMetricProvider):
@@ -45,21 +51,10 @@ class ColumnValueCounts(ColumnMetricProvider):
         )
         column = accessor_domain_kwargs["column"]
 
-        counts = df[column].value_counts()
-        if sort == "value":
-            try:
-                counts.sort_index(inplace=True)
-            except TypeError:
-                # Having values of multiple types in a object dtype column (e.g., strings and floats)
-                # raises a TypeError when the sorting method performs comparisons.
-                if df[column].dtype == object:
-                    counts.index = counts.index.astype(str)
-                    counts.sort_index(inplace=True)
-        elif sort == "counts":
-            counts.sort_values(inplace=True)
-        counts.name = "count"
-        counts.index.name = "value"
-        return counts
+        counts = _get_arrow_value_counts(df[column])
+        if counts is None:
+            counts = df[column].value_counts()
+        return _sort_pandas_value_counts(counts, sort, df[column].dtype == object)
 
     @metric_value(engine=SqlAlchemyExecutionEngine)
     def _sqlalchemy(
@@ -157,3 +152,60 @@ class ColumnValueCounts(ColumnMetricProvider):
             name="count",
         )
         return series
+
+    @classmethod
+    def get_chunk_merger(cls, metric: MetricConfiguration) -> Optional[ChunkMerger]:
+        sort = metric.metric_value_kwargs.get("sort", cls.default_kwarg_values["sort"])
+
+        def get_state(cls, execution_engine, metric_domain_kwargs, **kwargs):
+            df, _, accessor_domain_kwargs = execution_engine.get_compute_domain(
+                metric_domain_kwargs, MetricDomainTypes.COLUMN
+            )
+            column = df[accessor_domain_kwargs["column"]]
+            return column.value_counts(), column.dtype == object
+
+        def merge(states):
+            counts = reduce(
+                lambda left, right: left.add(right, fill_value=0),
+                [chunk_counts for chunk_counts, _ in states],
+                pd.Series(dtype="int64"),
+            ).astype("int64")
+            is_object_column = any(
+                chunk_is_object_column for _, chunk_is_object_column in states
+            )
+            return _sort_pandas_value_counts(counts, sort, is_object_column)
+
+        return ChunkMerger(merge=merge, get_state=get_state)
+
+
+def _get_arrow_value_counts(column: pd.Series) -> Optional[pd.Series]:
+    """Counts the non-null values of a column of an ArrowDtype with pyarrow.compute, or returns None if the column is
+    not backed by Arrow data."""
+    value_counts = compute_with_arrow(
+        column, lambda values: pc.value_counts(values.drop_null())
+    )
+    if value_counts is None:
+        return None
+    return pd.Series(
+        value_counts.field("counts").to_numpy(),
+        index=pd.Index(value_counts.field("values").to_pandas()),
+    )
+
+
+def _sort_pandas_value_counts(
+    counts: pd.Series, sort: str, is_object_column: bool
+) -> pd.Series:
+    if sort == "value":
+        try:
+            counts.sort_index(inplace=True)
+        except TypeError:
+            # Having values of multiple types in a object dtype column (e.g., strings and floats)
+            # raises a TypeError when the sorting method performs comparisons.
+            if is_object_column:
+                counts.index = counts.index.astype(str)
+                counts.sort_index(inplace=True)
+    elif sort == "counts":
+        counts.sort_values(inplace=True)
+    counts.name = "count"
+    counts.index.name = "value"
+    return counts
@@ -1,5 +1,7 @@
 from typing import Optional
 
+import pandas as pd
+
 from great_expectations.core import ExpectationConfiguration
 from great_expectations.execution_engine import (
     ExecutionEngine,
@@ -9,12 +11,13 @@ from great_expectations.execution_engine import (
 from great_expectations.execution_engine.sqlalchemy_execution_engine import (
     SqlAlchemyExecutionEngine,
 )
-from great_expectations.expectations.metrics.import_manager import F, sa
+from great_expectations.expectations.metrics.import_manager import F, pc, sa
 from great_expectations.expectations.metrics.map_metric import (
     ColumnMapMetricProvider,
     column_condition_partial,
     column_function_partial,
 )
+from great_expectations.expectations.metrics.util import compute_with_arrow
 from great_expectations.validator.validation_graph import MetricConfiguration
 
 
@@ -72,6 +75,9 @@ class ColumnValuesValueLength(ColumnMapMetricProvider):
 
     @column_function_partial(engine=PandasExecutionEngine)
     def _pandas_function(cls, column, **kwargs):
+        lengths = compute_with_arrow(column, lambda values: pc.utf8_length(values))
+        if lengths is not None:
+            return pd.Series(lengths.to_pandas().to_numpy(), index=column.index)
         return column.astype(str).str.len()
 
     @column_function_partial(engine=SqlAlchemyExecutionEngine)
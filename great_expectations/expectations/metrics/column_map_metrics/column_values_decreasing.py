@@ -24,6 +24,7 @@ from great_expectations.validator.validation_graph import MetricConfiguration
 
 class ColumnValuesDecreasing(ColumnMapMetricProvider):
     condition_metric_name = "column_values.decreasing"
+    row_local = False
     condition_value_keys = ("strictly",)
     default_kwarg_values = {"strictly": False}
 
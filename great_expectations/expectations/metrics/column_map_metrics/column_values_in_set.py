@@ -12,6 +12,12 @@ from great_expectations.expectations.metrics.map_metric import (
     ColumnMapMetricProvider,
     column_condition_partial,
 )
+from great_expectations.expectations.metrics.util import (
+    arrow_condition_to_series,
+    arrow_is_in,
+    column_isin,
+    compute_with_arrow,
+)
 
 
 class ColumnValuesInSet(ColumnMapMetricProvider):
@@ -23,7 +29,12 @@ class ColumnValuesInSet(ColumnMapMetricProvider):
         if value_set is None:
             # Vacuously true
             return np.ones(len(column), dtype=np.bool_)
-        return column.isin(value_set)
+        is_in = compute_with_arrow(
+            column, lambda values: arrow_is_in(values, value_set)
+        )
+        if is_in is not None:
+            return arrow_condition_to_series(is_in, column)
+        return column_isin(column, value_set)
 
     @column_condition_partial(engine=SqlAlchemyExecutionEngine)
     def _sqlalchemy(cls, column, value_set, **kwargs):
@@ -37,4 +48,4 @@ class ColumnValuesInSet(ColumnMapMetricProvider):
         if value_set is None:
             # vacuously true
             return F.lit(True)
-        return column.isin(value_set)
+        return column_isin(column, value_set)
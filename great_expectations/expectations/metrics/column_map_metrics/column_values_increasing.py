@@ -29,6 +29,7 @@ from great_expectations.validator.validation_graph import MetricConfiguration
 
 class ColumnValuesIncreasing(ColumnMapMetricProvider):
     condition_metric_name = "column_values.increasing"
+    row_local = False
     condition_value_keys = ("strictly",)
     default_kwarg_values = {"strictly": False}
 
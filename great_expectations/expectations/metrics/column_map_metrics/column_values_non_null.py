@@ -14,6 +14,7 @@ from great_expectations.expectations.metrics.map_metric import (
     column_condition_partial,
 )
 from great_expectations.expectations.metrics.metric_provider import (
+    ChunkMerger,
     MetricProvider,
     metric_value,
 )
@@ -54,6 +55,10 @@ class ColumnValuesNonNullCount(MetricProvider):
     def _spark(*, metrics, **kwargs):
         return metrics["column_values.null.unexpected_count"]
 
+    @classmethod
+    def get_chunk_merger(cls, metric: MetricConfiguration) -> Optional[ChunkMerger]:
+        return ChunkMerger(uses_data=False)
+
     @classmethod
     def _get_evaluation_dependencies(
         cls,
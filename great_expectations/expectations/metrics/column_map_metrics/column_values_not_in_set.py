@@ -12,7 +12,13 @@ from great_expectations.expectations.metrics.map_metric import (
     ColumnMapMetricProvider,
     column_condition_partial,
 )
-from great_expectations.expectations.metrics.util import parse_value_set
+from great_expectations.expectations.metrics.util import (
+    arrow_condition_to_series,
+    arrow_is_in,
+    column_isin,
+    compute_with_arrow,
+    parse_value_set,
+)
 
 
 class ColumnValuesNotInSet(ColumnMapMetricProvider):
@@ -31,8 +37,13 @@ class ColumnValuesNotInSet(ColumnMapMetricProvider):
             parsed_value_set = parse_value_set(value_set=value_set)
         else:
             parsed_value_set = value_set
+            is_in = compute_with_arrow(
+                column, lambda values: arrow_is_in(values, value_set)
+            )
+            if is_in is not None:
+                return ~arrow_condition_to_series(is_in, column)
 
-        return ~column.isin(parsed_value_set)
+        return ~column_isin(column, parsed_value_set)
 
     @column_condition_partial(engine=SqlAlchemyExecutionEngine)
     def _sqlalchemy(cls, column, value_set, parse_strings_as_datetimes, **kwargs):
@@ -11,7 +11,12 @@ from great_expectations.expectations.metrics.map_metric import (
     ColumnMapMetricProvider,
     column_condition_partial,
 )
-from great_expectations.expectations.metrics.util import get_dialect_regex_expression
+from great_expectations.expectations.metrics.import_manager import pc
+from great_expectations.expectations.metrics.util import (
+    arrow_condition_to_series,
+    compute_with_arrow,
+    get_dialect_regex_expression,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -22,6 +27,11 @@ class ColumnValuesNotMatchRegex(ColumnMapMetricProvider):
 
     @column_condition_partial(engine=PandasExecutionEngine)
     def _pandas(cls, column, regex, **kwargs):
+        matches = compute_with_arrow(
+            column, lambda values: pc.match_substring_regex(values, pattern=regex)
+        )
+        if matches is not None:
+            return ~arrow_condition_to_series(matches, column)
         return ~column.astype(str).str.contains(regex)
 
     @column_condition_partial(engine=SqlAlchemyExecutionEngine)
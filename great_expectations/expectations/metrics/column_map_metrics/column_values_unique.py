@@ -26,6 +26,7 @@ from great_expectations.validator.validation_graph import MetricConfiguration
 
 class ColumnValuesUnique(ColumnMapMetricProvider):
     condition_metric_name = "column_values.unique"
+    row_local = False
 
     @column_condition_partial(engine=PandasExecutionEngine)
     def _pandas(cls, column, **kwargs):
@@ -44,3 +44,11 @@ try:
 except ImportError:
     logger.debug("No spark SQLContext available.")
     SQLContext = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:
+    logger.debug("No pyarrow module available.")
+    pa = None
+    pc = None
@@ -1,8 +1,9 @@
 import uuid
-from functools import wraps
+from functools import partial, wraps
 from typing import Any, Callable, Dict, List, Optional, Tuple, Type, Union
 
 import numpy as np
+import pandas as pd
 
 from great_expectations.core import ExpectationConfiguration
 from great_expectations.core.util import convert_to_json_serializable
@@ -25,6 +26,7 @@ from great_expectations.execution_engine.sqlalchemy_execution_engine import (
     sa,
 )
 from great_expectations.expectations.metrics.metric_provider import (
+    ChunkMerger,
     MetricProvider,
     metric_partial,
 )
@@ -82,17 +84,15 @@ def column_function_partial(
                 )
 
                 (
-                    df,
+                    column,
                     compute_domain_kwargs,
                     accessor_domain_kwargs,
-                ) = execution_engine.get_compute_domain(
-                    domain_kwargs=metric_domain_kwargs, domain_type=domain_type
+                ) = execution_engine.get_domain_column(
+                    metric_domain_kwargs, filter_column_isnull=filter_column_isnull
                 )
-                if filter_column_isnull:
-                    df = df[df[accessor_domain_kwargs["column"]].notnull()]
                 values = metric_fn(
                     cls,
-                    df[accessor_domain_kwargs["column"]],
+                    column,
                     **metric_value_kwargs,
                     _metrics=metrics,
                 )
@@ -278,21 +278,24 @@ def column_condition_partial(
                 )
 
                 (
-                    df,
+                    column,
                     compute_domain_kwargs,
                     accessor_domain_kwargs,
-                ) = execution_engine.get_compute_domain(
-                    domain_kwargs=metric_domain_kwargs, domain_type=domain_type
+                ) = execution_engine.get_domain_column(
+                    metric_domain_kwargs, filter_column_isnull=filter_column_isnull
                 )
-                if filter_column_isnull:
-                    df = df[df[accessor_domain_kwargs["column"]].notnull()]
 
                 meets_expectation_series = metric_fn(
                     cls,
-                    df[accessor_domain_kwargs["column"]],
+                    column,
                     **metric_value_kwargs,
                     _metrics=metrics,
                 )
+                if not isinstance(meets_expectation_series, pd.Series):
+                    # The unexpected outputs locate the unexpected rows by the index of the condition
+                    meets_expectation_series = pd.Series(
+                        meets_expectation_series, index=column.index
+                    )
                 return (
                     ~meets_expectation_series,
                     compute_domain_kwargs,
@@ -460,23 +463,35 @@ def _pandas_map_condition_unexpected_count(
     return np.count_nonzero(metrics["unexpected_condition"][0])
 
 
-def _pandas_column_map_condition_values(
+def _pandas_get_unexpected_mask(boolean_mapped_unexpected_values, result_format):
+    """Returns the rows flagged as unexpected by the condition mask, truncated to the partial_unexpected_count unless
+    the COMPLETE result_format is requested.
+
+    The mask is indexed like the (possibly null-filtered) domain it was computed over, so the unexpected rows can be
+    located in the domain without filtering it again."""
+    unexpected_mask = boolean_mapped_unexpected_values == True
+    if result_format["result_format"] != "COMPLETE":
+        limit = result_format["partial_unexpected_count"]
+        unexpected_mask = unexpected_mask & (
+            unexpected_mask.cumsum() <= limit
+        )
+    return unexpected_mask
+
+
+def _pandas_get_unexpected_domain(
     cls,
     execution_engine: "PandasExecutionEngine",
-    metric_domain_kwargs: Dict,
-    metric_value_kwargs: Dict,
     metrics: Dict[str, Any],
+    column_only: bool,
     **kwargs,
 ):
-    """Return values from the specified domain that match the map-style metric in the metrics dictionary."""
+    """Returns the unexpected rows (or, if column_only, the unexpected values of the domain column) identified by the
+    condition mask in the metrics dictionary, honoring the requested result_format."""
     (
-        boolean_map_unexpected_values,
+        boolean_mapped_unexpected_values,
         compute_domain_kwargs,
         accessor_domain_kwargs,
     ) = metrics["unexpected_condition"]
-    df, _, _ = execution_engine.get_compute_domain(
-        domain_kwargs=compute_domain_kwargs, domain_type="identity"
-    )
     ###
     # NOTE: 20201111 - JPC - in the map_series / map_condition_series world (pandas), we
     # currently handle filter_column_isnull differently than other map_fn / map_condition
@@ -485,25 +500,49 @@ def _pandas_column_map_condition_values(
     filter_column_isnull = kwargs.get(
         "filter_column_isnull", getattr(cls, "filter_column_isnull", False)
     )
-    if filter_column_isnull:
-        df = df[df[accessor_domain_kwargs["column"]].notnull()]
-
-    if "column" in accessor_domain_kwargs:
-        domain_values = df[accessor_domain_kwargs["column"]]
+    if column_only:
+        if "column" not in accessor_domain_kwargs:
+            raise ValueError(
+                "_pandas_get_unexpected_domain requires a column in accessor_domain_kwargs"
+            )
+        # The column is shared with the other metrics over the domain (see PandasExecutionEngine.get_domain_column)
+        data, _, _ = execution_engine.get_domain_column(
+            {**compute_domain_kwargs, **accessor_domain_kwargs},
+            filter_column_isnull=filter_column_isnull,
+        )
     else:
-        raise ValueError(
-            "_pandas_column_map_condition_values requires a column in accessor_domain_kwargs"
+        df, _, _ = execution_engine.get_compute_domain(
+            domain_kwargs=compute_domain_kwargs, domain_type="identity"
+        )
+        data = df
+        if filter_column_isnull:
+            data = data[df[accessor_domain_kwargs["column"]].notnull()]
+    return data[
+        _pandas_get_unexpected_mask(
+            boolean_mapped_unexpected_values, kwargs["result_format"]
         )
+    ]
 
-    result_format = metric_value_kwargs["result_format"]
-    if result_format["result_format"] == "COMPLETE":
-        return list(domain_values[boolean_map_unexpected_values == True])
-    else:
-        return list(
-            domain_values[boolean_map_unexpected_values == True][
-                : result_format["partial_unexpected_count"]
-            ]
+
+def _pandas_column_map_condition_values(
+    cls,
+    execution_engine: "PandasExecutionEngine",
+    metric_domain_kwargs: Dict,
+    metric_value_kwargs: Dict,
+    metrics: Dict[str, Any],
+    **kwargs,
+):
+    """Return values from the specified domain that match the map-style metric in the metrics dictionary."""
+    return list(
+        _pandas_get_unexpected_domain(
+            cls,
+            execution_engine,
+            metrics,
+            column_only=True,
+            result_format=metric_value_kwargs["result_format"],
+            **kwargs,
         )
+    )
 
 
 def _pandas_column_map_series_and_domain_values(
@@ -531,46 +570,25 @@ def _pandas_column_map_series_and_domain_values(
     assert (
         accessor_domain_kwargs == accessor_domain_kwargs_2
     ), "map_series and condition must have the same accessor kwargs"
-    df, _, _ = execution_engine.get_compute_domain(
-        domain_kwargs=compute_domain_kwargs, domain_type="identity"
+    result_format = metric_value_kwargs["result_format"]
+    domain_values = _pandas_get_unexpected_domain(
+        cls,
+        execution_engine,
+        metrics,
+        column_only=True,
+        result_format=result_format,
+        **kwargs,
     )
-    ###
-    # NOTE: 20201111 - JPC - in the map_series / map_condition_series world (pandas), we
-    # currently handle filter_column_isnull differently than other map_fn / map_condition
-    # cases.
-    ###
-    filter_column_isnull = kwargs.get(
-        "filter_column_isnull", getattr(cls, "filter_column_isnull", False)
+    return (
+        list(domain_values),
+        list(
+            map_series[
+                _pandas_get_unexpected_mask(
+                    boolean_map_unexpected_values, result_format
+                )
+            ]
+        ),
     )
-    if filter_column_isnull:
-        df = df[df[accessor_domain_kwargs["column"]].notnull()]
-
-    if "column" in accessor_domain_kwargs:
-        domain_values = df[accessor_domain_kwargs["column"]]
-    else:
-        raise ValueError(
-            "_pandas_column_map_series_and_domain_values requires a column in accessor_domain_kwargs"
-        )
-
-    result_format = metric_value_kwargs["result_format"]
-    if result_format["result_format"] == "COMPLETE":
-        return (
-            list(domain_values[boolean_map_unexpected_values == True]),
-            list(map_series[boolean_map_unexpected_values == True]),
-        )
-    else:
-        return (
-            list(
-                domain_values[boolean_map_unexpected_values == True][
-                    : result_format["partial_unexpected_count"]
-                ]
-            ),
-            list(
-                map_series[boolean_map_unexpected_values == True][
-                    : result_format["partial_unexpected_count"]
-                ]
-            ),
-        )
 
 
 def _pandas_map_condition_index(
@@ -581,36 +599,12 @@ def _pandas_map_condition_index(
     metrics: Dict[str, Any],
     **kwargs,
 ):
-    (
-        boolean_mapped_unexpected_values,
-        compute_domain_kwargs,
-        accessor_domain_kwargs,
-    ) = metrics.get("unexpected_condition")
-
-    df, _, _ = execution_engine.get_compute_domain(
-        domain_kwargs=compute_domain_kwargs, domain_type="identity"
+    """Returns the index of the unexpected rows, which is read directly from the condition mask."""
+    boolean_mapped_unexpected_values = metrics.get("unexpected_condition")[0]
+    unexpected_mask = _pandas_get_unexpected_mask(
+        boolean_mapped_unexpected_values, metric_value_kwargs["result_format"]
     )
-    ###
-    # NOTE: 20201111 - JPC - in the map_series / map_condition_series world (pandas), we
-    # currently handle filter_column_isnull differently than other map_fn / map_condition
-    # cases.
-    ###
-    filter_column_isnull = kwargs.get(
-        "filter_column_isnull", getattr(cls, "filter_column_isnull", False)
-    )
-    if filter_column_isnull:
-        df = df[df[accessor_domain_kwargs["column"]].notnull()]
-    data = df[accessor_domain_kwargs["column"]]
-
-    result_format = metric_value_kwargs["result_format"]
-    if result_format["result_format"] == "COMPLETE":
-        return list(df[boolean_mapped_unexpected_values == True].index)
-    else:
-        return list(
-            df[boolean_mapped_unexpected_values == True].index[
-                : result_format["partial_unexpected_count"]
-            ]
-        )
+    return list(unexpected_mask.index[unexpected_mask.values])
 
 
 def _pandas_column_map_condition_value_counts(
@@ -622,56 +616,32 @@ def _pandas_column_map_condition_value_counts(
     **kwargs,
 ):
     """Returns respective value counts for distinct column values"""
-    (
-        boolean_mapped_unexpected_values,
-        compute_domain_kwargs,
-        accessor_domain_kwargs,
-    ) = metrics.get("unexpected_condition")
-
-    df, _, _ = execution_engine.get_compute_domain(
-        domain_kwargs=compute_domain_kwargs, domain_type="identity"
-    )
-    ###
-    # NOTE: 20201111 - JPC - in the map_series / map_condition_series world (pandas), we
-    # currently handle filter_column_isnull differently than other map_fn / map_condition
-    # cases.
-    ###
-    filter_column_isnull = kwargs.get(
-        "filter_column_isnull", getattr(cls, "filter_column_isnull", False)
+    result_format = metric_value_kwargs["result_format"]
+    unexpected_values = _pandas_get_unexpected_domain(
+        cls,
+        execution_engine,
+        metrics,
+        column_only=True,
+        result_format={"result_format": "COMPLETE"},
+        **kwargs,
     )
-    if filter_column_isnull:
-        df = df[df[accessor_domain_kwargs["column"]].notnull()]
-    data = df[accessor_domain_kwargs["column"]]
-    if "column" in accessor_domain_kwargs:
-        domain_values = df[accessor_domain_kwargs["column"]]
-    else:
-        raise ValueError(
-            "_pandas_column_map_condition_value_counts requires a column in accessor_domain_kwargs"
-        )
 
-    result_format = metric_value_kwargs["result_format"]
     value_counts = None
     try:
-        value_counts = domain_values[
-            boolean_mapped_unexpected_values == True
-        ].value_counts()
+        value_counts = unexpected_values.value_counts()
     except ValueError:
         try:
-            value_counts = (
-                domain_values[boolean_mapped_unexpected_values == True]
-                .apply(tuple)
-                .value_counts()
-            )
+            value_counts = unexpected_values.apply(tuple).value_counts()
         except ValueError:
             pass
 
-    if not value_counts:
+    if value_counts is None:
         raise MetricError("Unable to compute value counts")
 
     if result_format["result_format"] == "COMPLETE":
         return value_counts
     else:
-        return value_counts[result_format["partial_unexpected_count"]]
+        return value_counts.iloc[: result_format["partial_unexpected_count"]]
 
 
 def _pandas_map_condition_rows(
@@ -683,34 +653,14 @@ def _pandas_map_condition_rows(
     **kwargs,
 ):
     """Return values from the specified domain (ignoring the column constraint) that match the map-style metric in the metrics dictionary."""
-    (
-        boolean_mapped_unexpected_values,
-        compute_domain_kwargs,
-        accessor_domain_kwargs,
-    ) = metrics.get("unexpected_condition")
-
-    df, _, _ = execution_engine.get_compute_domain(
-        domain_kwargs=compute_domain_kwargs, domain_type="identity"
-    )
-    ###
-    # NOTE: 20201111 - JPC - in the map_series / map_condition_series world (pandas), we
-    # currently handle filter_column_isnull differently than other map_fn / map_condition
-    # cases.
-    ###
-    filter_column_isnull = kwargs.get(
-        "filter_column_isnull", getattr(cls, "filter_column_isnull", False)
+    return _pandas_get_unexpected_domain(
+        cls,
+        execution_engine,
+        metrics,
+        column_only=False,
+        result_format=metric_value_kwargs["result_format"],
+        **kwargs,
     )
-    if filter_column_isnull:
-        df = df[df[accessor_domain_kwargs["column"]].notnull()]
-    data = df[accessor_domain_kwargs["column"]]
-
-    result_format = metric_value_kwargs["result_format"]
-    if result_format["result_format"] == "COMPLETE":
-        return df[boolean_mapped_unexpected_values == True]
-    else:
-        return df[boolean_mapped_unexpected_values == True][
-            result_format["partial_unexpected_count"]
-        ]
 
 
 def _sqlalchemy_map_condition_unexpected_count_aggregate_fn(
@@ -1036,6 +986,13 @@ def _spark_map_condition_rows(
         return filtered.limit(result_format["partial_unexpected_count"]).collect()
 
 
+# The SparkDFExecutionEngine collects these outputs for all the map metrics sharing a compute domain together, see
+# SparkDFExecutionEngine.resolve_unexpected_output_bundle
+spark_column_map_condition_values.unexpected_output = "values"
+_spark_column_map_condition_value_counts.unexpected_output = "value_counts"
+_spark_map_condition_rows.unexpected_output = "rows"
+
+
 class MapMetricProvider(MetricProvider):
     condition_domain_keys = (
         "batch_id",
@@ -1052,6 +1009,9 @@ class MapMetricProvider(MetricProvider):
     condition_value_keys = tuple()
     function_value_keys = tuple()
     filter_column_isnull = True
+    # False if the condition (or function) value of a row depends on the other rows of the domain, as for uniqueness;
+    # such metrics cannot be computed independently over the chunks of a batch that is read in chunks
+    row_local = True
 
     @classmethod
     def _register_metric_functions(cls):
@@ -1372,6 +1332,132 @@ class MapMetricProvider(MetricProvider):
 
         return dependencies
 
+    @classmethod
+    def get_chunk_merger(cls, metric: MetricConfiguration) -> Optional[ChunkMerger]:
+        metric_name = metric.metric_name
+        if metric_name.endswith(".condition") or metric_name.endswith(".map"):
+            # Row-level partial metrics are recomputed on each chunk by the metrics that depend on them
+            return ChunkMerger() if cls.row_local else None
+        if metric_name.endswith(".unexpected_count"):
+            return ChunkMerger(merge=sum)
+
+        result_format = metric.metric_value_kwargs.get("result_format")
+        if result_format is None or result_format["result_format"] == "COMPLETE":
+            limit = None
+        else:
+            limit = result_format["partial_unexpected_count"]
+        if metric_name.endswith(".unexpected_values"):
+            return ChunkMerger(
+                merge=partial(_merge_pandas_unexpected_values, limit=limit)
+            )
+        if metric_name.endswith(".unexpected_index_list"):
+            offset_chunks = bool(metric.metric_domain_kwargs.get("row_condition"))
+            return ChunkMerger(
+                merge=partial(
+                    _merge_pandas_unexpected_index_lists,
+                    limit=limit,
+                    offset_chunks=offset_chunks,
+                ),
+                get_state=_pandas_map_condition_index_and_domain_length,
+            )
+        if metric_name.endswith(".unexpected_rows"):
+            return ChunkMerger(
+                merge=partial(_merge_pandas_unexpected_rows, limit=limit)
+            )
+        if metric_name.endswith(".unexpected_value_counts"):
+            # The value counts of every chunk are complete, so that truncating them does not bias the merged counts
+            return ChunkMerger(
+                merge=partial(_merge_pandas_unexpected_value_counts, limit=limit),
+                get_state=_pandas_column_map_condition_complete_value_counts,
+            )
+        return None
+
+
+def _pandas_map_condition_index_and_domain_length(
+    cls,
+    execution_engine: "PandasExecutionEngine",
+    metric_domain_kwargs: Dict,
+    metric_value_kwargs: Dict,
+    metrics: Dict[str, Any],
+    **kwargs,
+):
+    """Returns the index of the unexpected rows of one chunk of a batch read in chunks, along with the length of the
+    domain of the chunk."""
+    index_list = _pandas_map_condition_index(
+        cls, execution_engine, metric_domain_kwargs, metric_value_kwargs, metrics
+    )
+    compute_domain_kwargs = metrics["unexpected_condition"][1]
+    df, _, _ = execution_engine.get_compute_domain(
+        domain_kwargs=compute_domain_kwargs, domain_type="identity"
+    )
+    return index_list, len(df)
+
+
+def _merge_pandas_unexpected_index_lists(
+    states: List[Tuple[list, int]], limit: Optional[int], offset_chunks: bool
+) -> list:
+    """Combines the unexpected index lists of the chunks of a batch. Chunks are read with a continuous index, but
+    filtering them with a row condition resets it, so their indices are then offset by the lengths of the filtered
+    domains of the preceding chunks."""
+    index_list = []
+    offset = 0
+    for chunk_index_list, domain_length in states:
+        if offset_chunks:
+            chunk_index_list = [index + offset for index in chunk_index_list]
+        index_list.extend(chunk_index_list)
+        offset += domain_length
+    return index_list[:limit]
+
+
+def _merge_pandas_unexpected_rows(
+    states: List[pd.DataFrame], limit: Optional[int]
+) -> pd.DataFrame:
+    if not states:
+        return pd.DataFrame()
+    return pd.concat(states).iloc[:limit]
+
+
+def _pandas_column_map_condition_complete_value_counts(
+    cls,
+    execution_engine: "PandasExecutionEngine",
+    metric_domain_kwargs: Dict,
+    metric_value_kwargs: Dict,
+    metrics: Dict[str, Any],
+    **kwargs,
+):
+    return _pandas_column_map_condition_value_counts(
+        cls,
+        execution_engine,
+        metric_domain_kwargs,
+        {**metric_value_kwargs, "result_format": {"result_format": "COMPLETE"}},
+        metrics,
+    )
+
+
+def _merge_pandas_unexpected_values(states: list, limit: Optional[int]):
+    if states and isinstance(states[0], tuple):
+        # Map series metrics return both the unexpected domain values and the corresponding map series values
+        return tuple(
+            _merge_pandas_unexpected_values(list(chunk_values), limit)
+            for chunk_values in zip(*states)
+        )
+    unexpected_values = []
+    for chunk_unexpected_values in states:
+        unexpected_values.extend(chunk_unexpected_values)
+    return unexpected_values[:limit]
+
+
+def _merge_pandas_unexpected_value_counts(
+    states: List[pd.Series], limit: Optional[int]
+) -> pd.Series:
+    value_counts = pd.Series(dtype="int64")
+    for chunk_value_counts in states:
+        value_counts = value_counts.add(chunk_value_counts, fill_value=0)
+    value_counts = value_counts.astype("int64").sort_values(
+        ascending=False, kind="mergesort"
+    )
+    return value_counts.iloc[:limit]
+
 
 class ColumnMapMetricProvider(MapMetricProvider):
     condition_domain_keys = (
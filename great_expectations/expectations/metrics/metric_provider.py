@@ -1,6 +1,6 @@
 import logging
 from functools import wraps
-from typing import Callable, Optional, Type, Union
+from typing import Any, Callable, List, Optional, Type, Union
 
 from great_expectations.core import ExpectationConfiguration
 from great_expectations.core.util import nested_update
@@ -66,6 +66,30 @@ def metric_partial(
     return wrapper
 
 
+class ChunkMerger:
+    """Describes how the value of a metric is computed over a batch that is read in chunks (see
+    ChunkedPandasBatchData).
+
+    Args:
+        merge: a function combining the list of the states computed over every chunk into the value of the metric.
+            Row-level partial metrics, such as conditions, are recomputed on each chunk and do not need one.
+        get_state: a function computing the state of the metric over one chunk, called with the same arguments as
+            the metric function; the metric function itself is used if it is not provided.
+        uses_data: False if the metric is derived from its dependencies only, in which case it is computed once
+            by its metric function, without reading the batch.
+    """
+
+    def __init__(
+        self,
+        merge: Optional[Callable[[List[Any]], Any]] = None,
+        get_state: Optional[Callable] = None,
+        uses_data: bool = True,
+    ):
+        self.merge = merge
+        self.get_state = get_state
+        self.uses_data = uses_data
+
+
 class MetaMetricProvider(type):
     """MetaMetricProvider registers metrics as they are defined."""
 
@@ -226,3 +250,19 @@ class MetricProvider(metaclass=MetaMetricProvider):
                 )
 
         return dependencies
+
+    @classmethod
+    def get_approximation_error_bound(
+        cls,
+        metric: MetricConfiguration,
+        execution_engine: ExecutionEngine,
+    ) -> Optional[dict]:
+        """Returns the error bound of the value of a metric computed in approximate mode, for instance
+        {"relative_standard_error": 0.01}, or None if the bound is not known."""
+        return None
+
+    @classmethod
+    def get_chunk_merger(cls, metric: MetricConfiguration) -> Optional[ChunkMerger]:
+        """Returns the ChunkMerger used to compute a metric over a batch that is read in chunks, or None if the
+        metric cannot be computed that way."""
+        return None
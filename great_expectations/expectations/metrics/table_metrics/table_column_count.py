@@ -9,7 +9,10 @@ from great_expectations.execution_engine import (
 from great_expectations.execution_engine.sqlalchemy_execution_engine import (
     SqlAlchemyExecutionEngine,
 )
-from great_expectations.expectations.metrics.metric_provider import metric_value
+from great_expectations.expectations.metrics.metric_provider import (
+    ChunkMerger,
+    metric_value,
+)
 from great_expectations.expectations.metrics.table_metric import TableMetricProvider
 from great_expectations.validator.validation_graph import MetricConfiguration
 
@@ -53,6 +56,10 @@ class TableColumnCount(TableMetricProvider):
         columns = metrics.get("table.columns")
         return len(columns)
 
+    @classmethod
+    def get_chunk_merger(cls, metric: MetricConfiguration) -> Optional[ChunkMerger]:
+        return ChunkMerger(uses_data=False)
+
     @classmethod
     def _get_evaluation_dependencies(
         cls,
@@ -1,4 +1,6 @@
-from typing import Any, Dict, Tuple
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
 
 from great_expectations.exceptions import GreatExpectationsError
 from great_expectations.execution_engine import (
@@ -14,9 +16,13 @@ from great_expectations.expectations.metrics.import_manager import (
     reflection,
     sparktypes,
 )
-from great_expectations.expectations.metrics.metric_provider import metric_value
+from great_expectations.expectations.metrics.metric_provider import (
+    ChunkMerger,
+    metric_value,
+)
 from great_expectations.expectations.metrics.table_metric import TableMetricProvider
 from great_expectations.expectations.metrics.util import column_reflection_fallback
+from great_expectations.validator.validation_graph import MetricConfiguration
 
 
 class ColumnTypes(TableMetricProvider):
@@ -82,6 +88,28 @@ class ColumnTypes(TableMetricProvider):
             df.schema, include_nested=metric_value_kwargs["include_nested"]
         )
 
+    @classmethod
+    def get_chunk_merger(cls, metric: MetricConfiguration) -> Optional[ChunkMerger]:
+        return ChunkMerger(merge=_merge_pandas_column_metadata)
+
+
+def _merge_pandas_column_metadata(chunk_column_metadata: List[List[dict]]):
+    """Combines the column metadata of the chunks of a batch: a column whose type differs between chunks (e.g. an
+    integer column with null values in some chunks only) gets the type that can hold the values of every chunk."""
+    if not chunk_column_metadata:
+        return []
+    columns = []
+    for column_metadata in zip(*chunk_column_metadata):
+        dtypes = [col["type"] for col in column_metadata]
+        dtype = dtypes[0]
+        if any(other_dtype != dtype for other_dtype in dtypes[1:]):
+            try:
+                dtype = np.result_type(*dtypes)
+            except TypeError:
+                dtype = np.dtype(object)
+        columns.append({"name": column_metadata[0]["name"], "type": dtype})
+    return columns
+
 
 def _get_sqlalchemy_column_metadata(engine, batch_data: SqlAlchemyBatchData):
     insp = reflection.Inspector.from_engine(engine)
@@ -1,4 +1,4 @@
-from typing import Any, Dict, Tuple
+from typing import Any, Dict, Optional, Tuple
 
 from great_expectations.execution_engine import (
     PandasExecutionEngine,
@@ -13,10 +13,12 @@ from great_expectations.execution_engine.sqlalchemy_execution_engine import (
 )
 from great_expectations.expectations.metrics.import_manager import F, sa
 from great_expectations.expectations.metrics.metric_provider import (
+    ChunkMerger,
     metric_partial,
     metric_value,
 )
 from great_expectations.expectations.metrics.table_metric import TableMetricProvider
+from great_expectations.validator.validation_graph import MetricConfiguration
 
 
 class TableRowCount(TableMetricProvider):
@@ -65,3 +67,7 @@ class TableRowCount(TableMetricProvider):
         runtime_configuration: Dict,
     ):
         return F.count(F.lit(1)), metric_domain_kwargs, dict()
+
+    @classmethod
+    def get_chunk_merger(cls, metric: MetricConfiguration) -> Optional[ChunkMerger]:
+        return ChunkMerger(merge=sum)
@@ -1,7 +1,8 @@
 import logging
-from typing import Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Union
 
 import numpy as np
+import pandas as pd
 from dateutil.parser import parse
 
 try:
@@ -60,7 +61,11 @@ try:
 except ImportError:
     bigquery_types_tuple = None
     pybigquery = None
-from great_expectations.execution_engine.util import check_sql_engine_dialect
+from great_expectations.execution_engine.util import (
+    check_sql_engine_dialect,
+    get_approximate_percentile_disc_sql,
+)
+from great_expectations.expectations.metrics.import_manager import pa, pc
 
 SCHEMAS = {
     "api_np": {
@@ -212,6 +217,88 @@ def attempt_allowing_relative_error(dialect):
     return detected_redshift or detected_psycopg2
 
 
+def is_redshift_dialect(dialect) -> bool:
+    """Redshift is also commonly reached through the postgresql driver, in which case it reports the version of the
+    PostgreSQL server it was forked from (8.0.2). The server version is only known once the engine has connected, which
+    SqlAlchemyExecutionEngine ensures before computing the domain of a metric."""
+    if dialect.name.lower() == "redshift":
+        return True
+    server_version_info = getattr(dialect, "server_version_info", None)
+    return (
+        dialect.name.lower() == "postgresql"
+        and server_version_info is not None
+        and tuple(server_version_info) < (9, 4)
+    )
+
+
+def get_quantile_aggregate(
+    column, quantile: float, dialect, allow_relative_error=False, interpolate=False
+):
+    """Returns an aggregate function computing a quantile of the column on the given dialect, so that it can be
+    computed in the same query as the other aggregates of its domain, or None if the dialect does not provide one.
+
+    If interpolate is True, the quantile is interpolated between its two nearest values (as percentile_cont does);
+    otherwise the nearest value is returned (as percentile_disc does). Approximate aggregate functions are only used
+    if allow_relative_error is set.
+    """
+    dialect_name = dialect.name.lower()
+    if allow_relative_error:
+        if dialect_name in ["awsathena", "presto", "trino", "snowflake"]:
+            return sa.func.approx_percentile(column, quantile)
+        if dialect_name == "bigquery":
+            # APPROX_QUANTILES returns the 1001 boundaries of 1000 buckets of (approximately) equal size
+            compiled_column = column.compile(dialect=dialect)
+            return sa.literal_column(
+                f"APPROX_QUANTILES({compiled_column}, 1000)[OFFSET({int(round(quantile * 1000))})]"
+            )
+    if interpolate:
+        if dialect_name in ["oracle", "postgresql", "redshift", "snowflake"]:
+            return sa.func.percentile_cont(quantile).within_group(column.asc())
+        return None
+    if is_redshift_dialect(dialect):
+        # Redshift only supports the approximate version of the percentile_disc aggregate function.
+        if not allow_relative_error:
+            raise ValueError(
+                f'The SQL engine dialect "{str(dialect)}" does not support computing quantiles '
+                "without approximation error; set allow_relative_error to True to allow approximate quantiles."
+            )
+        return sa.literal_column(
+            get_approximate_percentile_disc_sql(
+                selects=[sa.func.percentile_disc(quantile).within_group(column.asc())],
+                sql_engine_dialect=dialect,
+            )
+        )
+    if dialect_name in ["oracle", "postgresql", "snowflake"]:
+        return sa.func.percentile_disc(quantile).within_group(column.asc())
+    return None
+
+
+def get_approximate_count_distinct_aggregate(column, dialect):
+    """Returns an aggregate function estimating the number of distinct values of the column on the given dialect, or
+    None if the dialect does not provide one."""
+    dialect_name = dialect.name.lower()
+    if dialect_name in ["awsathena", "presto", "trino"]:
+        return sa.func.approx_distinct(column)
+    if dialect_name in ["bigquery", "oracle", "snowflake"]:
+        return sa.func.approx_count_distinct(column)
+    if is_redshift_dialect(dialect):
+        compiled_column = column.compile(dialect=dialect)
+        return sa.literal_column(f"APPROXIMATE COUNT(DISTINCT {compiled_column})")
+    return None
+
+
+def has_approximate_quantile_aggregate(dialect) -> bool:
+    """Returns True if get_quantile_aggregate computes approximate quantiles on the given dialect when relative error
+    is allowed."""
+    return dialect.name.lower() in [
+        "awsathena",
+        "presto",
+        "trino",
+        "snowflake",
+        "bigquery",
+    ] or is_redshift_dialect(dialect)
+
+
 def column_reflection_fallback(selectable, dialect, sqlalchemy_engine):
     """If we can't reflect the table, use a query to at least get column names."""
     col_info_dict_list: List[Dict]
@@ -253,6 +340,63 @@ def parse_value_set(value_set):
     return parsed_value_set
 
 
+def get_arrow_array(column: pd.Series) -> Optional["pa.ChunkedArray"]:
+    """Returns the Arrow data backing a pandas column of an ArrowDtype (see the dtype_backend of the
+    PandasExecutionEngine), without copying it, or None if the column is not backed by Arrow data."""
+    if pa is None or not isinstance(column.dtype, getattr(pd, "ArrowDtype", ())):
+        return None
+    arrow_array = pa.array(column.array)
+    if isinstance(arrow_array, pa.Array):
+        arrow_array = pa.chunked_array([arrow_array])
+    return arrow_array
+
+
+def compute_with_arrow(column: pd.Series, kernel: Callable) -> Optional[Any]:
+    """Applies a pyarrow.compute kernel to the Arrow data backing a pandas column of an ArrowDtype.
+
+    Returns None if the column is not backed by Arrow data, or if the kernel does not support its type or arguments
+    (e.g. a regex that RE2 cannot compile), in which case the metric is to be computed with pandas.
+    """
+    arrow_array = get_arrow_array(column)
+    if arrow_array is None:
+        return None
+    try:
+        return kernel(arrow_array)
+    except (pa.ArrowException, TypeError, ValueError) as e:
+        logger.debug(f"Falling back to pandas after an Arrow kernel failed: {e}")
+        return None
+
+
+def arrow_is_in(values: "pa.ChunkedArray", value_set: List[Any]) -> "pa.ChunkedArray":
+    """Applies the pyarrow.compute.is_in kernel to Arrow data, to be used through compute_with_arrow.
+
+    Raises a TypeError, for the metric to be computed with pandas, if the value_set is not of the type of the data:
+    is_in would cast it to that type, e.g. finding the string "2" in a column of integers.
+    """
+    arrow_value_set = pa.array(value_set)
+    if arrow_value_set.type != values.type:
+        raise TypeError(
+            f"The value_set of type {arrow_value_set.type} does not have the type {values.type} of the column"
+        )
+    return pc.is_in(values, value_set=arrow_value_set)
+
+
+def column_isin(column: pd.Series, value_set: List[Any]) -> pd.Series:
+    """Returns column.isin(value_set), comparing the values of a column backed by Arrow data as Python objects, since
+    pandas would otherwise have pyarrow cast the value_set to the type of the column, or fail to."""
+    if get_arrow_array(column) is not None:
+        column = column.astype(object)
+    return column.isin(value_set)
+
+
+def arrow_condition_to_series(condition, column: pd.Series) -> pd.Series:
+    """Converts the boolean array returned by a pyarrow.compute kernel over a column into a boolean series aligned
+    with the column, in which null results are False."""
+    return pd.Series(
+        np.asarray(condition.fill_null(False), dtype=bool), index=column.index
+    )
+
+
 def filter_pair_metric_nulls(column_A, column_B, ignore_row_if):
     if ignore_row_if == "both_values_are_missing":
         boolean_mapped_null_values = column_A.isnull() & column_B.isnull()
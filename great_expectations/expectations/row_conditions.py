@@ -1,3 +1,7 @@
+import ast
+import itertools
+from typing import List, Optional, Tuple
+
 from pyparsing import (
     CaselessLiteral,
     Combine,
@@ -57,6 +61,26 @@ class ConditionParserError(GreatExpectationsError):
     pass
 
 
+# The comparison operators of pandas conditions which have the same semantics as those of parquet filters. Rows with
+# a null value satisfy "!=" and "not in" comparisons in pandas, but never in parquet filters.
+PARQUET_FILTER_OPERATORS = {
+    ast.Eq: "==",
+    ast.Gt: ">",
+    ast.GtE: ">=",
+    ast.In: "in",
+    ast.Lt: "<",
+    ast.LtE: "<=",
+}
+REVERSED_PARQUET_FILTER_OPERATORS = {
+    "==": "==",
+    ">": "<",
+    ">=": "<=",
+    "<": ">",
+    "<=": ">=",
+}
+MAX_PARQUET_FILTER_CONJUNCTIONS = 64
+
+
 def _parse_great_expectations_condition(row_condition: str):
     try:
         return condition.parseString(row_condition)
@@ -128,3 +152,91 @@ def parse_condition_to_sqlalchemy(
         return sa.not_(sa.column(column).is_(None))
     else:
         raise ConditionParserError(f"unrecognized column condition: {row_condition}")
+
+
+def parse_condition_to_parquet_filters(row_condition: str) -> List[List[Tuple]]:
+    """Translates a pandas row_condition into parquet filters, in disjunctive normal form (a list of conjunctions of
+    (column, op, value) tuples), as accepted by the filters argument of pyarrow.parquet.read_table.
+
+    The filters select all the rows satisfying the condition, but possibly other rows too: comparisons that cannot be
+    translated are left out of the conjunctions in which they appear. The condition must therefore still be applied to
+    the rows that are read.
+    """
+    try:
+        expression = ast.parse(row_condition.strip(), mode="eval").body
+    except SyntaxError:
+        raise ConditionParserError(f"unable to parse condition: {row_condition}")
+    filters = _get_parquet_filters(expression)
+    if filters is None:
+        raise ConditionParserError(
+            f"unable to translate condition to parquet filters: {row_condition}"
+        )
+    return filters
+
+
+def _get_parquet_filters(expression: ast.expr) -> Optional[List[List[Tuple]]]:
+    """Returns the parquet filters of an expression, or None if it does not restrict the rows to read."""
+    if isinstance(expression, ast.BoolOp) or (
+        isinstance(expression, ast.BinOp)
+        and isinstance(expression.op, (ast.BitAnd, ast.BitOr))
+    ):
+        if isinstance(expression, ast.BoolOp):
+            is_and = isinstance(expression.op, ast.And)
+            operands = expression.values
+        else:
+            is_and = isinstance(expression.op, ast.BitAnd)
+            operands = [expression.left, expression.right]
+        operand_filters = [_get_parquet_filters(operand) for operand in operands]
+        if is_and:
+            operand_filters = [filters for filters in operand_filters if filters]
+            if not operand_filters:
+                return None
+            filters = [
+                [
+                    comparison
+                    for conjunction in conjunctions
+                    for comparison in conjunction
+                ]
+                for conjunctions in itertools.product(*operand_filters)
+            ]
+            return filters if len(filters) <= MAX_PARQUET_FILTER_CONJUNCTIONS else None
+        if any(filters is None for filters in operand_filters):
+            return None
+        return [conjunction for filters in operand_filters for conjunction in filters]
+
+    if isinstance(expression, ast.Compare):
+        conjunction = []
+        operands = [expression.left] + expression.comparators
+        for left, op, right in zip(operands, expression.ops, operands[1:]):
+            comparison = _get_parquet_filter_comparison(left, op, right)
+            if comparison is not None:
+                conjunction.append(comparison)
+        return [conjunction] if conjunction else None
+
+    return None
+
+
+def _get_parquet_filter_comparison(
+    left: ast.expr, op: ast.cmpop, right: ast.expr
+) -> Optional[Tuple]:
+    operator = PARQUET_FILTER_OPERATORS.get(type(op))
+    if operator is None:
+        return None
+    if isinstance(right, ast.Name) and operator in REVERSED_PARQUET_FILTER_OPERATORS:
+        left, right = right, left
+        operator = REVERSED_PARQUET_FILTER_OPERATORS[operator]
+    if not isinstance(left, ast.Name):
+        return None
+    try:
+        value = ast.literal_eval(right)
+    except ValueError:
+        return None
+    if isinstance(value, (list, tuple, set)):
+        # In pandas conditions, comparing a column to a list for equality checks for membership
+        if operator not in ("==", "in"):
+            return None
+        operator = "in"
+        value = list(value)
+    elif operator == "in" or value is None:
+        return None
+    return left.id, operator, value
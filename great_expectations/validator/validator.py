@@ -7,13 +7,14 @@ import traceback
 import warnings
 from collections import defaultdict, namedtuple
 from collections.abc import Hashable
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Iterable, List, Optional, Union
 
 import pandas as pd
 from dateutil.parser import parse
 
 from great_expectations import __version__ as ge_version
-from great_expectations.core.batch import Batch
+from great_expectations.core.batch import Batch, BatchDefinition
 from great_expectations.core.evaluation_parameters import build_evaluation_parameters
 from great_expectations.core.expectation_configuration import ExpectationConfiguration
 from great_expectations.core.expectation_suite import (
@@ -24,6 +25,7 @@ from great_expectations.core.expectation_validation_result import (
     ExpectationSuiteValidationResult,
     ExpectationValidationResult,
 )
+from great_expectations.core.metric import ResolvedMetricIdentifier
 from great_expectations.core.run_identifier import RunIdentifier
 from great_expectations.data_asset.util import recursively_convert_to_json_serializable
 from great_expectations.dataset import PandasDataset, SparkDFDataset, SqlAlchemyDataset
@@ -32,6 +34,9 @@ from great_expectations.exceptions import (
     GreatExpectationsError,
     InvalidExpectationConfigurationError,
 )
+from great_expectations.execution_engine.sqlalchemy_execution_engine import (
+    NONDETERMINISTIC_SAMPLING_METHODS,
+)
 from great_expectations.expectations.registry import (
     get_expectation_impl,
     get_metric_provider,
@@ -59,6 +64,7 @@ class Validator:
         expectation_suite_name=None,
         data_context=None,
         batches=None,
+        resolved_metric_store=None,
         **kwargs,
     ):
         """
@@ -67,6 +73,10 @@ class Validator:
         :param profiler (profiler class) = None: The profiler that should be run on the data_asset to
             build a baseline expectation suite.
 
+        :param resolved_metric_store (ResolvedMetricStore or str) = None: An optional store (or the name of a store in
+            the data_context) in which resolved metrics are persisted, keyed by batch fingerprint, so that validating
+            unchanged data again reuses them instead of recomputing them.
+
         Note: DataAsset is designed to support multiple inheritance (e.g. PandasDataset inherits from both a
         Pandas DataFrame and Dataset which inherits from DataAsset), so it accepts generic *args and **kwargs arguments
         so that they can also be passed to other parent classes. In python 2, there isn't a clean way to include all of
@@ -78,6 +88,9 @@ class Validator:
         self._data_context = data_context
         self._execution_engine = execution_engine
         self._expose_dataframe_methods = False
+        if isinstance(resolved_metric_store, str):
+            resolved_metric_store = data_context.stores[resolved_metric_store]
+        self._resolved_metric_store = resolved_metric_store
         self._validator_config = {}
 
         if batches is None:
@@ -89,7 +102,9 @@ class Validator:
             assert isinstance(
                 batch, Batch
             ), "batches provided to Validator must be Great Expectations Batch objects"
-            self._execution_engine.load_batch_data(batch.id, batch.data)
+            self._execution_engine.load_batch_data(
+                batch.id, batch.data, batch_markers=batch.batch_markers
+            )
             self._batches[batch.id] = batch
 
         self.interactive_evaluation = interactive_evaluation
@@ -103,6 +118,8 @@ class Validator:
             "result_format": "BASIC",
         }
         self._validator_config = {}
+        self._metric_resolution_times = {}
+        self._metric_bundle_resolution_times = {}
 
         # This special state variable tracks whether a validation run is going on, which will disable
         # saving expectation config objects
@@ -367,8 +384,12 @@ class Validator:
         else:
             catch_exceptions = False
 
+        if metrics is None:
+            metrics = dict()
+
         processed_configurations = []
         evrs = []
+        metrics_to_store = dict()
         for configuration in configurations:
             # Validating
             try:
@@ -385,6 +406,19 @@ class Validator:
 
             try:
                 for metric in validation_dependencies.values():
+                    if metric.id in metrics:
+                        continue
+                    resolved_metric_identifier = self._get_resolved_metric_identifier(
+                        metric
+                    )
+                    if resolved_metric_identifier is not None:
+                        stored_value = self._get_stored_metric(
+                            resolved_metric_identifier
+                        )
+                        if stored_value is not None:
+                            metrics[metric.id] = stored_value
+                            continue
+                        metrics_to_store[metric.id] = resolved_metric_identifier
                     self.build_metric_dependency_graph(
                         graph,
                         metric,
@@ -409,10 +443,9 @@ class Validator:
                 else:
                     raise err
 
-        if metrics is None:
-            metrics = dict()
-
         metrics = self.resolve_validation_graph(graph, metrics, runtime_configuration)
+        for metric_id, resolved_metric_identifier in metrics_to_store.items():
+            self._store_metric(resolved_metric_identifier, metrics.get(metric_id))
         for configuration in processed_configurations:
             try:
                 result = configuration.metrics_validate(
@@ -440,22 +473,193 @@ class Validator:
         return evrs
 
     def resolve_validation_graph(self, graph, metrics, runtime_configuration=None):
-        done: bool = False
-        while not done:
-            ready_metrics, needed_metrics = self._parse_validation_graph(graph, metrics)
-            metrics.update(
-                self._resolve_metrics(
-                    execution_engine=self._execution_engine,
-                    metrics_to_resolve=ready_metrics,
-                    metrics=metrics,
-                    runtime_configuration=runtime_configuration,
+        """Resolves all metrics in the validation graph using a level-by-level topological schedule.
+
+        The graph is scanned once to build, for every metric, a counter of its unresolved dependencies and the list of
+        metrics depending on it. Each level consists of the metrics whose counters have reached zero; resolving a level
+        decrements the counters of its dependents, which yields the next level without rescanning the graph.
+
+        Each level is resolved in a single call to the execution engine, so that it can bundle or batch its metrics. If
+        "max_workers" (read from the runtime_configuration, falling back to the validator config) is greater than one,
+        the level is instead split into independent units of work, one for the metrics computed from a
+        "metric_partial_fn" and one per domain for the others, which are dispatched to a thread pool of that size.
+
+        The time spent computing each metric is recorded in metric_resolution_times, and that spent computing metrics
+        together, in a bundle, in metric_bundle_resolution_times.
+
+                Args:
+                    graph (ValidationGraph): The graph of metrics to resolve
+                    metrics (dict): Metrics that have already been resolved, keyed by metric id
+                    runtime_configuration (dict): A dictionary of runtime keyword arguments
+
+                Returns:
+                    The metrics dictionary, updated with all the metrics of the graph
+        """
+        if runtime_configuration is None:
+            runtime_configuration = dict()
+
+        max_workers = runtime_configuration.get("max_workers")
+        if max_workers is None:
+            max_workers = self.get_config_value("max_workers")
+        if max_workers is None:
+            max_workers = 1
+
+        metric_configurations = {}
+        unresolved_dependency_counts = {}
+        dependents = defaultdict(set)
+        for edge in graph.edges:
+            if edge.left.id in metrics:
+                continue
+            metric_configurations.setdefault(edge.left.id, edge.left)
+            unresolved_dependency_counts.setdefault(edge.left.id, 0)
+            if edge.right is None or edge.right.id in metrics:
+                continue
+            if edge.left.id not in dependents[edge.right.id]:
+                dependents[edge.right.id].add(edge.left.id)
+                unresolved_dependency_counts[edge.left.id] += 1
+
+        self._metric_resolution_times = dict()
+        self._metric_bundle_resolution_times = dict()
+        ready_metric_ids = [
+            metric_id
+            for metric_id, count in unresolved_dependency_counts.items()
+            if count == 0
+        ]
+        executor = None
+        if max_workers > 1:
+            executor = ThreadPoolExecutor(max_workers=max_workers)
+        try:
+            while ready_metric_ids:
+                metrics.update(
+                    self._resolve_metrics_level(
+                        metrics_to_resolve=[
+                            metric_configurations[metric_id]
+                            for metric_id in ready_metric_ids
+                        ],
+                        metrics=metrics,
+                        runtime_configuration=runtime_configuration,
+                        executor=executor,
+                    )
                 )
+                next_ready_metric_ids = []
+                for metric_id in ready_metric_ids:
+                    for dependent_id in dependents[metric_id]:
+                        unresolved_dependency_counts[dependent_id] -= 1
+                        if unresolved_dependency_counts[dependent_id] == 0:
+                            next_ready_metric_ids.append(dependent_id)
+                ready_metric_ids = next_ready_metric_ids
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True)
+
+        unresolved_metric_ids = [
+            metric_id
+            for metric_id in metric_configurations
+            if metric_id not in metrics
+        ]
+        if len(unresolved_metric_ids) > 0:
+            raise GreatExpectationsError(
+                f"Unable to resolve metrics with circular or missing dependencies: {str(unresolved_metric_ids)}"
             )
-            if len(ready_metrics) + len(needed_metrics) == 0:
-                done = True
 
         return metrics
 
+    def _resolve_metrics_level(
+        self,
+        metrics_to_resolve: List[MetricConfiguration],
+        metrics: Dict,
+        runtime_configuration: dict,
+        executor: Optional[ThreadPoolExecutor] = None,
+    ) -> Dict:
+        """Resolves a set of metrics whose dependencies are all available, optionally on the provided executor.
+
+        Without an executor, the whole level is resolved in a single call, so that the execution engine can bundle or
+        otherwise batch its metrics. With an executor, metrics computed from a "metric_partial_fn" are resolved in a
+        single call so that the execution engine can still bundle them, and all other metrics are resolved in one call
+        per domain, the calls running concurrently."""
+        if executor is None:
+            return self._resolve_timed_metrics(
+                metrics_to_resolve, metrics, runtime_configuration
+            )
+
+        bundled_metrics = []
+        metrics_by_domain = defaultdict(list)
+        for metric_to_resolve in metrics_to_resolve:
+            metric_fn = get_metric_provider(
+                metric_to_resolve.metric_name, execution_engine=self._execution_engine
+            )[1]
+            if metric_fn is None:
+                bundled_metrics.append(metric_to_resolve)
+            else:
+                metrics_by_domain[metric_to_resolve.metric_domain_kwargs_id].append(
+                    metric_to_resolve
+                )
+        work_units = list(metrics_by_domain.values())
+        if len(bundled_metrics) > 0:
+            work_units.append(bundled_metrics)
+
+        if len(work_units) < 2:
+            results = [
+                self._resolve_timed_metrics(work_unit, metrics, runtime_configuration)
+                for work_unit in work_units
+            ]
+        else:
+            futures = [
+                executor.submit(
+                    self._resolve_timed_metrics,
+                    work_unit,
+                    metrics,
+                    runtime_configuration,
+                )
+                for work_unit in work_units
+            ]
+            results = [future.result() for future in futures]
+
+        resolved_metrics = dict()
+        for result in results:
+            resolved_metrics.update(result)
+        return resolved_metrics
+
+    def _resolve_timed_metrics(
+        self,
+        metrics_to_resolve: List[MetricConfiguration],
+        metrics: Dict,
+        runtime_configuration: dict,
+    ) -> Dict:
+        """Resolves the given metrics together, recording the time the execution engine spent computing each of them,
+        or each bundle of metrics it computed together."""
+        with self._execution_engine.recording_metric_resolution_times() as times:
+            resolved_metrics = self._resolve_metrics(
+                execution_engine=self._execution_engine,
+                metrics_to_resolve=metrics_to_resolve,
+                metrics=metrics,
+                runtime_configuration=runtime_configuration,
+            )
+        for metric_ids, elapsed in times.items():
+            if len(metric_ids) == 1:
+                self._metric_resolution_times[metric_ids[0]] = elapsed
+                logger.debug(
+                    f"Resolved metric {str(metric_ids[0])} in {elapsed:.6f} seconds"
+                )
+            else:
+                self._metric_bundle_resolution_times[metric_ids] = elapsed
+                logger.debug(
+                    f"Resolved a bundle of {len(metric_ids)} metrics in {elapsed:.6f} seconds"
+                )
+        return resolved_metrics
+
+    @property
+    def metric_resolution_times(self) -> Dict:
+        """Time, in seconds, spent computing each metric during the last call to resolve_validation_graph, keyed by
+        metric id. Metrics computed together in a bundle are recorded in metric_bundle_resolution_times instead."""
+        return self._metric_resolution_times
+
+    @property
+    def metric_bundle_resolution_times(self) -> Dict:
+        """Time, in seconds, spent computing each bundle of metrics (such as the aggregates of a SQL query) during the
+        last call to resolve_validation_graph, keyed by the tuple of the ids of the metrics of the bundle"""
+        return self._metric_bundle_resolution_times
+
     def _parse_validation_graph(self, validation_graph, metrics):
         """Given validation graph, returns the ready and needed metrics necessary for validation using a traversal of
         validation graph (a graph structure of metric ids) edges"""
@@ -490,6 +694,65 @@ class Validator:
             metrics_to_resolve, metrics, runtime_configuration
         )
 
+    def _get_batch_fingerprint(self, batch_id: str) -> Optional[str]:
+        """Returns a fingerprint identifying the data of a batch across runs, if one can be determined: either the
+        pandas_data_fingerprint of its BatchMarkers, or, for batches reading a whole table or table partition, the id of
+        its BatchDefinition. Random or limit samples of a table are not identified by their BatchDefinition, since each
+        run may sample other rows."""
+        batch = self._batches.get(batch_id)
+        if batch is None:
+            return None
+        if batch.batch_markers.get("pandas_data_fingerprint"):
+            return batch.batch_markers["pandas_data_fingerprint"]
+        if (
+            batch.batch_spec.get("table_name")
+            and isinstance(batch.batch_definition, BatchDefinition)
+            and batch.batch_spec.get("sampling_method")
+            not in NONDETERMINISTIC_SAMPLING_METHODS
+        ):
+            return batch.batch_definition.id
+        return None
+
+    def _get_resolved_metric_identifier(
+        self, metric: MetricConfiguration
+    ) -> Optional[ResolvedMetricIdentifier]:
+        """Returns the key under which the given metric is persisted in the resolved metric store, or None if
+        persisting it is not possible."""
+        if self._resolved_metric_store is None:
+            return None
+        batch_id = metric.metric_domain_kwargs.get("batch_id") or self.active_batch_id
+        batch_fingerprint = self._get_batch_fingerprint(batch_id)
+        if batch_fingerprint is None:
+            return None
+        return ResolvedMetricIdentifier.from_metric_id(batch_fingerprint, metric.id)
+
+    def _get_stored_metric(
+        self, resolved_metric_identifier: ResolvedMetricIdentifier
+    ):
+        try:
+            if not self._resolved_metric_store.has_key(resolved_metric_identifier):
+                return None
+            return self._resolved_metric_store.get(resolved_metric_identifier)
+        except Exception as e:
+            logger.warning(
+                f"Unable to read metric {str(resolved_metric_identifier.to_tuple())} from the resolved metric store: "
+                f"{str(e)}"
+            )
+            return None
+
+    def _store_metric(
+        self, resolved_metric_identifier: ResolvedMetricIdentifier, value
+    ):
+        if value is None:
+            return
+        try:
+            self._resolved_metric_store.set(resolved_metric_identifier, value)
+        except Exception as e:
+            logger.warning(
+                f"Unable to write metric {str(resolved_metric_identifier.to_tuple())} to the resolved metric store: "
+                f"{str(e)}"
+            )
+
     def _initialize_expectations(
         self, expectation_suite=None, expectation_suite_name=None
     ):
@@ -1159,6 +1422,7 @@ class Validator:
             raise
         finally:
             self._active_validation = False
+            self._execution_engine.release_resources()
 
         if getattr(data_context, "_usage_statistics_handler", None):
             handler = data_context._usage_statistics_handler
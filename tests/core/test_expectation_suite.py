@@ -424,3 +424,71 @@ def test_get_column_expectations(
 ):
     obs = suite_with_table_and_column_expectations.get_column_expectations()
     assert obs == [exp1, exp2, exp3, exp4]
+
+
+def test_get_referenced_columns(
+    empty_suite, suite_with_table_and_column_expectations, exp1, table_exp2
+):
+    assert empty_suite.get_referenced_columns() is None
+
+    suite = ExpectationSuite(
+        expectation_suite_name="warning",
+        expectations=[
+            exp1,
+            table_exp2,
+            ExpectationConfiguration(
+                expectation_type="expect_column_to_exist", kwargs={"column": "c"}
+            ),
+            ExpectationConfiguration(
+                expectation_type="expect_compound_columns_to_be_unique",
+                kwargs={"column_list": ["a", "d"]},
+            ),
+        ],
+    )
+    assert suite.get_referenced_columns() == ["a", "c", "d"]
+
+    # Expectations about the schema of the batch, or with a row_condition, need all the columns of the batch
+    assert suite_with_table_and_column_expectations.get_referenced_columns() is None
+    suite.add_expectation(
+        ExpectationConfiguration(
+            expectation_type="expect_column_to_exist",
+            kwargs={"column": "c", "column_index": 2},
+        )
+    )
+    assert suite.get_referenced_columns() is None
+    suite = ExpectationSuite(
+        expectation_suite_name="warning",
+        expectations=[
+            ExpectationConfiguration(
+                expectation_type="expect_column_values_to_not_be_null",
+                kwargs={"column": "a", "row_condition": 'b=="x"'},
+            )
+        ],
+    )
+    assert suite.get_referenced_columns() is None
+
+
+def test_get_shared_row_condition(empty_suite, exp1):
+    assert empty_suite.get_shared_row_condition() is None
+
+    expectations = [
+        ExpectationConfiguration(
+            expectation_type="expect_column_values_to_not_be_null",
+            kwargs={
+                "column": column,
+                "row_condition": 'region=="EU"',
+                "condition_parser": "pandas",
+            },
+        )
+        for column in ["a", "b"]
+    ]
+    suite = ExpectationSuite(
+        expectation_suite_name="warning", expectations=expectations
+    )
+    assert suite.get_shared_row_condition() == {
+        "row_condition": 'region=="EU"',
+        "condition_parser": "pandas",
+    }
+
+    suite.add_expectation(exp1)
+    assert suite.get_shared_row_condition() is None
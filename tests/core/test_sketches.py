@@ -0,0 +1,83 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from great_expectations.core.sketches import (
+    FrequentItemsSketch,
+    HyperLogLog,
+    QuantileSketch,
+)
+
+
+def test_hyperloglog_estimate_is_within_error_bound():
+    values = np.random.RandomState(0).randint(0, 50000, size=200000)
+    sketch = HyperLogLog().update(values)
+
+    distinct_values = len(np.unique(values))
+    assert abs(sketch.estimate() - distinct_values) <= (
+        4 * sketch.relative_standard_error * distinct_values
+    )
+
+
+def test_hyperloglog_merge_matches_single_sketch():
+    values = pd.Series(np.random.RandomState(1).randint(0, 10000, size=50000))
+    sketch = HyperLogLog().update(values)
+    merged_sketch = (
+        HyperLogLog().update(values[:20000]).merge(HyperLogLog().update(values[20000:]))
+    )
+
+    assert merged_sketch.estimate() == sketch.estimate()
+
+
+def test_hyperloglog_ignores_nulls_and_counts_small_cardinalities():
+    sketch = HyperLogLog().update(["a", "b", None, "a", np.nan, "c"])
+
+    assert sketch.estimate() == 3
+
+
+def test_hyperloglog_merge_requires_same_precision():
+    with pytest.raises(ValueError):
+        HyperLogLog(precision=10).merge(HyperLogLog(precision=12))
+
+
+def test_quantile_sketch_rank_error_is_bounded():
+    values = np.random.RandomState(2).normal(size=100000)
+    sketch = QuantileSketch(capacity=256)
+    for chunk in np.array_split(values, 13):
+        sketch.merge(QuantileSketch(capacity=256).update(chunk))
+
+    assert sketch.count == len(values)
+    assert 0 < sketch.rank_error < 0.05
+    sorted_values = np.sort(values)
+    quantiles = [0.0, 0.1, 0.25, 0.5, 0.75, 0.9, 1.0]
+    for quantile, estimate in zip(quantiles, sketch.quantiles(quantiles)):
+        rank = np.searchsorted(sorted_values, estimate, side="right") / len(values)
+        assert abs(rank - quantile) <= sketch.rank_error + 1 / len(values)
+
+
+def test_quantile_sketch_is_exact_below_capacity():
+    sketch = QuantileSketch().update([5, 1, None, 4, 2, 3])
+
+    assert sketch.rank_error == 0
+    assert sketch.quantiles([0, 0.5, 1]) == [1.0, 3.0, 5.0]
+    assert QuantileSketch().quantiles([0.5]) == [None]
+
+
+def test_frequent_items_sketch_error_is_bounded():
+    values = pd.Series(np.random.RandomState(3).zipf(1.5, size=20000))
+    sketch = FrequentItemsSketch(capacity=20)
+    for chunk in np.array_split(values, 5):
+        sketch.merge(FrequentItemsSketch(capacity=20).update(chunk))
+
+    assert sketch.count == len(values)
+    assert sketch.max_error <= len(values) / 21
+    value_counts = values.value_counts()
+    estimated_value_counts = sketch.value_counts()
+    assert len(estimated_value_counts) <= 20
+    assert estimated_value_counts.index[0] == value_counts.index[0]
+    for value, estimated_count in estimated_value_counts.items():
+        assert (
+            value_counts[value] - sketch.max_error
+            <= estimated_count
+            <= value_counts[value]
+        )
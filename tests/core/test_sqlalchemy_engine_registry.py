@@ -0,0 +1,56 @@
+import pytest
+
+from great_expectations.core.sqlalchemy_engine_registry import (
+    dispose_sqlalchemy_engines,
+    get_sqlalchemy_engine,
+)
+from great_expectations.data_context.store.database_store_backend import (
+    DatabaseStoreBackend,
+)
+from great_expectations.execution_engine.sqlalchemy_execution_engine import (
+    SqlAlchemyExecutionEngine,
+)
+
+
+@pytest.fixture
+def sqlite_url(tmp_path, sa):
+    yield f"sqlite:///{tmp_path / 'test.db'}"
+    dispose_sqlalchemy_engines()
+
+
+def test_get_sqlalchemy_engine(sqlite_url):
+    engine = get_sqlalchemy_engine(sqlite_url, pool_pre_ping=True, connect_args={})
+    assert (
+        get_sqlalchemy_engine(sqlite_url, connect_args={}, pool_pre_ping=True)
+        is engine
+    )
+    assert get_sqlalchemy_engine(sqlite_url) is not engine
+    assert get_sqlalchemy_engine(sqlite_url, pool_pre_ping=False) is not engine
+
+    # In-memory databases and engines built from a callable are never shared
+    assert get_sqlalchemy_engine("sqlite://") is not get_sqlalchemy_engine("sqlite://")
+    creator = engine.raw_connection
+    assert get_sqlalchemy_engine(sqlite_url, creator=creator) is not (
+        get_sqlalchemy_engine(sqlite_url, creator=creator)
+    )
+
+    dispose_sqlalchemy_engines()
+    assert (
+        get_sqlalchemy_engine(sqlite_url, pool_pre_ping=True, connect_args={})
+        is not engine
+    )
+
+
+def test_engine_is_shared_by_execution_engines_and_store_backends(sqlite_url):
+    execution_engine = SqlAlchemyExecutionEngine(connection_string=sqlite_url)
+    other_execution_engine = SqlAlchemyExecutionEngine(url=sqlite_url)
+    store_backend = DatabaseStoreBackend(
+        table_name="ge_validations_store",
+        key_columns=["expectation_suite_name"],
+        url=sqlite_url,
+    )
+
+    # sqlite execution engines hold a connection of their own to the shared engine, to keep their temporary tables
+    assert execution_engine.engine is not other_execution_engine.engine
+    assert execution_engine.engine.engine is other_execution_engine.engine.engine
+    assert store_backend.engine is execution_engine.engine.engine
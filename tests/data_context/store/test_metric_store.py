@@ -1,6 +1,8 @@
+import pandas as pd
 import pytest
 
 import tests.test_utils as test_utils
+from great_expectations.core.metric import ResolvedMetricIdentifier
 from great_expectations.data_context.util import instantiate_class_from_config
 
 
@@ -90,3 +92,30 @@ def test_metric_store_store_backend_id(in_memory_param_store):
     assert in_memory_param_store.store_backend_id is not None
     # Check that store_backend_id is a valid UUID
     assert test_utils.validate_uuid4(in_memory_param_store.store_backend_id)
+
+
+def test_resolved_metric_store_round_trip(tmp_path_factory):
+    path = str(tmp_path_factory.mktemp("test_resolved_metric_store_round_trip"))
+    store = instantiate_class_from_config(
+        config={
+            "class_name": "ResolvedMetricStore",
+            "store_backend": {
+                "class_name": "TupleFilesystemStoreBackend",
+                "base_directory": path,
+            },
+        },
+        config_defaults={
+            "module_name": "great_expectations.data_context.store",
+        },
+        runtime_environment={},
+    )
+    key = ResolvedMetricIdentifier.from_metric_id(
+        "fingerprint", ("column.value_counts", "column=a", tuple())
+    )
+    value = pd.Series([2, 1], index=["x", "y"])
+
+    assert not store.has_key(key)
+    store.set(key, value)
+    assert store.has_key(key)
+    assert store.get(key).equals(value)
+    assert store.list_keys() == [key]
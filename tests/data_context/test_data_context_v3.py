@@ -2,6 +2,7 @@ import datetime
 
 import pytest
 
+from great_expectations.core.expectation_configuration import ExpectationConfiguration
 from great_expectations.data_context import BaseDataContext
 from great_expectations.data_context.types.base import DataContextConfig
 from great_expectations.validator.validator import Validator
@@ -342,3 +343,24 @@ def test_in_memory_data_context_configuration(
 
     assert my_validator.expect_table_row_count_to_equal(1313)["success"]
     assert my_validator.expect_table_column_count_to_equal(7)["success"]
+
+
+def test_get_validator_with_project_columns(titanic_pandas_multibatch_data_context_v3):
+    context = titanic_pandas_multibatch_data_context_v3
+    suite = context.create_expectation_suite("my_projected_suite")
+    suite.add_expectation(
+        ExpectationConfiguration(
+            expectation_type="expect_column_values_to_not_be_null",
+            kwargs={"column": "Name"},
+        )
+    )
+
+    my_validator: Validator = context.get_validator(
+        datasource_name="titanic_multi_batch",
+        data_connector_name="my_data_connector",
+        data_asset_name="Titanic_1912",
+        expectation_suite=suite,
+        project_columns=True,
+    )
+    assert my_validator.active_batch.data.columns.tolist() == ["Name"]
+    assert my_validator.validate().success
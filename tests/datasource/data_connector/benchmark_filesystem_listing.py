@@ -0,0 +1,142 @@
+"""
+Benchmarks the listing of a synthetic directory tree by filesystem DataConnectors.
+
+The tree holds --num-files files under year/month/day directories, along with as many files again under directories
+that the regex of the data_asset cannot match.  The listing and the mapping of data_references onto BatchDefinitions
+are timed as they were done with Path.glob and a BatchRequest per data_reference, and as they are done now.
+
+    python tests/datasource/data_connector/benchmark_filesystem_listing.py --num-files 1000000
+"""
+import argparse
+import os
+import re
+import tempfile
+import time
+from pathlib import Path
+from typing import List
+
+from great_expectations.core.batch import BatchDefinition, PartitionDefinition
+from great_expectations.datasource.data_connector import (
+    InferredAssetFilesystemDataConnector,
+)
+from great_expectations.datasource.data_connector.util import (
+    convert_data_reference_string_to_batch_request_using_regex,
+    get_filesystem_one_level_directory_glob_path_list,
+    map_data_reference_string_to_batch_definition_list_using_regex,
+)
+
+REGEX_PATTERN: str = r"(\d{4})/(\d{2})/(\d{2})/(.+)_(\d+)\.csv"
+GROUP_NAMES: List[str] = ["year", "month", "day", "data_asset_name", "index"]
+GLOB_DIRECTIVE: str = "**/*.csv"
+
+
+def create_tree(base_directory: str, num_files: int, files_per_directory: int):
+    num_directories: int = max(num_files // files_per_directory, 1)
+    for directory_index in range(num_directories):
+        year: int = 2000 + directory_index // 366
+        month: int = 1 + directory_index // 31 % 12
+        day: int = 1 + directory_index % 31
+        for directory in [
+            os.path.join(base_directory, f"{year}", f"{month:02d}", f"{day:02d}"),
+            os.path.join(base_directory, "archive", f"{year}", f"{directory_index}"),
+        ]:
+            os.makedirs(directory, exist_ok=True)
+            for file_index in range(files_per_directory):
+                open(os.path.join(directory, f"events_{file_index}.csv"), "w").close()
+
+
+def list_with_path_glob(base_directory: str) -> List[BatchDefinition]:
+    batch_definition_list: List[BatchDefinition] = []
+    for path in Path(base_directory).glob(GLOB_DIRECTIVE):
+        batch_request = convert_data_reference_string_to_batch_request_using_regex(
+            data_reference=os.path.relpath(str(path), base_directory),
+            regex_pattern=REGEX_PATTERN,
+            group_names=GROUP_NAMES,
+        )
+        if batch_request is not None:
+            batch_definition_list.append(
+                BatchDefinition(
+                    datasource_name="benchmark_datasource",
+                    data_connector_name="benchmark_data_connector",
+                    data_asset_name=batch_request.data_asset_name,
+                    partition_definition=PartitionDefinition(
+                        batch_request.partition_request
+                    ),
+                )
+            )
+    return batch_definition_list
+
+
+def list_with_scandir(base_directory: str) -> List[BatchDefinition]:
+    regex_pattern = re.compile(REGEX_PATTERN)
+    batch_definition_list: List[BatchDefinition] = []
+    for data_reference in get_filesystem_one_level_directory_glob_path_list(
+        base_directory_path=base_directory,
+        glob_directive=GLOB_DIRECTIVE,
+        regex_pattern=REGEX_PATTERN,
+    ):
+        batch_definitions = (
+            map_data_reference_string_to_batch_definition_list_using_regex(
+                datasource_name="benchmark_datasource",
+                data_connector_name="benchmark_data_connector",
+                data_asset_name=None,
+                data_reference=data_reference,
+                regex_pattern=regex_pattern,
+                group_names=GROUP_NAMES,
+            )
+        )
+        if batch_definitions is not None:
+            batch_definition_list.extend(batch_definitions)
+    return batch_definition_list
+
+
+def refresh_data_connector(base_directory: str) -> int:
+    data_connector = InferredAssetFilesystemDataConnector(
+        name="benchmark_data_connector",
+        datasource_name="benchmark_datasource",
+        base_directory=base_directory,
+        glob_directive=GLOB_DIRECTIVE,
+        default_regex={"pattern": REGEX_PATTERN, "group_names": GROUP_NAMES},
+    )
+    data_connector._refresh_data_references_cache()
+    return data_connector.get_data_reference_list_count()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--num-files", type=int, default=1000000)
+    parser.add_argument("--files-per-directory", type=int, default=100)
+    parser.add_argument(
+        "--base-directory",
+        help="directory in which to create the tree, or that holds the tree of an "
+        "earlier run",
+    )
+    args = parser.parse_args()
+
+    base_directory: str = args.base_directory or tempfile.mkdtemp(
+        prefix="ge_filesystem_listing_benchmark_"
+    )
+    if not os.listdir(base_directory):
+        start: float = time.perf_counter()
+        create_tree(
+            base_directory=base_directory,
+            num_files=args.num_files,
+            files_per_directory=args.files_per_directory,
+        )
+        elapsed: float = time.perf_counter() - start
+        print(f"Created the tree in {base_directory} in {elapsed:.1f}s")
+
+    for description, list_function in [
+        ("Path.glob and a BatchRequest per data_reference", list_with_path_glob),
+        ("os.scandir with the regex pruning directories", list_with_scandir),
+        ("InferredAssetFilesystemDataConnector refresh", refresh_data_connector),
+    ]:
+        start: float = time.perf_counter()
+        result = list_function(base_directory)
+        elapsed: float = time.perf_counter() - start
+        count: int = result if isinstance(result, int) else len(result)
+        print(f"{description}: {count} data_references in {elapsed:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
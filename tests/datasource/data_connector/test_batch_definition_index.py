@@ -0,0 +1,128 @@
+from typing import List
+
+import pytest
+
+import great_expectations.exceptions.exceptions as ge_exceptions
+from great_expectations.core.batch import (
+    BatchDefinition,
+    BatchRequest,
+    PartitionDefinition,
+)
+from great_expectations.datasource.data_connector.batch_definition_index import (
+    BatchDefinitionIndex,
+)
+from great_expectations.datasource.data_connector.util import (
+    batch_definition_matches_batch_request,
+    build_sorters_from_config,
+)
+
+
+@pytest.fixture
+def batch_definition_list() -> List[BatchDefinition]:
+    return [
+        BatchDefinition(
+            datasource_name="test_environment",
+            data_connector_name="general_filesystem_data_connector",
+            data_asset_name=data_asset_name,
+            partition_definition=PartitionDefinition(
+                {"name": name, "timestamp": timestamp}
+            ),
+        )
+        for data_asset_name in ["TestFiles", "OtherFiles"]
+        for name, timestamp in [
+            ("james", "20200811"),
+            ("alex", "20200809"),
+            ("james", "20200713"),
+            ("will", "20200810"),
+            ("james", "20200810"),
+        ]
+    ]
+
+
+def test_get_batch_definition_list(batch_definition_list):
+    index = BatchDefinitionIndex(batch_definition_list=batch_definition_list)
+    assert len(index) == 10
+
+    for batch_request in [
+        BatchRequest(data_asset_name="TestFiles"),
+        BatchRequest(
+            data_asset_name="OtherFiles",
+            partition_request={"partition_identifiers": {"name": "james"}},
+        ),
+        BatchRequest(
+            partition_request={
+                "partition_identifiers": {"name": "james", "timestamp": "20200810"}
+            }
+        ),
+        BatchRequest(
+            data_asset_name="TestFiles",
+            partition_request={"partition_identifiers": {"name": "abe"}},
+        ),
+        BatchRequest(
+            data_asset_name="TestFiles",
+            partition_request={"partition_identifiers": {"name": ["james"]}},
+        ),
+        BatchRequest(data_asset_name="MissingFiles"),
+    ]:
+        assert index.get_batch_definition_list(batch_request=batch_request) == [
+            batch_definition
+            for batch_definition in batch_definition_list
+            if batch_definition_matches_batch_request(
+                batch_definition=batch_definition, batch_request=batch_request
+            )
+        ]
+
+
+def test_sort(batch_definition_list):
+    sorters = build_sorters_from_config(
+        config_list=[
+            {"orderby": "asc", "class_name": "LexicographicSorter", "name": "name"},
+            {
+                "datetime_format": "%Y%m%d",
+                "orderby": "desc",
+                "class_name": "DateTimeSorter",
+                "name": "timestamp",
+            },
+        ]
+    )
+    index = BatchDefinitionIndex(
+        batch_definition_list=batch_definition_list, sorters=sorters
+    )
+
+    james_batch_definition_list: List[
+        BatchDefinition
+    ] = index.get_batch_definition_list(
+        batch_request=BatchRequest(
+            data_asset_name="TestFiles",
+            partition_request={"partition_identifiers": {"name": "james"}},
+        )
+    )
+    assert [
+        batch_definition.partition_definition["timestamp"]
+        for batch_definition in index.sort(james_batch_definition_list)
+    ] == ["20200811", "20200810", "20200713"]
+    assert index.sort(batch_definition_list[:5]) == [
+        batch_definition_list[1],
+        batch_definition_list[0],
+        batch_definition_list[4],
+        batch_definition_list[2],
+        batch_definition_list[3],
+    ]
+
+    # A batch_definition that cannot be sorted only prevents sorting the lists that include it
+    unsortable_batch_definition = BatchDefinition(
+        datasource_name="test_environment",
+        data_connector_name="general_filesystem_data_connector",
+        data_asset_name="TestFiles",
+        partition_definition=PartitionDefinition({"name": "abe"}),
+    )
+    index = BatchDefinitionIndex(
+        batch_definition_list=batch_definition_list + [unsortable_batch_definition],
+        sorters=sorters,
+    )
+    assert index.sort(batch_definition_list[3:5]) == [
+        batch_definition_list[4],
+        batch_definition_list[3],
+    ]
+    with pytest.raises(ge_exceptions.SorterError):
+        index.sort([unsortable_batch_definition] + batch_definition_list[:2])
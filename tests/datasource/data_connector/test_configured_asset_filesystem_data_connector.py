@@ -16,6 +16,9 @@ from great_expectations.data_context.util import instantiate_class_from_config
 from great_expectations.datasource.data_connector import (
     ConfiguredAssetFilesystemDataConnector,
 )
+from great_expectations.datasource.data_connector.util import (
+    get_filesystem_one_level_directory_glob_path_list,
+)
 from tests.test_utils import create_files_in_directory
 
 yaml = YAML()
@@ -1286,3 +1289,73 @@ def test_basic_instantiation_with_nested_directories(tmp_path_factory):
         "unmatched_data_reference_count": 1,
         "example_data_reference": {},
     }
+
+
+def test_data_references_cache_ttl(tmp_path_factory, monkeypatch):
+    base_directory = str(tmp_path_factory.mktemp("test_data_references_cache_ttl"))
+    create_files_in_directory(
+        directory=base_directory,
+        file_name_list=["alpha-1.csv", "alpha-2.csv", "beta-1.csv"],
+    )
+
+    listed_directories: List[str] = []
+
+    def counting_get_filesystem_one_level_directory_glob_path_list(
+        base_directory_path, glob_directive, regex_pattern=None
+    ):
+        listed_directories.append(base_directory_path)
+        return get_filesystem_one_level_directory_glob_path_list(
+            base_directory_path=base_directory_path,
+            glob_directive=glob_directive,
+            regex_pattern=regex_pattern,
+        )
+
+    monkeypatch.setattr(
+        "great_expectations.datasource.data_connector.configured_asset_filesystem_data_connector"
+        ".get_filesystem_one_level_directory_glob_path_list",
+        counting_get_filesystem_one_level_directory_glob_path_list,
+    )
+
+    def get_indexes(my_data_connector) -> List[str]:
+        return [
+            batch_definition.partition_definition["index"]
+            for batch_definition in my_data_connector.get_batch_definition_list_from_batch_request(
+                BatchRequest(
+                    datasource_name="test_environment",
+                    data_connector_name="my_data_connector",
+                    data_asset_name="alpha",
+                )
+            )
+        ]
+
+    connectors: dict = {
+        data_references_cache_ttl: ConfiguredAssetFilesystemDataConnector(
+            name="my_data_connector",
+            datasource_name="test_environment",
+            base_directory=base_directory,
+            glob_directive="*.csv",
+            assets={
+                "alpha": {"pattern": "alpha-(\\d+)\\.csv", "group_names": ["index"]},
+                "beta": {"pattern": "beta-(\\d+)\\.csv", "group_names": ["index"]},
+            },
+            data_references_cache_ttl=data_references_cache_ttl,
+        )
+        for data_references_cache_ttl in [None, 0]
+    }
+    for my_data_connector in connectors.values():
+        assert get_indexes(my_data_connector) == ["1", "2"]
+        # Only the requested asset is listed
+        assert list(my_data_connector._data_references_cache.keys()) == ["alpha"]
+    assert len(listed_directories) == 2
+
+    # The directory is not listed again while it is not modified
+    assert get_indexes(connectors[0]) == ["1", "2"]
+    assert len(listed_directories) == 2
+
+    create_files_in_directory(directory=base_directory, file_name_list=["alpha-3.csv"])
+    directory_mtime_ns: int = os.stat(base_directory).st_mtime_ns + 1_000_000_000
+    os.utime(base_directory, ns=(directory_mtime_ns, directory_mtime_ns))
+
+    assert get_indexes(connectors[None]) == ["1", "2"]
+    assert get_indexes(connectors[0]) == ["1", "2", "3"]
+    assert len(listed_directories) == 3
@@ -1053,3 +1053,81 @@ assets:
         )
         == 5
     )
+
+
+@mock_s3
+def test_data_references_cache_ttl_lists_keys_after_the_last_cached_key():
+    region_name: str = "us-east-1"
+    bucket: str = "test_bucket"
+    conn = boto3.resource("s3", region_name=region_name)
+    conn.create_bucket(Bucket=bucket)
+    client = boto3.client("s3", region_name=region_name)
+
+    test_df: pd.DataFrame = pd.DataFrame(data={"col1": [1, 2], "col2": [3, 4]})
+
+    def put_keys(keys: List[str]):
+        for key in keys:
+            client.put_object(
+                Bucket=bucket,
+                Body=test_df.to_csv(index=False).encode("utf-8"),
+                Key=key,
+            )
+
+    put_keys(["alpha/alpha-1.csv", "alpha/alpha-2.csv", "beta/beta-1.csv"])
+
+    my_data_connector = ConfiguredAssetS3DataConnector(
+        name="my_data_connector",
+        datasource_name="FAKE_DATASOURCE_NAME",
+        default_regex={
+            "pattern": "(.+)-(\\d+)\\.csv",
+            "group_names": ["name", "index"],
+        },
+        bucket=bucket,
+        prefix="",
+        assets={
+            "alpha": {
+                "prefix": "alpha/",
+                "pattern": "alpha/alpha-(\\d+)\\.csv",
+                "group_names": ["index"],
+            },
+            "beta": {
+                "prefix": "beta/",
+                "pattern": "beta/beta-(\\d+)\\.csv",
+                "group_names": ["index"],
+            },
+        },
+        data_references_cache_ttl=0,
+    )
+    list_objects_v2_calls: List[dict] = []
+    list_objects_v2 = my_data_connector._s3.list_objects_v2
+
+    def spy_list_objects_v2(**kwargs):
+        list_objects_v2_calls.append(kwargs)
+        return list_objects_v2(**kwargs)
+
+    my_data_connector._s3.list_objects_v2 = spy_list_objects_v2
+
+    def get_indexes() -> List[str]:
+        return [
+            batch_definition.partition_definition["index"]
+            for batch_definition in my_data_connector.get_batch_definition_list_from_batch_request(
+                BatchRequest(
+                    datasource_name="FAKE_DATASOURCE_NAME",
+                    data_connector_name="my_data_connector",
+                    data_asset_name="alpha",
+                )
+            )
+        ]
+
+    # Only the requested asset is listed
+    assert get_indexes() == ["1", "2"]
+    assert len(list_objects_v2_calls) == 1
+    assert list(my_data_connector._data_references_cache.keys()) == ["alpha"]
+
+    put_keys(["alpha/alpha-3.csv"])
+    assert get_indexes() == ["1", "2", "3"]
+    assert list_objects_v2_calls[-1]["StartAfter"] == "alpha/alpha-2.csv"
+
+    # Nothing follows the last cached key
+    assert get_indexes() == ["1", "2", "3"]
+    assert list_objects_v2_calls[-1]["StartAfter"] == "alpha/alpha-3.csv"
@@ -1,4 +1,10 @@
+import os
+from pathlib import Path
+from typing import List
+
+import boto3
 import pytest
+from moto import mock_s3
 
 import great_expectations.exceptions.exceptions as ge_exceptions
 from great_expectations.core.batch import (
@@ -15,9 +21,12 @@ from great_expectations.datasource.data_connector.util import (
     build_sorters_from_config,
     convert_batch_request_to_data_reference_string_using_regex,
     convert_data_reference_string_to_batch_request_using_regex,
+    get_filesystem_one_level_directory_glob_path_list,
+    list_s3_keys,
     map_batch_definition_to_data_reference_string_using_regex,
     map_data_reference_string_to_batch_definition_list_using_regex,
 )
+from tests.test_utils import create_files_in_directory
 
 
 def test_batch_definition_matches_batch_request():
@@ -471,3 +480,147 @@ def test_build_sorters_from_config_bad_config():
     ]
     with pytest.raises(ge_exceptions.SorterError):
         build_sorters_from_config(sorters_config)
+
+
+@mock_s3
+def test_list_s3_keys():
+    region_name: str = "us-east-1"
+    bucket: str = "test_bucket"
+    conn = boto3.resource("s3", region_name=region_name)
+    conn.create_bucket(Bucket=bucket)
+    client = boto3.client("s3", region_name=region_name)
+
+    keys: list = (
+        [f"data/a-{index:02d}.csv" for index in range(12)]
+        + [f"data/2020/{index:02d}.csv" for index in range(5)]
+        + [f"data/2020/01/{index:02d}.csv" for index in range(7)]
+        + [f"data/2021/{index:02d}.csv" for index in range(3)]
+    )
+    for key in keys:
+        client.put_object(Bucket=bucket, Body=b"a,b\n1,2\n", Key=key)
+    client.put_object(Bucket=bucket, Body=b"", Key="data/empty.csv")
+
+    query_options: dict = {
+        "Bucket": bucket,
+        "Prefix": "data/",
+        "Delimiter": "/",
+        "MaxKeys": 2,
+    }
+
+    # Pages are followed until the listing is complete
+    iterator_dict: dict = {}
+    assert (
+        list(
+            list_s3_keys(
+                s3=client,
+                query_options=query_options,
+                iterator_dict=iterator_dict,
+                recursive=False,
+            )
+        )
+        == keys[:12]
+    )
+    assert iterator_dict == {}
+    assert "ContinuationToken" not in query_options
+
+    # Common prefixes are listed concurrently, and their keys yielded depth first
+    for max_workers in [1, 4]:
+        assert (
+            list(
+                list_s3_keys(
+                    s3=client,
+                    query_options=query_options,
+                    recursive=True,
+                    max_workers=max_workers,
+                )
+            )
+            == keys
+        )
+
+    # A listing that is not consumed entirely stops
+    listing = list_s3_keys(s3=client, query_options=query_options, recursive=True)
+    assert next(listing) == keys[0]
+    listing.close()
+
+    with pytest.raises(ValueError):
+        list(
+            list_s3_keys(
+                s3=client,
+                query_options=dict(query_options, Prefix="missing/"),
+                recursive=True,
+            )
+        )
+
+
+def test_get_filesystem_one_level_directory_glob_path_list(tmp_path_factory):
+    base_directory = str(tmp_path_factory.mktemp("test_glob_path_list"))
+    create_files_in_directory(
+        directory=base_directory,
+        file_name_list=[
+            "top.csv",
+            ".hidden.csv",
+            "2020/01/alpha.csv",
+            "2020/01/beta.txt",
+            "2020/02/alpha.csv",
+            "2020/archive/alpha.csv",
+            "2021/01/alpha.csv",
+            "misc/notes/alpha.csv",
+            "misc/alpha.csv",
+        ],
+    )
+
+    # Paths are the ones Path.glob finds
+    for glob_directive in [
+        "*",
+        "*.csv",
+        "*/*",
+        "**/*",
+        "**/*.csv",
+        "2020/*/*.csv",
+        "*/**/alpha.csv",
+        "**/**/*",
+        "**",
+        "missing/*",
+    ]:
+        assert sorted(
+            get_filesystem_one_level_directory_glob_path_list(
+                base_directory_path=base_directory, glob_directive=glob_directive
+            )
+        ) == sorted(
+            os.path.relpath(str(path), base_directory)
+            for path in Path(base_directory).glob(glob_directive)
+        )
+
+    # Directories that no path matched by the regex can be under are not listed
+    path_list: List[str] = sorted(
+        get_filesystem_one_level_directory_glob_path_list(
+            base_directory_path=base_directory,
+            glob_directive="**/*",
+            regex_pattern=r"(\d{4})/(\d{2})/(.+)\.csv",
+        )
+    )
+    assert path_list == [
+        ".hidden.csv",
+        "2020",
+        "2020/01",
+        "2020/01/alpha.csv",
+        "2020/01/beta.txt",
+        "2020/02",
+        "2020/02/alpha.csv",
+        "2020/archive",
+        "2021",
+        "2021/01",
+        "2021/01/alpha.csv",
+        "misc",
+        "top.csv",
+    ]
+
+    # Nothing is pruned for regex patterns that may match across directories
+    for regex_pattern in [r"(.+)/(\d{2})/(.+)\.csv", r"2020/.+|misc/.+"]:
+        assert len(
+            get_filesystem_one_level_directory_glob_path_list(
+                base_directory_path=base_directory,
+                glob_directive="**/*",
+                regex_pattern=regex_pattern,
+            )
+        ) == len(list(Path(base_directory).glob("**/*")))
@@ -189,8 +189,12 @@ def test_basic_pandas_datasource_self_check(basic_pandas_datasource):
         "execution_engine": {
             "caching": True,
             "class_name": "PandasExecutionEngine",
+            "metric_cache_max_entries": 1024,
+            "metric_cache_max_bytes": 134217728,
             "discard_subset_failing_expectations": False,
             "boto3_options": {},
+            "row_condition_cache_max_entries": 16,
+            "dtype_backend": "numpy",
         },
         "data_connectors": {
             "count": 2,
@@ -232,6 +236,8 @@ def test_basic_spark_datasource_self_check(basic_spark_datasource):
         "execution_engine": {
             "caching": True,
             "class_name": "SparkDFExecutionEngine",
+            "metric_cache_max_entries": 1024,
+            "metric_cache_max_bytes": 134217728,
             "persist": True,
             "spark_config": {
                 "spark.master": "local[*]",
@@ -413,6 +419,68 @@ def test_get_batch_list_from_batch_request(basic_pandas_datasource):
     )
 
 
+def test_get_batch_list_from_batch_request_and_iter_batches_lazily(
+    basic_pandas_datasource, monkeypatch
+):
+    data_connector = basic_pandas_datasource.data_connectors[
+        "my_filesystem_data_connector"
+    ]
+    for number in range(3):
+        pd.DataFrame({"number": [number] * (number + 1)}).to_csv(
+            os.path.join(data_connector.base_directory, f"Titanic_{number}.csv"),
+            index=False,
+        )
+
+    loaded: list = []
+    get_batch_data_and_metadata = data_connector.get_batch_data_and_metadata
+
+    def counting_get_batch_data_and_metadata(batch_definition):
+        loaded.append(batch_definition.partition_definition["number"])
+        return get_batch_data_and_metadata(batch_definition=batch_definition)
+
+    monkeypatch.setattr(
+        data_connector,
+        "get_batch_data_and_metadata",
+        counting_get_batch_data_and_metadata,
+    )
+
+    batch_request: BatchRequest = BatchRequest(
+        datasource_name="my_datasource",
+        data_connector_name="my_filesystem_data_connector",
+        data_asset_name="Titanic",
+    )
+    batch_list: List[Batch] = basic_pandas_datasource.get_batch_list_from_batch_request(
+        batch_request=batch_request, lazy=True
+    )
+    assert len(batch_list) == 3
+    assert loaded == []
+    assert batch_list[1].data.shape == (2, 1)
+    assert batch_list[1].batch_markers["pandas_data_fingerprint"] is not None
+    assert loaded == ["1"]
+    batch_list[1].unload()
+    assert batch_list[1].batch_spec is not None
+    assert loaded == ["1"]
+
+    for prefetch in (0, 2):
+        loaded.clear()
+        batches: List[Batch] = []
+        for batch in basic_pandas_datasource.iter_batches_from_batch_request(
+            batch_request=batch_request, prefetch=prefetch
+        ):
+            assert batch.is_loaded
+            assert all(not previous.is_loaded for previous in batches)
+            batches.append(batch)
+        assert loaded == ["0", "1", "2"]
+        assert [batch.data.shape[0] for batch in batches] == [1, 2, 3]
+
+    with pytest.raises(ValueError):
+        next(
+            basic_pandas_datasource.iter_batches_from_batch_request(
+                batch_request=batch_request, prefetch=-1
+            )
+        )
+
+
 def test_get_batch_with_caching():
     pass
 
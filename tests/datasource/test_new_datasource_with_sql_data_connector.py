@@ -64,7 +64,11 @@ data_connectors:
     report["execution_engine"].pop("connection_string")
 
     assert report == {
-        "execution_engine": {"class_name": "SqlAlchemyExecutionEngine"},
+        "execution_engine": {
+            "class_name": "SqlAlchemyExecutionEngine",
+            "metric_cache_max_entries": 1024,
+            "metric_cache_max_bytes": 134217728,
+        },
         "data_connectors": {
             "count": 1,
             "my_sqlite_db": {
@@ -1,6 +1,11 @@
+import numpy as np
 import pandas as pd
 
-from great_expectations.datasource.util import hash_pandas_dataframe
+from great_expectations.datasource.util import (
+    FINGERPRINT_BLOCK_ROWS,
+    FINGERPRINT_SAMPLE_BLOCKS,
+    hash_pandas_dataframe,
+)
 
 
 def test_hash_pandas_dataframe_hashable_df():
@@ -15,3 +20,24 @@ def test_hash_pandas_dataframe_unhashable_df():
     df1 = pd.DataFrame(data)
     df2 = pd.DataFrame(data)
     assert hash_pandas_dataframe(df1) == hash_pandas_dataframe(df2)
+
+
+def test_hash_pandas_dataframe_sampled():
+    row_count = 4 * FINGERPRINT_SAMPLE_BLOCKS * FINGERPRINT_BLOCK_ROWS
+    df = pd.DataFrame({"a": np.arange(row_count), "b": ["x"] * row_count})
+    fingerprint = hash_pandas_dataframe(df, sampled=True)
+    assert hash_pandas_dataframe(df.copy(), sampled=True) == fingerprint
+    assert fingerprint != hash_pandas_dataframe(df)
+
+    # The first and last rows are always sampled, and so is the shape
+    for changed_df in [df.assign(a=df["a"].replace(0, -1)), df.iloc[:-1]]:
+        assert hash_pandas_dataframe(changed_df, sampled=True) != fingerprint
+
+    # A row between two sampled blocks is not, but the metadata of the source reflects its change
+    changed_df = df.assign(a=df["a"].replace(FINGERPRINT_BLOCK_ROWS + 1, -1))
+    assert hash_pandas_dataframe(changed_df, sampled=True) == fingerprint
+    assert hash_pandas_dataframe(
+        df, sampled=True, source_metadata={"size": 10, "mtime_ns": 1}
+    ) != hash_pandas_dataframe(
+        changed_df, sampled=True, source_metadata={"size": 10, "mtime_ns": 2}
+    )
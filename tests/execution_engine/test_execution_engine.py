@@ -3,6 +3,11 @@ import pytest
 
 from great_expectations.exceptions import GreatExpectationsError
 from great_expectations.execution_engine import ExecutionEngine, PandasExecutionEngine
+from great_expectations.execution_engine.execution_engine import (
+    DEFAULT_METRIC_CACHE_MAX_BYTES,
+    DEFAULT_METRIC_CACHE_MAX_ENTRIES,
+    MetricCache,
+)
 from great_expectations.validator.validation_graph import MetricConfiguration
 
 
@@ -167,3 +172,81 @@ def test_resolve_metrics_with_incomplete_metric_input():
     # Ensuring that incomplete metrics given raises a GreatExpectationsError
     with pytest.raises(GreatExpectationsError) as error:
         engine.resolve_metrics(metrics_to_resolve=(desired_metric,), metrics={})
+
+
+def test_resolve_metrics_uses_metric_cache():
+    df = pd.DataFrame({"a": [1, 2, 3, None]})
+    engine = PandasExecutionEngine(batch_data_dict={"my_id": df})
+    mean = MetricConfiguration(
+        metric_name="column.mean",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs=dict(),
+    )
+
+    metrics = engine.resolve_metrics(metrics_to_resolve=(mean,))
+    assert engine.metric_cache_statistics["misses"] == 1
+    assert engine.metric_cache_statistics["entries"] == 1
+
+    assert engine.resolve_metrics(metrics_to_resolve=(mean,)) == metrics
+    assert engine.metric_cache_statistics["hits"] == 1
+
+    # Replacing the data of a batch invalidates the metrics cached for it
+    engine.load_batch_data("my_id", pd.DataFrame({"a": [10, 20]}))
+    assert engine.metric_cache_statistics["entries"] == 0
+    assert engine.resolve_metrics(metrics_to_resolve=(mean,)) == {mean.id: 15}
+
+    engine.unload_batch_data("my_id")
+    assert engine.metric_cache_statistics["entries"] == 0
+    assert engine.metric_cache_statistics["evictions"] == 2
+    assert engine.loaded_batch_data_dict == {}
+
+
+def test_metric_cache_is_bounded():
+    df = pd.DataFrame({"a": [1, 2, 3, None], "b": [4, 5, 6, 7]})
+    metrics_to_resolve = tuple(
+        MetricConfiguration(
+            metric_name="column.mean",
+            metric_domain_kwargs={"column": column},
+            metric_value_kwargs=dict(),
+        )
+        for column in ["a", "b"]
+    )
+
+    engine = PandasExecutionEngine(batch_data_dict={"my_id": df})
+    assert engine.config["metric_cache_max_entries"] == DEFAULT_METRIC_CACHE_MAX_ENTRIES
+    assert engine.config["metric_cache_max_bytes"] == DEFAULT_METRIC_CACHE_MAX_BYTES
+
+    engine = PandasExecutionEngine(
+        batch_data_dict={"my_id": df},
+        metric_cache_max_entries=1,
+        metric_cache_max_bytes=None,
+    )
+    engine.resolve_metrics(metrics_to_resolve=metrics_to_resolve)
+    assert engine.metric_cache_statistics["entries"] == 1
+    assert engine.metric_cache_statistics["evictions"] == 1
+    assert engine.config["metric_cache_max_entries"] == 1
+
+
+def test_metric_cache_evicts_least_recently_used_entries():
+    cache = MetricCache(max_entries=2)
+    cache.put("batch", ("metric_a",), 1)
+    cache.put("batch", ("metric_b",), 2)
+    assert cache.get("batch", ("metric_a",)) == 1
+    cache.put("batch", ("metric_c",), 3)
+
+    assert cache.get("batch", ("metric_b",)) is None
+    assert cache.get("batch", ("metric_a",)) == 1
+    assert cache.get("batch", ("metric_c",)) == 3
+    assert cache.statistics == {
+        "hits": 3,
+        "misses": 1,
+        "evictions": 1,
+        "entries": 2,
+        "size_in_bytes": cache.statistics["size_in_bytes"],
+    }
+
+    cache = MetricCache(max_bytes=1000)
+    cache.put("batch", ("large_metric",), list(range(1000)))
+    assert len(cache) == 0
+    cache.invalidate_batch("batch")
+    assert cache.statistics["size_in_bytes"] == 0
@@ -1,15 +1,18 @@
 import datetime
+import gzip
 import os
 import random
 from typing import List
 
 import boto3
+import numpy as np
 import pandas as pd
 import pytest
 from moto import mock_s3
 
 import great_expectations.exceptions.exceptions as ge_exceptions
 from great_expectations.core.batch import Batch
+from great_expectations.core.expectation_configuration import ExpectationConfiguration
 from great_expectations.datasource.data_connector import (
     ConfiguredAssetS3DataConnector,
     InferredAssetS3DataConnector,
@@ -22,9 +25,11 @@ from great_expectations.datasource.types.batch_spec import (
 from great_expectations.exceptions.metric_exceptions import MetricProviderError
 from great_expectations.execution_engine.execution_engine import MetricDomainTypes
 from great_expectations.execution_engine.pandas_execution_engine import (
+    ChunkedPandasBatchData,
     PandasExecutionEngine,
 )
 from great_expectations.validator.validation_graph import MetricConfiguration
+from great_expectations.validator.validator import Validator
 
 
 def test_reader_fn():
@@ -174,6 +179,44 @@ def test_get_compute_domain_with_row_condition():
     assert accessor_kwargs == {}, "Accessor kwargs have been modified"
 
 
+def test_get_compute_domain_with_row_condition_is_memoized():
+    engine = PandasExecutionEngine(row_condition_cache_max_entries=1)
+    df = pd.DataFrame({"a": [1, 2, 3, 4], "b": [2, 3, 4, None]})
+    engine.load_batch_data(batch_data=df, batch_id="1234")
+
+    domain_kwargs = {"row_condition": "b > 2", "condition_parser": "pandas"}
+    data, _, _ = engine.get_compute_domain(
+        domain_kwargs=domain_kwargs, domain_type="table"
+    )
+    column_data, _, accessor_kwargs = engine.get_compute_domain(
+        domain_kwargs={"column": "a", **domain_kwargs}, domain_type="column"
+    )
+    # The same condition on the same batch is only evaluated once
+    assert column_data is data
+    assert accessor_kwargs == {"column": "a"}
+    assert domain_kwargs == {"row_condition": "b > 2", "condition_parser": "pandas"}
+
+    # Evaluating another condition evicts the least recently used one
+    engine.get_compute_domain(
+        domain_kwargs={"row_condition": "b > 3", "condition_parser": "pandas"},
+        domain_type="table",
+    )
+    data_after_eviction, _, _ = engine.get_compute_domain(
+        domain_kwargs=domain_kwargs, domain_type="table"
+    )
+    assert data_after_eviction is not data
+    assert data_after_eviction.equals(data)
+
+    # Replacing the batch data invalidates the memoized frames
+    engine.load_batch_data(
+        batch_data=pd.DataFrame({"a": [1, 2], "b": [3, 4]}), batch_id="1234"
+    )
+    data, _, _ = engine.get_compute_domain(
+        domain_kwargs=domain_kwargs, domain_type="table"
+    )
+    assert list(data["a"]) == [1, 2]
+
+
 # What happens when we filter such that no value meets the condition?
 def test_get_compute_domain_with_unmeetable_row_condition():
     engine = PandasExecutionEngine()
@@ -387,6 +430,34 @@ def test_get_batch_with_split_on_whole_table_s3():
         )
 
 
+@mock_s3
+def test_get_batch_from_compressed_and_binary_s3_objects(tmp_path):
+    region_name: str = "us-east-1"
+    bucket: str = "test_bucket"
+    conn = boto3.resource("s3", region_name=region_name)
+    conn.create_bucket(Bucket=bucket)
+    client = boto3.client("s3", region_name=region_name)
+
+    test_df: pd.DataFrame = pd.DataFrame(data={"col1": [1, 2], "col2": ["é", "ü"]})
+    client.put_object(
+        Bucket=bucket,
+        Body=gzip.compress(test_df.to_csv(index=False).encode("utf-8")),
+        Key="path/A-100.csv",
+        ContentEncoding="gzip",
+    )
+    test_df.to_parquet(tmp_path / "A-101.parquet")
+    client.upload_file(
+        str(tmp_path / "A-101.parquet"), Bucket=bucket, Key="path/A-101.parquet"
+    )
+
+    # Objects are decompressed according to their Content-Encoding, and parquet files are read through ranged GETs
+    for key in ["path/A-100.csv", "path/A-101.parquet"]:
+        batch_df = PandasExecutionEngine().get_batch_data(
+            batch_spec=S3BatchSpec(s3=f"s3a://{bucket}/{key}")
+        )
+        pd.testing.assert_frame_equal(pd.DataFrame(batch_df), test_df)
+
+
 def test_get_batch_with_split_on_column_value(test_df):
     split_df = PandasExecutionEngine().get_batch_data(
         RuntimeDataBatchSpec(
@@ -622,3 +693,486 @@ def test_get_batch_with_split_on_divided_integer_and_sample_on_list(test_df):
     assert split_df.shape == (2, 10)
     assert split_df.id.min() == 54
     assert split_df.id.max() == 59
+
+
+def test_get_batch_data_with_chunksize(tmp_path):
+    path = str(tmp_path / "data.csv")
+    pd.DataFrame({"a": range(10)}).to_csv(path, index=False)
+
+    batch_data = PandasExecutionEngine().get_batch_data(
+        PathBatchSpec(
+            path=path,
+            chunksize=4,
+            sampling_method="_sample_using_mod",
+            sampling_kwargs={"column_name": "a", "mod": 2, "value": 0},
+        )
+    )
+    assert isinstance(batch_data, ChunkedPandasBatchData)
+    # The batch can be read any number of times, and is sampled chunk by chunk
+    for _ in range(2):
+        assert [list(chunk["a"]) for chunk in batch_data] == [[0, 2], [4, 6], [8]]
+
+    with pytest.raises(ge_exceptions.BatchSpecError):
+        PandasExecutionEngine().get_batch_data(
+            PathBatchSpec(
+                path=path,
+                chunksize=4,
+                sampling_method="_sample_using_limit",
+                sampling_kwargs={"n": 5},
+            )
+        )
+
+
+def test_get_batch_data_with_columns(tmp_path):
+    df = pd.DataFrame({"a": [1, 2, 3], "b": [4, 5, 6], "c": [1, 1, 2], "d": [7, 8, 9]})
+    df.to_csv(tmp_path / "data.csv", index=False)
+    df.to_json(tmp_path / "data.json")
+
+    # The columns used to split the batch are loaded too, while missing columns are ignored
+    for path in [tmp_path / "data.csv", tmp_path / "data.json"]:
+        batch_data = PandasExecutionEngine().get_batch_data(
+            PathBatchSpec(
+                path=str(path),
+                columns=["b", "a", "e"],
+                splitter_method="_split_on_column_value",
+                splitter_kwargs={
+                    "column_name": "c",
+                    "partition_definition": {"c": 1},
+                },
+            )
+        )
+        assert list(batch_data.columns) == ["a", "b", "c"]
+        assert list(batch_data["a"]) == [1, 2]
+
+    # Reader options set explicitly take precedence
+    batch_data = PandasExecutionEngine().get_batch_data(
+        PathBatchSpec(
+            path=str(tmp_path / "data.csv"),
+            columns=["a"],
+            reader_options={"usecols": ["a", "d"]},
+        )
+    )
+    assert list(batch_data.columns) == ["a", "d"]
+
+
+def test_get_batch_data_with_columns_missing_from_columnar_file(tmp_path):
+    pytest.importorskip("pyarrow")
+    df = pd.DataFrame({"a": [1, 2, 3], "b": [4, 5, 6], "c": [1, 1, 2]})
+    df.to_parquet(tmp_path / "data.parquet")
+    df.to_feather(tmp_path / "data.feather")
+    df.to_orc(tmp_path / "data.orc")
+
+    # Columns missing from the schema of the file are not requested from the reader
+    for path, reader_method in [
+        ("data.parquet", "read_parquet"),
+        ("data.feather", "read_feather"),
+        ("data.orc", "read_orc"),
+    ]:
+        for dtype_backend in ["numpy", "pyarrow"]:
+            engine = PandasExecutionEngine(dtype_backend=dtype_backend)
+            batch_data = engine.get_batch_data(
+                PathBatchSpec(
+                    path=str(tmp_path / path),
+                    reader_method=reader_method,
+                    columns=["b", "a", "e"],
+                )
+            )
+            assert sorted(batch_data.columns) == ["a", "b"]
+            assert list(batch_data["a"]) == [1, 2, 3]
+
+
+def test_get_batch_data_with_row_condition(tmp_path):
+    df = pd.DataFrame({"region": ["EU", "US", "EU", "APAC"], "a": [1, 2, 3, 4]})
+    df.to_csv(tmp_path / "data.csv", index=False)
+    df.to_parquet(tmp_path / "data.parquet", row_group_size=2)
+
+    for path in [tmp_path / "data.csv", tmp_path / "data.parquet"]:
+        batch_data, batch_markers = PandasExecutionEngine().get_batch_data_and_markers(
+            PathBatchSpec(
+                path=str(path),
+                row_condition='region == "EU" and a != 2',
+                condition_parser="pandas",
+            )
+        )
+        assert list(batch_data["a"]) == [1, 3]
+        if path.suffix == ".parquet":
+            # Only the comparisons that hold for nulls as they do in pandas are pushed down
+            assert batch_markers["pushed_down_filters"] == [[["region", "==", "EU"]]]
+        else:
+            assert "pushed_down_filters" not in batch_markers
+
+    with pytest.raises(ge_exceptions.BatchSpecError):
+        PandasExecutionEngine().get_batch_data(
+            PathBatchSpec(
+                path=str(tmp_path / "data.csv"), row_condition='region == "EU"'
+            )
+        )
+
+
+def test_get_batch_data_with_row_condition_of_literals_mismatching_parquet_schema(
+    tmp_path,
+):
+    pytest.importorskip("pyarrow")
+    df = pd.DataFrame(
+        {
+            "ts": pd.to_datetime(["2020-01-01", "2020-07-01", "2020-08-01"]),
+            "a": [1, 2, 3],
+            "region": ["EU", "US", "EU"],
+        }
+    )
+    df.to_parquet(tmp_path / "data.parquet")
+
+    # Comparisons that pyarrow would refuse are left out of the filters, and the row_condition is applied in pandas
+    for row_condition, expected_a, expected_filters in [
+        ("ts > '2020-06-01'", [2, 3], None),
+        ("a == '2'", [], None),
+        ("a == '2' and region == 'EU'", [], [[["region", "==", "EU"]]]),
+        ("a > 1 and ts > '2020-06-01'", [2, 3], [[["a", ">", 1]]]),
+    ]:
+        batch_data, batch_markers = PandasExecutionEngine().get_batch_data_and_markers(
+            PathBatchSpec(
+                path=str(tmp_path / "data.parquet"),
+                row_condition=row_condition,
+                condition_parser="pandas",
+            )
+        )
+        assert list(batch_data["a"]) == expected_a
+        assert batch_markers.get("pushed_down_filters") == expected_filters
+
+
+def test_get_batch_data_with_pyarrow_dtype_backend(tmp_path):
+    pa = pytest.importorskip("pyarrow")
+    df = pd.DataFrame({"a": [1, 2, None], "b": ["x", "yy", None]})
+    df.to_csv(tmp_path / "data.csv", index=False)
+    df.to_parquet(tmp_path / "data.parquet")
+
+    engine = PandasExecutionEngine(dtype_backend="pyarrow")
+    for batch_spec in [
+        PathBatchSpec(path=str(tmp_path / "data.parquet")),
+        PathBatchSpec(path=str(tmp_path / "data.csv")),
+        RuntimeDataBatchSpec(batch_data=pa.Table.from_pandas(df)),
+    ]:
+        batch_data = engine.get_batch_data(batch_spec)
+        assert all(isinstance(dtype, pd.ArrowDtype) for dtype in batch_data.dtypes)
+        assert batch_data["b"].tolist()[:2] == ["x", "yy"]
+
+    # The dtype_backend of a batch_spec overrides the one of the engine
+    batch_data = PandasExecutionEngine().get_batch_data(
+        PathBatchSpec(path=str(tmp_path / "data.parquet"), dtype_backend="pyarrow")
+    )
+    assert isinstance(batch_data["a"].dtype, pd.ArrowDtype)
+
+    with pytest.raises(ge_exceptions.InvalidConfigError):
+        PandasExecutionEngine(dtype_backend="arrow")
+
+
+def test_get_batch_data_from_memory_mapped_batch_spec(tmp_path):
+    pa = pytest.importorskip("pyarrow")
+    df = pd.DataFrame({"a": range(100000), "b": ["x", "yy"] * 50000})
+    batch_spec = PandasExecutionEngine.convert_to_memory_mapped_batch_spec(
+        RuntimeDataBatchSpec(
+            batch_data=df,
+            sampling_method="_sample_using_mod",
+            sampling_kwargs={"column_name": "a", "mod": 2, "value": 0},
+        ),
+        path=str(tmp_path / "data.arrow"),
+    )
+    assert isinstance(batch_spec, PathBatchSpec)
+    assert batch_spec.memory_map
+    assert batch_spec["sampling_method"] == "_sample_using_mod"
+    assert "batch_data" not in batch_spec
+    assert os.listdir(tmp_path) == ["data.arrow"]
+
+    batch_data = PandasExecutionEngine().get_batch_data(batch_spec)
+    assert isinstance(batch_data["b"].dtype, pd.ArrowDtype)
+    assert batch_data["a"].tolist() == list(range(0, 100000, 2))
+
+    allocated_bytes = pa.total_allocated_bytes()
+    batch_data = PandasExecutionEngine().get_batch_data(
+        PathBatchSpec(path=str(tmp_path / "data.arrow"), memory_map=True)
+    )
+    # The columns refer to the mapped file rather than to memory allocated by pyarrow
+    assert pa.total_allocated_bytes() - allocated_bytes < df.memory_usage().sum() / 10
+    assert batch_data["b"].tolist() == df["b"].tolist()
+
+    with pytest.raises(ge_exceptions.BatchSpecError):
+        PandasExecutionEngine().get_batch_data(
+            PathBatchSpec(
+                path=str(tmp_path / "data.arrow"),
+                reader_method="read_feather",
+                reader_options={"use_threads": False},
+                memory_map=True,
+            )
+        )
+
+
+def test_get_batch_data_and_markers_with_sampled_fingerprint(tmp_path, monkeypatch):
+    path = tmp_path / "data.csv"
+    pd.DataFrame({"a": [1, 2, 3]}).to_csv(path, index=False)
+    _, batch_markers = PandasExecutionEngine().get_batch_data_and_markers(
+        PathBatchSpec(path=str(path))
+    )
+    assert "pandas_data_fingerprint_sampled" not in batch_markers
+
+    # Batches whose size exceeds the threshold are fingerprinted by a sample of their rows and the file metadata
+    monkeypatch.setattr(
+        "great_expectations.execution_engine.pandas_execution_engine.HASH_THRESHOLD", 0
+    )
+    _, sampled_batch_markers = PandasExecutionEngine().get_batch_data_and_markers(
+        PathBatchSpec(path=str(path))
+    )
+    assert sampled_batch_markers["pandas_data_fingerprint_sampled"]
+    assert (
+        sampled_batch_markers["pandas_data_fingerprint"]
+        != batch_markers["pandas_data_fingerprint"]
+    )
+
+    os.utime(path, ns=(0, 0))
+    _, touched_batch_markers = PandasExecutionEngine().get_batch_data_and_markers(
+        PathBatchSpec(path=str(path))
+    )
+    assert (
+        touched_batch_markers["pandas_data_fingerprint"]
+        != sampled_batch_markers["pandas_data_fingerprint"]
+    )
+
+
+def test_load_modified_large_runtime_batch_without_fingerprint(monkeypatch):
+    monkeypatch.setattr(
+        "great_expectations.execution_engine.pandas_execution_engine.HASH_THRESHOLD", 0
+    )
+    df = pd.DataFrame({"a": np.arange(1000000)})
+    engine = PandasExecutionEngine()
+    metric = MetricConfiguration(
+        metric_name="column.min",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs=dict(),
+    )
+
+    def load_and_resolve_min(batch_data):
+        batch_data, batch_markers = engine.get_batch_data_and_markers(
+            RuntimeDataBatchSpec(batch_data=batch_data)
+        )
+        # A sample of the rows of an in-memory DataFrame does not identify its data
+        assert "pandas_data_fingerprint" not in batch_markers
+        engine.load_batch_data("runtime", batch_data, batch_markers=batch_markers)
+        return engine.resolve_metrics(metrics_to_resolve=(metric,))[metric.id]
+
+    assert load_and_resolve_min(df) == 0
+    modified_df = df.copy()
+    modified_df.loc[500000, "a"] = -1
+    assert load_and_resolve_min(modified_df) == -1
+
+
+def _validate_path_batch_spec(batch_spec, configurations, runtime_configuration=None):
+    execution_engine = PandasExecutionEngine()
+    batch_data, batch_markers = execution_engine.get_batch_data_and_markers(
+        batch_spec
+    )
+    validator = Validator(
+        execution_engine=execution_engine,
+        batches=[
+            Batch(data=batch_data, batch_markers=batch_markers, batch_spec=batch_spec)
+        ],
+    )
+    return [
+        result.to_json_dict()["result"]
+        for result in validator.graph_validate(
+            configurations=configurations, runtime_configuration=runtime_configuration
+        )
+    ]
+
+
+def test_validate_batch_with_chunksize_matches_whole_batch(tmp_path):
+    random_state = np.random.RandomState(0)
+    df = pd.DataFrame(
+        {
+            "a": random_state.normal(size=1000),
+            "b": random_state.choice(["x", "y", "z", None], size=1000),
+            "c": np.arange(1000),
+        }
+    )
+    df.loc[500, "a"] = np.nan
+    path = str(tmp_path / "data.csv")
+    df.to_csv(path, index=False)
+
+    configurations = [
+        ExpectationConfiguration(
+            expectation_type="expect_table_row_count_to_equal",
+            kwargs={"value": 1000},
+        ),
+        ExpectationConfiguration(
+            expectation_type="expect_table_columns_to_match_ordered_list",
+            kwargs={"column_list": ["a", "b", "c"]},
+        ),
+        ExpectationConfiguration(
+            expectation_type="expect_column_stdev_to_be_between",
+            kwargs={"column": "a", "min_value": 0, "max_value": 2},
+        ),
+        ExpectationConfiguration(
+            expectation_type="expect_column_max_to_be_between",
+            kwargs={"column": "c", "min_value": 0, "max_value": 2000},
+        ),
+        ExpectationConfiguration(
+            expectation_type="expect_column_median_to_be_between",
+            kwargs={"column": "c", "min_value": 0, "max_value": 2000},
+        ),
+        ExpectationConfiguration(
+            expectation_type="expect_column_quantile_values_to_be_between",
+            kwargs={
+                "column": "c",
+                "quantile_ranges": {
+                    "quantiles": [0.1, 0.5, 0.9],
+                    "value_ranges": [[0, 1000], [0, 1000], [0, 1000]],
+                },
+            },
+        ),
+        ExpectationConfiguration(
+            expectation_type="expect_column_unique_value_count_to_be_between",
+            kwargs={"column": "b", "min_value": 0, "max_value": 3},
+        ),
+        ExpectationConfiguration(
+            expectation_type="expect_column_distinct_values_to_be_in_set",
+            kwargs={"column": "b", "value_set": ["x", "y", "z"]},
+        ),
+        ExpectationConfiguration(
+            expectation_type="expect_column_values_to_not_be_null",
+            kwargs={"column": "a"},
+        ),
+        ExpectationConfiguration(
+            expectation_type="expect_column_values_to_be_in_set",
+            kwargs={
+                "column": "b",
+                "value_set": ["x", "y"],
+                "result_format": "COMPLETE",
+            },
+        ),
+        ExpectationConfiguration(
+            expectation_type="expect_column_values_to_be_between",
+            kwargs={
+                "column": "c",
+                "min_value": 0,
+                "max_value": 900,
+                "row_condition": 'b=="x"',
+                "condition_parser": "pandas",
+                "result_format": "COMPLETE",
+            },
+        ),
+    ]
+    whole_batch_results = _validate_path_batch_spec(
+        PathBatchSpec(path=path), configurations
+    )
+    chunked_batch_results = _validate_path_batch_spec(
+        PathBatchSpec(path=path, chunksize=128), configurations
+    )
+
+    assert chunked_batch_results == whole_batch_results
+
+
+def test_validate_batch_with_chunksize_reads_batch_once_per_graph_level(
+    tmp_path, monkeypatch
+):
+    df = pd.DataFrame(
+        {
+            "a": np.arange(1000.0),
+            "b": np.random.RandomState(0).choice(["x", "y", None], size=1000),
+            "c": np.arange(1000),
+        }
+    )
+    path = str(tmp_path / "data.csv")
+    df.to_csv(path, index=False)
+    passes = []
+    iterate_chunks = ChunkedPandasBatchData.__iter__
+
+    def count_passes(batch_data):
+        passes.append(batch_data)
+        return iterate_chunks(batch_data)
+
+    monkeypatch.setattr(ChunkedPandasBatchData, "__iter__", count_passes)
+
+    configurations = [
+        ExpectationConfiguration(
+            expectation_type="expect_table_row_count_to_equal",
+            kwargs={"value": 1000},
+        ),
+        ExpectationConfiguration(
+            expectation_type="expect_column_max_to_be_between",
+            kwargs={"column": "c", "min_value": 0, "max_value": 2000},
+        ),
+        ExpectationConfiguration(
+            expectation_type="expect_column_mean_to_be_between",
+            kwargs={"column": "a", "min_value": 0, "max_value": 2000},
+        ),
+        ExpectationConfiguration(
+            expectation_type="expect_column_values_to_not_be_null",
+            kwargs={"column": "b"},
+        ),
+        ExpectationConfiguration(
+            expectation_type="expect_column_values_to_be_in_set",
+            kwargs={"column": "b", "value_set": ["x"]},
+        ),
+    ]
+    batch_spec = PathBatchSpec(path=path, chunksize=128)
+    results = _validate_path_batch_spec(batch_spec, configurations)
+    # The metrics of a level of the validation graph are computed in a single pass over the chunks
+    assert len(passes) == 2
+
+    # Passes resolved concurrently over the same batch each read their own chunks
+    assert (
+        _validate_path_batch_spec(
+            batch_spec, configurations, runtime_configuration={"max_workers": 4}
+        )
+        == results
+    )
+    assert results == _validate_path_batch_spec(
+        PathBatchSpec(path=path), configurations
+    )
+
+
+def test_resolve_quantiles_with_chunksize_beyond_sketch_capacity(tmp_path):
+    path = str(tmp_path / "data.csv")
+    pd.DataFrame({"a": np.arange(10000)}).to_csv(path, index=False)
+    engine = PandasExecutionEngine()
+    engine.load_batch_data(
+        "chunked", engine.get_batch_data(PathBatchSpec(path=path, chunksize=1000))
+    )
+
+    def resolve_quantiles(metric_name, **metric_value_kwargs):
+        metric = MetricConfiguration(
+            metric_name=metric_name,
+            metric_domain_kwargs={"column": "a"},
+            metric_value_kwargs=metric_value_kwargs,
+        )
+        return engine.resolve_metrics(metrics_to_resolve=(metric,))[metric.id]
+
+    # The sketch cannot hold every value, so quantiles are only estimated
+    with pytest.raises(ge_exceptions.GreatExpectationsError):
+        resolve_quantiles("column.quantile_values", quantiles=[0.5])
+    with pytest.raises(ge_exceptions.GreatExpectationsError):
+        resolve_quantiles("column.median")
+
+    quartiles = resolve_quantiles(
+        "column.quantile_values", quantiles=[0.25, 0.75], allow_relative_error=0.01
+    )
+    assert abs(quartiles[0] - 2500) <= 100
+    assert abs(quartiles[1] - 7500) <= 100
+
+
+def test_resolve_metrics_with_chunksize_rejects_conditions_spanning_rows(tmp_path):
+    path = str(tmp_path / "data.csv")
+    pd.DataFrame({"a": [1, 2, 1, 3]}).to_csv(path, index=False)
+    engine = PandasExecutionEngine()
+    engine.load_batch_data(
+        "chunked", engine.get_batch_data(PathBatchSpec(path=path, chunksize=2))
+    )
+
+    with pytest.raises(ge_exceptions.GreatExpectationsError):
+        engine.resolve_metrics(
+            metrics_to_resolve=(
+                MetricConfiguration(
+                    metric_name="column_values.unique.condition",
+                    metric_domain_kwargs={"column": "a"},
+                    metric_value_kwargs=dict(),
+                ),
+            )
+        )
@@ -9,6 +9,7 @@ import pytest
 
 import great_expectations.exceptions.exceptions as ge_exceptions
 from great_expectations.core.batch import Batch
+from great_expectations.core.expectation_configuration import ExpectationConfiguration
 from great_expectations.datasource.types.batch_spec import (
     PathBatchSpec,
     RuntimeDataBatchSpec,
@@ -26,6 +27,7 @@ from great_expectations.expectations.metrics import (
     ColumnValuesZScore,
 )
 from great_expectations.validator.validation_graph import MetricConfiguration
+from tests.test_utils import _build_spark_validator_with_data
 
 try:
     pyspark = pytest.importorskip("pyspark")
@@ -276,6 +278,23 @@ def test_get_batch_empty_splitter(test_folder_connection_path_csv):
     assert len(test_sparkdf.columns) == 2
 
 
+def test_get_batch_with_columns(test_folder_connection_path_csv):
+    test_sparkdf = SparkDFExecutionEngine().get_batch_data(
+        PathBatchSpec(
+            path=os.path.join(test_folder_connection_path_csv, "test.csv"),
+            reader_options={"header": True},
+            columns=["col_2", "col_3"],
+            splitter_method="_split_on_column_value",
+            splitter_kwargs={
+                "column_name": "col_1",
+                "partition_definition": {"col_1": "2"},
+            },
+        )
+    )
+    assert test_sparkdf.count() == 1
+    assert test_sparkdf.columns == ["col_2"]
+
+
 def test_get_batch_empty_splitter_tsv(test_folder_connection_path_tsv):
     # reader_method not configured because spark will configure own reader by default
     # reader_options are needed to specify the fact that the first line of test file is the header
@@ -1138,6 +1157,117 @@ def test_resolve_metric_bundle_with_nonexistent_metric():
         print(e)
 
 
+# Ensuring that the unexpected outputs of map metrics on the same domain are collected together, with the same
+# results as when they are collected one by one
+def test_resolve_unexpected_output_bundle(caplog, spark_session):
+    caplog.set_level(logging.DEBUG, logger="great_expectations")
+    engine = _build_spark_engine(
+        spark_session,
+        pd.DataFrame({"a": [1, 4, 2, 5, 4, 6], "b": [3, 3, 7, 3, 8, 8]}),
+    )
+    result_format = {"result_format": "SUMMARY", "partial_unexpected_count": 2}
+    conditions = {
+        column: MetricConfiguration(
+            metric_name="column_values.in_set.condition",
+            metric_domain_kwargs={"column": column},
+            metric_value_kwargs={"value_set": [1, 2, 3]},
+        )
+        for column in ["a", "b"]
+    }
+    metrics = engine.resolve_metrics(metrics_to_resolve=conditions.values())
+
+    desired_metrics = [
+        MetricConfiguration(
+            metric_name=f"column_values.in_set.{unexpected_output}",
+            metric_domain_kwargs={"column": column},
+            metric_value_kwargs={
+                "value_set": [1, 2, 3],
+                "result_format": result_format,
+            },
+            metric_dependencies={"unexpected_condition": conditions[column]},
+        )
+        for column in ["a", "b"]
+        for unexpected_output in [
+            "unexpected_values",
+            "unexpected_rows",
+            "unexpected_value_counts",
+        ]
+    ]
+    results = engine.resolve_metrics(
+        metrics_to_resolve=desired_metrics, metrics=metrics
+    )
+    assert (
+        "SparkDFExecutionEngine collected 6 unexpected outputs on domain_id"
+        in caplog.text
+    )
+
+    values_a, rows_a, value_counts_a, values_b, rows_b, value_counts_b = [
+        results[desired_metric.id] for desired_metric in desired_metrics
+    ]
+    assert values_a == [4, 5]
+    assert [row.asDict() for row in rows_a] == [{"a": 4, "b": 3}, {"a": 5, "b": 3}]
+    assert value_counts_a[0].asDict() == {"a": 4, "count": 2}
+    assert len(value_counts_a) == 2
+    assert values_b == [7, 8]
+    assert [row.asDict() for row in rows_b] == [{"a": 2, "b": 7}, {"a": 4, "b": 8}]
+    assert value_counts_b[0].asDict() == {"b": 8, "count": 2}
+    assert len(value_counts_b) == 2
+
+    # A metric alone on its domain is collected by its own metric function
+    separate_engine = _build_spark_engine(
+        spark_session,
+        pd.DataFrame({"a": [1, 4, 2, 5, 4, 6], "b": [3, 3, 7, 3, 8, 8]}),
+    )
+    metrics = separate_engine.resolve_metrics(metrics_to_resolve=conditions.values())
+    separate_results = separate_engine.resolve_metrics(
+        metrics_to_resolve=desired_metrics[:1], metrics=metrics
+    )
+    assert separate_results[desired_metrics[0].id] == values_a
+
+
+# Ensuring that the unexpected outputs of map metrics over different compute domains of the same dataframe are
+# collected together when validating
+def test_graph_validate_bundles_unexpected_outputs_across_domains(caplog):
+    validator = _build_spark_validator_with_data(
+        pd.DataFrame(
+            {
+                "a": ["x", "y", None, "z", "y", "w"],
+                "b": ["p", "q", "q", None, "r", "r"],
+            }
+        )
+    )
+    configurations = [
+        ExpectationConfiguration(
+            expectation_type="expect_column_values_to_be_in_set",
+            kwargs={"column": "a", "value_set": ["x"]},
+        ),
+        ExpectationConfiguration(
+            expectation_type="expect_column_values_to_be_in_set",
+            kwargs={
+                "column": "b",
+                "value_set": ["p"],
+                "row_condition": "a IS NOT NULL",
+                "condition_parser": "spark",
+            },
+        ),
+    ]
+    caplog.set_level(logging.DEBUG, logger="great_expectations")
+    results = validator.graph_validate(configurations=configurations)
+
+    collected_messages = [
+        record.message
+        for record in caplog.records
+        if record.message.startswith("SparkDFExecutionEngine collected")
+    ]
+    assert len(collected_messages) == 1
+    assert collected_messages[0].startswith(
+        "SparkDFExecutionEngine collected 2 unexpected outputs on domain_id"
+    )
+    result_a, result_b = [result.result for result in results]
+    assert result_a["partial_unexpected_list"] == ["y", "z", "y", "w"]
+    assert result_b["partial_unexpected_list"] == ["q", "r", "r"]
+
+
 # Making sure dataframe property is functional
 def test_dataframe_property_given_loaded_batch():
     from pyspark.sql import SparkSession
@@ -1153,3 +1283,34 @@ def test_dataframe_property_given_loaded_batch():
 
     # Ensuring Data not distorted
     assert engine.dataframe == df
+
+
+def test_loaded_batches_are_persisted_until_released(spark_session, test_sparkdf):
+    engine = SparkDFExecutionEngine(persist="memory_only")
+    batch_data = engine.get_batch_data(
+        RuntimeDataBatchSpec(batch_data=test_sparkdf.select("*"))
+    )
+    engine.load_batch_data(batch_id="1234", batch_data=batch_data)
+    assert engine.persisted_batch_ids == ["1234"]
+    assert engine.dataframe.storageLevel == pyspark.StorageLevel.MEMORY_ONLY
+
+    # Released batches stay loaded, and are persisted again when they are next used
+    engine.release_resources()
+    assert engine.persisted_batch_ids == []
+    assert not engine.dataframe.is_cached
+    engine.get_compute_domain(domain_kwargs={}, domain_type="table")
+    assert engine.persisted_batch_ids == ["1234"]
+
+    engine.unload_batch_data("1234")
+    assert engine.persisted_batch_ids == []
+    assert not batch_data.is_cached
+
+    # DataFrames already cached by the caller are neither persisted nor unpersisted by the engine
+    cached_df = test_sparkdf.cache()
+    engine.load_batch_data(batch_id="5678", batch_data=cached_df)
+    assert engine.persisted_batch_ids == []
+    engine.unload_batch_data("5678")
+    assert cached_df.is_cached
+
+    with pytest.raises(ge_exceptions.ExecutionEngineError):
+        SparkDFExecutionEngine(persist="not_a_storage_level")
@@ -1,16 +1,19 @@
 import logging
 import os
+from typing import List
 
 import pandas as pd
 import pytest
 
 from great_expectations.core.batch import Batch, BatchSpec
+from great_expectations.core.id_dict import IDDict
 from great_expectations.data_context.util import file_relative_path
 from great_expectations.exceptions import GreatExpectationsError
 from great_expectations.exceptions.exceptions import InvalidConfigError
 from great_expectations.exceptions.metric_exceptions import MetricProviderError
 from great_expectations.execution_engine.execution_engine import MetricDomainTypes
 from great_expectations.execution_engine.sqlalchemy_execution_engine import (
+    SqlAlchemyBatchData,
     SqlAlchemyExecutionEngine,
 )
 from great_expectations.expectations.metrics import (
@@ -20,6 +23,7 @@ from great_expectations.expectations.metrics import (
     ColumnValuesZScore,
 )
 from great_expectations.validator.validation_graph import MetricConfiguration
+from great_expectations.validator.validator import Validator
 
 # Function to test for spark dataframe equality
 from tests.test_utils import _build_sa_engine
@@ -192,6 +196,335 @@ def test_sa_batch_aggregate_metrics(caplog, sa):
     assert found_message
 
 
+def _resolve_in_set_unexpected_counts_and_mean(caplog, sa, **engine_kwargs):
+    eng = sa.create_engine("sqlite://", echo=False)
+    pd.DataFrame({"a": [1, 2, None, 5, 5], "b": [None, 1, 1, 4, None]}).to_sql(
+        "test", eng
+    )
+    batch_data = SqlAlchemyBatchData(engine=eng, table_name="test")
+    engine = SqlAlchemyExecutionEngine(
+        engine=eng, batch_data_dict={"my_id": batch_data}, **engine_kwargs
+    )
+
+    metrics = dict()
+    partial_metrics = []
+    for column, value_set in [("a", [1, 2]), ("b", [1])]:
+        condition = MetricConfiguration(
+            metric_name="column_values.in_set.condition",
+            metric_domain_kwargs={"column": column},
+            metric_value_kwargs={"value_set": value_set},
+        )
+        partial_metrics.append(
+            MetricConfiguration(
+                metric_name="column_values.in_set.unexpected_count.aggregate_fn",
+                metric_domain_kwargs={"column": column},
+                metric_value_kwargs={"value_set": value_set},
+                metric_dependencies={"unexpected_condition": condition},
+            )
+        )
+        metrics.update(engine.resolve_metrics(metrics_to_resolve=(condition,)))
+    partial_metrics.append(
+        MetricConfiguration(
+            metric_name="column.mean.aggregate_fn",
+            metric_domain_kwargs={"column": "a"},
+            metric_value_kwargs=dict(),
+        )
+    )
+    metrics.update(
+        engine.resolve_metrics(
+            metrics_to_resolve=tuple(partial_metrics), metrics=metrics
+        )
+    )
+    desired_metrics = [
+        MetricConfiguration(
+            metric_name=partial_metric.metric_name[: -len(".aggregate_fn")],
+            metric_domain_kwargs=partial_metric.metric_domain_kwargs,
+            metric_value_kwargs=partial_metric.metric_value_kwargs,
+            metric_dependencies={"metric_partial_fn": partial_metric},
+        )
+        for partial_metric in partial_metrics
+    ]
+
+    caplog.set_level(logging.DEBUG, logger="great_expectations")
+    caplog.clear()
+    res = engine.resolve_metrics(
+        metrics_to_resolve=tuple(desired_metrics), metrics=metrics
+    )
+    return [res[desired_metric.id] for desired_metric in desired_metrics]
+
+
+def _get_bundle_log_messages(caplog) -> List[str]:
+    """Returns the messages logged while resolving a metric bundle, with the timing of every statement masked."""
+    return [
+        "SqlAlchemyExecutionEngine executed a bundle query"
+        if record.message.startswith(
+            "SqlAlchemyExecutionEngine executed a bundle query"
+        )
+        else record.message
+        for record in caplog.records
+    ]
+
+
+def test_sa_batch_aggregate_metrics_fuses_conditional_domains(caplog, sa):
+    assert _resolve_in_set_unexpected_counts_and_mean(caplog, sa) == [2, 1, 3.25]
+    # The aggregates over the null-filtered domains are computed alongside the unconditional one
+    assert _get_bundle_log_messages(caplog) == [
+        "SqlAlchemyExecutionEngine executed a bundle query",
+        "SqlAlchemyExecutionEngine computed 3 metrics on domain_id ()",
+    ]
+
+    assert _resolve_in_set_unexpected_counts_and_mean(
+        caplog, sa, max_bundle_select_width=2
+    ) == [2, 1, 3.25]
+    assert _get_bundle_log_messages(caplog) == [
+        "SqlAlchemyExecutionEngine executed a bundle query",
+        "SqlAlchemyExecutionEngine executed a bundle query",
+        "SqlAlchemyExecutionEngine computed 2 metrics on domain_id ()",
+        "SqlAlchemyExecutionEngine computed 1 metrics on domain_id ()",
+    ]
+
+
+def _resolve_per_batch(caplog, engine, batch_ids, metric_name="column.max"):
+    desired_metrics = []
+    for batch_id in batch_ids:
+        partial_metric = MetricConfiguration(
+            metric_name=f"{metric_name}.aggregate_fn",
+            metric_domain_kwargs={"column": "a", "batch_id": batch_id},
+            metric_value_kwargs=dict(),
+        )
+        desired_metrics.append(
+            MetricConfiguration(
+                metric_name=metric_name,
+                metric_domain_kwargs={"column": "a", "batch_id": batch_id},
+                metric_value_kwargs=dict(),
+                metric_dependencies={"metric_partial_fn": partial_metric},
+            )
+        )
+    metrics = engine.resolve_metrics(
+        metrics_to_resolve=tuple(
+            metric.metric_dependencies["metric_partial_fn"]
+            for metric in desired_metrics
+        )
+    )
+
+    caplog.set_level(logging.DEBUG, logger="great_expectations")
+    caplog.clear()
+    res = engine.resolve_metrics(
+        metrics_to_resolve=tuple(desired_metrics), metrics=metrics
+    )
+    return [res[desired_metric.id] for desired_metric in desired_metrics]
+
+
+def test_sa_batch_aggregate_metrics_with_concurrent_queries(caplog, sa, tmp_path):
+    eng = sa.create_engine(f"sqlite:///{tmp_path / 'concurrent_queries.db'}")
+    pd.DataFrame({"a": [1, 2, 3]}).to_sql("test_1", eng, index=False)
+    pd.DataFrame({"a": [4, 5, 6]}).to_sql("test_2", eng, index=False)
+    engine = SqlAlchemyExecutionEngine(
+        engine=eng,
+        batch_data_dict={
+            "batch_1": SqlAlchemyBatchData(engine=eng, table_name="test_1"),
+            "batch_2": SqlAlchemyBatchData(engine=eng, table_name="test_2"),
+        },
+        max_concurrent_queries=2,
+    )
+    # sqlite engines are bound to a single connection, so the bundle queries are executed serially
+    assert not isinstance(engine.engine, sa.engine.Engine)
+    assert _resolve_per_batch(caplog, engine, ["batch_1", "batch_2"]) == [3, 6]
+    assert _get_bundle_log_messages(caplog) == [
+        "SqlAlchemyExecutionEngine is bound to a single connection: executing bundle queries serially",
+        "SqlAlchemyExecutionEngine executed a bundle query",
+        "SqlAlchemyExecutionEngine executed a bundle query",
+        "SqlAlchemyExecutionEngine computed 1 metrics on domain_id "
+        + IDDict({"batch_id": "batch_1"}).to_id(),
+        "SqlAlchemyExecutionEngine computed 1 metrics on domain_id "
+        + IDDict({"batch_id": "batch_2"}).to_id(),
+    ]
+
+
+def test_sa_batch_aggregate_metrics_with_concurrent_queries_on_pooled_engine(
+    caplog, sa, tmp_path
+):
+    # Every thread checks out its own connection, which is the only one that sees the temporary tables it creates
+    eng = sa.create_engine(
+        f"sqlite:///{tmp_path / 'concurrent_queries.db'}",
+        poolclass=sa.pool.SingletonThreadPool,
+    )
+    pd.DataFrame({"a": [1, 2, 3]}).to_sql("test_1", eng, index=False)
+    pd.DataFrame({"a": [4, 5, 6]}).to_sql("test_2", eng, index=False)
+    engine = SqlAlchemyExecutionEngine(engine=eng, max_concurrent_queries=2)
+    # Stand in for the pooled engine of a server dialect, on which each bundle query checks out its own connection
+    engine.engine = eng
+    engine.load_batch_data(
+        "batch_1", SqlAlchemyBatchData(engine=eng, table_name="test_1")
+    )
+    engine.load_batch_data(
+        "batch_2", SqlAlchemyBatchData(engine=eng, table_name="test_2")
+    )
+    assert _resolve_per_batch(caplog, engine, ["batch_1", "batch_2"]) == [3, 6]
+    messages = _get_bundle_log_messages(caplog)
+    assert "executing bundle queries serially" not in " ".join(messages)
+    assert messages.count("SqlAlchemyExecutionEngine executed a bundle query") == 2
+
+    # Temporary tables only exist within the connection that created them, so a bundle that selects from one is not
+    # spread across the pool
+    engine.load_batch_data(
+        "batch_3",
+        SqlAlchemyBatchData(
+            engine=eng, query="SELECT * FROM test_2", create_temp_table=True
+        ),
+    )
+    assert engine.loaded_batch_data_dict["batch_3"].temp_table_name is not None
+    assert _resolve_per_batch(
+        caplog, engine, ["batch_1", "batch_3"], metric_name="column.min"
+    ) == [1, 4]
+    assert _get_bundle_log_messages(caplog)[0] == (
+        "SqlAlchemyExecutionEngine bundle selects from a temporary table: executing bundle queries serially"
+    )
+
+
+def test_instantiation_with_invalid_max_concurrent_queries(sa):
+    with pytest.raises(InvalidConfigError):
+        SqlAlchemyExecutionEngine(
+            engine=sa.create_engine("sqlite://"), max_concurrent_queries=0
+        )
+
+
+def test_temp_table_policy(sa):
+    eng = sa.create_engine("sqlite://")
+    pd.DataFrame({"a": [1, 2, 3, 4], "b": [1, 1, 2, 2]}).to_sql(
+        "test", eng, index=False
+    )
+    engine = SqlAlchemyExecutionEngine(engine=eng)
+    assert engine.temp_table_policy == "auto"
+
+    # Splits are queried in place, while samples which could change between queries are materialized
+    split_batch_data, _ = engine.get_batch_data_and_markers(
+        BatchSpec(
+            table_name="test",
+            partition_definition={"b": 1},
+            splitter_method="_split_on_column_value",
+            splitter_kwargs={"column_name": "b"},
+        )
+    )
+    assert split_batch_data.temp_table_name is None
+    assert split_batch_data.row_count() == 2
+    sampled_batch_data, _ = engine.get_batch_data_and_markers(
+        BatchSpec(
+            table_name="test",
+            sampling_method="_sample_using_limit",
+            sampling_kwargs={"n": 3},
+        )
+    )
+    temp_table_name = sampled_batch_data.temp_table_name
+    assert temp_table_name.startswith("ge_tmp_")
+    assert sampled_batch_data.row_count() == 3
+
+    never_batch_data, _ = engine.get_batch_data_and_markers(
+        BatchSpec(
+            table_name="test",
+            sampling_method="_sample_using_limit",
+            sampling_kwargs={"n": 3},
+            temp_table_policy="never",
+        )
+    )
+    assert never_batch_data.temp_table_name is None
+    always_engine = SqlAlchemyExecutionEngine(engine=eng, temp_table_policy="always")
+    always_batch_data, _ = always_engine.get_batch_data_and_markers(
+        BatchSpec(table_name="test")
+    )
+    assert always_batch_data.temp_table_name.startswith("ge_tmp_")
+
+    # Temporary tables are dropped when their batch is unloaded
+    engine.load_batch_data(batch_id="sampled", batch_data=sampled_batch_data)
+    engine.load_batch_data(batch_id="also_sampled", batch_data=sampled_batch_data)
+    engine.unload_batch_data("sampled")
+    assert sampled_batch_data.temp_table_name == temp_table_name
+    engine.unload_batch_data("also_sampled")
+    assert sampled_batch_data.temp_table_name is None
+    assert temp_table_name not in sa.inspect(engine.engine).get_temp_table_names()
+
+    with pytest.raises(InvalidConfigError):
+        SqlAlchemyExecutionEngine(engine=eng, temp_table_policy="sometimes")
+
+
+def test_validate_releases_temp_tables(sa):
+    eng = sa.create_engine("sqlite://")
+    pd.DataFrame({"a": [1, 2, 3, 4]}).to_sql("test", eng, index=False)
+    engine = SqlAlchemyExecutionEngine(engine=eng)
+    batch_spec = BatchSpec(
+        table_name="test",
+        splitter_method="_split_on_whole_table",
+        splitter_kwargs={},
+        partition_definition={},
+        temp_table_policy="always",
+    )
+    batch_data, batch_markers = engine.get_batch_data_and_markers(batch_spec)
+    temp_table_name = batch_data.temp_table_name
+    validator = Validator(
+        execution_engine=engine,
+        batches=[
+            Batch(data=batch_data, batch_markers=batch_markers, batch_spec=batch_spec)
+        ],
+    )
+    assert validator.expect_column_max_to_be_between(
+        "a", min_value=4, max_value=4
+    ).success
+
+    # The temporary table is dropped once the validation is finished
+    assert validator.validate().success
+    assert batch_data.temp_table_name is None
+    assert temp_table_name not in sa.inspect(engine.engine).get_temp_table_names()
+
+    # and created again when metrics are next computed over the batch
+    assert validator.expect_column_min_to_be_between(
+        "a", min_value=1, max_value=1
+    ).success
+    assert batch_data.temp_table_name == temp_table_name
+    assert temp_table_name in sa.inspect(engine.engine).get_temp_table_names()
+
+
+def test_validate_keeps_temp_tables_of_random_samples(sa):
+    eng = sa.create_engine("sqlite://")
+    pd.DataFrame({"a": range(1000)}).to_sql("test", eng, index=False)
+    engine = SqlAlchemyExecutionEngine(engine=eng)
+    batch_spec = BatchSpec(
+        table_name="test",
+        sampling_method="_sample_using_random",
+        sampling_kwargs={"p": 0.5},
+    )
+    batch_data, batch_markers = engine.get_batch_data_and_markers(batch_spec)
+    temp_table_name = batch_data.temp_table_name
+    validator = Validator(
+        execution_engine=engine,
+        batches=[
+            Batch(data=batch_data, batch_markers=batch_markers, batch_spec=batch_spec)
+        ],
+    )
+    validator.expect_column_min_to_be_between("a", min_value=0)
+    validator.expect_column_max_to_be_between("a", max_value=1000)
+    validator.expect_table_row_count_to_be_between(min_value=0)
+
+    # The sample is not drawn again between validations, so that the metrics cached for the batch still hold for it
+    def get_observed_values():
+        return {
+            result.expectation_config.expectation_type: result.result["observed_value"]
+            for result in validator.validate().results
+        }
+
+    observed_values = get_observed_values()
+    assert batch_data.temp_table_name == temp_table_name
+    values = [
+        row[0]
+        for row in eng.execute(sa.select(["*"]).select_from(batch_data.selectable))
+    ]
+    assert observed_values == {
+        "expect_column_min_to_be_between": min(values),
+        "expect_column_max_to_be_between": max(values),
+        "expect_table_row_count_to_be_between": len(values),
+    }
+    assert get_observed_values() == observed_values
+
+
 # Ensuring functionality of compute_domain when no domain kwargs are given
 def test_get_compute_domain_with_no_domain_kwargs(sa):
     engine = _build_sa_engine(pd.DataFrame({"a": [1, 2, 3, 4], "b": [2, 3, 4, None]}))
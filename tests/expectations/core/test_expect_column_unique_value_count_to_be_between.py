@@ -0,0 +1,75 @@
+import pandas as pd
+
+from great_expectations.core.batch import Batch
+from great_expectations.core.expectation_configuration import ExpectationConfiguration
+from great_expectations.core.sketches import HyperLogLog
+from great_expectations.execution_engine import PandasExecutionEngine
+from great_expectations.execution_engine.sqlalchemy_execution_engine import (
+    SqlAlchemyBatchData,
+    SqlAlchemyExecutionEngine,
+)
+from great_expectations.validator.validator import Validator
+
+
+def _get_configurations():
+    return [
+        ExpectationConfiguration(
+            expectation_type="expect_column_unique_value_count_to_be_between",
+            kwargs={"column": "a", "min_value": 3, "max_value": 3},
+        ),
+        ExpectationConfiguration(
+            expectation_type="expect_column_proportion_of_unique_values_to_be_between",
+            kwargs={"column": "a", "min_value": 0.75, "max_value": 0.75},
+        ),
+    ]
+
+
+def test_expect_column_unique_value_count_to_be_between_approximate_pandas():
+    df = pd.DataFrame({"a": [1, 2, 2, 3, None]})
+    validator = Validator(
+        execution_engine=PandasExecutionEngine(), batches=[Batch(data=df)]
+    )
+
+    exact_results = validator.graph_validate(configurations=_get_configurations())
+    assert all(result.success for result in exact_results)
+    assert all("details" not in result.result for result in exact_results)
+
+    approximate_results = validator.graph_validate(
+        configurations=_get_configurations(),
+        runtime_configuration={"approximate": True},
+    )
+    assert [result.result["observed_value"] for result in approximate_results] == [
+        3,
+        0.75,
+    ]
+    for result in approximate_results:
+        assert result.success
+        assert result.result["details"] == {
+            "approximate": True,
+            "error_bound": {
+                "relative_standard_error": HyperLogLog().relative_standard_error
+            },
+        }
+
+
+def test_expect_column_unique_value_count_to_be_between_approximate_sa(sa):
+    eng = sa.create_engine("sqlite://")
+    pd.DataFrame({"a": [1, 2, 2, 3, None]}).to_sql("test", eng, index=False)
+    engine = SqlAlchemyExecutionEngine(engine=eng)
+    validator = Validator(
+        execution_engine=engine,
+        batches=[Batch(data=SqlAlchemyBatchData(engine=eng, table_name="test"))],
+    )
+
+    results = validator.graph_validate(
+        configurations=_get_configurations(),
+        runtime_configuration={"approximate": True},
+    )
+    assert [result.result["observed_value"] for result in results] == [3, 0.75]
+    # sqlite has no approximate aggregate function, so the count is exact
+    for result in results:
+        assert result.success
+        assert result.result["details"] == {
+            "approximate": True,
+            "error_bound": {"relative_standard_error": 0.0},
+        }
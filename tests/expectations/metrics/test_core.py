@@ -2,6 +2,7 @@ import logging
 
 import numpy as np
 import pandas as pd
+import pytest
 
 from great_expectations.core.batch import Batch
 from great_expectations.execution_engine import (
@@ -12,6 +13,10 @@ from great_expectations.execution_engine.sqlalchemy_execution_engine import (
     SqlAlchemyBatchData,
     SqlAlchemyExecutionEngine,
 )
+from great_expectations.expectations.metrics.util import (
+    get_quantile_aggregate,
+    is_redshift_dialect,
+)
 from great_expectations.expectations.registry import get_metric_provider
 from great_expectations.validator.validation_graph import MetricConfiguration
 
@@ -279,6 +284,68 @@ def test_map_column_value_lengths_between_pd():
     assert ser_expected_lengths.equals(result_series)
 
 
+def test_core_metrics_pd_with_arrow_dtypes():
+    pa = pytest.importorskip("pyarrow")
+    df = pd.DataFrame(
+        {"a": [1, 2, 3, 3, None], "b": ["foo", "bar", "bazz", None, "foo"]}
+    )
+    arrow_df = pa.Table.from_pandas(df).to_pandas(types_mapper=pd.ArrowDtype)
+    desired_metrics = [
+        MetricConfiguration("column.min", {"column": "a"}, dict()),
+        MetricConfiguration("column.max", {"column": "a"}, dict()),
+        MetricConfiguration("column.mean", {"column": "a"}, dict()),
+        MetricConfiguration(
+            "column_values.in_set.condition",
+            {"column": "b"},
+            {"value_set": ["foo", "bar"]},
+        ),
+        MetricConfiguration(
+            "column_values.match_regex.condition", {"column": "b"}, {"regex": "^ba"}
+        ),
+        MetricConfiguration("column_values.value_length.map", {"column": "b"}, dict()),
+    ]
+
+    results = _build_pandas_engine(df).resolve_metrics(desired_metrics)
+    arrow_results = _build_pandas_engine(arrow_df).resolve_metrics(desired_metrics)
+    for desired_metric in desired_metrics[:3]:
+        assert arrow_results[desired_metric.id] == results[desired_metric.id]
+    for desired_metric in desired_metrics[3:]:
+        assert list(arrow_results[desired_metric.id][0]) == list(
+            results[desired_metric.id][0]
+        )
+
+    value_counts = MetricConfiguration(
+        "column.value_counts", {"column": "b"}, {"sort": "value", "collate": None}
+    )
+    arrow_value_counts = _build_pandas_engine(arrow_df).resolve_metrics(
+        [value_counts]
+    )[value_counts.id]
+    assert arrow_value_counts.to_dict() == {"bar": 1, "bazz": 1, "foo": 2}
+
+
+def test_map_in_set_pd_with_arrow_dtypes_and_value_set_of_another_type():
+    pa = pytest.importorskip("pyarrow")
+    df = pd.DataFrame({"a": [1, 2, 3, None], "b": ["1", "2", "x", None]})
+    arrow_df = pa.Table.from_pandas(df).to_pandas(types_mapper=pd.ArrowDtype)
+
+    # The value_set is not cast to the type of the column, e.g. "2" is not found among integers, as with pandas
+    for column, value_set in [("a", ["2", "x"]), ("a", [2.0]), ("b", [1, 2])]:
+        for metric_name in [
+            "column_values.in_set.condition",
+            "column_values.not_in_set.condition",
+        ]:
+            desired_metric = MetricConfiguration(
+                metric_name, {"column": column}, {"value_set": value_set}
+            )
+            results = _build_pandas_engine(df).resolve_metrics([desired_metric])
+            arrow_results = _build_pandas_engine(arrow_df).resolve_metrics(
+                [desired_metric]
+            )
+            assert list(arrow_results[desired_metric.id][0]) == list(
+                results[desired_metric.id][0]
+            )
+
+
 def test_map_unique_pd():
     engine = _build_pandas_engine(pd.DataFrame({"a": [1, 2, 3, 3, None]}))
     desired_metric = MetricConfiguration(
@@ -291,6 +358,107 @@ def test_map_unique_pd():
     assert list(results[desired_metric.id][0]) == [False, False, True, True]
 
 
+def test_map_unique_pd_unexpected_outputs():
+    engine = _build_pandas_engine(
+        pd.DataFrame(
+            {
+                "a": [None, 1, 2, 3, 3, 4, 3],
+                "b": ["fish", "foo", "bar", "baz", "qux", "quux", "corge"],
+            }
+        )
+    )
+    condition_metric = MetricConfiguration(
+        metric_name="column_values.unique.condition",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs=dict(),
+    )
+    metrics = engine.resolve_metrics(metrics_to_resolve=(condition_metric,))
+
+    result_format = {"result_format": "BASIC", "partial_unexpected_count": 2}
+    output_metrics = {
+        name: MetricConfiguration(
+            metric_name="column_values.unique." + name,
+            metric_domain_kwargs={"column": "a"},
+            metric_value_kwargs={"result_format": result_format}
+            if name != "unexpected_count"
+            else dict(),
+            metric_dependencies={"unexpected_condition": condition_metric},
+        )
+        for name in (
+            "unexpected_count",
+            "unexpected_values",
+            "unexpected_index_list",
+            "unexpected_value_counts",
+            "unexpected_rows",
+        )
+    }
+    results = engine.resolve_metrics(
+        metrics_to_resolve=tuple(output_metrics.values()), metrics=metrics
+    )
+    assert results[output_metrics["unexpected_count"].id] == 3
+    assert results[output_metrics["unexpected_values"].id] == [3, 3]
+    # The index refers to rows of the unfiltered batch, null rows included
+    assert results[output_metrics["unexpected_index_list"].id] == [3, 4]
+    assert list(results[output_metrics["unexpected_value_counts"].id].items()) == [
+        (3, 3)
+    ]
+    assert list(results[output_metrics["unexpected_rows"].id]["b"]) == [
+        "baz",
+        "qux",
+    ]
+
+
+def test_map_conditions_pd_bundled_over_a_domain():
+    engine = _build_pandas_engine(
+        pd.DataFrame({"a": [None, 1, 2, 3, 4], "b": ["x", "y", None, "x", "z"]})
+    )
+    get_compute_domain_calls = []
+    get_compute_domain = engine.get_compute_domain
+
+    def recording_get_compute_domain(domain_kwargs, *args, **kwargs):
+        get_compute_domain_calls.append(domain_kwargs.get("column"))
+        return get_compute_domain(domain_kwargs, *args, **kwargs)
+
+    engine.get_compute_domain = recording_get_compute_domain
+    condition_metrics = [
+        MetricConfiguration(
+            metric_name=f"column_values.{name}.condition",
+            metric_domain_kwargs={"column": column},
+            metric_value_kwargs={"value_set": value_set},
+        )
+        for name in ["in_set", "not_in_set"]
+        for column, value_set in [("a", [1, 2]), ("b", ["x"])]
+    ]
+    metrics = engine.resolve_metrics(metrics_to_resolve=condition_metrics)
+
+    # The metrics over the batch are resolved together: each column is fetched and filtered for nulls only once
+    assert sorted(get_compute_domain_calls) == ["a", "b"]
+
+    get_compute_domain_calls.clear()
+    result_format = {"result_format": "COMPLETE"}
+    output_metrics = [
+        MetricConfiguration(
+            metric_name=condition_metric.metric_name.replace(
+                ".condition", ".unexpected_values"
+            ),
+            metric_domain_kwargs=condition_metric.metric_domain_kwargs,
+            metric_value_kwargs={"result_format": result_format},
+            metric_dependencies={"unexpected_condition": condition_metric},
+        )
+        for condition_metric in condition_metrics
+    ]
+    results = engine.resolve_metrics(
+        metrics_to_resolve=output_metrics, metrics=metrics
+    )
+    assert sorted(get_compute_domain_calls) == ["a", "b"]
+    assert [results[output_metric.id] for output_metric in output_metrics] == [
+        [3, 4],
+        ["y", "z"],
+        [1, 2],
+        ["x", "x"],
+    ]
+
+
 def test_map_unique_spark(spark_session):
     engine = _build_spark_engine(
         pd.DataFrame(
@@ -684,6 +852,105 @@ def test_median_metric_spark(spark_session):
     assert results == {desired_metric.id: 2}
 
 
+def test_median_metric_sa(sa):
+    engine = _build_sa_engine(
+        pd.DataFrame({"a": [4, 1, None, 3, 2], "b": [5, 1, 3, 4, None]}), sa
+    )
+
+    metrics = dict()
+    desired_metrics = []
+    for column in ["a", "b"]:
+        nonnull_count = MetricConfiguration(
+            metric_name="column_values.nonnull.count",
+            metric_domain_kwargs={"column": column},
+            metric_value_kwargs=dict(),
+        )
+        metrics[nonnull_count.id] = 4
+        partial_metric = MetricConfiguration(
+            metric_name="column.median.aggregate_fn",
+            metric_domain_kwargs={"column": column},
+            metric_value_kwargs=dict(),
+            metric_dependencies={"column_values.nonnull.count": nonnull_count},
+        )
+        metrics.update(
+            engine.resolve_metrics(
+                metrics_to_resolve=(partial_metric,), metrics=metrics
+            )
+        )
+        desired_metrics.append(
+            MetricConfiguration(
+                metric_name="column.median",
+                metric_domain_kwargs={"column": column},
+                metric_value_kwargs=dict(),
+                metric_dependencies={"metric_partial_fn": partial_metric},
+            )
+        )
+
+    # sqlite has no median aggregate, so both medians are scalar subqueries of one statement
+    results = engine.resolve_metrics(
+        metrics_to_resolve=tuple(desired_metrics), metrics=metrics
+    )
+    assert results == {desired_metrics[0].id: 2.5, desired_metrics[1].id: 3.5}
+
+
+def test_get_quantile_aggregate(sa):
+    from sqlalchemy.dialects import postgresql, sqlite
+
+    column = sa.column("a")
+    median = get_quantile_aggregate(
+        column, 0.5, postgresql.dialect(), interpolate=True
+    )
+    assert (
+        str(median.compile(dialect=postgresql.dialect()))
+        == "percentile_cont(%(percentile_cont_1)s) WITHIN GROUP (ORDER BY a ASC)"
+    )
+    quantile = get_quantile_aggregate(column, 0.25, postgresql.dialect())
+    assert (
+        str(quantile.compile(dialect=postgresql.dialect()))
+        == "percentile_disc(%(percentile_disc_1)s) WITHIN GROUP (ORDER BY a ASC)"
+    )
+    assert get_quantile_aggregate(column, 0.5, sqlite.dialect()) is None
+    assert (
+        get_quantile_aggregate(
+            column, 0.5, sqlite.dialect(), allow_relative_error=True, interpolate=True
+        )
+        is None
+    )
+
+
+def test_get_quantile_aggregate_on_redshift_through_postgresql_driver(sa):
+    from sqlalchemy.dialects import postgresql
+
+    column = sa.column("a")
+    dialect = postgresql.dialect()
+    # The server version is unknown until the engine connects
+    assert not is_redshift_dialect(dialect)
+    dialect.server_version_info = (8, 0, 2)
+    assert is_redshift_dialect(dialect)
+    with pytest.raises(ValueError):
+        get_quantile_aggregate(column, 0.25, dialect)
+    assert "approximate percentile_disc" in str(
+        get_quantile_aggregate(column, 0.25, dialect, allow_relative_error=True)
+    ).lower()
+
+
+def test_mysql_quantiles_of_several_columns_in_one_statement(sa):
+    from sqlalchemy.dialects import mysql
+
+    from great_expectations.expectations.metrics.column_aggregate_metrics.column_quantile_values import (
+        _get_column_quantiles_mysql,
+    )
+
+    table = sa.table("test", sa.column("a"), sa.column("b"))
+    # Bundled quantile metrics are selected as scalar subqueries of a single statement, each with its own CTE
+    statement = sa.select(
+        _get_column_quantiles_mysql(table.c.a, [0.25, 0.5], table)
+        + _get_column_quantiles_mysql(table.c.b, [0.5], table)
+    )
+    compiled = str(statement.compile(dialect=mysql.dialect()))
+    assert compiled.count("percent_rank()") == 2
+
+
 def test_distinct_metric_spark(spark_session):
     engine = _build_spark_engine(pd.DataFrame({"a": [1, 2, 1, 2, 3, 3]}), spark_session)
 
@@ -1,5 +1,9 @@
+import pytest
+
 from great_expectations.expectations.row_conditions import (
+    ConditionParserError,
     _parse_great_expectations_condition,
+    parse_condition_to_parquet_filters,
     parse_condition_to_spark,
     parse_condition_to_sqlalchemy,
 )
@@ -41,3 +45,24 @@ def test_parse_condition_to_sqlalchemy(sa):
 
     res = parse_condition_to_sqlalchemy('col("foo").notNull()')
     assert str(res) == "foo IS NOT NULL"
+
+
+def test_parse_condition_to_parquet_filters():
+    assert parse_condition_to_parquet_filters('region == "EU"') == [
+        [("region", "==", "EU")]
+    ]
+    assert parse_condition_to_parquet_filters("(a == 1 or a == 2) & (5 < b)") == [
+        [("a", "==", 1), ("b", ">", 5)],
+        [("a", "==", 2), ("b", ">", 5)],
+    ]
+    assert parse_condition_to_parquet_filters("1 < a <= 3 and b == [1, 2]") == [
+        [("a", ">", 1), ("a", "<=", 3), ("b", "in", [1, 2])]
+    ]
+
+    # Comparisons that cannot be translated are left out of conjunctions, since nulls satisfy "!=" in pandas
+    assert parse_condition_to_parquet_filters("a != 1 and b.notnull() and c >= 2") == [
+        [("c", ">=", 2)]
+    ]
+    for row_condition in ["a != 1", "a == 1 or b.notnull()", "a == b", "`a b` > 1"]:
+        with pytest.raises(ConditionParserError):
+            parse_condition_to_parquet_filters(row_condition)
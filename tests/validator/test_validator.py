@@ -1,14 +1,30 @@
+import time
+
 import pandas as pd
+import pytest
 
 import great_expectations.expectations.metrics
 from great_expectations.core import IDDict
-from great_expectations.core.batch import Batch, BatchRequest, PartitionRequest
+from great_expectations.core.batch import (
+    Batch,
+    BatchDefinition,
+    BatchMarkers,
+    BatchRequest,
+    PartitionDefinition,
+    PartitionRequest,
+)
 from great_expectations.core.expectation_configuration import ExpectationConfiguration
 from great_expectations.core.expectation_validation_result import (
     ExpectationValidationResult,
 )
+from great_expectations.core.id_dict import BatchSpec
+from great_expectations.data_context.store import ResolvedMetricStore
+from great_expectations.exceptions import GreatExpectationsError
 from great_expectations.exceptions.metric_exceptions import MetricProviderError
-from great_expectations.execution_engine import PandasExecutionEngine
+from great_expectations.execution_engine import (
+    PandasExecutionEngine,
+    SqlAlchemyExecutionEngine,
+)
 from great_expectations.expectations.core import ExpectColumnMaxToBeBetween
 from great_expectations.expectations.core.expect_column_value_z_scores_to_be_less_than import (
     ExpectColumnValueZScoresToBeLessThan,
@@ -20,6 +36,7 @@ from great_expectations.validator.validation_graph import (
     ValidationGraph,
 )
 from great_expectations.validator.validator import Validator
+from tests.test_utils import _build_sa_engine
 
 
 def test_parse_validation_graph():
@@ -316,6 +333,203 @@ def test_graph_validate_with_runtime_config(basic_datasource):
     ]
 
 
+def _record_resolve_metrics_calls(execution_engine, calls):
+    resolve_metrics = execution_engine.resolve_metrics
+
+    def recording_resolve_metrics(metrics_to_resolve, *args, **kwargs):
+        metrics_to_resolve = list(metrics_to_resolve)
+        calls.append(metrics_to_resolve)
+        return resolve_metrics(metrics_to_resolve, *args, **kwargs)
+
+    execution_engine.resolve_metrics = recording_resolve_metrics
+
+
+def test_resolve_validation_graph_with_max_workers():
+    df = pd.DataFrame({"a": [1, 5, 22, 3, 5, 10], "b": [1, 2, 3, 4, 5, None]})
+    configurations = [
+        ExpectationConfiguration(
+            expectation_type="expect_column_value_z_scores_to_be_less_than",
+            kwargs={
+                "column": column,
+                "mostly": 0.9,
+                "threshold": 4,
+                "double_sided": True,
+            },
+        )
+        for column in ["a", "b"]
+    ] + [
+        ExpectationConfiguration(
+            expectation_type="expect_column_max_to_be_between",
+            kwargs={"column": column, "min_value": 1, "max_value": 29},
+        )
+        for column in ["a", "b"]
+    ]
+
+    serial_calls = []
+    serial_validator = Validator(
+        execution_engine=PandasExecutionEngine(), batches=[Batch(data=df)]
+    )
+    _record_resolve_metrics_calls(serial_validator.execution_engine, serial_calls)
+    serial_results = serial_validator.graph_validate(configurations=configurations)
+
+    parallel_calls = []
+    parallel_validator = Validator(
+        execution_engine=PandasExecutionEngine(), batches=[Batch(data=df)]
+    )
+    _record_resolve_metrics_calls(parallel_validator.execution_engine, parallel_calls)
+    parallel_results = parallel_validator.graph_validate(
+        configurations=configurations, runtime_configuration={"max_workers": 4}
+    )
+
+    assert parallel_results == serial_results
+    assert all(result.success for result in parallel_results)
+    assert set(parallel_validator.metric_resolution_times.keys()) == set(
+        serial_validator.metric_resolution_times.keys()
+    )
+    assert all(
+        elapsed >= 0
+        for elapsed in parallel_validator.metric_resolution_times.values()
+    )
+
+    # Serially, each level of the graph is resolved in one call, whatever the domains of its metrics
+    assert any(
+        len({metric.metric_domain_kwargs_id for metric in call}) > 1
+        for call in serial_calls
+    )
+    assert len(serial_calls) < len(parallel_calls)
+    assert sorted(metric.id for call in serial_calls for metric in call) == sorted(
+        metric.id for call in parallel_calls for metric in call
+    )
+
+
+def test_resolve_validation_graph_with_circular_dependency():
+    metric = MetricConfiguration("column.max", IDDict({"column": "a"}), IDDict())
+    graph = ValidationGraph(edges=[MetricEdge(metric, metric)])
+    validator = Validator(execution_engine=PandasExecutionEngine())
+
+    with pytest.raises(GreatExpectationsError):
+        validator.resolve_validation_graph(graph, dict())
+
+
+def test_resolve_validation_graph_records_metric_resolution_times(sa):
+    df = pd.DataFrame({"a": [1, 5, 22, 3, 5, 10], "b": [1, 2, 3, 4, 5, None]})
+    configurations = [
+        ExpectationConfiguration(
+            expectation_type="expect_column_max_to_be_between",
+            kwargs={"column": column, "min_value": 1, "max_value": 29},
+        )
+        for column in ["a", "b"]
+    ]
+    validator = Validator(
+        execution_engine=PandasExecutionEngine(), batches=[Batch(data=df)]
+    )
+    get_compute_domain = validator.execution_engine.get_compute_domain
+
+    def slow_get_compute_domain(domain_kwargs, *args, **kwargs):
+        if domain_kwargs.get("column") == "a":
+            time.sleep(0.2)
+        return get_compute_domain(domain_kwargs, *args, **kwargs)
+
+    validator.execution_engine.get_compute_domain = slow_get_compute_domain
+    validator.graph_validate(configurations=configurations)
+
+    # The metrics of a level are timed one by one, although they are resolved by a single call to the engine
+    max_resolution_times = {
+        metric_id: elapsed
+        for metric_id, elapsed in validator.metric_resolution_times.items()
+        if metric_id[0] == "column.max"
+    }
+    assert sorted(max_resolution_times.values())[0] < 0.2
+    assert sorted(max_resolution_times.values())[1] >= 0.2
+    assert validator.metric_bundle_resolution_times == {}
+
+    # The aggregates computed by the same SQL query are timed as a bundle
+    validator = Validator(execution_engine=_build_sa_engine(df))
+    validator.graph_validate(configurations=configurations)
+    assert [
+        sorted(metric_id[0] for metric_id in metric_ids)
+        for metric_ids in validator.metric_bundle_resolution_times
+    ] == [["column.max", "column.max"]]
+    assert not any(
+        metric_id[0] == "column.max"
+        for metric_id in validator.metric_resolution_times
+    )
+
+
+def test_graph_validate_with_resolved_metric_store():
+    df = pd.DataFrame({"a": [1, 5, 22, 3, 5, 10], "b": [1, 2, 3, 4, 5, None]})
+    batch_markers = BatchMarkers(
+        {
+            "ge_load_time": "20210101T000000.000000Z",
+            "pandas_data_fingerprint": "8c46fdaf0bd356fd58b7bcd9b2e6012d",
+        }
+    )
+    configuration = ExpectationConfiguration(
+        expectation_type="expect_column_max_to_be_between",
+        kwargs={"column": "a", "min_value": 1, "max_value": 29},
+    )
+    resolved_metric_store = ResolvedMetricStore()
+
+    validator = Validator(
+        execution_engine=PandasExecutionEngine(),
+        batches=[Batch(data=df, batch_markers=batch_markers)],
+        resolved_metric_store=resolved_metric_store,
+    )
+    result = validator.graph_validate(configurations=[configuration])
+    assert len(validator.metric_resolution_times) > 0
+    assert len(resolved_metric_store.list_keys()) > 0
+
+    validator = Validator(
+        execution_engine=PandasExecutionEngine(),
+        batches=[Batch(data=df, batch_markers=batch_markers)],
+        resolved_metric_store=resolved_metric_store,
+    )
+    assert validator.graph_validate(configurations=[configuration]) == result
+    assert validator.metric_resolution_times == {}
+
+
+def test_get_batch_fingerprint_of_table_batches(sa):
+    eng = sa.create_engine("sqlite://")
+    pd.DataFrame({"a": [1, 2, 3, 4]}).to_sql("test", eng, index=False)
+    engine = SqlAlchemyExecutionEngine(engine=eng)
+    batches = []
+    for sampling_kwargs in [
+        {},
+        {
+            "sampling_method": "_sample_using_mod",
+            "sampling_kwargs": {"column_name": "a", "mod": 2, "value": 1},
+        },
+        {"sampling_method": "_sample_using_random", "sampling_kwargs": {"p": 0.5}},
+        {"sampling_method": "_sample_using_limit", "sampling_kwargs": {"n": 2}},
+    ]:
+        batch_spec = BatchSpec(table_name="test", **sampling_kwargs)
+        batch_data, batch_markers = engine.get_batch_data_and_markers(batch_spec)
+        batches.append(
+            Batch(
+                data=batch_data,
+                batch_definition=BatchDefinition(
+                    datasource_name="my_datasource",
+                    data_connector_name="my_data_connector",
+                    data_asset_name="test",
+                    partition_definition=PartitionDefinition(
+                        {"sampling": sampling_kwargs.get("sampling_method")}
+                    ),
+                ),
+                batch_spec=batch_spec,
+                batch_markers=batch_markers,
+            )
+        )
+    validator = Validator(execution_engine=engine, batches=batches)
+
+    # Each run may draw another random or limit sample, so such batches are not identified across runs
+    assert [validator._get_batch_fingerprint(batch.id) for batch in batches] == [
+        batches[0].batch_definition.id,
+        batches[1].batch_definition.id,
+        None,
+        None,
+    ]
+
+
 def test_validator_default_expectation_args__pandas(basic_datasource):
     df = pd.DataFrame({"a": [1, 5, 22, 3, 5, 10], "b": [1, 2, 3, 4, 5, None]})
     expectationConfiguration = ExpectationConfiguration(